@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ====================================================
+# Copyright 2018 Christopher Simpkins
+# MIT License
+# ====================================================
+
+"""
+Benchmarks the access of delta results through a deltajson report string that is
+parsed with json.loads and through the ufodiff.api DeltaResult object of a synthetic
+result with N *.glif file changes.  Reports the time and peak Python memory.
+
+Usage:
+  python benchmarks/bench_api.py [--files 100000]
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+
+from ufodiff import api
+
+
+def get_delta_result(file_number):
+    filepath_list = [
+        "source/Test-{}.ufo/glyphs/uni{:04X}.glif".format(index % 4, 0x4E00 + index)
+        for index in range(file_number)
+    ]
+    return api.DeltaResult(
+        filepath_list[: file_number // 2],
+        [],
+        filepath_list[file_number // 2 :],  # noqa: E203
+        branches=["master", "feature"],
+    )
+
+
+def measure(label, function):
+    start = time.perf_counter()
+    count = function()
+    elapsed = time.perf_counter() - start
+    # separate run, tracemalloc slows down allocations
+    tracemalloc.start()
+    function()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(
+        "{:<32} {:>8} files {:>9.1f} ms   peak memory: {:>7.2f} MiB".format(
+            label, count, elapsed * 1000, peak / (1024 * 1024)
+        )
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--files", type=int, default=100000)
+    args = parser.parse_args()
+
+    delta_result = get_delta_result(args.files)
+
+    def json_round_trip():
+        report_dict = {"branches": delta_result.branches}
+        for change in api.CHANGE_TYPES:
+            report_dict[change] = delta_result.filepaths(change)
+        report_dict = json.loads(json.dumps(report_dict))
+        return sum(len(report_dict[change]) for change in api.CHANGE_TYPES)
+
+    def api_filepaths():
+        return sum(len(delta_result.filepaths(change)) for change in api.CHANGE_TYPES)
+
+    def api_records():
+        count = 0
+        for record in delta_result:
+            if record.category == api.GLYPH:
+                count += 1
+        return count
+
+    measure("deltajson string + json.loads", json_round_trip)
+    measure("api DeltaResult.filepaths", api_filepaths)
+    measure("api DeltaRecord iteration", api_records)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ====================================================
+# Copyright 2018 Christopher Simpkins
+# MIT License
+# ====================================================
+
+"""
+Benchmarks the delta reports of the last N commits with one `ufodiff` process per
+range and with a single `ufodiff delta all batch` process.  Run the benchmark from
+the root of a git repository with at least N commits.
+
+Usage:
+  python benchmarks/bench_batch.py [--ranges 10] [--engine subprocess]
+"""
+
+import argparse
+import subprocess
+import sys
+import time
+
+UFODIFF_COMMAND = [sys.executable, "-c", "from ufodiff.app import main; main()"]
+
+
+def run_ufodiff(arg_list):
+    subprocess.check_call(UFODIFF_COMMAND + arg_list, stdout=subprocess.DEVNULL)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--ranges", type=int, default=10)
+    parser.add_argument("--engine", default="subprocess")
+    args = parser.parse_args()
+
+    option_list = ["--engine=" + args.engine, "--no-cache"]
+    range_list = ["commits:" + str(number) for number in range(1, args.ranges + 1)]
+
+    start = time.perf_counter()
+    for range_string in range_list:
+        run_ufodiff(["delta", "all", range_string] + option_list)
+    process_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    run_ufodiff(["delta", "all", "batch"] + range_list + option_list)
+    batch_elapsed = time.perf_counter() - start
+
+    print("ranges: {}   engine: {}".format(args.ranges, args.engine))
+    print("one process per range: {:>8.1f} ms".format(process_elapsed * 1000))
+    print("batch process:         {:>8.1f} ms".format(batch_elapsed * 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ====================================================
+# Copyright 2018 Christopher Simpkins
+# MIT License
+# ====================================================
+
+"""
+Benchmarks UFO source filepath classification.  Compares per-path
+Ufo.validate_file calls with the batch UfoPathClassifier.classify_many API
+across a synthetic list of git repository filepaths.
+
+Usage:
+  python benchmarks/bench_classifier.py [--paths 1000000] [--ufos 20]
+"""
+
+import argparse
+import time
+
+from ufodiff.utilities.ufo import Ufo, UfoPathClassifier
+
+
+def make_filepath_list(path_number, ufo_number):
+    """
+    Returns a synthetic list of filepaths with a mix of glyph, non-glyph, data,
+    images, and non-UFO files across ufo_number source directories
+    """
+    nonglyph_files = [
+        "metainfo.plist",
+        "fontinfo.plist",
+        "kerning.plist",
+        "layercontents.plist",
+        "glyphs/contents.plist",
+    ]
+    filepath_list = []
+    index = 0
+    while len(filepath_list) < path_number:
+        ufo_path = "source/Test-" + str(index % ufo_number) + ".ufo"
+        remainder = index % 100
+        if remainder < 80:
+            filepath_list.append(ufo_path + "/glyphs/uni" + str(index) + ".glif")
+        elif remainder < 85:
+            filepath_list.append(ufo_path + "/" + nonglyph_files[remainder - 80])
+        elif remainder < 88:
+            filepath_list.append(ufo_path + "/data/com.test." + str(index))
+        elif remainder < 91:
+            filepath_list.append(ufo_path + "/images/img" + str(index) + ".png")
+        else:
+            filepath_list.append("build/artefacts/obj" + str(index) + ".o")
+        index += 1
+    return filepath_list
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--paths", type=int, default=1000000)
+    parser.add_argument("--ufos", type=int, default=20)
+    args = parser.parse_args()
+
+    filepath_list = make_filepath_list(args.paths, args.ufos)
+
+    ufo = Ufo()
+    start = time.perf_counter()
+    validate_result = [ufo.validate_file(filepath) for filepath in filepath_list]
+    validate_time = time.perf_counter() - start
+
+    classifier = UfoPathClassifier()
+    start = time.perf_counter()
+    category_list = classifier.classify_many(filepath_list)
+    classify_time = time.perf_counter() - start
+
+    # warm directory cache, e.g. a second range in the same process
+    start = time.perf_counter()
+    classifier.classify_many(filepath_list)
+    classify_warm_time = time.perf_counter() - start
+
+    assert validate_result == [
+        category != UfoPathClassifier.NOT_UFO for category in category_list
+    ]
+    print("filepaths: {}".format(len(filepath_list)))
+    print("Ufo.validate_file            : {:.3f} s".format(validate_time))
+    print("classify_many (cold cache)   : {:.3f} s".format(classify_time))
+    print("classify_many (warm cache)   : {:.3f} s".format(classify_warm_time))
+
+
+if __name__ == "__main__":
+    main()
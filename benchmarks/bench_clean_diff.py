@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ====================================================
+# Copyright 2018 Christopher Simpkins
+# MIT License
+# ====================================================
+
+"""
+Microbenchmark for the git diff 'cleaning' in ufodiff.subcommands.diff.Diff.
+Compares the previous string concatenation implementation with the line
+oriented generator implementation across synthetic *.glif diffs of increasing
+size.
+
+Usage:
+  python benchmarks/bench_clean_diff.py [--sizes 1K,1M,10M,100M,500M]
+                                        [--legacy-max-size 10M]
+"""
+
+import argparse
+import os
+import time
+
+from ufodiff.subcommands.diff import Diff
+
+SIZE_SUFFIXES = {"K": 1024, "M": 1024**2, "G": 1024**3}
+
+
+def legacy_clean_diff_string(dirty_diff_string):
+    dirty_diffstring_list = dirty_diff_string.split("\n")
+    clean_diff_string = ""
+    for a_string in dirty_diffstring_list:
+        if a_string.startswith("\x1b[1mdiff --git") or a_string.startswith(
+            "diff --git"
+        ):
+            clean_a_string = a_string.replace("diff --git", "")
+            clean_a_string = clean_a_string.replace(" ", os.linesep)
+            clean_diff_string += clean_a_string + os.linesep
+        elif "100644" in a_string:
+            clean_a_string = a_string.replace("100644", "")
+            clean_a_string = clean_a_string.replace("mode", "")
+            clean_diff_string += clean_a_string + os.linesep
+        else:
+            clean_diff_string += a_string + os.linesep
+    if "---" in clean_diff_string and "+++" in clean_diff_string:
+        clean_diff_string_list = clean_diff_string.split(os.linesep)
+        purged_head_paths_diff_string_list = clean_diff_string_list[3:]
+        clean_diff_string = ""
+        for line in purged_head_paths_diff_string_list:
+            clean_diff_string += line + os.linesep
+    return clean_diff_string
+
+
+def parse_size(size_string):
+    size_string = size_string.strip().upper()
+    if size_string[-1] in SIZE_SUFFIXES:
+        return int(float(size_string[:-1]) * SIZE_SUFFIXES[size_string[-1]])
+    return int(size_string)
+
+
+def make_dirty_diff_string(size):
+    """Returns a synthetic single file *.glif git diff string of ~size bytes"""
+    header = (
+        "diff --git a/source/Test-Regular.ufo/glyphs/a.glif "
+        "b/source/Test-Regular.ufo/glyphs/a.glif\n"
+        "index c13403487..8e84d1d01 100644\n"
+        "--- a/source/Test-Regular.ufo/glyphs/a.glif\n"
+        "+++ b/source/Test-Regular.ufo/glyphs/a.glif\n"
+    )
+    hunk = (
+        "@@ -7,4 +7,4 @@\n"
+        "     <contour>\n"
+        '-      <point x="100" y="200" type="line"/>\n'
+        '+      <point x="101" y="200" type="line"/>\n'
+        "     </contour>\n"
+    )
+    hunk_number = max(1, (size - len(header)) // len(hunk))
+    return header + (hunk * hunk_number)
+
+
+def time_call(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", default="1K,1M,10M,100M,500M")
+    parser.add_argument(
+        "--legacy-max-size",
+        default="10M",
+        help="largest input size timed with the previous implementation",
+    )
+    args = parser.parse_args()
+
+    diff = Diff(".")
+    legacy_max_size = parse_size(args.legacy_max_size)
+    print("{:>12} {:>14} {:>14}".format("input bytes", "legacy (s)", "generator (s)"))
+    for size_string in args.sizes.split(","):
+        dirty_diff_string = make_dirty_diff_string(parse_size(size_string))
+        generator_time, clean_string = time_call(
+            diff._clean_diff_string, dirty_diff_string
+        )
+        if len(dirty_diff_string) <= legacy_max_size:
+            legacy_time, legacy_clean_string = time_call(
+                legacy_clean_diff_string, dirty_diff_string
+            )
+            assert legacy_clean_string == clean_string
+            legacy_time_string = "{:.4f}".format(legacy_time)
+        else:
+            legacy_time_string = "skipped"
+        print(
+            "{:>12} {:>14} {:>14.4f}".format(
+                len(dirty_diff_string), legacy_time_string, generator_time
+            )
+        )
+        del dirty_diff_string, clean_string
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ====================================================
+# Copyright 2018 Christopher Simpkins
+# MIT License
+# ====================================================
+
+"""
+Benchmarks the glyph name lookups of a large glyph layer.  A temporary git
+repository is created with a contents.plist file and reports the time of a cold
+lookup (contents.plist parse and cache entry write), a disk cache hit in a new
+GlyphNameIndex, and an in-memory hit.
+
+Usage:
+  python benchmarks/bench_contents.py [--glyphs 60000] [--lookups 1000]
+"""
+
+import argparse
+import os
+import plistlib
+import shutil
+import tempfile
+import time
+
+from git import Repo
+
+from ufodiff.utilities.contents import GlyphNameIndex
+
+GLYPHS_DIRPATH = "source/Test-Regular.ufo/glyphs"
+
+
+def make_repository(repo_path, glyph_number):
+    repo = Repo.init(repo_path)
+    with repo.config_writer() as config:
+        config.set_value("user", "name", "ufodiff")
+        config.set_value("user", "email", "ufodiff@example.com")
+    glyphs_path = os.path.join(repo_path, *GLYPHS_DIRPATH.split("/"))
+    os.makedirs(glyphs_path)
+    contents_dict = {
+        "uni{:04X}".format(0x4E00 + index): "uni{:04X}.glif".format(0x4E00 + index)
+        for index in range(glyph_number)
+    }
+    with open(os.path.join(glyphs_path, "contents.plist"), "wb") as f:
+        f.write(plistlib.dumps(contents_dict))
+    repo.git.add("-A")
+    repo.git.commit("-m", "contents")
+    return repo
+
+
+def time_lookup(glyph_name_index, filepath_list, revision):
+    start = time.perf_counter()
+    glyph_name_dict = glyph_name_index.get_glyph_names(filepath_list, revision)
+    assert len(glyph_name_dict) == len(filepath_list)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--glyphs", type=int, default=60000)
+    parser.add_argument("--lookups", type=int, default=1000)
+    args = parser.parse_args()
+
+    repo_path = tempfile.mkdtemp(prefix="ufodiff-bench-")
+    try:
+        repo = make_repository(repo_path, args.glyphs)
+        filepath_list = [
+            GLYPHS_DIRPATH + "/uni{:04X}.glif".format(0x4E00 + index)
+            for index in range(min(args.lookups, args.glyphs))
+        ]
+        print("glyphs: {}   lookups: {}".format(args.glyphs, len(filepath_list)))
+        for revision in ("HEAD", None):
+            label = "working tree" if revision is None else revision
+            glyph_name_index = GlyphNameIndex(repo)
+            cold = time_lookup(glyph_name_index, filepath_list, revision)
+            memory = time_lookup(glyph_name_index, filepath_list, revision)
+            disk = time_lookup(GlyphNameIndex(repo), filepath_list, revision)
+            shutil.rmtree(os.path.join(repo.git_dir, "ufodiff"))
+            print(
+                "{:<13} parse: {:>8.1f} ms   disk cache: {:>8.1f} ms   "
+                "memory: {:>6.2f} ms".format(
+                    label, cold * 1000, disk * 1000, memory * 1000
+                )
+            )
+    finally:
+        shutil.rmtree(repo_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ====================================================
+# Copyright 2018 Christopher Simpkins
+# MIT License
+# ====================================================
+
+"""
+Benchmarks the collection of added, deleted, and modified filepaths for the
+delta subcommands.  Compares the three per-status `git diff --name-only
+--diff-filter=[A|D|M]` calls that were previously used with the single
+`git diff --name-status -z` call and the in-process commit tree comparison.  The
+optional glyph / nonglyph file filter is applied to the name-status and in-process
+collections.
+
+Usage:
+  python benchmarks/bench_delta_collection.py [--repo PATH] [--rev BASE..HEAD] [--runs N]
+    [--file-filter glyph|nonglyph]
+"""
+
+import argparse
+import time
+
+from git import Repo
+from git.cmd import Git
+from gitdb import GitDB
+
+from ufodiff.utilities.gitdelta import (
+    FILE_FILTERS,
+    get_file_filter_pathspec_list,
+    get_name_status_filepath_lists,
+    get_tree_filepath_lists,
+)
+
+
+class SubprocessCounter(object):
+    """Counts the git subprocess calls that are made through GitPython"""
+
+    def __init__(self):
+        self.count = 0
+        self._execute = Git.execute
+
+    def __enter__(self):
+        counter = self
+
+        def counting_execute(git_self, *args, **kwargs):
+            counter.count += 1
+            return counter._execute(git_self, *args, **kwargs)
+
+        Git.execute = counting_execute
+        return self
+
+    def __exit__(self, *exc_info):
+        Git.execute = self._execute
+
+
+def collect_with_diff_filters(git, diff_arg_string):
+    filepath_lists = []
+    for diff_filter in ("A", "D", "M"):
+        filepath_string = git.diff(
+            "--name-only", "--diff-filter=" + diff_filter, diff_arg_string
+        )
+        filepath_lists.append(filepath_string.split("\n"))
+    return tuple(filepath_lists)
+
+
+def collect_with_name_status(git, diff_arg_string, file_filter=None):
+    return get_name_status_filepath_lists(
+        git, diff_arg_string, get_file_filter_pathspec_list(file_filter)
+    )
+
+
+def collect_with_tree(repo, diff_arg_string, file_filter=None):
+    base_revision, head_revision = diff_arg_string.split("..")
+    return get_tree_filepath_lists(
+        repo, base_revision, head_revision, file_filter=file_filter
+    )
+
+
+def run_benchmark(name, collect_func, git_handle, diff_arg_string, runs, *args):
+    with SubprocessCounter() as counter:
+        start = time.perf_counter()
+        for _ in range(runs):
+            collect_func(git_handle, diff_arg_string, *args)
+        elapsed = time.perf_counter() - start
+    print(
+        "{:<14} subprocesses/run: {:>3}   mean wall time: {:>9.2f} ms".format(
+            name, counter.count // runs, (elapsed / runs) * 1000
+        )
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--repo", default=".", help="path to git repository")
+    parser.add_argument("--rev", default="HEAD~1..HEAD", help="git revision range")
+    parser.add_argument("--runs", type=int, default=10, help="number of runs")
+    parser.add_argument("--file-filter", choices=FILE_FILTERS, default=None)
+    args = parser.parse_args()
+
+    git = Repo(args.repo).git
+    run_benchmark("diff-filter", collect_with_diff_filters, git, args.rev, args.runs)
+    run_benchmark(
+        "name-status",
+        collect_with_name_status,
+        git,
+        args.rev,
+        args.runs,
+        args.file_filter,
+    )
+    repo = Repo(args.repo, odbt=GitDB)
+    run_benchmark(
+        "inprocess", collect_with_tree, repo, args.rev, args.runs, args.file_filter
+    )
+
+
+if __name__ == "__main__":
+    main()
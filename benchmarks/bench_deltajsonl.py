@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ====================================================
+# Copyright 2018 Christopher Simpkins
+# MIT License
+# ====================================================
+
+"""
+Benchmarks the deltajson and deltajsonl report writers with a synthetic delta result
+of N *.glif file changes.  Reports the time to the first byte of output, the total
+time, and the peak Python memory of the serialization (the file lists of the delta
+result are created before the measurement).
+
+Usage:
+  python benchmarks/bench_deltajsonl.py [--files 100000]
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from ufodiff.subcommands.delta import DeltaJSONLinesWriter, DeltaJSONWriter
+from ufodiff.utilities.deltarecords import DeltaResult
+
+
+class SyntheticDelta(object):
+    """Delta object interface of the report writers with synthetic file lists"""
+
+    glyph_names = False
+    is_commit_test = False
+    is_branch_test = True
+
+    def __init__(self, file_number):
+        self.delta_result = DeltaResult(
+            [
+                "source/Test-Regular.ufo/glyphs/uni{:04X}.glif".format(0x4E00 + index)
+                for index in range(file_number)
+            ],
+            [],
+            [],
+            branches=["master", "feature"],
+        )
+
+    def get_delta_result(self):
+        return self.delta_result
+
+
+class NullStream(object):
+    """Text stream that records the time of the first write"""
+
+    def __init__(self):
+        self.first_write_time = None
+
+    def write(self, text):
+        if self.first_write_time is None:
+            self.first_write_time = time.perf_counter()
+
+    def writelines(self, line_iterable):
+        for line in line_iterable:
+            self.write(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--files", type=int, default=100000)
+    args = parser.parse_args()
+
+    delta = SyntheticDelta(args.files)
+    for label, writer_class in (
+        ("deltajson", DeltaJSONWriter),
+        ("deltajsonl", DeltaJSONLinesWriter),
+    ):
+        outstream = NullStream()
+        start = time.perf_counter()
+        writer_class(delta).write(outstream)
+        elapsed = time.perf_counter() - start
+        first_byte_elapsed = outstream.first_write_time - start
+        # separate run, tracemalloc slows down allocations
+        tracemalloc.start()
+        writer_class(delta).write(NullStream())
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(
+            "{:<11} first byte: {:>8.2f} ms   total: {:>8.1f} ms   "
+            "peak memory: {:>6.2f} MiB".format(
+                label, first_byte_elapsed * 1000, elapsed * 1000, peak / (1024 * 1024)
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
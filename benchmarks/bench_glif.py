@@ -0,0 +1,146 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ====================================================
+# Copyright 2018 Christopher Simpkins
+# MIT License
+# ====================================================
+
+"""
+Benchmarks *.glif parsing on a synthetic CJK UFO.  Compares an ElementTree parse
+into per-point dictionaries with the streaming expat parser in
+ufodiff.utilities.glif (eager and lazy outline decoding).  Reports the parse time
+and the retained memory in bytes per glyph.
+
+Usage:
+  python benchmarks/bench_glif.py [--glyphs 50000] [--contours 12] [--points 24]
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+import xml.etree.ElementTree as ElementTree
+
+from ufodiff.utilities.glif import parse_glif
+
+
+def make_glif_data(index, contour_number, point_number):
+    """Returns synthetic CJK ideograph *.glif bytes"""
+    codepoint = 0x4E00 + index
+    line_list = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        '<glyph name="uni{:04X}" format="2">'.format(codepoint),
+        '  <advance width="1000" height="1000"/>',
+        '  <unicode hex="{:04X}"/>'.format(codepoint),
+        "  <outline>",
+    ]
+    for contour_index in range(contour_number):
+        line_list.append("    <contour>")
+        for point_index in range(point_number):
+            x = (index * 7 + contour_index * 61 + point_index * 13) % 1000
+            y = (index * 3 + contour_index * 37 + point_index * 29) % 1000
+            if point_index % 3 == 0:
+                line_list.append(
+                    '      <point x="{}" y="{}" type="curve" smooth="yes"/>'.format(
+                        x, y
+                    )
+                )
+            else:
+                line_list.append('      <point x="{}" y="{}"/>'.format(x, y))
+        line_list.append("    </contour>")
+    line_list.extend(
+        [
+            "  </outline>",
+            "  <lib>",
+            "    <dict>",
+            "      <key>public.markColor</key>",
+            "      <string>1,0,0,1</string>",
+            "    </dict>",
+            "  </lib>",
+            "</glyph>",
+            "",
+        ]
+    )
+    return "\n".join(line_list).encode("utf-8")
+
+
+def parse_glif_elementtree(glif_data):
+    """ElementTree parse into per-point dictionaries"""
+    root = ElementTree.fromstring(glif_data)
+    glyph_dict = {"name": root.get("name"), "unicodes": [], "contours": []}
+    for element in root:
+        if element.tag == "advance":
+            glyph_dict["width"] = float(element.get("width", 0))
+        elif element.tag == "unicode":
+            glyph_dict["unicodes"].append(element.get("hex"))
+        elif element.tag == "outline":
+            for contour in element:
+                glyph_dict["contours"].append(
+                    [
+                        {
+                            "x": float(point.get("x")),
+                            "y": float(point.get("y")),
+                            "type": point.get("type"),
+                            "smooth": point.get("smooth") == "yes",
+                        }
+                        for point in contour
+                    ]
+                )
+    return glyph_dict
+
+
+def run_benchmark(name, parse_func, glif_data_list):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    glyph_list = [parse_func(glif_data) for glif_data in glif_data_list]
+    elapsed = time.perf_counter() - start
+    retained_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # parse time without tracemalloc overhead
+    del glyph_list
+    gc.collect()
+    start = time.perf_counter()
+    glyph_list = [parse_func(glif_data) for glif_data in glif_data_list]
+    elapsed = time.perf_counter() - start
+    print(
+        "{:<22} parse time: {:>8.2f} s   {:>9.1f} us/glyph   {:>8.0f} bytes/glyph".format(
+            name,
+            elapsed,
+            (elapsed / len(glif_data_list)) * 1000000,
+            retained_bytes / len(glif_data_list),
+        )
+    )
+    del glyph_list
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--glyphs", type=int, default=50000)
+    parser.add_argument("--contours", type=int, default=12)
+    parser.add_argument("--points", type=int, default=24)
+    args = parser.parse_args()
+
+    glif_data_list = [
+        make_glif_data(index, args.contours, args.points)
+        for index in range(args.glyphs)
+    ]
+    print(
+        "glyphs: {}   points/glyph: {}   glif bytes/glyph: {:.0f}".format(
+            args.glyphs,
+            args.contours * args.points,
+            sum(len(x) for x in glif_data_list) / len(glif_data_list),
+        )
+    )
+    run_benchmark("ElementTree dicts", parse_glif_elementtree, glif_data_list)
+    run_benchmark("expat __slots__", parse_glif, glif_data_list)
+    run_benchmark(
+        "expat __slots__ lazy",
+        lambda glif_data: parse_glif(glif_data, lazy_outline=True),
+        glif_data_list,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ====================================================
+# Copyright 2018 Christopher Simpkins
+# MIT License
+# ====================================================
+
+"""
+Benchmarks the glyphdiff comparison of a large *.glif delta with sequential and
+process pool execution.  A temporary git repository is created with a synthetic CJK
+UFO in which every glyph is modified in the second commit.
+
+Usage:
+  python benchmarks/bench_glyphdiff_parallel.py [--glyphs 10000] [--workers 1,2,4]
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+from git import Repo
+
+from bench_glif import make_glif_data
+from ufodiff.subcommands.glyphdiff import GlyphDiff
+
+
+def make_repository(repo_path, glyph_number):
+    repo = Repo.init(repo_path)
+    with repo.config_writer() as config:
+        config.set_value("user", "name", "ufodiff")
+        config.set_value("user", "email", "ufodiff@example.com")
+    glyphs_path = os.path.join(repo_path, "source", "Test-Regular.ufo", "glyphs")
+    os.makedirs(glyphs_path)
+    for revision in (0, 1):
+        for index in range(glyph_number):
+            # one more point per contour in the second commit
+            glif_data = make_glif_data(index, 12, 24 + revision)
+            filepath = os.path.join(
+                glyphs_path, "uni{:04X}.glif".format(0x4E00 + index)
+            )
+            with open(filepath, "wb") as f:
+                f.write(glif_data)
+        repo.git.add("-A")
+        repo.git.commit("-m", "revision " + str(revision))
+    return repo
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--glyphs", type=int, default=10000)
+    parser.add_argument("--workers", default="1,2,4")
+    args = parser.parse_args()
+
+    repo_path = tempfile.mkdtemp(prefix="ufodiff-bench-")
+    try:
+        make_repository(repo_path, args.glyphs)
+        print("glyphs: {}   CPUs: {}".format(args.glyphs, os.cpu_count()))
+        for workers in [int(x) for x in args.workers.split(",")]:
+            glyphdiff = GlyphDiff(repo_path, workers=workers)
+            start = time.perf_counter()
+            report_number = sum(
+                1 for _ in glyphdiff.get_glyph_diff_string_generator("commits:1")
+            )
+            elapsed = time.perf_counter() - start
+            print(
+                "workers: {:>2}   time: {:>7.2f} s   {:>7.1f} us/glyph   "
+                "reports: {}".format(
+                    workers, elapsed, (elapsed / args.glyphs) * 1000000, report_number
+                )
+            )
+    finally:
+        shutil.rmtree(repo_path)
+
+
+if __name__ == "__main__":
+    main()
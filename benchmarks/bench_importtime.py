@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ====================================================
+# Copyright 2018 Christopher Simpkins
+# MIT License
+# ====================================================
+
+"""
+Benchmarks the startup time of the `ufodiff` executable.  Reports the median
+cumulative `python -X importtime` time of the ufodiff.app module, the number of
+imported modules, and the median wall clock time of requests that exit before any
+git repository access, compared with an empty Python interpreter.  Run the
+benchmark from the root of a git repository.
+
+Usage:
+  python benchmarks/bench_importtime.py [--runs 20]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+UFODIFF_CODE = "import sys; sys.argv = {!r}; from ufodiff.app import main; main()"
+REQUESTS = (
+    ["--version"],
+    ["--help"],
+    ["delta", "bogus", "commits:1"],
+    ["diffnc", "commits:1"],
+)
+
+
+def get_import_time_dict(code):
+    """
+    :param code: (string) Python code that is executed with `python -X importtime`
+    :return: (dict) {module name: cumulative import time in microseconds}
+    """
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+    )
+    import_time_dict = {}
+    for line in process.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            fields = line[len("import time:") :].split("|")  # noqa: E203
+            if fields[1].strip().isdigit():
+                import_time_dict[fields[2].strip()] = int(fields[1])
+    return import_time_dict
+
+
+def get_wall_time(command):
+    start = time.perf_counter()
+    subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    import_time_dict_list = [
+        get_import_time_dict("import ufodiff.app") for _ in range(args.runs)
+    ]
+    print(
+        "{:<32} {:>8.1f} ms   {} modules".format(
+            "import ufodiff.app",
+            statistics.median(
+                import_time_dict["ufodiff.app"] / 1000
+                for import_time_dict in import_time_dict_list
+            ),
+            len(import_time_dict_list[-1]),
+        )
+    )
+    git_module_list = [
+        module_name
+        for module_name in import_time_dict_list[-1]
+        if module_name.split(".")[0] in ("git", "gitdb", "smmap")
+    ]
+    print("{:<32} {:>8}".format("GitPython modules", len(git_module_list)))
+
+    for label, command in [("python -c pass", [sys.executable, "-c", "pass"])] + [
+        (
+            "ufodiff " + " ".join(argv),
+            [sys.executable, "-c", UFODIFF_CODE.format(["ufodiff"] + argv)],
+        )
+        for argv in REQUESTS
+    ]:
+        wall_time = statistics.median(get_wall_time(command) for _ in range(args.runs))
+        print("{:<32} {:>8.1f} ms".format(label, wall_time * 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ====================================================
+# Copyright 2018 Christopher Simpkins
+# MIT License
+# ====================================================
+
+"""
+Benchmarks the kerning pair comparison of two kerning.plist revisions.  Compares a
+plistlib load into nested dictionaries followed by a nested comparison with the
+flat interned (first, second) : value pair dictionaries in
+ufodiff.utilities.kerning.  Reports the time and the peak memory of each approach.
+
+Usage:
+  python benchmarks/bench_kerning.py [--pairs 150000] [--changes 1000]
+"""
+
+import argparse
+import gc
+import plistlib
+import random
+import time
+import tracemalloc
+
+from ufodiff.utilities.kerning import get_kerning_pair_changes, load_kerning_pairs
+
+
+def make_kerning_data(pair_number, change_number):
+    """Returns base and head revision kerning.plist bytes"""
+    name_list = ["glyph" + str(index) for index in range(int(pair_number**0.5) + 1)]
+    name_list.extend("public.kern1.group" + str(index) for index in range(200))
+    randomizer = random.Random(0)
+    kerning_dict = {}
+    while sum(len(x) for x in kerning_dict.values()) < pair_number:
+        first = randomizer.choice(name_list)
+        second = randomizer.choice(name_list)
+        kerning_dict.setdefault(first, {})[second] = randomizer.randrange(-150, 50)
+    base_data = plistlib.dumps(kerning_dict)
+    first_list = sorted(kerning_dict)
+    for _ in range(change_number):
+        second_dict = kerning_dict[randomizer.choice(first_list)]
+        second = randomizer.choice(sorted(second_dict))
+        second_dict[second] += randomizer.choice((-10, -5, 5, 10))
+    return base_data, plistlib.dumps(kerning_dict)
+
+
+def compare_nested(base_data, head_data):
+    """plistlib nested dictionaries and a nested comparison"""
+    old_dict = plistlib.loads(base_data)
+    new_dict = plistlib.loads(head_data)
+    changed = []
+    for first, old_second_dict in old_dict.items():
+        new_second_dict = new_dict.get(first, {})
+        for second, old_value in old_second_dict.items():
+            new_value = new_second_dict.get(second)
+            if new_value is not None and new_value != old_value:
+                changed.append(((first, second), old_value, new_value))
+    return changed
+
+
+def compare_flat(base_data, head_data):
+    """ufodiff flat interned pair dictionaries"""
+    return get_kerning_pair_changes(
+        load_kerning_pairs(base_data), load_kerning_pairs(head_data)
+    ).changed
+
+
+def run_benchmark(name, compare_func, base_data, head_data):
+    gc.collect()
+    tracemalloc.start()
+    change_list = compare_func(base_data, head_data)
+    peak_bytes = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del change_list
+    gc.collect()
+    # time without tracemalloc overhead
+    start = time.perf_counter()
+    change_list = compare_func(base_data, head_data)
+    elapsed = time.perf_counter() - start
+    print(
+        "{:<26} time: {:>7.3f} s   peak memory: {:>7.1f} MiB   changes: {}".format(
+            name, elapsed, peak_bytes / (1024 * 1024), len(change_list)
+        )
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--pairs", type=int, default=150000)
+    parser.add_argument("--changes", type=int, default=1000)
+    args = parser.parse_args()
+
+    base_data, head_data = make_kerning_data(args.pairs, args.changes)
+    print("pairs: {}   kerning.plist bytes: {}".format(args.pairs, len(base_data)))
+    run_benchmark("plistlib nested dicts", compare_nested, base_data, head_data)
+    run_benchmark("expat flat pair dict", compare_flat, base_data, head_data)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ====================================================
+# Copyright 2018 Christopher Simpkins
+# MIT License
+# ====================================================
+
+"""
+Benchmarks the `ufodiff log` per-commit timeline of a long commit history.  A
+temporary git repository is created with `git fast-import` in which each commit
+modifies a *.glif file and every tenth commit also modifies a file outside of the
+UFO source.  Reports the time and the peak Python memory of the timeline.
+
+Usage:
+  python benchmarks/bench_log.py [--commits 100000]
+"""
+
+import argparse
+import io
+import shutil
+import subprocess
+import tempfile
+import time
+import tracemalloc
+
+from ufodiff.subcommands.log import Log
+
+
+def make_repository(repo_path, commit_number):
+    subprocess.check_call(["git", "init", "-q", repo_path])
+    stream = io.BytesIO()
+    for index in range(commit_number):
+        filepath = "source/Test-Regular.ufo/glyphs/uni{:04X}.glif".format(
+            0x4E00 + index % 5000
+        )
+        data = "<glyph name='{}' format='2'/>".format(index).encode("utf-8")
+        message = "commit {}".format(index).encode("utf-8")
+        stream.write(b"commit refs/heads/master\n")
+        stream.write(
+            b"committer ufodiff <ufodiff@example.com> "
+            + str(1500000000 + index).encode("ascii")
+            + b" +0000\n"
+        )
+        stream.write(b"data " + str(len(message)).encode("ascii") + b"\n" + message)
+        stream.write(b"\n")
+        stream.write(b"M 100644 inline " + filepath.encode("utf-8") + b"\n")
+        stream.write(b"data " + str(len(data)).encode("ascii") + b"\n" + data + b"\n")
+        if index % 10 == 0:
+            stream.write(b"M 100644 inline README.md\n")
+            stream.write(b"data " + str(len(data)).encode("ascii") + b"\n" + data)
+            stream.write(b"\n")
+    subprocess.run(
+        ["git", "-C", repo_path, "fast-import", "--quiet"],
+        input=stream.getvalue(),
+        check=True,
+    )
+    subprocess.check_call(["git", "-C", repo_path, "checkout", "-q", "master"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--commits", type=int, default=100000)
+    args = parser.parse_args()
+
+    repo_path = tempfile.mkdtemp(prefix="ufodiff-bench-")
+    try:
+        make_repository(repo_path, args.commits)
+        log = Log(repo_path)
+        tracemalloc.start()
+        start = time.perf_counter()
+        commit_number = 0
+        for _ in log.get_commit_changes_generator("commits:" + str(args.commits)):
+            commit_number += 1
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(
+            "commits: {}   time: {:>7.2f} s   {:>6.1f} us/commit   "
+            "peak memory: {:>6.2f} MiB".format(
+                commit_number,
+                elapsed,
+                (elapsed / max(commit_number, 1)) * 1000000,
+                peak / (1024 * 1024),
+            )
+        )
+    finally:
+        shutil.rmtree(repo_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ====================================================
+# Copyright 2018 Christopher Simpkins
+# MIT License
+# ====================================================
+
+"""
+Benchmarks the key path diff of a rewritten lib.plist file.  A temporary git
+repository is created with a large lib.plist file that is rewritten with a
+different key order and indentation, a single changed key, and one inserted and one
+deleted public.glyphOrder item.  Compares the
+`git diff --minimal` call, the complete `ufodiff diffnc` text diff, and the
+PlistDiff key path diff.
+
+Usage:
+  python benchmarks/bench_plistdiff.py [--keys 5000] [--glyphs 50000] [--runs 5]
+"""
+
+import argparse
+import os
+import plistlib
+import random
+import shutil
+import tempfile
+import time
+
+from git import Repo
+
+from ufodiff.subcommands.diff import Diff
+from ufodiff.subcommands.plistdiff import PlistDiff
+
+
+def make_lib_plist_dict(key_number, glyph_number):
+    lib_dict = {
+        "public.glyphOrder": [
+            "uni{:04X}".format(0x4E00 + i) for i in range(glyph_number)
+        ]
+    }
+    for index in range(key_number):
+        lib_dict["com.test.key" + str(index)] = {
+            "value": index,
+            "name": "key" + str(index),
+            "list": [index, index + 1, index + 2],
+        }
+    return lib_dict
+
+
+def write_plist(filepath, plist_dict, sort_keys):
+    plist_data = plistlib.dumps(plist_dict, sort_keys=sort_keys)
+    if sort_keys is False:
+        # tools rewrite the file with a different indentation
+        plist_data = plist_data.replace(b"\t", b"  ")
+    with open(filepath, "wb") as f:
+        f.write(plist_data)
+
+
+def make_repository(repo_path, key_number, glyph_number):
+    repo = Repo.init(repo_path)
+    with repo.config_writer() as config:
+        config.set_value("user", "name", "ufodiff")
+        config.set_value("user", "email", "ufodiff@example.com")
+    ufo_path = os.path.join(repo_path, "source", "Test-Regular.ufo")
+    os.makedirs(ufo_path)
+    lib_plist_path = os.path.join(ufo_path, "lib.plist")
+    lib_dict = make_lib_plist_dict(key_number, glyph_number)
+    write_plist(lib_plist_path, lib_dict, sort_keys=True)
+    repo.git.add("-A")
+    repo.git.commit("-m", "first")
+    # one key change, one inserted and one deleted glyph order item, and a rewrite
+    # with a shuffled key order
+    lib_dict["com.test.key0"]["value"] = -1
+    lib_dict["public.glyphOrder"].insert(10, "new")
+    del lib_dict["public.glyphOrder"][glyph_number // 2]
+    key_list = list(lib_dict.keys())
+    random.Random(0).shuffle(key_list)
+    write_plist(
+        lib_plist_path, {key: lib_dict[key] for key in key_list}, sort_keys=False
+    )
+    repo.git.add("-A")
+    repo.git.commit("-m", "second")
+    return repo
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--keys", type=int, default=5000)
+    parser.add_argument("--glyphs", type=int, default=50000)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    repo_path = tempfile.mkdtemp(prefix="ufodiff-bench-")
+    try:
+        repo = make_repository(repo_path, args.keys, args.glyphs)
+
+        start = time.perf_counter()
+        for _ in range(args.runs):
+            text_diff_string = repo.git.diff("--minimal", "HEAD~1", "--", "*lib.plist")
+        text_diff_time = (time.perf_counter() - start) / args.runs
+
+        diff = Diff(repo_path, color_diff=False, stream_diff=True)
+        start = time.perf_counter()
+        for _ in range(args.runs):
+            diffnc_line_number = sum(
+                len(x.split(os.linesep))
+                for x in diff.get_diff_string_generator("commits:1")
+            )
+        diffnc_time = (time.perf_counter() - start) / args.runs
+
+        plistdiff = PlistDiff(repo_path)
+        start = time.perf_counter()
+        for _ in range(args.runs):
+            report_list = list(plistdiff.get_plist_diff_string_generator("commits:1"))
+        plistdiff_time = (time.perf_counter() - start) / args.runs
+
+        print(
+            "git diff --minimal : {:>9.3f} s  {:>8} lines".format(
+                text_diff_time, len(text_diff_string.split("\n"))
+            )
+        )
+        print(
+            "ufodiff diffnc     : {:>9.3f} s  {:>8} lines".format(
+                diffnc_time, diffnc_line_number
+            )
+        )
+        print(
+            "plistdiff          : {:>9.3f} s  {:>8} lines".format(
+                plistdiff_time, sum(len(x.split(os.linesep)) for x in report_list)
+            )
+        )
+    finally:
+        shutil.rmtree(repo_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ====================================================
+# Copyright 2018 Christopher Simpkins
+# MIT License
+# ====================================================
+
+"""
+Benchmarks the latency of delta and diff requests with a new `ufodiff` process per
+request (cold) and with a `ufodiff serve` daemon (warm).  Warm requests are sent
+with a new `ufodiff-client` process per request and with the client send_request
+function from a running Python process.  Run the benchmark from the root of a git
+repository with at least two commits and a `master` branch.
+
+Usage:
+  python benchmarks/bench_serve.py [--requests 20]
+"""
+
+import argparse
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from ufodiff.client import send_request
+
+UFODIFF_COMMAND = [sys.executable, "-c", "from ufodiff.app import main; main()"]
+CLIENT_COMMAND = [sys.executable, "-c", "from ufodiff.client import main; main()"]
+REQUESTS = (
+    ["deltajson", "all", "commits:2"],
+    ["deltajson", "all", "branch:master"],
+    ["diffnc", "commits:1"],
+)
+
+
+def get_latency_list(run_request, argv, request_number):
+    latency_list = []
+    for _ in range(request_number):
+        start = time.perf_counter()
+        run_request(argv)
+        latency_list.append((time.perf_counter() - start) * 1000)
+    return latency_list
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=20)
+    args = parser.parse_args()
+
+    socket_dirpath = tempfile.mkdtemp(prefix="ufodiff-bench-")
+    socket_path = os.path.join(socket_dirpath, "serve.sock")
+    server_process = subprocess.Popen(
+        UFODIFF_COMMAND + ["serve", "--socket=" + socket_path],
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        while not os.path.exists(socket_path):
+            time.sleep(0.01)
+        cwd = os.path.abspath(".")
+
+        def run_cold(argv):
+            subprocess.check_call(UFODIFF_COMMAND + argv, stdout=subprocess.DEVNULL)
+
+        def run_client(argv):
+            subprocess.check_call(
+                CLIENT_COMMAND + argv + ["--socket=" + socket_path],
+                stdout=subprocess.DEVNULL,
+            )
+
+        def run_warm(argv):
+            response = send_request(socket_path, argv, cwd)
+            assert response["status"] == 0, response["stderr"]
+
+        print("requests: {}   median (mean) latency".format(args.requests))
+        for argv in REQUESTS:
+            print(" ".join(argv))
+            for label, run_request in (
+                ("cold ufodiff process", run_cold),
+                ("ufodiff-client process", run_client),
+                ("warm send_request", run_warm),
+            ):
+                latency_list = get_latency_list(run_request, argv, args.requests)
+                print(
+                    "  {:<24} {:>8.1f} ms ({:>8.1f} ms)".format(
+                        label,
+                        statistics.median(latency_list),
+                        statistics.mean(latency_list),
+                    )
+                )
+    finally:
+        server_process.terminate()
+        server_process.wait()
+        shutil.rmtree(socket_dirpath)
+
+
+if __name__ == "__main__":
+    main()
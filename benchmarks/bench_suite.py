@@ -0,0 +1,239 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ====================================================
+# Copyright 2018 Christopher Simpkins
+# MIT License
+# ====================================================
+
+"""
+Benchmark suite of the ufodiff delta, diff, report rendering, kerning, and UFO path
+classification code on synthetic UFO source git repositories of increasing size
+(see synthetic_repo.py).  Reports the median time of each benchmark and writes the
+results to a JSON file that can be compared with the results of other ufodiff
+releases with the --compare option.
+
+Benchmarks:
+ - delta.<engine>   : Delta commit history comparison of all commits with the
+                      subprocess, inprocess, and ufotree engines
+ - delta.branch     : Delta comparison with the initial commit `base` branch
+ - diff.commits_1   : streamed diffnc text diff of the last commit
+ - render.<format>  : text, json, jsonl, and markdown delta report rendering of the
+                      delta.subprocess comparison, and text rendering with glyph names
+ - kerning.commits_1: kerning.plist pair comparison of the last commit
+ - classifier       : UfoPathClassifier.classify_many on all repository filepaths
+
+Usage:
+  python benchmarks/bench_suite.py [--sizes small,medium] [--runs 5]
+    [--output results.json] [--compare previous.json] [--repo-dir PATH]
+"""
+
+import argparse
+import io
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import tempfile
+import time
+
+from synthetic_repo import SyntheticUfoRepository
+from ufodiff.settings import VERSION
+from ufodiff.subcommands.delta import Delta
+from ufodiff.subcommands.diff import Diff
+from ufodiff.subcommands.kerning import KerningDelta
+from ufodiff.utilities.gitdelta import ENGINES
+from ufodiff.utilities.ufo import UfoPathClassifier
+
+RESULTS_FORMAT_VERSION = 1
+# synthetic repository parameters of the benchmark sizes
+SIZES = {
+    "small": SyntheticUfoRepository(
+        ufo_number=1, glyph_number=500, kerning_pair_number=1000, commit_number=10
+    ),
+    "medium": SyntheticUfoRepository(
+        ufo_number=2, glyph_number=5000, kerning_pair_number=20000, commit_number=20
+    ),
+    # about 100k files and a 1.4 GB fast-import stream, the repository generation
+    # takes a few minutes, reuse the repository with --repo-dir
+    "large": SyntheticUfoRepository(
+        ufo_number=4, glyph_number=20000, kerning_pair_number=100000, commit_number=30
+    ),
+}
+DELTA_WRITE_FORMATS = ("text", "json", "jsonl", "markdown")
+
+
+def time_function(function, runs):
+    """
+    :param function: function without arguments
+    :param runs: (int) number of timed calls
+    :return: (dict) median and min time in milliseconds and number of runs
+    """
+    elapsed_list = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        function()
+        elapsed_list.append((time.perf_counter() - start) * 1000)
+    return {
+        "median_ms": round(statistics.median(elapsed_list), 3),
+        "min_ms": round(min(elapsed_list), 3),
+        "runs": runs,
+    }
+
+
+def get_benchmark_function_dict(repo_path, commit_number, filepath_list):
+    """
+    :param repo_path: (string) path of a synthetic UFO source git repository
+    :param commit_number: (int) number of commits that follow the initial commit
+    :param filepath_list: (list) repository filepaths
+    :return: (dict) benchmark name : function without arguments
+    """
+    all_commits_kwargs = {"is_commit_test": True, "commit_number": str(commit_number)}
+    benchmark_function_dict = {}
+    for engine in ENGINES:
+        benchmark_function_dict["delta." + engine] = lambda engine=engine: Delta(
+            repo_path, [], engine=engine, **all_commits_kwargs
+        )
+    benchmark_function_dict["delta.branch"] = lambda: Delta(
+        repo_path, [], is_branch_test=True, compare_branch_name="base"
+    )
+    benchmark_function_dict["diff.commits_1"] = lambda: sum(
+        1
+        for _ in Diff(repo_path, stream_diff=True).get_diff_string_generator(
+            "commits:1"
+        )
+    )
+    # report rendering of a delta that is collected once
+    delta = Delta(repo_path, [], **all_commits_kwargs)
+    for write_format in DELTA_WRITE_FORMATS:
+        benchmark_function_dict["render." + write_format] = (
+            lambda write_format=write_format: delta.get_writer(write_format).write(
+                io.StringIO()
+            )
+        )
+    glyph_names_delta = Delta(repo_path, [], glyph_names=True, **all_commits_kwargs)
+    benchmark_function_dict["render.text_glyph_names"] = lambda: (
+        glyph_names_delta.get_writer("text").write(io.StringIO())
+    )
+    benchmark_function_dict["kerning.commits_1"] = (
+        lambda: KerningDelta(repo_path, [], is_commit_test=True, commit_number="1")
+        .get_writer("json")
+        .write(io.StringIO())
+    )
+    benchmark_function_dict["classifier"] = lambda: UfoPathClassifier().classify_many(
+        filepath_list
+    )
+    return benchmark_function_dict
+
+
+def run_size(size_name, repository, repo_dir, runs):
+    """
+    Creates or reuses the synthetic repository of a benchmark size and runs the
+    benchmarks
+    :return: (dict) size result
+    """
+    repo_path = os.path.join(repo_dir, size_name)
+    if os.path.isdir(os.path.join(repo_path, ".git")):
+        generation_ms = None
+    else:
+        start = time.perf_counter()
+        repository.write(repo_path)
+        generation_ms = round((time.perf_counter() - start) * 1000, 1)
+    head_sha1 = (
+        subprocess.check_output(["git", "-C", repo_path, "rev-parse", "HEAD"])
+        .decode("ascii")
+        .strip()
+    )
+    filepath_list = (
+        subprocess.check_output(["git", "-C", repo_path, "ls-files", "-z"])
+        .decode("utf-8")
+        .split("\0")[:-1]
+    )
+    benchmark_dict = {}
+    for name, function in get_benchmark_function_dict(
+        repo_path, repository.commit_number, filepath_list
+    ).items():
+        function()  # warm up the git object and file system caches
+        benchmark_dict[name] = time_function(function, runs)
+    return {
+        "parameters": repository.get_parameter_dict(),
+        "head": head_sha1,
+        "files": len(filepath_list),
+        "generation_ms": generation_ms,
+        "benchmarks": benchmark_dict,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", default="small,medium")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--output", help="JSON results file path")
+    parser.add_argument("--compare", help="JSON results file of a previous run")
+    parser.add_argument(
+        "--repo-dir",
+        help="directory of the synthetic repositories, reused in later runs "
+        "(default: temporary directory)",
+    )
+    args = parser.parse_args()
+
+    size_name_list = args.sizes.split(",")
+    for size_name in size_name_list:
+        if size_name not in SIZES:
+            parser.error(
+                "unknown size '{}', sizes: {}".format(size_name, ", ".join(SIZES))
+            )
+    previous_size_dict = {}
+    if args.compare:
+        with open(args.compare) as f:
+            previous_size_dict = json.load(f)["sizes"]
+
+    if args.repo_dir:
+        repo_dir = args.repo_dir
+        if not os.path.isdir(repo_dir):
+            os.makedirs(repo_dir)
+    else:
+        repo_dir = tempfile.mkdtemp(prefix="ufodiff-bench-")
+    results_dict = {
+        "format": RESULTS_FORMAT_VERSION,
+        "ufodiff": VERSION,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "git": subprocess.check_output(["git", "--version"]).decode("ascii").strip(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "sizes": {},
+    }
+    try:
+        for size_name in size_name_list:
+            size_dict = run_size(size_name, SIZES[size_name], repo_dir, args.runs)
+            results_dict["sizes"][size_name] = size_dict
+            previous_benchmark_dict = previous_size_dict.get(size_name, {}).get(
+                "benchmarks", {}
+            )
+            print(
+                "{}: {} files   HEAD: {}".format(
+                    size_name, size_dict["files"], size_dict["head"][:10]
+                )
+            )
+            for name, timing_dict in size_dict["benchmarks"].items():
+                line = "  {:<26} {:>10.2f} ms".format(name, timing_dict["median_ms"])
+                if name in previous_benchmark_dict:
+                    line += "   {:>6.2f}x previous".format(
+                        timing_dict["median_ms"]
+                        / max(previous_benchmark_dict[name]["median_ms"], 0.001)
+                    )
+                print(line)
+    finally:
+        if not args.repo_dir:
+            shutil.rmtree(repo_dir)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results_dict, f, indent=2, sort_keys=True)
+            f.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,491 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ====================================================
+# Copyright 2018 Christopher Simpkins
+# MIT License
+# ====================================================
+
+"""
+Creates reproducible synthetic UFO source git repositories for the ufodiff
+benchmarks.  The repository includes N UFO sources with G glyphs, K kerning pairs,
+additional glyph layers, and data / images directory files.  The initial commit is
+followed by C commits with a configurable churn: in each commit and UFO source a
+fraction of the glyphs, layer glyphs, and kerning pairs is modified, one glyph is
+added, one glyph is deleted, and one data file, one image file, the fontinfo.plist
+file, and a README.md file outside of the UFO sources are modified.
+
+The repository is written with a single `git fast-import` stream, commit dates and
+the pseudo-random choices are fixed so that the same parameters create the same
+commit SHA1s.  The `base` branch points to the initial commit.
+
+Usage:
+  python benchmarks/synthetic_repo.py PATH [--ufos 2] [--glyphs 5000]
+    [--kerning 20000] [--commits 20] [--churn 0.05] [--layers 1] [--data 10]
+    [--images 5] [--seed 0]
+"""
+
+import argparse
+import random
+import subprocess
+import time
+from xml.sax.saxutils import escape
+
+from bench_glif import make_glif_data
+
+GLIF_CONTOUR_NUMBER = 4
+GLIF_POINT_NUMBER = 12
+# kerning pairs per first glyph of the kerning.plist files
+KERNING_SECOND_NUMBER = 64
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+PLIST_HEADER = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" '
+    '"http://www.apple.com/DTDs/PropertyList-1.0.dtd">\n'
+    '<plist version="1.0">'
+)
+
+
+class SyntheticUfoRepository(object):
+    """
+    Definition of a synthetic UFO source git repository
+
+    :param ufo_number: (int) number of UFO sources
+    :param glyph_number: (int) number of glyphs per UFO source in the initial commit
+    :param kerning_pair_number: (int) number of kerning pairs per UFO source
+    :param commit_number: (int) number of commits that follow the initial commit
+    :param churn: (float) fraction of the glyphs, layer glyphs, and kerning pairs that
+     is modified in each commit
+    :param layer_number: (int) number of glyph layers in addition to the default
+     layer, each layer includes every fourth glyph
+    :param data_file_number: (int) number of data directory files per UFO source
+    :param image_file_number: (int) number of images directory files per UFO source
+    :param seed: (int) seed of the pseudo-random glyph and kerning pair choices
+    """
+
+    def __init__(
+        self,
+        ufo_number=2,
+        glyph_number=5000,
+        kerning_pair_number=20000,
+        commit_number=20,
+        churn=0.05,
+        layer_number=1,
+        data_file_number=10,
+        image_file_number=5,
+        seed=0,
+    ):
+        self.ufo_number = ufo_number
+        self.glyph_number = glyph_number
+        self.kerning_pair_number = kerning_pair_number
+        self.commit_number = commit_number
+        self.churn = churn
+        self.layer_number = layer_number
+        self.data_file_number = data_file_number
+        self.image_file_number = image_file_number
+        self.seed = seed
+
+    def get_parameter_dict(self):
+        """
+        :return: (dict) repository parameter name : value pairs
+        """
+        return {
+            "ufos": self.ufo_number,
+            "glyphs": self.glyph_number,
+            "kerning": self.kerning_pair_number,
+            "commits": self.commit_number,
+            "churn": self.churn,
+            "layers": self.layer_number,
+            "data": self.data_file_number,
+            "images": self.image_file_number,
+            "seed": self.seed,
+        }
+
+    def write(self, repo_path):
+        """
+        Creates the git repository and checks out the master branch
+        :param repo_path: (string) path of the new git repository directory
+        :return: (string) SHA1 of the last commit
+        """
+        subprocess.check_call(["git", "init", "-q", repo_path])
+        process = subprocess.Popen(
+            ["git", "-C", repo_path, "fast-import", "--quiet"], stdin=subprocess.PIPE
+        )
+        try:
+            _SyntheticHistoryWriter(self, process.stdin).write()
+        finally:
+            process.stdin.close()
+        if process.wait() != 0:
+            raise subprocess.CalledProcessError(process.returncode, "git fast-import")
+        subprocess.check_call(["git", "-C", repo_path, "checkout", "-q", "master"])
+        return (
+            subprocess.check_output(["git", "-C", repo_path, "rev-parse", "HEAD"])
+            .decode("ascii")
+            .strip()
+        )
+
+
+class _SyntheticUfoState(object):
+    """Current glyph, kerning, and file revision state of a synthetic UFO source"""
+
+    def __init__(self, ufo_path, repository, rng):
+        self.ufo_path = ufo_path
+        self.glyph_index_list = list(range(repository.glyph_number))
+        # glyph index : revision number, modifications alternate the point number
+        self.glyph_revision_dict = {}
+        self.layer_name_list = [
+            "glyphs.layer{}".format(index + 1)
+            for index in range(repository.layer_number)
+        ]
+        self.layer_glyph_index_list = list(range(0, repository.glyph_number, 4))
+        self.layer_glyph_revision_dict = {}
+        self.kerning_dict = {}
+        first_number = -(-repository.kerning_pair_number // KERNING_SECOND_NUMBER)
+        pair_number = 0
+        for first_index in range(first_number):
+            second_dict = self.kerning_dict[get_glyph_name(first_index)] = {}
+            for second_index in range(KERNING_SECOND_NUMBER):
+                if pair_number == repository.kerning_pair_number:
+                    break
+                second_glyph_index = (first_index * 7 + second_index) % max(
+                    repository.glyph_number, KERNING_SECOND_NUMBER
+                )
+                second_dict[get_glyph_name(second_glyph_index)] = rng.randrange(
+                    -100, 100, 5
+                )
+                pair_number += 1
+
+
+class _SyntheticHistoryWriter(object):
+    """Writes the `git fast-import` stream of a SyntheticUfoRepository"""
+
+    def __init__(self, repository, outstream):
+        self.repository = repository
+        self.outstream = outstream
+        self.rng = random.Random(repository.seed)
+        self.ufo_state_list = [
+            _SyntheticUfoState(
+                "source/Test-{}.ufo".format(index + 1), repository, self.rng
+            )
+            for index in range(repository.ufo_number)
+        ]
+
+    def _write_file(self, filepath, data):
+        self.outstream.write(b"M 100644 inline " + filepath.encode("utf-8") + b"\n")
+        self.outstream.write(
+            b"data " + str(len(data)).encode("ascii") + b"\n" + data + b"\n"
+        )
+
+    def _write_commit_header(self, commit_index):
+        message = "commit {}".format(commit_index).encode("utf-8")
+        self.outstream.write(b"commit refs/heads/master\n")
+        self.outstream.write(b"mark :" + str(commit_index + 1).encode("ascii") + b"\n")
+        self.outstream.write(
+            b"committer ufodiff <ufodiff@example.com> "
+            + str(1500000000 + commit_index * 3600).encode("ascii")
+            + b" +0000\n"
+        )
+        self.outstream.write(
+            b"data " + str(len(message)).encode("ascii") + b"\n" + message + b"\n"
+        )
+
+    def _write_glyph(self, ufo_state, layer_name, glyph_index, revision):
+        self._write_file(
+            "{}/{}/{}.glif".format(
+                ufo_state.ufo_path, layer_name, get_glyph_name(glyph_index)
+            ),
+            make_glif_data(
+                glyph_index, GLIF_CONTOUR_NUMBER, GLIF_POINT_NUMBER + revision % 2
+            ),
+        )
+
+    def _write_glyph_index_files(self, ufo_state):
+        # contents.plist and the lib.plist glyph order change with added and
+        # deleted glyphs
+        glyph_name_list = [
+            get_glyph_name(glyph_index) for glyph_index in ufo_state.glyph_index_list
+        ]
+        self._write_file(
+            ufo_state.ufo_path + "/glyphs/contents.plist",
+            make_plist_data(
+                {glyph_name: glyph_name + ".glif" for glyph_name in glyph_name_list}
+            ),
+        )
+        self._write_file(
+            ufo_state.ufo_path + "/lib.plist",
+            make_plist_data({"public.glyphOrder": glyph_name_list}),
+        )
+
+    def _write_fontinfo(self, ufo_state, commit_index):
+        self._write_file(
+            ufo_state.ufo_path + "/fontinfo.plist",
+            make_plist_data(
+                {
+                    "familyName": "Test",
+                    "styleName": ufo_state.ufo_path.split("/")[-1][:-4],
+                    "unitsPerEm": 1000,
+                    "versionMajor": 1,
+                    "versionMinor": commit_index,
+                }
+            ),
+        )
+
+    def _write_data_file(self, ufo_state, file_index, commit_index):
+        self._write_file(
+            "{}/data/com.example.ufodiff/data{}.txt".format(
+                ufo_state.ufo_path, file_index
+            ),
+            "data file {} revision {}\n".format(file_index, commit_index).encode(
+                "utf-8"
+            ),
+        )
+
+    def _write_image_file(self, ufo_state, file_index, commit_index):
+        self._write_file(
+            "{}/images/image{}.png".format(ufo_state.ufo_path, file_index),
+            PNG_SIGNATURE
+            + bytes(
+                (file_index * 31 + commit_index * 17 + index) % 256
+                for index in range(512)
+            ),
+        )
+
+    def _write_initial_ufo(self, ufo_state):
+        repository = self.repository
+        ufo_path = ufo_state.ufo_path
+        self._write_file(
+            ufo_path + "/metainfo.plist",
+            make_plist_data({"creator": "com.example.ufodiff", "formatVersion": 3}),
+        )
+        self._write_fontinfo(ufo_state, 0)
+        self._write_file(
+            ufo_path + "/groups.plist",
+            make_plist_data(
+                {
+                    "public.kern1.A": [get_glyph_name(index) for index in range(4)],
+                    "public.kern2.B": [get_glyph_name(index) for index in range(4, 8)],
+                }
+            ),
+        )
+        self._write_file(
+            ufo_path + "/kerning.plist", make_plist_data(ufo_state.kerning_dict)
+        )
+        self._write_file(ufo_path + "/features.fea", b"languagesystem DFLT dflt;\n")
+        self._write_file(
+            ufo_path + "/layercontents.plist",
+            make_plist_data(
+                [["public.default", "glyphs"]]
+                + [
+                    [layer_name[7:], layer_name]
+                    for layer_name in ufo_state.layer_name_list
+                ]
+            ),
+        )
+        self._write_glyph_index_files(ufo_state)
+        for glyph_index in ufo_state.glyph_index_list:
+            self._write_glyph(ufo_state, "glyphs", glyph_index, 0)
+        layer_glyph_name_list = [
+            get_glyph_name(glyph_index)
+            for glyph_index in ufo_state.layer_glyph_index_list
+        ]
+        for layer_name in ufo_state.layer_name_list:
+            self._write_file(
+                "{}/{}/contents.plist".format(ufo_path, layer_name),
+                make_plist_data(
+                    {
+                        glyph_name: glyph_name + ".glif"
+                        for glyph_name in layer_glyph_name_list
+                    }
+                ),
+            )
+            self._write_file(
+                "{}/{}/layerinfo.plist".format(ufo_path, layer_name),
+                make_plist_data({"color": "0,0,1,1"}),
+            )
+            for glyph_index in ufo_state.layer_glyph_index_list:
+                self._write_glyph(ufo_state, layer_name, glyph_index, 0)
+        for file_index in range(repository.data_file_number):
+            self._write_data_file(ufo_state, file_index, 0)
+        for file_index in range(repository.image_file_number):
+            self._write_image_file(ufo_state, file_index, 0)
+
+    def _write_ufo_changes(self, ufo_state, commit_index):
+        repository = self.repository
+        rng = self.rng
+        # modified glyphs
+        modified_number = int(len(ufo_state.glyph_index_list) * repository.churn)
+        modified_glyph_index_list = rng.sample(
+            ufo_state.glyph_index_list, modified_number
+        )
+        for glyph_index in modified_glyph_index_list:
+            revision = ufo_state.glyph_revision_dict.get(glyph_index, 0) + 1
+            ufo_state.glyph_revision_dict[glyph_index] = revision
+            self._write_glyph(ufo_state, "glyphs", glyph_index, revision)
+        # modified layer glyphs
+        for layer_name in ufo_state.layer_name_list:
+            for glyph_index in rng.sample(
+                ufo_state.layer_glyph_index_list,
+                int(len(ufo_state.layer_glyph_index_list) * repository.churn),
+            ):
+                revision_key = (layer_name, glyph_index)
+                revision = ufo_state.layer_glyph_revision_dict.get(revision_key, 0) + 1
+                ufo_state.layer_glyph_revision_dict[revision_key] = revision
+                self._write_glyph(ufo_state, layer_name, glyph_index, revision)
+        # one added and one deleted glyph
+        added_glyph_index = repository.glyph_number + commit_index - 1
+        self._write_glyph(ufo_state, "glyphs", added_glyph_index, 0)
+        modified_glyph_index_set = set(modified_glyph_index_list)
+        deleted_glyph_index = rng.choice(
+            [
+                glyph_index
+                for glyph_index in ufo_state.glyph_index_list
+                if glyph_index not in modified_glyph_index_set
+            ]
+        )
+        ufo_state.glyph_index_list.remove(deleted_glyph_index)
+        ufo_state.glyph_index_list.append(added_glyph_index)
+        self.outstream.write(
+            "D {}/glyphs/{}.glif\n".format(
+                ufo_state.ufo_path, get_glyph_name(deleted_glyph_index)
+            ).encode("utf-8")
+        )
+        self._write_glyph_index_files(ufo_state)
+        # modified kerning pair values
+        kerning_pair_list = [
+            (first, second)
+            for first, second_dict in ufo_state.kerning_dict.items()
+            for second in second_dict
+        ]
+        for first, second in rng.sample(
+            kerning_pair_list, int(len(kerning_pair_list) * repository.churn)
+        ):
+            ufo_state.kerning_dict[first][second] += 5
+        if len(kerning_pair_list) > 0:
+            self._write_file(
+                ufo_state.ufo_path + "/kerning.plist",
+                make_plist_data(ufo_state.kerning_dict),
+            )
+        # modified fontinfo.plist, data, and images files
+        self._write_fontinfo(ufo_state, commit_index)
+        if repository.data_file_number > 0:
+            self._write_data_file(
+                ufo_state, commit_index % repository.data_file_number, commit_index
+            )
+        if repository.image_file_number > 0:
+            self._write_image_file(
+                ufo_state, commit_index % repository.image_file_number, commit_index
+            )
+
+    def write(self):
+        self._write_commit_header(0)
+        self._write_file("README.md", b"Synthetic UFO source repository\n")
+        for ufo_state in self.ufo_state_list:
+            self._write_initial_ufo(ufo_state)
+        self.outstream.write(b"\n")
+        for commit_index in range(1, self.repository.commit_number + 1):
+            self._write_commit_header(commit_index)
+            self._write_file(
+                "README.md", "revision {}\n".format(commit_index).encode("utf-8")
+            )
+            for ufo_state in self.ufo_state_list:
+                self._write_ufo_changes(ufo_state, commit_index)
+            self.outstream.write(b"\n")
+        self.outstream.write(b"reset refs/heads/base\nfrom :1\n\n")
+
+
+def _escape(text):
+    if "&" in text or "<" in text or ">" in text:
+        return escape(text)
+    return text
+
+
+def _get_plist_leaf_line(value, indent):
+    # None for dict and list values
+    if isinstance(value, str):
+        return "{}<string>{}</string>".format(indent, _escape(value))
+    if isinstance(value, int):
+        return "{}<integer>{}</integer>".format(indent, value)
+    return None
+
+
+def _append_plist_value_lines(line_list, value, indent):
+    # dict and list leaf values are appended without a recursive call
+    append = line_list.append
+    item_indent = indent + "\t"
+    if isinstance(value, dict):
+        append(indent + "<dict>")
+        for key in sorted(value):
+            append("{}<key>{}</key>".format(item_indent, _escape(key)))
+            line = _get_plist_leaf_line(value[key], item_indent)
+            if line is None:
+                _append_plist_value_lines(line_list, value[key], item_indent)
+            else:
+                append(line)
+        append(indent + "</dict>")
+    elif isinstance(value, list):
+        append(indent + "<array>")
+        for item in value:
+            line = _get_plist_leaf_line(item, item_indent)
+            if line is None:
+                _append_plist_value_lines(line_list, item, item_indent)
+            else:
+                append(line)
+        append(indent + "</array>")
+    else:
+        append(_get_plist_leaf_line(value, indent))
+
+
+def make_plist_data(value):
+    """
+    Returns XML property list bytes of dict, list, string, and integer values in the
+    plistlib.dumps format.  plistlib serialization is the largest part of the
+    generation time of repositories with large contents.plist and kerning.plist
+    files.
+    """
+    line_list = [PLIST_HEADER]
+    _append_plist_value_lines(line_list, value, "")
+    line_list.extend(["</plist>", ""])
+    return "\n".join(line_list).encode("utf-8")
+
+
+def get_glyph_name(glyph_index):
+    """Returns the glyph name of the make_glif_data *.glif data of a glyph index"""
+    return "uni{:04X}".format(0x4E00 + glyph_index)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("path")
+    parser.add_argument("--ufos", type=int, default=2)
+    parser.add_argument("--glyphs", type=int, default=5000)
+    parser.add_argument("--kerning", type=int, default=20000)
+    parser.add_argument("--commits", type=int, default=20)
+    parser.add_argument("--churn", type=float, default=0.05)
+    parser.add_argument("--layers", type=int, default=1)
+    parser.add_argument("--data", type=int, default=10)
+    parser.add_argument("--images", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    repository = SyntheticUfoRepository(
+        ufo_number=args.ufos,
+        glyph_number=args.glyphs,
+        kerning_pair_number=args.kerning,
+        commit_number=args.commits,
+        churn=args.churn,
+        layer_number=args.layers,
+        data_file_number=args.data,
+        image_file_number=args.images,
+        seed=args.seed,
+    )
+    start = time.perf_counter()
+    head_sha1 = repository.write(args.path)
+    print(
+        "{}   HEAD: {}   time: {:.1f} s".format(
+            args.path, head_sha1, time.perf_counter() - start
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ====================================================
+# Copyright 2018 Christopher Simpkins
+# MIT License
+# ====================================================
+
+"""
+The api.py module defines the ufodiff Python API.  Comparisons return structured
+DeltaResult objects rather than formatted report strings, so integrations do not
+serialize and parse a JSON report to read the changed files.
+
+    from ufodiff import api
+
+    result = api.delta("path/to/repository", "v1.0", "v1.1", ["Test-Regular.ufo"])
+    for record in result:
+        print(record.change, record.path, record.ufo, record.layer, record.category)
+    glyph_filepaths = [record.path for record in result.modified
+                       if record.category == api.GLYPH]
+
+DeltaResult iteration creates one DeltaRecord per file on demand.  DeltaRecord
+objects are named tuples with the path, change, ufo, layer, and category fields.
+"""
+
+from git import Repo
+
+from ufodiff.subcommands.delta import Delta
+from ufodiff.utilities.deltarecords import (
+    ADDED,
+    CHANGE_TYPES,
+    DELETED,
+    MODIFIED,
+    DeltaRecord,
+    DeltaResult,
+)
+from ufodiff.utilities.gitdelta import SUBPROCESS_ENGINE
+from ufodiff.utilities.ufo import UfoPathClassifier
+
+__all__ = [
+    "ADDED",
+    "CHANGE_TYPES",
+    "DATA",
+    "DELETED",
+    "GLYPH",
+    "IMAGE",
+    "LAYER",
+    "MODIFIED",
+    "NONGLYPH",
+    "DeltaRecord",
+    "DeltaResult",
+    "delta",
+]
+
+# DeltaRecord category values
+GLYPH = UfoPathClassifier.GLYPH
+NONGLYPH = UfoPathClassifier.NONGLYPH
+LAYER = UfoPathClassifier.LAYER
+DATA = UfoPathClassifier.DATA
+IMAGE = UfoPathClassifier.IMAGE
+
+
+def delta(
+    repo,
+    base,
+    head="HEAD",
+    filters=None,
+    file_filter=None,
+    engine=SUBPROCESS_ENGINE,
+    use_cache=False,
+):
+    """
+    Compares the UFO source files of two git revisions
+    :param repo: (string) path to root of git repository or a GitPython Repo object
+    :param base: (string) base git revision (e.g. branch name, tag, commit SHA1,
+     'HEAD~2')
+    :param head: (string) head git revision
+    :param filters: (list) *.ufo directory filters (e.g. ['Test-Regular.ufo']), None
+     for all UFO sources
+    :param file_filter: (string) 'glyph' for *.glif files only, 'nonglyph' for
+     *.plist and *.fea files only, or None for all UFO source files
+    :param engine: (string) filepath collection engine (see Delta)
+    :param use_cache: (boolean) read and write the persistent delta cache in the
+     `.git/ufodiff` directory
+    :return: (ufodiff.utilities.deltarecords.DeltaResult) structured result
+    :raises: ValueError for invalid engine or file_filter values,
+     git.exc.GitCommandError or gitdb.exc.BadName for invalid revisions
+    """
+    if isinstance(repo, Repo):
+        gitrepo_path = repo.working_tree_dir
+    else:
+        gitrepo_path = repo
+        repo = None
+    return Delta(
+        gitrepo_path,
+        list(filters or []),
+        is_branch_test=True,
+        compare_branch_name=base,
+        head_branch_name=head,
+        engine=engine,
+        use_cache=use_cache,
+        file_filter=file_filter,
+        repo=repo,
+    ).get_delta_result()
@@ -25,9 +25,20 @@ from standardstreams import stderr, stdout
 from ufodiff import (
     settings,
 )  # defines application version, help string, version string, usage string
-from ufodiff.subcommands.delta import Delta
-from ufodiff.subcommands.diff import Diff
 from ufodiff.utilities import dir_exists
+from ufodiff.utilities.gitdelta import ENGINES, SUBPROCESS_ENGINE
+
+# The subcommand modules import GitPython and are imported in the subcommand
+# branches of main() after argument validation.  Help, version, usage, and argument
+# validation error requests do not import GitPython.
+
+# report formats of the delta subcommands
+DELTA_WRITE_FORMATS = {
+    "delta": "text",
+    "deltajson": "json",
+    "deltajsonl": "jsonl",
+    "deltamd": "markdown",
+}
 
 
 def main():
@@ -50,8 +61,8 @@ def main():
         stdout(settings.USAGE)
         sys.exit(0)
 
-    # DELTA + DELTAJSON + DELTAMD sub-commands
-    if c.subcmd in {"delta", "deltajson", "deltamd"}:
+    # DELTA + DELTAJSON + DELTAJSONL + DELTAMD sub-commands
+    if c.subcmd in DELTA_WRITE_FORMATS:
         # argument validation
         validate_delta_commands_args(c)
         # create list for UFO filtered analyses as requested by user
@@ -60,6 +71,58 @@ def main():
             if arg.endswith(".ufo"):
                 ufo_directory_list.append(arg)
 
+        from ufodiff.subcommands.delta import Delta
+
+        # filepath collection engine requested with `--engine=[name]`
+        if c.contains_definitions("engine"):
+            engine = c.get_definition("engine")
+        else:
+            engine = SUBPROCESS_ENGINE
+
+        # persistent delta cache in .git/ufodiff, disabled with `--no-cache`
+        use_cache = not c.contains_switches("no-cache")
+        # *.glif file glyph names from the contents.plist files with `--glyph-names`
+        glyph_names = c.contains_switches("glyph-names")
+        # report format of the subcommand
+        write_format = DELTA_WRITE_FORMATS[c.subcmd]
+
+        # BATCH MODE: one report per range with a shared repository handle
+        if c.arg2 == "batch":
+            from ufodiff.subcommands.batch import DeltaBatch, parse_delta_range
+
+            # ranges that follow the batch argument or one range per stdin line
+            range_list = [
+                arg
+                for arg in c.argv[3:]
+                if not arg.endswith(".ufo") and not arg.startswith("-")
+            ]
+            if len(range_list) == 0:
+                range_list = [
+                    line.strip()
+                    for line in sys.stdin
+                    if line.strip() != "" and not line.startswith("#")
+                ]
+            for range_string in range_list:
+                try:
+                    parse_delta_range(range_string)
+                except ValueError as e:
+                    stderr("[ufodiff] ERROR: " + str(e))
+                    sys.exit(1)
+            delta_batch = DeltaBatch(
+                get_git_root_path(),
+                ufo_directory_list,
+                engine=engine,
+                use_cache=use_cache,
+                glyph_names=glyph_names,
+                file_filter=None if c.arg1 == "all" else c.arg1,
+            )
+            delta_writer = delta_batch.get_writer(range_list, write_format=write_format)
+            if c.contains_definitions("output"):
+                delta_writer.write_file(c.get_definition("output"))
+            else:
+                delta_writer.write(sys.stdout)
+            sys.exit(0)
+
         # flags for type of test
         is_branch_test = False
         is_commits_test = False
@@ -82,41 +145,61 @@ def main():
         # perform the delta analysis on the repository, different object
         # for commits vs branch tests
         if is_commits_test is True:
+            test_kwargs = {"is_commit_test": True, "commit_number": commit_number}
+        elif is_branch_test is True:
+            test_kwargs = {"is_branch_test": True, "compare_branch_name": branch_name}
+
+        if c.arg1 == "all":
             delta = Delta(
                 verified_gitroot_path,
                 ufo_directory_list,
-                is_commit_test=True,
-                commit_number=commit_number,
+                engine=engine,
+                use_cache=use_cache,
+                glyph_names=glyph_names,
+                **test_kwargs
             )
-        elif is_branch_test is True:
+        elif c.arg1 == "kerning":
+            from ufodiff.subcommands.kerning import KerningDelta
+
+            # kerning.plist pair analysis
+            delta = KerningDelta(
+                verified_gitroot_path, ufo_directory_list, **test_kwargs
+            )
+        elif c.arg1 == "groups":
+            from ufodiff.subcommands.groups import GroupsDelta
+
+            # groups.plist membership analysis with affected kerning pairs
+            delta = GroupsDelta(
+                verified_gitroot_path, ufo_directory_list, **test_kwargs
+            )
+        elif c.arg1 in ("glyph", "nonglyph"):
+            # *.glif only or *.plist / *.fea only, filtered with git pathspecs
             delta = Delta(
                 verified_gitroot_path,
                 ufo_directory_list,
-                is_branch_test=True,
-                compare_branch_name=branch_name,
+                engine=engine,
+                use_cache=use_cache,
+                glyph_names=glyph_names,
+                file_filter=c.arg1,
+                **test_kwargs
             )
 
-        if c.arg1 == "all":
-            if c.subcmd == "delta":
-                sys.stdout.write(delta.get_stdout_string(write_format="text"))
-            elif c.subcmd == "deltajson":
-                sys.stdout.write(delta.get_stdout_string(write_format="json"))
-            elif c.subcmd == "deltamd":
-                sys.stdout.write(delta.get_stdout_string(write_format="markdown"))
-        # TODO: implement glyph only command handling with 'ufo delta glyph'
-        # elif c.arg1 == "glyph":
-        #     pass
-        # TODO: implement nonglyph only command handling with 'ufo delta nonglyph'
-        # elif c.arg1 == "nonglyph":
-        #     pass
+        delta_writer = delta.get_writer(write_format=write_format)
+        # stream the report to a file with `--output=[filepath]` or to stdout
+        if c.contains_definitions("output"):
+            delta_writer.write_file(c.get_definition("output"))
+        else:
+            delta_writer.write(sys.stdout)
     # DIFF SUBCOMMAND
     elif c.subcmd == "diff":
         # argument validation
         validate_diff_commands_args(c)
+        from ufodiff.subcommands.diff import Diff
+
         # execute the command
         try:
             verified_gitroot_path = get_git_root_path()
-            diff = Diff(verified_gitroot_path, color_diff=True)
+            diff = Diff(verified_gitroot_path, color_diff=True, stream_diff=True)
             for diff_string in diff.get_diff_string_generator(c.arg1):
                 stdout(diff_string)
         except Exception as e:
@@ -130,10 +213,12 @@ def main():
     elif c.subcmd == "diffnc":
         # argument validations
         validate_diff_commands_args(c)
+        from ufodiff.subcommands.diff import Diff
+
         # execute the command
         try:
             verified_gitroot_path = get_git_root_path()
-            diff = Diff(verified_gitroot_path, color_diff=False)
+            diff = Diff(verified_gitroot_path, color_diff=False, stream_diff=True)
             for diff_string in diff.get_diff_string_generator(c.arg1):
                 stdout(diff_string)
         except Exception as e:
@@ -143,6 +228,93 @@ def main():
                 + str(e)
             )
             sys.exit(1)
+    # LOG SUBCOMMAND
+    elif c.subcmd == "log":
+        # argument validations
+        validate_log_commands_args(c)
+        from ufodiff.subcommands.log import Log
+
+        # create list for UFO filtered analyses as requested by user
+        ufo_directory_list = []
+        for arg in c.argv:
+            if arg.endswith(".ufo"):
+                ufo_directory_list.append(arg)
+        # execute the command, one JSON line per commit is streamed as git log output
+        # is parsed
+        try:
+            log = Log(get_git_root_path(), ufo_directory_list)
+            log_writer = log.get_writer(c.arg1)
+            if c.contains_definitions("output"):
+                log_writer.write_file(c.get_definition("output"))
+            else:
+                log_writer.write(sys.stdout)
+        except Exception as e:
+            stderr(
+                "[ufodiff] ERROR: Unable to excecute your request. Error returned as: "
+                + os.linesep
+                + str(e)
+            )
+            sys.exit(1)
+    # SERVE SUBCOMMAND
+    elif c.subcmd == "serve":
+        from ufodiff.subcommands.serve import serve
+
+        # daemon for `ufodiff-client` requests with warm repository state
+        gitrepo_path = get_git_root_path()
+        if c.contains_definitions("socket"):
+            socket_path = c.get_definition("socket")
+        else:
+            socket_path = None
+        try:
+            serve(gitrepo_path, socket_path)
+        except Exception as e:
+            stderr(
+                "[ufodiff] ERROR: Unable to start the ufodiff server. Error returned "
+                "as: " + os.linesep + str(e)
+            )
+            sys.exit(1)
+    # GLYPHDIFF + PLISTDIFF SUBCOMMANDS
+    elif c.subcmd in {"glyphdiff", "plistdiff"}:
+        # argument validations
+        validate_glyphdiff_commands_args(c)
+        # create list for UFO filtered analyses as requested by user
+        ufo_directory_list = []
+        for arg in c.argv:
+            if arg.endswith(".ufo"):
+                ufo_directory_list.append(arg)
+        # execute the command
+        try:
+            verified_gitroot_path = get_git_root_path()
+            if c.subcmd == "glyphdiff":
+                from ufodiff.subcommands.glyphdiff import GlyphDiff
+
+                # glyph comparison worker processes requested with `--workers=[N]`
+                if c.contains_definitions("workers"):
+                    workers = int(c.get_definition("workers"))
+                else:
+                    workers = None
+                glyphdiff = GlyphDiff(
+                    verified_gitroot_path, ufo_directory_list, workers=workers
+                )
+                # stream the report to a file with `--output=[filepath]` or to stdout
+                glyphdiff_writer = glyphdiff.get_writer(c.arg1)
+                if c.contains_definitions("output"):
+                    glyphdiff_writer.write_file(c.get_definition("output"))
+                else:
+                    glyphdiff_writer.write(sys.stdout)
+            else:
+                from ufodiff.subcommands.plistdiff import PlistDiff
+
+                plistdiff = PlistDiff(verified_gitroot_path, ufo_directory_list)
+                for diff_string in plistdiff.get_plist_diff_string_generator(c.arg1):
+                    stdout(diff_string)
+        except Exception as e:
+            stderr(
+                "[ufodiff] ERROR: Unable to excecute your request. Error returned as: "
+                + os.linesep
+                + str(e)
+            )
+            sys.exit(1)
     # # DIFF-FILE SUBCOMMAND
     # user specified file/directory filters on the diff performed
     # elif c.subcmd == "diff-filter":
@@ -158,7 +330,7 @@ def main():
 
 def validate_delta_commands_args(command_obj):
     """
-    Validates arguments for any delta/deltajson/deltamd command requested
+    Validates arguments for any delta/deltajson/deltajsonl/deltamd command requested
     by user. It provides user error messages and raises SystemExit for
     erroneous command entry at the command line.
 
@@ -166,7 +338,7 @@ def validate_delta_commands_args(command_obj):
     :return: no return object, SystemExit raised for all errors detected
     """
     # used in command line argument validations
-    acceptable_deltacommands = ["all"]
+    acceptable_deltacommands = ["all", "glyph", "nonglyph", "kerning", "groups"]
     # Command line argument validations
     if command_obj.argc < 3:  # expected argument number
         stderr("[ufodiff] ERROR: Missing arguments.")
@@ -185,7 +357,42 @@ def validate_delta_commands_args(command_obj):
         for acceptable_deltacommand in acceptable_deltacommands:
             stderr(" " + acceptable_deltacommand)
         sys.exit(1)
-    if command_obj.arg2.startswith("commits:"):
+    if command_obj.arg0 == "deltajsonl" and command_obj.arg1 in ("kerning", "groups"):
+        stderr(
+            "[ufodiff] ERROR: The deltajsonl format is available for the all, glyph, "
+            "and nonglyph reports"
+        )
+        sys.exit(1)
+    if command_obj.arg1 in ("kerning", "groups"):
+        # *.plist content reports, the options of the filepath delta reports are
+        # not used
+        option_list = [
+            option
+            for option in ("engine", "workers")
+            if command_obj.contains_definitions(option)
+        ] + [
+            switch
+            for switch in ("no-cache", "glyph-names")
+            if command_obj.contains_switches(switch)
+        ]
+        if len(option_list) > 0:
+            stderr(
+                "[ufodiff] ERROR: The '--"
+                + option_list[0]
+                + "' option is not available for the "
+                + command_obj.arg1
+                + " report"
+            )
+            sys.exit(1)
+    if command_obj.arg2 == "batch":
+        # ranges are validated after they are read from the arguments or stdin
+        if command_obj.arg1 not in ("all", "glyph", "nonglyph"):
+            stderr(
+                "[ufodiff] ERROR: Batch mode is available for the all, glyph, and "
+                "nonglyph reports"
+            )
+            sys.exit(1)
+    elif command_obj.arg2.startswith("commits:"):
         commits_list = command_obj.arg2.split(":")
         if (
             len(commits_list) == 2 and commits_list[1] == ""
@@ -208,10 +415,19 @@ def validate_delta_commands_args(command_obj):
             sys.exit(1)
     else:
         stderr(
-            "[ufodiff] ERROR: Please include either the 'commits:' or "
-            "'branch:' argument in the command"
+            "[ufodiff] ERROR: Please include either the 'commits:', "
+            "'branch:', or 'batch' argument in the command"
         )
         sys.exit(1)
+    if command_obj.contains_definitions("engine"):
+        if command_obj.get_definition("engine") not in ENGINES:
+            stderr(
+                "[ufodiff] ERROR: '"
+                + command_obj.get_definition("engine")
+                + "' is not a valid engine. Acceptable engines include: "
+                + ", ".join(ENGINES)
+            )
+            sys.exit(1)
 
 
 def validate_diff_commands_args(command_obj):
@@ -249,6 +465,65 @@ def validate_diff_commands_args(command_obj):
             sys.exit(1)
 
 
+def validate_log_commands_args(command_obj):
+    """
+    Validates arguments for the log command requested by user.  It provides user
+    error messages and raises SystemExit for erroneous command entry at the command
+    line.
+
+    :param command_obj: a commandlines library Command object
+    :return: no return object, SystemExit raised for all errors detected
+    """
+    if command_obj.argc < 2:
+        stderr("[ufodiff] ERROR: Missing arguments.")
+        sys.exit(1)
+    if command_obj.arg1.startswith("commits:"):
+        validate_commit_number(command_obj.arg1.split(":", 1)[1])
+    elif command_obj.arg1.startswith("branch:"):
+        if len(command_obj.arg1) < 8:
+            stderr(
+                "[ufodiff] ERROR: Please include the name of a git branch "
+                "following the colon in the 'branch:[name]' argument"
+            )
+            sys.exit(1)
+    elif ".." not in command_obj.arg1:
+        stderr(
+            "[ufodiff] ERROR: Please include the 'commits:[N]', 'branch:[name]', or "
+            "'[base]..[head]' argument in the command"
+        )
+        sys.exit(1)
+
+
+def validate_glyphdiff_commands_args(command_obj):
+    """
+    Validates arguments for the glyphdiff and plistdiff commands requested by user.  It
+    provides user error messages and raises SystemExit for erroneous command entry at
+    the command line.
+
+    :param command_obj: a commandlines library Command object
+    :return: no return object, SystemExit raised for all errors detected
+    """
+    # commits:[N] and branch:[name] validations are shared with diff/diffnc
+    validate_diff_commands_args(command_obj)
+    if not (
+        command_obj.arg1.startswith("commits:")
+        or command_obj.arg1.startswith("branch:")
+    ):
+        stderr(
+            "[ufodiff] ERROR: Please include either the 'commits:' or "
+            "'branch:' argument in the command"
+        )
+        sys.exit(1)
+    if command_obj.contains_definitions("workers"):
+        workers = command_obj.get_definition("workers")
+        if not workers.isdigit() or int(workers) == 0:
+            stderr(
+                "[ufodiff] ERROR: The value of the '--workers' option should be an "
+                "integer value over zero"
+            )
+            sys.exit(1)
+
+
 def validate_commit_number(commits_number):
     """
     Validates commit number entered by user following `commits:` argument
@@ -274,18 +549,20 @@ def validate_commit_number(commits_number):
         sys.exit(1)
 
 
-def get_git_root_path():
+def get_git_root_path(dirpath="."):
     """
     Recursively searches for git root path over 4 directory levels above working directory
+    :param dirpath: (string) start directory of the search, the working directory by
+     default
     :return: validated git root path as string OR raises SystemExit if not found
     """
     try:
-        # begin by defining current working directory as root of git repository
-        unverified_gitroot_path = os.path.abspath(".")
+        # begin by defining the start directory as root of git repository
+        unverified_gitroot_path = os.path.abspath(dirpath)
 
         # check to see if this assumption is correct
         if dir_exists(os.path.join(unverified_gitroot_path, ".git")):
-            verified_gitroot_path = os.path.join(unverified_gitroot_path, ".git")
+            verified_gitroot_path = unverified_gitroot_path
         # if not, recursive search up to three directories above for the git repo root
         else:
             one_level_up = os.path.abspath(
@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ====================================================
+# Copyright 2018 Christopher Simpkins
+# MIT License
+# ====================================================
+
+"""
+The client.py module defines the `ufodiff-client` command line executable.  The
+client forwards `ufodiff` command line arguments to a `ufodiff serve` daemon over a
+local Unix socket and writes the daemon response to the standard output and standard
+error streams.  The module only imports the Python standard library so that the
+client starts without the import of GitPython.
+
+Protocol: one request per connection.  The client sends one JSON object on a single
+line and the daemon responds with one JSON object on a single line.
+
+ request:   {"argv": ["delta", "all", "commits:2"], "cwd": "/path/to/repository"}
+ response:  {"supported": true, "status": 0, "stdout": "...", "stderr": ""}
+
+Requests that the daemon does not support ("supported": false) and requests made
+when the daemon is not running are executed in the client process with the
+`ufodiff` application.
+"""
+
+import contextlib
+import io
+import json
+import os
+import socket
+import sys
+
+SERVE_SOCKET_FILENAME = "serve.sock"
+# socket path definition option of `ufodiff serve` and `ufodiff-client`
+SERVE_SOCKET_OPTION = "--socket="
+
+
+def get_default_socket_path(gitrepo_path):
+    """
+    Defines the default daemon socket path in the `.git/ufodiff` directory
+    :param gitrepo_path: (string) path to root of git repository
+    :return: (string) Unix socket path
+    """
+    # the directory name is DELTA_CACHE_DIRNAME in ufodiff.utilities.deltacache
+    return os.path.join(gitrepo_path, ".git", "ufodiff", SERVE_SOCKET_FILENAME)
+
+
+def get_socket_path(argv, dirpath):
+    """
+    Defines the daemon socket path from the `--socket=[path]` option in argv or the
+    default socket path of the git repository that includes dirpath
+    :param argv: (list) command line arguments
+    :param dirpath: (string) working directory path
+    :return: (string) Unix socket path or None if it is not defined
+    """
+    for arg in argv:
+        if arg.startswith(SERVE_SOCKET_OPTION):
+            return arg.split("=", 1)[1]
+    from ufodiff.app import get_git_root_path
+
+    # requests outside of a git repository are executed and reported in the client
+    # process
+    try:
+        with contextlib.redirect_stderr(io.StringIO()):
+            gitrepo_path = get_git_root_path(dirpath)
+    except SystemExit:
+        return None
+    return get_default_socket_path(gitrepo_path)
+
+
+def send_request(socket_path, argv, cwd, timeout=None):
+    """
+    Sends a request to the `ufodiff serve` daemon and returns the response
+    :param socket_path: (string) daemon Unix socket path
+    :param argv: (list) ufodiff command line arguments without the executable name
+    :param cwd: (string) working directory of the request
+    :param timeout: (float) socket timeout in seconds, None for blocking calls
+    :return: (dict) response dictionary
+    :raises: OSError (socket.error) if the daemon is not available
+    """
+    request_data = json.dumps({"argv": list(argv), "cwd": cwd}) + "\n"
+    client_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client_socket.settimeout(timeout)
+        client_socket.connect(socket_path)
+        client_socket.sendall(request_data.encode("utf-8"))
+        with client_socket.makefile("rb") as response_file:
+            response_line = response_file.readline()
+    finally:
+        client_socket.close()
+    if not response_line.endswith(b"\n"):
+        raise OSError("incomplete response from the ufodiff server on " + socket_path)
+    return json.loads(response_line.decode("utf-8"))
+
+
+def run_local(argv):
+    """
+    Executes a request with the `ufodiff` application in the client process
+    :param argv: (list) ufodiff command line arguments without the executable name
+    :return: no return object, raises SystemExit
+    """
+    from ufodiff.app import main as ufodiff_main
+
+    sys.argv = ["ufodiff"] + list(argv)
+    ufodiff_main()
+
+
+def main():
+    """Defines the logic for the `ufodiff-client` command line executable"""
+    cwd = os.path.abspath(".")
+    socket_path = get_socket_path(sys.argv[1:], cwd)
+    argv = [arg for arg in sys.argv[1:] if not arg.startswith(SERVE_SOCKET_OPTION)]
+    if socket_path is None or not hasattr(socket, "AF_UNIX"):
+        run_local(argv)
+    try:
+        response = send_request(socket_path, argv, cwd)
+    except (OSError, ValueError):
+        # the daemon is not running
+        run_local(argv)
+    if response.get("supported") is not True:
+        run_local(argv)
+    sys.stdout.write(response["stdout"])
+    sys.stderr.write(response["stderr"])
+    sys.exit(response["status"])
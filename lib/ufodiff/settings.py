@@ -36,25 +36,72 @@ Subcommands:
 
 - delta         --- UFO source file add/del/mod report as plain text
    - all
+   - glyph
+   - nonglyph
+   - kerning
+   - groups
 - deltajson     --- UFO source file add/del/mod report as JSON
    - all
+   - glyph
+   - nonglyph
+   - kerning
+   - groups
+- deltajsonl    --- UFO source file add/del/mod report as NDJSON, one line per file
+   - all
+   - glyph
+   - nonglyph
 - deltamd       --- UFO source file add/del/mod report as Markdown
    - all
+   - glyph
+   - nonglyph
+   - kerning
+   - groups
 - diff          --- colored text diff of UFO spec files (only)
 - diffnc        --- uncolored text diff of UFO spec files (only)
+- glyphdiff     --- structural diff of *.glif glyph files
+- log           --- per-commit UFO source file add/del/mod timeline as NDJSON
+- plistdiff     --- key path diff of fontinfo.plist and lib.plist files
+- serve         --- daemon for ufodiff-client requests with warm repository state
 
 Syntax:
-  ufodiff delta all [commits:[N] | branch:[name]] <optional UFO filter>
-  ufodiff deltajson all [commits:[N] | branch:[name]] <optional UFO filter>
-  ufodiff deltamd all [commits:[N] | branch:[name]] <optional UFO filter>
+  ufodiff delta [report] [commits:[N] | branch:[name]] <optional UFO filter>
+  ufodiff deltajson [report] [commits:[N] | branch:[name]] <optional UFO filter>
+  ufodiff deltajsonl [report] [commits:[N] | branch:[name]] <optional UFO filter>
+  ufodiff deltamd [report] [commits:[N] | branch:[name]] <optional UFO filter>
+  ufodiff delta[json|jsonl|md] [report] batch [range ...] <optional UFO filter>
   ufodiff diff [commits:[N] | branch:[name]]
   ufodiff diffnc [commits:[N] | branch:[name]]
+  ufodiff glyphdiff [commits:[N] | branch:[name]] <optional UFO filter>
+  ufodiff log [commits:[N] | branch:[name] | [base]..[head]] <optional UFO filter>
+  ufodiff plistdiff [commits:[N] | branch:[name]] <optional UFO filter>
+  ufodiff serve <optional --socket=[path]>
+  ufodiff-client [ufodiff subcommand and arguments] <optional --socket=[path]>
+
+Options (delta, deltajson, deltajsonl, deltamd):
+  --engine=subprocess   collect file changes with a `git diff` call (default)
+  --engine=inprocess    compare commit trees in-process without git subprocess calls
+  --engine=ufotree      in-process comparison of changed *.ufo directory trees only
+  --output=[filepath]   write the report to a file instead of standard output
+  --no-cache            do not read or write the delta cache in .git/ufodiff
+  --glyph-names         include the glyph names of *.glif files in the reports
+
+Options (glyphdiff):
+  --workers=[N]         number of glyph comparison processes (default: CPU number)
+  --output=[filepath]   write the report to a file instead of standard output
 
 Increase or decrease integer value after the `commits:` argument to analyze across \
 that number of commits in the commit history.
 
 Include an existing git branch for comparison with your current branch after the \
 `branch:` argument.
+
+The serve daemon answers the delta, deltajson, deltajsonl, deltamd (all, glyph, \
+nonglyph) and \
+diff, diffnc requests of ufodiff-client on the .git/ufodiff/serve.sock Unix socket.  \
+Other requests are executed by ufodiff-client.
+
+Batch mode reports each range that follows the `batch` argument (or each line of \
+standard input) in one process.  Ranges: commits:[N], branch:[name], [base]..[head]
 """
 
 # ------------------------------------------------------------------------------
@@ -0,0 +1,246 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ====================================================
+# Copyright 2018 Christopher Simpkins
+# MIT License
+# ====================================================
+
+"""
+The batch.py module defines the DeltaBatch class that evaluates the delta reports of
+multiple revision ranges in one process.  The GitPython Repo object (and its object
+database), the UFO path classifier directory cache, the glyph name index, and the
+current branch name are shared by the Delta objects of all ranges.
+
+Ranges:
+ - commits:[N]     HEAD~N compared with HEAD (and the working tree with the default
+                   subprocess engine)
+ - branch:[name]   branch compared with the current branch
+ - [base]..[head]  any two revisions (e.g. release tags v1.0..v1.1)
+"""
+
+import json
+import os
+
+from git import Repo
+from gitdb import GitDB
+
+from ufodiff.subcommands.delta import (
+    DELTA_WRITERS,
+    Delta,
+    DeltaJSONLinesWriter,
+    DeltaJSONWriter,
+)
+from ufodiff.utilities.contents import GlyphNameIndex
+from ufodiff.utilities.gitdelta import SUBPROCESS_ENGINE, TREE_ENGINES
+from ufodiff.utilities.ufo import UfoPathClassifier
+from ufodiff.utilities.writer import StreamWriter
+
+# range header format strings of the text and markdown batch reports
+RANGE_HEADER_FORMATS = {
+    "text": os.linesep + "Range: {}" + os.linesep,
+    "markdown": os.linesep + "# {}" + os.linesep,
+}
+
+
+def parse_delta_range(range_string):
+    """
+    Defines the Delta class test keyword arguments for a batch range
+    :param range_string: (string) 'commits:[N]', 'branch:[name]', or '[base]..[head]'
+    :return: (dict) Delta keyword arguments
+    :raises: ValueError for invalid ranges
+    """
+    if range_string.startswith("commits:"):
+        commit_number = range_string.split(":", 1)[1]
+        if not commit_number.isdigit() or int(commit_number) == 0:
+            raise ValueError(
+                "'" + range_string + "' does not include a commit number over zero"
+            )
+        return {"is_commit_test": True, "commit_number": commit_number}
+    elif range_string.startswith("branch:"):
+        branch_name = range_string.split(":", 1)[1]
+        if branch_name == "":
+            raise ValueError("'" + range_string + "' does not include a branch name")
+        return {"is_branch_test": True, "compare_branch_name": branch_name}
+    elif ".." in range_string:
+        base_revision, head_revision = range_string.split("..", 1)
+        # the symmetric difference '...' syntax is not supported
+        if base_revision == "" or head_revision == "" or head_revision[0] == ".":
+            raise ValueError(
+                "'" + range_string + "' is not a valid [base]..[head] revision range"
+            )
+        return {
+            "is_branch_test": True,
+            "compare_branch_name": base_revision,
+            "head_branch_name": head_revision,
+        }
+    raise ValueError(
+        "'" + range_string + "' is not a valid range. Please use the 'commits:[N]', "
+        "'branch:[name]', or '[base]..[head]' syntax"
+    )
+
+
+class DeltaBatch(object):
+    """
+    DeltaBatch class creates the Delta objects of multiple ranges with shared
+    repository state.  Delta objects are created on demand so that one range is held
+    in memory at a time.
+
+    :param gitrepo_path: (string) path to root of git repository
+    :param ufo_directory_list: (list) user defined UFO source directory filters
+    :param engine: (string) filepath collection engine (see Delta)
+    :param use_cache: (boolean) read and write the persistent delta cache (see Delta)
+    :param glyph_names: (boolean) include the glyph names of *.glif files (see Delta)
+    :param file_filter: (string) 'glyph', 'nonglyph', or None for all UFO files
+    """
+
+    def __init__(
+        self,
+        gitrepo_path,
+        ufo_directory_list,
+        engine=SUBPROCESS_ENGINE,
+        use_cache=False,
+        glyph_names=False,
+        file_filter=None,
+    ):
+        self.gitrepo_path = gitrepo_path
+        self.ufo_directory_list = ufo_directory_list
+        self.engine = engine
+        self.use_cache = use_cache
+        self.glyph_names = glyph_names
+        self.file_filter = file_filter
+        # shared GitPython Repo object, the in-process engines read objects with the
+        # pure Python object database
+        if engine in TREE_ENGINES:
+            self.repo = Repo(gitrepo_path, odbt=GitDB)
+        else:
+            self.repo = Repo(gitrepo_path)
+        # shared UFO path classifier with the parent directory classification cache
+        self.ufo_classifier = UfoPathClassifier()
+        # shared contents.plist glyph name index
+        self.glyph_name_index = None
+        if glyph_names is True:
+            self.glyph_name_index = GlyphNameIndex(self.repo, use_cache=use_cache)
+        # defined on the first branch range
+        self.current_branch_name = None
+
+    def _get_current_branch_name(self):
+        if self.current_branch_name is None:
+            if self.repo.head.is_detached:
+                self.current_branch_name = "HEAD"
+            else:
+                self.current_branch_name = self.repo.active_branch.name
+        return self.current_branch_name
+
+    def get_delta(self, range_string):
+        """
+        Creates the Delta object of a range
+        :param range_string: (string) 'commits:[N]', 'branch:[name]', or
+         '[base]..[head]'
+        :return: (Delta) the Delta object of the range
+        """
+        test_kwargs = parse_delta_range(range_string)
+        if test_kwargs.get("is_branch_test") and "head_branch_name" not in test_kwargs:
+            test_kwargs["head_branch_name"] = self._get_current_branch_name()
+        return Delta(
+            self.gitrepo_path,
+            self.ufo_directory_list,
+            engine=self.engine,
+            use_cache=self.use_cache,
+            glyph_names=self.glyph_names,
+            file_filter=self.file_filter,
+            repo=self.repo,
+            ufo_classifier=self.ufo_classifier,
+            glyph_name_index=self.glyph_name_index,
+            **test_kwargs
+        )
+
+    def get_delta_generator(self, range_list):
+        """
+        Generator that yields the Delta object of each range in range_list order
+        :param range_list: (iterable) range strings
+        :return: (Python generator) (range string, Delta) tuples
+        """
+        for range_string in range_list:
+            yield range_string, self.get_delta(range_string)
+
+    def get_writer(self, range_list, write_format=None):
+        """
+        Returns the batch report writer for the write_format type.
+        :param range_list: (iterable) range strings
+        :param write_format: (string) options include 'text', 'json', 'jsonl', and
+         'markdown'
+        :return: (DeltaBatchWriter) report writer object for the ranges
+        """
+        return DELTA_BATCH_WRITERS[write_format](self, range_list, write_format)
+
+
+class DeltaBatchWriter(StreamWriter):
+    """
+    Base class for batch report writers.
+
+    :param delta_batch: (DeltaBatch) the DeltaBatch object
+    :param range_list: (iterable) range strings
+    :param write_format: (string) options include 'text', 'json', 'jsonl', and
+     'markdown'
+    """
+
+    def __init__(self, delta_batch, range_list, write_format):
+        self.delta_batch = delta_batch
+        self.range_list = range_list
+        self.write_format = write_format
+
+
+class DeltaBatchRangeWriter(DeltaBatchWriter):
+    """
+    Writes plain text and Markdown format batch reports.  Each range report is written
+    with the Delta report writer of write_format after a range header, a
+    `Range: [range]` line in text reports and a `# [range]` section in Markdown
+    reports.
+    """
+
+    def write_range_header(self, outstream, range_string):
+        outstream.write(RANGE_HEADER_FORMATS[self.write_format].format(range_string))
+
+    def write(self, outstream):
+        for range_string, delta in self.delta_batch.get_delta_generator(
+            self.range_list
+        ):
+            self.write_range_header(outstream, range_string)
+            DELTA_WRITERS[self.write_format](delta).write(outstream)
+
+
+class DeltaBatchJSONWriter(DeltaBatchWriter):
+    """
+    Writes JSON format batch reports as newline delimited JSON, one deltajson report
+    object with an additional 'range' key per line.
+    """
+
+    def write(self, outstream):
+        for range_string, delta in self.delta_batch.get_delta_generator(
+            self.range_list
+        ):
+            report_dict = dict(DeltaJSONWriter(delta).get_report_dict())
+            report_dict["range"] = range_string
+            outstream.write(json.dumps(report_dict) + "\n")
+
+
+class DeltaBatchJSONLinesWriter(DeltaBatchWriter):
+    """
+    Writes newline delimited JSON format batch reports, the deltajsonl header, file,
+    and footer objects of each range with an additional 'range' key.
+    """
+
+    def write(self, outstream):
+        for range_string, delta in self.delta_batch.get_delta_generator(
+            self.range_list
+        ):
+            DeltaJSONLinesWriter(delta, {"range": range_string}).write(outstream)
+
+
+DELTA_BATCH_WRITERS = {
+    "text": DeltaBatchRangeWriter,
+    "json": DeltaBatchJSONWriter,
+    "jsonl": DeltaBatchJSONLinesWriter,
+    "markdown": DeltaBatchRangeWriter,
+}
@@ -10,9 +10,35 @@ import json
 import os
 
 from git import Repo
+from gitdb import GitDB
 
 from ufodiff.settings import major_version, minor_version, patch_version
-from ufodiff.utilities.ufo import Ufo
+from ufodiff.utilities.contents import GlyphNameIndex
+from ufodiff.utilities.deltacache import (
+    DELTA_CACHE_DIRNAME,
+    DeltaCache,
+    get_delta_cache_key,
+)
+from ufodiff.utilities.deltarecords import (
+    ADDED,
+    CHANGE_TYPES,
+    DELETED,
+    MODIFIED,
+    DeltaResult,
+)
+from ufodiff.utilities.gitdelta import (
+    ENGINES,
+    FILE_FILTERS,
+    SUBPROCESS_ENGINE,
+    TREE_ENGINES,
+    UFO_TREE_ENGINE,
+    get_commit_sha1_list,
+    get_file_filter_pathspec_list,
+    get_name_status_filepath_lists,
+    get_tree_filepath_lists,
+)
+from ufodiff.utilities.ufo import Ufo, UfoDirectoryFilter, UfoPathClassifier
+from ufodiff.utilities.writer import StreamWriter
 
 
 class Delta(object):
@@ -37,6 +63,27 @@ class Delta(object):
      in git repository
     :param compare_branch_name: (string) the branch name requested by user for test
      vs. current branch (user specified)
+    :param engine: (string) filepath collection engine, 'subprocess' (default) for a
+     `git diff` subprocess call, 'inprocess' for a commit tree comparison through the
+     gitdb object database without git subprocess calls, or 'ufotree' for an in-process
+     comparison that only descends into changed *.ufo directories
+    :param use_cache: (boolean) read and write the classified UFO file lists in the
+     persistent delta cache in the `.git/ufodiff` directory.  Commit history tests
+     with the 'subprocess' engine include uncommitted working tree changes and are
+     not cached.
+    :param glyph_names: (boolean) include the glyph names of *.glif files in the
+     reports, glyph names are defined with the layer contents.plist files
+    :param file_filter: (string) 'glyph' for *.glif files only, 'nonglyph' for
+     *.plist and *.fea files only, or None for all UFO files.  The filter is applied
+     in git with pathspecs (see ufodiff.utilities.gitdelta)
+    :param head_branch_name: (string) branch or revision that is compared with
+     compare_branch_name in branch tests, None for the current branch
+    :param repo: GitPython Repo object that is shared with other Delta objects (e.g.
+     ufodiff.subcommands.batch.DeltaBatch), None to open the repository at gitrepo_path
+    :param ufo_classifier: (UfoPathClassifier) shared UFO path classifier, None for a
+     new classifier
+    :param glyph_name_index: (GlyphNameIndex) shared glyph name index, None for a new
+     index on the first glyph name request
     """
 
     def __init__(
@@ -47,6 +94,14 @@ class Delta(object):
         commit_number="0",
         is_branch_test=False,
         compare_branch_name=None,
+        engine=SUBPROCESS_ENGINE,
+        use_cache=False,
+        glyph_names=False,
+        file_filter=None,
+        head_branch_name=None,
+        repo=None,
+        ufo_classifier=None,
+        glyph_name_index=None,
     ):
         # path to root of git repository
         self.gitrepo_path = gitrepo_path
@@ -64,9 +119,40 @@ class Delta(object):
         )
         # defined in _define_and_validate_ufo_diff_lists if branch test
         self.current_branch_name = ""
+        # branch test head, None for the current branch
+        self.head_branch_name = head_branch_name
         # Ufo class used for UFO source validations
         self.ufo = Ufo()
-        # GitPython object (instantiated in class method)
+        # UfoPathClassifier class used for batch UFO source filepath classification
+        if ufo_classifier is None:
+            ufo_classifier = UfoPathClassifier()
+        self.ufo_classifier = ufo_classifier
+        # filepath collection engine (see ufodiff.utilities.gitdelta)
+        if engine not in ENGINES:
+            raise ValueError(
+                "'" + str(engine) + "' is not a valid engine. "
+                "Acceptable engines include: " + ", ".join(ENGINES)
+            )
+        self.engine = engine
+        # glyph / nonglyph file filter (see ufodiff.utilities.gitdelta)
+        if file_filter is not None and file_filter not in FILE_FILTERS:
+            raise ValueError(
+                "'" + str(file_filter) + "' is not a valid file filter. "
+                "Acceptable file filters include: " + ", ".join(FILE_FILTERS)
+            )
+        self.file_filter = file_filter
+        # persistent delta cache (see ufodiff.utilities.deltacache)
+        self.use_cache = use_cache
+        self.delta_cache = None
+        # glyph names in reports (see ufodiff.utilities.contents)
+        self.glyph_names = glyph_names
+        self.glyph_name_dict = None
+        self.glyph_name_index = glyph_name_index
+        # compared revisions for glyph name lookups, None for the working tree
+        self.base_revision = None
+        self.head_revision = None
+        # GitPython objects (instantiated in class method if not shared)
+        self.repo = repo
         self.git = None
         # stores delta file strings in .delta_dict attribute
         self.delta_fp_string_dict = DeltaFilepathStringDict(ufo_directory_list)
@@ -92,48 +178,177 @@ class Delta(object):
         Defines Delta class properties on instantiation of the object in app.py module
         :return: no return object
         """
+        if self.engine in TREE_ENGINES:
+            self._define_ufo_diff_lists_inprocess()
+            return
+
         # instantiate git Repo object
-        repo = Repo(self.gitrepo_path)
+        if self.repo is None:
+            self.repo = Repo(self.gitrepo_path)
         # define class attribute git object
-        self.git = repo.git
+        self.git = self.repo.git
 
+        cache_key = None
         if self.is_commit_test is True:
-            commit_number_string = "HEAD~" + self.commit_number  # with HEAD~N syntax
-            added_file_string = self.git.diff(
-                "--name-only", "--diff-filter=A", commit_number_string
-            )
-            added_filepath_list = added_file_string.split("\n")
-            deleted_file_string = self.git.diff(
-                "--name-only", "--diff-filter=D", commit_number_string
-            )
-            deleted_filepath_list = deleted_file_string.split("\n")
-            modified_file_string = self.git.diff(
-                "--name-only", "--diff-filter=M", commit_number_string
-            )
-            modified_filepath_list = modified_file_string.split("\n")
+            diff_arg_string = "HEAD~" + self.commit_number  # with HEAD~N syntax
+            # HEAD~N is compared with the working tree
+            self.base_revision = diff_arg_string
         elif self.is_branch_test is True:
-            self.current_branch_name = self.git.rev_parse(["--abbrev-ref", "HEAD"])
-            branch_comparison_string = (
-                self.compare_branch_name + ".." + self.current_branch_name
-            )
-            added_file_string = self.git.diff(
-                ["--name-only", "--diff-filter=A", branch_comparison_string]
-            )
-            added_filepath_list = added_file_string.split("\n")
-            deleted_file_string = self.git.diff(
-                ["--name-only", "--diff-filter=D", branch_comparison_string]
-            )
-            deleted_filepath_list = deleted_file_string.split("\n")
-            modified_file_string = self.git.diff(
-                ["--name-only", "--diff-filter=M", branch_comparison_string]
-            )
-            modified_filepath_list = modified_file_string.split("\n")
+            if self.head_branch_name is None:
+                self.current_branch_name = self.git.rev_parse(["--abbrev-ref", "HEAD"])
+            else:
+                self.current_branch_name = self.head_branch_name
+            diff_arg_string = self.compare_branch_name + ".." + self.current_branch_name
+            self.base_revision = self.compare_branch_name
+            self.head_revision = self.current_branch_name
+            # branch comparisons do not include the working tree and can be cached
+            if self.use_cache is True:
+                base_commit_sha1, head_commit_sha1 = self.git.rev_parse(
+                    [
+                        self.compare_branch_name + "^{commit}",
+                        self.current_branch_name + "^{commit}",
+                    ]
+                ).split("\n")
+                cache_key = self._get_delta_cache_key(
+                    base_commit_sha1, head_commit_sha1
+                )
+                if self._load_ufo_diff_lists_from_cache(cache_key) is True:
+                    return
+
+        # single `git diff --name-status -z` call for added, deleted, modified files
+        (
+            added_filepath_list,
+            deleted_filepath_list,
+            modified_filepath_list,
+        ) = get_name_status_filepath_lists(
+            self.git,
+            diff_arg_string,
+            get_file_filter_pathspec_list(self.file_filter),
+        )
 
         # load class attribute lists with the filepaths that are validated to be UFO
         # in the following method
         self._validate_ufo_and_load_dict_from_filepath_strings(
             added_filepath_list, deleted_filepath_list, modified_filepath_list
         )
+        if cache_key is not None:
+            self._save_ufo_diff_lists_to_cache(cache_key)
+
+    def _define_ufo_diff_lists_inprocess(self):
+        """
+        Defines Delta class properties with the in-process engines.  Commit trees are
+        compared through the gitdb object database and no git subprocess is spawned.
+        Commit history tests compare HEAD~N with HEAD (uncommitted working tree
+        changes are not included).
+        :return: no return object
+        """
+        # pure Python object database, GitCmdObjectDB spawns a `git cat-file` process
+        if self.repo is None:
+            self.repo = Repo(self.gitrepo_path, odbt=GitDB)
+        self.git = self.repo.git
+
+        if self.is_commit_test is True:
+            base_revision = "HEAD~" + self.commit_number
+            head_revision = "HEAD"
+        elif self.is_branch_test is True:
+            if self.head_branch_name is not None:
+                self.current_branch_name = self.head_branch_name
+            elif self.repo.head.is_detached:
+                self.current_branch_name = "HEAD"
+            else:
+                self.current_branch_name = self.repo.active_branch.name
+            base_revision = self.compare_branch_name
+            head_revision = self.current_branch_name
+
+        # commit trees are compared, results can be cached by commit SHA1
+        base_revision = self.repo.commit(base_revision).hexsha
+        head_revision = self.repo.commit(head_revision).hexsha
+        self.base_revision = base_revision
+        self.head_revision = head_revision
+        cache_key = None
+        if self.use_cache is True:
+            cache_key = self._get_delta_cache_key(base_revision, head_revision)
+            if self._load_ufo_diff_lists_from_cache(cache_key) is True:
+                return
+
+        (
+            added_filepath_list,
+            deleted_filepath_list,
+            modified_filepath_list,
+        ) = get_tree_filepath_lists(
+            self.repo,
+            base_revision,
+            head_revision,
+            ufo_subtrees_only=(self.engine == UFO_TREE_ENGINE),
+            ufo_filter_list=self.ufo_directory_list,
+            file_filter=self.file_filter,
+        )
+
+        self._validate_ufo_and_load_dict_from_filepath_strings(
+            added_filepath_list, deleted_filepath_list, modified_filepath_list
+        )
+        if cache_key is not None:
+            self._save_ufo_diff_lists_to_cache(cache_key)
+
+    def _get_delta_cache_key(self, base_commit_sha1, head_commit_sha1):
+        """
+        Defines the DeltaCache object for the repository on first use and returns the
+        delta cache key for the commit pair.
+
+        :param base_commit_sha1: (string) full SHA1 of the base commit
+        :param head_commit_sha1: (string) full SHA1 of the head commit
+        :return: (string) delta cache key
+        """
+        if self.delta_cache is None:
+            self.delta_cache = DeltaCache(
+                os.path.join(self.repo.git_dir, DELTA_CACHE_DIRNAME)
+            )
+        if self.is_commit_test is True:
+            commit_number = self.commit_number
+        else:
+            commit_number = None
+        return get_delta_cache_key(
+            base_commit_sha1,
+            head_commit_sha1,
+            self.ufo_directory_list,
+            commit_number,
+            self.file_filter,
+        )
+
+    def _load_ufo_diff_lists_from_cache(self, cache_key):
+        """
+        Defines the Delta class properties from a delta cache entry.
+
+        :param cache_key: (string) delta cache key
+        :return: (boolean) True if the cache entry was found and loaded
+        """
+        entry_dict = self.delta_cache.get(cache_key)
+        if entry_dict is None:
+            return False
+        self.added_ufo_file_list.extend(entry_dict["added"])
+        self.deleted_ufo_file_list.extend(entry_dict["deleted"])
+        self.modified_ufo_file_list.extend(entry_dict["modified"])
+        if self.is_commit_test:
+            self.commit_sha1_list = entry_dict["commits"]
+        self._load_delta_dict()
+        return True
+
+    def _save_ufo_diff_lists_to_cache(self, cache_key):
+        """
+        Writes the classified UFO file lists to the delta cache.
+
+        :param cache_key: (string) delta cache key
+        :return: no return object
+        """
+        self.delta_cache.set(
+            cache_key,
+            {
+                "added": self.added_ufo_file_list,
+                "deleted": self.deleted_ufo_file_list,
+                "modified": self.modified_ufo_file_list,
+                "commits": self.commit_sha1_list,
+            },
+        )
 
     def _add_commit_sha1_to_lists(self):
         """
@@ -142,6 +357,11 @@ class Delta(object):
 
         :return: no return object
         """
+        if self.engine in TREE_ENGINES:
+            self.commit_sha1_list = get_commit_sha1_list(
+                self.repo, int(self.commit_number)
+            )
+            return
         sha1_num_commits = "-" + self.commit_number
         sha1_args = [sha1_num_commits, "--pretty=%h"]
         # git log -[N] --pretty=%h ===> newline delimited list of SHA1 x N commit
@@ -166,29 +386,32 @@ class Delta(object):
         :return: no return object
         """
         # test for valid UFO files and add the filepath string to the appropriate class
-        # instance attribute
-        # load added files list
-        if len(added_filepath_list) > 0:
-            for added_file in added_filepath_list:
-                if self.ufo.validate_file(added_file) is True:
-                    self.added_ufo_file_list.append(added_file)
-
-        # load deleted files list
-        if len(deleted_filepath_list) > 0:
-            for deleted_file in deleted_filepath_list:
-                if self.ufo.validate_file(deleted_file) is True:
-                    self.deleted_ufo_file_list.append(deleted_file)
-
-        # load modified files list
-        if len(modified_filepath_list) > 0:
-            for modified_file in modified_filepath_list:
-                if self.ufo.validate_file(modified_file) is True:
-                    self.modified_ufo_file_list.append(modified_file)
+        # instance attribute with the batch UFO path classifier
+        for filepath_list, ufo_file_list in (
+            (added_filepath_list, self.added_ufo_file_list),
+            (deleted_filepath_list, self.deleted_ufo_file_list),
+            (modified_filepath_list, self.modified_ufo_file_list),
+        ):
+            category_list = self.ufo_classifier.classify_many(filepath_list)
+            ufo_file_list.extend(
+                filepath
+                for filepath, category in zip(filepath_list, category_list)
+                if category != UfoPathClassifier.NOT_UFO
+            )
 
+        if self.is_commit_test:
+            self._add_commit_sha1_to_lists()
+        self._load_delta_dict()
+
+    def _load_delta_dict(self):
+        """
+        Loads the commit SHA1 or branch names and the validated UFO file lists into
+        the DeltaFilepathStringDict delta_dict Python dictionary.
+        :return: no return object
+        """
         # define the key:value structure of the dictionary attribute on the
         # DeltaFilepathStringDict() class
         if self.is_commit_test:
-            self._add_commit_sha1_to_lists()
             self.delta_fp_string_dict.add_commit_sha1(
                 self.commit_sha1_list
             )  # create 'commits' dict key
@@ -213,44 +436,7 @@ class Delta(object):
         :return: (string) plain text string formatted Python string
           intended for standard output stream
         """
-        textstring = ""
-        if (
-            self.is_commit_test is True
-        ):  # include commits if this is an analysis of commit history
-            # Write SHA1 commits under examination
-            if len(self.delta_fp_string_dict.delta_dict["commits"]) > 0:
-                textstring += (
-                    os.linesep + "Commit history SHA1 for this analysis:" + os.linesep
-                )
-                for sha1_commit in self.delta_fp_string_dict.delta_dict["commits"]:
-                    textstring += " " + sha1_commit + os.linesep
-                textstring += os.linesep
-        elif (
-            self.is_branch_test is True
-        ):  # include branches if this is a branch v branch analysis
-            if len(self.delta_fp_string_dict.delta_dict["branches"]) > 0:
-                textstring += os.linesep + "Branches under analysis:" + os.linesep
-                for branch in self.delta_fp_string_dict.delta_dict["branches"]:
-                    textstring += " " + branch + os.linesep
-                textstring += os.linesep
-
-        # include added files
-        if len(self.delta_fp_string_dict.delta_dict["added"]) > 0:
-            for added_file in self.delta_fp_string_dict.delta_dict["added"]:
-                add_append_string = "[A]:" + added_file + os.linesep
-                textstring += add_append_string
-        # include deleted files
-        if len(self.delta_fp_string_dict.delta_dict["deleted"]) > 0:
-            for deleted_file in self.delta_fp_string_dict.delta_dict["deleted"]:
-                del_append_string = "[D]:" + deleted_file + os.linesep
-                textstring += del_append_string
-        # include modified files
-        if len(self.delta_fp_string_dict.delta_dict["modified"]) > 0:
-            for modified_file in self.delta_fp_string_dict.delta_dict["modified"]:
-                mod_append_string = "[M]:" + modified_file + os.linesep
-                textstring += mod_append_string
-
-        return textstring
+        return DeltaTextWriter(self).get_string()
 
     def _get_delta_json_string(self):
         """
@@ -258,7 +444,7 @@ class Delta(object):
         :return: (string) JSON formatted Python string intended for
          standard output stream
         """
-        return json.dumps(self.delta_fp_string_dict.delta_dict)
+        return DeltaJSONWriter(self).get_string()
 
     def _get_delta_markdown_string(self):
         """
@@ -266,57 +452,246 @@ class Delta(object):
         :return: (string) Markdown formatted Python string intended for
          standard output stream
         """
-        markdown_string = ""
+        return DeltaMarkdownWriter(self).get_string()
 
-        if self.is_commit_test is True:
-            if len(self.delta_fp_string_dict.delta_dict["commits"]) > 0:
-                markdown_string += (
-                    os.linesep
-                    + "## Commit history SHA1 for this analysis:"
-                    + os.linesep
+    # PUBLIC METHODS
+
+    def get_stdout_string(self, write_format=None):
+        """
+        Called by app.py module with write_format type that is dependent
+        upon the user subcommand request
+        :param write_format: (string) options include 'text', 'json', 'jsonl', and
+         'markdown'
+        :return: (string) file change report formatted according to write_format parameter
+        """
+        if write_format == "text":
+            return self._get_delta_text_string()
+        elif write_format == "json":
+            return self._get_delta_json_string()
+        elif write_format == "markdown":
+            return self._get_delta_markdown_string()
+        elif write_format == "jsonl":
+            return DeltaJSONLinesWriter(self).get_string()
+
+    def get_writer(self, write_format=None):
+        """
+        Returns the report writer for the write_format type.  Writers stream the report
+        to standard output or to a file without creation of the full report string.
+        :param write_format: (string) options include 'text', 'json', 'jsonl', and
+         'markdown'
+        :return: (DeltaWriter) report writer object for this Delta object
+        """
+        return DELTA_WRITERS[write_format](self)
+
+    def get_delta_result(self):
+        """
+        Returns the structured result of the comparison.  The report writers and the
+        ufodiff.api Python API are defined on the DeltaResult object.
+        :return: (ufodiff.utilities.deltarecords.DeltaResult) added, deleted, and
+         modified UFO source files after the user defined UFO source filters
+        """
+        delta_dict = self.delta_fp_string_dict.delta_dict
+        return DeltaResult(
+            delta_dict[ADDED],
+            delta_dict[DELETED],
+            delta_dict[MODIFIED],
+            commits=delta_dict.get("commits"),
+            branches=delta_dict.get("branches"),
+            base_revision=self.base_revision,
+            head_revision=self.head_revision,
+            ufo_classifier=self.ufo_classifier,
+        )
+
+    def get_glyph_name_dict(self):
+        """
+        Maps the added, deleted, and modified *.glif filepaths to glyph names.  Added and
+        modified files are looked up in the head revision contents.plist files and
+        deleted files in the base revision contents.plist files.  Contents.plist files
+        are parsed once per git blob SHA1 and memoized in the `.git/ufodiff/contents`
+        cache directory.
+        :return: (dict) filepath : glyph name dictionary
+        """
+        if self.glyph_name_dict is None:
+            if self.glyph_name_index is None:
+                self.glyph_name_index = GlyphNameIndex(
+                    self.repo, use_cache=self.use_cache
                 )
-                for sha1_commit in self.delta_fp_string_dict.delta_dict["commits"]:
-                    markdown_string += "- `" + sha1_commit + "`" + os.linesep
-                markdown_string += os.linesep
-        elif self.is_branch_test is True:
-            if len(self.delta_fp_string_dict.delta_dict["branches"]) > 0:
-                markdown_string += (
-                    os.linesep + "## Branches under analysis:" + os.linesep
+            glyph_name_index = self.glyph_name_index
+            delta_dict = self.delta_fp_string_dict.delta_dict
+            self.glyph_name_dict = glyph_name_index.get_glyph_names(
+                (
+                    filepath
+                    for filepath in delta_dict["added"] + delta_dict["modified"]
+                    if filepath.endswith(".glif")
+                ),
+                self.head_revision,
+            )
+            self.glyph_name_dict.update(
+                glyph_name_index.get_glyph_names(
+                    (
+                        filepath
+                        for filepath in delta_dict["deleted"]
+                        if filepath.endswith(".glif")
+                    ),
+                    self.base_revision,
                 )
-                for branch in self.delta_fp_string_dict.delta_dict["branches"]:
-                    markdown_string += "- " + branch + os.linesep
-                markdown_string += os.linesep
+            )
+        return self.glyph_name_dict
 
-        # Added files block
-        markdown_string += "## Added Files" + os.linesep
-        if len(self.delta_fp_string_dict.delta_dict["added"]) > 0:
-            for added_file in self.delta_fp_string_dict.delta_dict["added"]:
-                markdown_string += "- " + added_file + os.linesep
-        else:
-            markdown_string += "- None" + os.linesep
 
-        # Deleted files block
-        markdown_string += os.linesep + os.linesep + "## Deleted Files" + os.linesep
-        if len(self.delta_fp_string_dict.delta_dict["deleted"]) > 0:
-            for deleted_file in self.delta_fp_string_dict.delta_dict["deleted"]:
-                markdown_string += "- " + deleted_file + os.linesep
+class DeltaWriter(StreamWriter):
+    """
+    Base class for the delta / deltajson / deltamd report writers.  Writers stream each
+    section of the report to a text stream (e.g. sys.stdout or an open file) rather than
+    creating the full report as a single string.  Report data are read from the
+    DeltaResult object of the Delta object (see Delta.get_delta_result).
+
+    :param delta: (ufodiff.subcommands.delta.Delta) the Delta object with report data
+    """
+
+    def __init__(self, delta):
+        self.delta = delta
+        self.delta_result = delta.get_delta_result()
+        # filepath : glyph name dictionary if glyph names are requested
+        self.glyph_name_dict = None
+        if delta.glyph_names is True:
+            self.glyph_name_dict = delta.get_glyph_name_dict()
+
+    def format_filepath(self, filepath, name_format="{0} ({1})"):
+        """
+        Formats a filepath with the glyph name of *.glif files when glyph names are
+        requested.
+        :param filepath: (string) git repository relative filepath
+        :param name_format: (string) filepath and glyph name format string
+        :return: (string) formatted filepath
+        """
+        if self.glyph_name_dict is None:
+            return filepath
+        glyph_name = self.glyph_name_dict.get(filepath)
+        if glyph_name is None:
+            return filepath
+        return name_format.format(filepath, glyph_name)
+
+
+class DeltaTextWriter(DeltaWriter):
+    """
+    Writes plain text format delta subcommand reports.
+    """
+
+    change_prefix_dict = {ADDED: "[A]:", DELETED: "[D]:", MODIFIED: "[M]:"}
+
+    def write(self, outstream):
+        linesep = os.linesep
+        if (
+            self.delta.is_commit_test is True
+        ):  # include commits if this is an analysis of commit history
+            # Write SHA1 commits under examination
+            if len(self.delta_result.commits) > 0:
+                outstream.write(
+                    linesep + "Commit history SHA1 for this analysis:" + linesep
+                )
+                outstream.writelines(
+                    " " + sha1_commit + linesep
+                    for sha1_commit in self.delta_result.commits
+                )
+                outstream.write(linesep)
+        elif (
+            self.delta.is_branch_test is True
+        ):  # include branches if this is a branch v branch analysis
+            if len(self.delta_result.branches) > 0:
+                outstream.write(linesep + "Branches under analysis:" + linesep)
+                outstream.writelines(
+                    " " + branch + linesep for branch in self.delta_result.branches
+                )
+                outstream.write(linesep)
+
+        format_filepath = self.format_filepath
+        # added, deleted, and modified files
+        for change in CHANGE_TYPES:
+            change_prefix = self.change_prefix_dict[change]
+            outstream.writelines(
+                change_prefix + format_filepath(filepath) + linesep
+                for filepath in self.delta_result.filepaths(change)
+            )
+
+
+class DeltaJSONWriter(DeltaWriter):
+    """
+    Writes JSON format deltajson subcommand reports.  JSON data are encoded and written
+    in chunks with json.dump.  Glyph names are written as a 'glyphs' filepath : glyph
+    name object when glyph names are requested.
+    """
+
+    def get_report_dict(self):
+        """
+        :return: (dict) JSON serializable report data
+        """
+        report_dict = {}
+        if self.delta_result.commits is not None:
+            report_dict["commits"] = self.delta_result.commits
+        elif self.delta_result.branches is not None:
+            report_dict["branches"] = self.delta_result.branches
+        for change in CHANGE_TYPES:
+            report_dict[change] = self.delta_result.filepaths(change)
+        if self.glyph_name_dict is not None:
+            report_dict["glyphs"] = self.glyph_name_dict
+        return report_dict
+
+    def write(self, outstream):
+        json.dump(self.get_report_dict(), outstream)
+
+
+class DeltaMarkdownWriter(DeltaWriter):
+    """
+    Writes Markdown format deltamd subcommand reports.
+    """
+
+    def _write_file_block(self, outstream, title, change):
+        outstream.write("## " + title + os.linesep)
+        filepath_list = self.delta_result.filepaths(change)
+        if len(filepath_list) > 0:
+            outstream.writelines(
+                "- " + self.format_filepath(filepath, "{0} (`{1}`)") + os.linesep
+                for filepath in filepath_list
+            )
         else:
-            markdown_string += "- None" + os.linesep
+            outstream.write("- None" + os.linesep)
+
+    def write(self, outstream):
+        linesep = os.linesep
+        if self.delta.is_commit_test is True:
+            if len(self.delta_result.commits) > 0:
+                outstream.write(
+                    linesep + "## Commit history SHA1 for this analysis:" + linesep
+                )
+                outstream.writelines(
+                    "- `" + sha1_commit + "`" + linesep
+                    for sha1_commit in self.delta_result.commits
+                )
+                outstream.write(linesep)
+        elif self.delta.is_branch_test is True:
+            if len(self.delta_result.branches) > 0:
+                outstream.write(linesep + "## Branches under analysis:" + linesep)
+                outstream.writelines(
+                    "- " + branch + linesep for branch in self.delta_result.branches
+                )
+                outstream.write(linesep)
 
+        # Added files block
+        self._write_file_block(outstream, "Added Files", ADDED)
+        # Deleted files block
+        outstream.write(linesep + linesep)
+        self._write_file_block(outstream, "Deleted Files", DELETED)
         # Modified files block
-        markdown_string += os.linesep + os.linesep + "## Modified Files" + os.linesep
-        if len(self.delta_fp_string_dict.delta_dict["modified"]) > 0:
-            for modified_file in self.delta_fp_string_dict.delta_dict["modified"]:
-                markdown_string += "- " + modified_file + os.linesep
-        else:
-            markdown_string += "- None" + os.linesep
+        outstream.write(linesep + linesep)
+        self._write_file_block(outstream, "Modified Files", MODIFIED)
 
         # Project URL + version footer
-        markdown_string += (
-            os.linesep
-            + os.linesep
+        outstream.write(
+            linesep
+            + linesep
             + "---"
-            + os.linesep
+            + linesep
             + "[ufodiff](https://github.com/source-foundry/ufodiff) v"
             + major_version
             + "."
@@ -325,31 +700,84 @@ class Delta(object):
             + patch_version
         )
 
-        return markdown_string
 
-    # PUBLIC METHODS
+class DeltaJSONLinesWriter(DeltaWriter):
+    """
+    Writes newline delimited JSON format deltajsonl subcommand reports.  Each JSON
+    object is serialized and written as soon as its file is classified, so memory
+    use does not depend on the number of files in the report:
+
+     {"type": "header", "commits": [...]}  or  {"type": "header", "branches": [...]}
+     {"type": "file", "change": "added", "path": "...", "ufo": "...",
+      "layer": "...", "category": "glyph"}  (one object per file, with a 'glyph'
+      glyph name key when glyph names are requested)
+     {"type": "footer", "added": 1, "deleted": 0, "modified": 0}
+
+    :param delta: (ufodiff.subcommands.delta.Delta) the Delta object with report data
+    :param record_fields: (dict) additional key : value pairs that are included in
+     every object (e.g. the range of batch reports), None for no additional pairs
+    """
 
-    def get_stdout_string(self, write_format=None):
-        """
-        Called by app.py module with write_format type that is dependent
-        upon the user subcommand request
-        :param write_format: (string) options include 'text', 'json', and 'markdown'
-        :return: (string) file change report formatted according to write_format parameter
-        """
-        if write_format == "text":
-            return self._get_delta_text_string()
-        elif write_format == "json":
-            return self._get_delta_json_string()
-        elif write_format == "markdown":
-            return self._get_delta_markdown_string()
+    def __init__(self, delta, record_fields=None):
+        DeltaWriter.__init__(self, delta)
+        self.record_fields = record_fields or {}
+
+    def _write_record(self, outstream, record_dict):
+        record_dict.update(self.record_fields)
+        outstream.write(json.dumps(record_dict) + "\n")
+
+    def write(self, outstream):
+        header_dict = {"type": "header"}
+        if self.delta_result.commits is not None:
+            header_dict["commits"] = self.delta_result.commits
+        elif self.delta_result.branches is not None:
+            header_dict["branches"] = self.delta_result.branches
+        self._write_record(outstream, header_dict)
+        # file objects are joined from JSON encoded values rather than serialized
+        # from per file dictionaries.  Only the path value is unique per file, the
+        # other values are encoded once per (change, ufo, layer, category) tuple.
+        encode = json.JSONEncoder().encode
+        record_fields_string = "".join(
+            ", {}: {}".format(encode(key), encode(value))
+            for key, value in self.record_fields.items()
+        )
+        fields_string_dict = {}
+        for delta_record in self.delta_result:
+            fields_key = delta_record[1:]
+            fields_string = fields_string_dict.get(fields_key)
+            if fields_string is None:
+                fields_string = fields_string_dict[fields_key] = (
+                    ', "change": {}, "ufo": {}, "layer": {}, "category": {}'.format(
+                        *[encode(value) for value in fields_key]
+                    )
+                )
+            filepath = delta_record.path
+            if self.glyph_name_dict is not None and filepath.endswith(".glif"):
+                glyph_string = ', "glyph": ' + encode(
+                    self.glyph_name_dict.get(filepath)
+                )
+            else:
+                glyph_string = ""
+            outstream.write(
+                '{"type": "file", "path": '
+                + encode(filepath)
+                + fields_string
+                + glyph_string
+                + record_fields_string
+                + "}\n"
+            )
+        footer_dict = {"type": "footer"}
+        for change in CHANGE_TYPES:
+            footer_dict[change] = len(self.delta_result.filepaths(change))
+        self._write_record(outstream, footer_dict)
 
-    # TODO: implement glyph only data
-    # def get_stdout_string_glyph_only(self):
-    #     pass
 
-    # TODO: implement nonglyph only data
-    # def get_stdout_string_nonglyph_only(self):
-    #     pass
+DELTA_WRITERS = {
+    "text": DeltaTextWriter,
+    "json": DeltaJSONWriter,
+    "jsonl": DeltaJSONLinesWriter,
+    "markdown": DeltaMarkdownWriter,
+}
 
 
 class DeltaFilepathStringDict(object):
@@ -358,26 +786,22 @@ class DeltaFilepathStringDict(object):
     spec and any user defined UFO path filters for use in the generation
     of standard output strings.
 
-    User defined UFO directory path filter occurs here.
+    User defined UFO directory path filter occurs here.  Filters match complete
+    *.ufo directory path components through a UfoDirectoryFilter path component trie.
     """
 
     def __init__(self, ufo_directory_list):
         self.delta_dict = {}
         self.ufo_directory_list = ufo_directory_list
+        self.ufo_directory_filter = UfoDirectoryFilter(ufo_directory_list)
 
     def _filter_and_load_lists(self, filepath_list):
-        the_filepath_list = []
         # no user defined UFO source filters, include all UFO source
-        if len(self.ufo_directory_list) == 0:
-            for delta_file in filepath_list:
-                the_filepath_list.append(delta_file)
+        if len(self.ufo_directory_filter) == 0:
+            return list(filepath_list)
         # user wants the results to be filtered by specific UFO directory(ies)
         else:
-            for delta_file in filepath_list:
-                for ufo_directory_filter_path in self.ufo_directory_list:
-                    if ufo_directory_filter_path in delta_file:
-                        the_filepath_list.append(delta_file)
-        return the_filepath_list
+            return self.ufo_directory_filter.filter(filepath_list)
 
     def add_added_filepaths(self, added_filepath_list):
         self.delta_dict["added"] = self._filter_and_load_lists(added_filepath_list)
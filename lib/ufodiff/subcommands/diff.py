@@ -23,17 +23,30 @@ class Diff(object):
     :param gitrepo_path: (string) path to root of git repository
     :param color_diff: (boolean) indicator for request for color diff (True) or
      uncolored diff (False)
+    :param stream_diff: (boolean) indicator for request to read the git diff standard
+     output stream incrementally (True) or as a single string (False)
     """
 
-    def __init__(self, gitrepo_path, color_diff=False):
+    def __init__(self, gitrepo_path, color_diff=False, stream_diff=False):
         self.gitrepo_path = gitrepo_path  # root path for git repository
         self.is_color_diff = color_diff  # is request for color diff = True
+        self.is_stream_diff = stream_diff  # is request for streamed git diff = True
         self.repo = Repo(self.gitrepo_path)  # GitPython Repo object
         self.git = self.repo.git  # GitPython Repo.git object
         self.ufo = Ufo()  # ufodiff.utilities.ufo.Ufo object
-        self.current_branch = self.git.rev_parse(
-            "--abbrev-ref", "HEAD"
-        )  # current git branch automatically detected
+        self._current_branch = None  # defined on first use in branch: requests
+
+    @property
+    def current_branch(self):
+        """
+        Current git branch name, automatically detected with `git rev-parse` on first
+        use so that commits: requests do not execute the additional git process.
+
+        :return: (string) current git branch name
+        """
+        if self._current_branch is None:
+            self._current_branch = self.git.rev_parse("--abbrev-ref", "HEAD")
+        return self._current_branch
 
     # PRIVATE METHODS
 
@@ -45,37 +58,117 @@ class Diff(object):
         :param dirty_diff_string: (string) the raw git diff string
         :return: (string) the cleaned git diff string
         """
-        dirty_diffstring_list = dirty_diff_string.split("\n")
-        clean_diff_string = ""
-        for a_string in dirty_diffstring_list:
+        return "".join(self._clean_diff_lines(dirty_diff_string.split("\n")))
+
+    def _clean_diff_lines(self, dirty_diff_line_iterable):
+        """
+        Line oriented generator implementation of the git diff 'cleaning' in
+        _clean_diff_string.  Each line is processed once and cleaned lines are
+        returned as soon as the two lead file path lines can be identified.
+
+        :param dirty_diff_line_iterable: (iterable of strings) raw git diff lines
+         without line endings
+        :return: (Python generator of strings) cleaned git diff text, the concatenation
+         of the strings is the cleaned git diff string
+        """
+        linesep = os.linesep
+        # cleaned lines are held until the '---' and '+++' lines are identified
+        pending_line_list = []
+        has_minus_line = False
+        has_plus_line = False
+        # number of lead lines that remain to be removed, defined when the
+        # '---' and '+++' lines are identified
+        purge_line_number = None
+        for a_string in dirty_diff_line_iterable:
             if a_string.startswith("\x1b[1mdiff --git") or a_string.startswith(
                 "diff --git"
             ):
                 clean_a_string = a_string.replace("diff --git", "")
-                clean_a_string = clean_a_string.replace(" ", os.linesep)
-                clean_diff_string += clean_a_string + os.linesep
+                clean_a_string = clean_a_string.replace(" ", linesep)
             elif "100644" in a_string:
                 clean_a_string = a_string.replace("100644", "")
                 clean_a_string = clean_a_string.replace("mode", "")
-                clean_diff_string += clean_a_string + os.linesep
             else:
-                clean_diff_string += a_string + os.linesep
-        # remove two lead lines from text diffs (unnecessary duplication of the two files)
-        if "---" in clean_diff_string and "+++" in clean_diff_string:
-            clean_diff_string_list = clean_diff_string.split(os.linesep)
-            purged_head_paths_diff_string_list = clean_diff_string_list[3:]
-            # reset the diff string to empty string and start again
-            clean_diff_string = ""
-            for line in purged_head_paths_diff_string_list:
-                clean_diff_string += line + os.linesep
-        return clean_diff_string
+                clean_a_string = a_string
+
+            if purge_line_number is None:
+                pending_line_list.append(clean_a_string)
+                has_minus_line = has_minus_line or "---" in clean_a_string
+                has_plus_line = has_plus_line or "+++" in clean_a_string
+                if has_minus_line and has_plus_line:
+                    # remove three lead lines from text diffs (blank line and
+                    # unnecessary duplication of the two files)
+                    purge_line_number = 3
+                    pending_string = linesep.join(pending_line_list)
+                    pending_line_list = []
+                    for line in pending_string.split(linesep):
+                        if purge_line_number > 0:
+                            purge_line_number -= 1
+                        else:
+                            yield line + linesep
+            elif purge_line_number > 0:
+                for line in clean_a_string.split(linesep):
+                    if purge_line_number > 0:
+                        purge_line_number -= 1
+                    else:
+                        yield line + linesep
+            else:
+                yield clean_a_string + linesep
+
+        if purge_line_number is None:
+            for clean_a_string in pending_line_list:
+                yield clean_a_string + linesep
+        elif purge_line_number == 0:
+            # the lead line removal splits on the line separator and keeps the
+            # empty string that follows the final line separator
+            yield linesep
+
+    def _split_diff_lines_by_file(self, dirty_diff_line_iterable):
+        """
+        Groups the lines of a raw git diff into the raw git diff lines for each
+        individual file.  The lines of a file are returned as soon as the header line
+        of the next file (or the end of the iterable) is reached.
+
+        :param dirty_diff_line_iterable: (iterable of strings) raw git diff lines
+         without line endings
+        :return: (Python generator of lists) raw git diff line lists for each file
+        """
+        file_diff_line_list = []
+        for a_string in dirty_diff_line_iterable:
+            if a_string.startswith("\x1b[1mdiff --git") or a_string.startswith(
+                "diff --git"
+            ):
+                if len(file_diff_line_list) > 0:
+                    yield file_diff_line_list
+                file_diff_line_list = []
+            file_diff_line_list.append(a_string)
+        if len(file_diff_line_list) > 0 and file_diff_line_list != [""]:
+            yield file_diff_line_list
+
+    def _get_diff_line_stream(self, diff_arg_list):
+        """
+        Reads the standard output stream of a git diff subprocess incrementally
+        through a pipe rather than as a single string after the process completes.
+
+        :param diff_arg_list: (list) git diff arguments
+        :return: (Python generator of strings) raw git diff lines without line endings
+        :raises: git.exc.GitCommandError if the git diff call fails
+        """
+        diff_process = self.git.diff(*diff_arg_list, as_process=True)
+        for line in diff_process.stdout:
+            if line.endswith(b"\n"):
+                line = line[:-1]
+            yield line.decode("utf-8", "surrogateescape")
+        # raises GitCommandError for non-zero exit status codes
+        diff_process.wait()
 
     # PUBLIC METHODS
 
     def get_diff_string_generator(self, git_user_diff_string):
         """
         Creates a Python generator that returns individual diff reports for filepaths
-        that match UFO spec filters.
+        that match UFO spec filters.  All UFO spec filters are passed to a single git
+        diff call and one diff report is returned for each file in git path order.
 
         Generator used as the creation of diff string across large numbers of *.glif
         file changes can take time to create.
@@ -99,36 +192,30 @@ class Diff(object):
         else:
             diff_arg_string = git_user_diff_string
 
+        # single git diff call with all UFO spec pathspecs, files are reported
+        # once each in git path order
+        diff_arg_list = [diff_arg_string, "--minimal"]
         if self.is_color_diff is True:
-            for ufo_file in ufo_file_list:
-                dirty_diff_string = self.git.diff(
-                    diff_arg_string, "--minimal", "--color", "--", ufo_file
-                )
-                cleaned_diff_string = self._clean_diff_string(dirty_diff_string)
-                # eliminates diff filters that did not include identified files
-                if len(cleaned_diff_string) > 1:
-                    if is_branch_test is True:
-                        cleaned_diff_string = (
-                            "branch "
-                            + diff_arg_string
-                            + os.linesep
-                            + cleaned_diff_string
-                        )
-                    yield cleaned_diff_string
+            diff_arg_list.append("--color")
+        diff_arg_list.append("--")
+        diff_arg_list.extend(ufo_file_list)
+        if self.is_stream_diff is True:
+            # memory is bounded by the largest diff of an individual file
+            dirty_diff_line_iterable = self._get_diff_line_stream(diff_arg_list)
         else:
-            for ufo_file in ufo_file_list:
-                dirty_diff_string = self.git.diff(
-                    diff_arg_string, "--minimal", "--", ufo_file
-                )
-                cleaned_diff_string = self._clean_diff_string(dirty_diff_string)
-                # eliminates diff filters that did not include identified files
-                if len(cleaned_diff_string) > 1:
-                    # add branch descriptions to the output from the diff
-                    if is_branch_test is True:
-                        cleaned_diff_string = (
-                            "branch "
-                            + diff_arg_string
-                            + os.linesep
-                            + cleaned_diff_string
-                        )
-                    yield cleaned_diff_string
+            dirty_diff_line_iterable = self.git.diff(*diff_arg_list).split("\n")
+
+        for dirty_file_diff_line_list in self._split_diff_lines_by_file(
+            dirty_diff_line_iterable
+        ):
+            cleaned_diff_string = "".join(
+                self._clean_diff_lines(dirty_file_diff_line_list)
+            )
+            # eliminates empty diff reports
+            if len(cleaned_diff_string) > 1:
+                # add branch descriptions to the output from the diff
+                if is_branch_test is True:
+                    cleaned_diff_string = (
+                        "branch " + diff_arg_string + os.linesep + cleaned_diff_string
+                    )
+                yield cleaned_diff_string
@@ -0,0 +1,185 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ====================================================
+# Copyright 2018 Christopher Simpkins
+# MIT License
+# ====================================================
+
+import binascii
+import os
+
+from git import Repo
+from gitdb import GitDB
+
+from ufodiff.utilities.gitdelta import get_diff_revisions, get_raw_diff_blob_list
+from ufodiff.utilities.glif import get_glyph_changes, parse_glif
+from ufodiff.utilities.parallel import is_parallel_workload, parallel_map
+from ufodiff.utilities.ufo import UfoDirectoryFilter, UfoPathClassifier
+from ufodiff.utilities.writer import StreamWriter
+
+
+class GlyphDiff(object):
+    """
+    GlyphDiff class performs a structural comparison of the *.glif glyph files that
+    changed between two git commits.  The changed glyph files and their blob SHA1 are
+    identified with a single `git diff --raw` call, glyph files with an unchanged blob
+    SHA1 are not read, and the blobs are read in-process through the gitdb object
+    database.  Large glyph deltas are compared in a process pool (see
+    ufodiff.utilities.parallel) and reported in filepath order.
+
+    :param gitrepo_path: (string) path to root of git repository
+    :param ufo_directory_list: (list) list of one or more UFO directories for filter
+     of results (user specified on CL)
+    :param workers: (int) number of worker processes for glyph comparisons, None for
+     the number of CPUs and 1 for sequential comparisons
+    """
+
+    def __init__(self, gitrepo_path, ufo_directory_list=None, workers=None):
+        self.gitrepo_path = gitrepo_path  # root path for git repository
+        self.workers = workers
+        # GitPython Repo object with in-process blob reads
+        self.repo = Repo(self.gitrepo_path, odbt=GitDB)
+        self.git = self.repo.git  # GitPython Repo.git object
+        self.ufo_classifier = UfoPathClassifier()
+        self.ufo_directory_filter = UfoDirectoryFilter(ufo_directory_list or [])
+
+    # PRIVATE METHODS
+
+    def _read_glyph(self, blob_sha1):
+        """
+        Reads and parses a *.glif blob from the git object database
+        :param blob_sha1: (string) hexadecimal blob SHA1 or None
+        :return: ufodiff.utilities.glif.Glyph object or None
+        """
+        if blob_sha1 is None:
+            return None
+        glif_data = self.repo.odb.stream(binascii.unhexlify(blob_sha1)).read()
+        return parse_glif(glif_data)
+
+    # PUBLIC METHODS
+
+    def get_glif_blob_list(self, base_revision, head_revision):
+        """
+        Defines the *.glif files that changed between two revisions with a single
+        `git diff --raw` call.
+
+        :param base_revision: (string) base revision (e.g. 'HEAD~2' or 'master')
+        :param head_revision: (string) head revision (e.g. 'HEAD' or 'feature')
+        :return: (list) (filepath, base blob SHA1 or None, head blob SHA1 or None)
+         tuples for the glyph files in user requested UFO directories
+        """
+        blob_record_list = []
+        for blob_record in get_raw_diff_blob_list(
+            self.git, base_revision, head_revision, ["*.glif"]
+        ):
+            filepath = blob_record[0]
+            if self.ufo_classifier.classify(filepath) != UfoPathClassifier.GLYPH:
+                continue
+            if len(self.ufo_directory_filter) > 0 and not (
+                self.ufo_directory_filter.matches(filepath)
+            ):
+                continue
+            blob_record_list.append(blob_record)
+        return blob_record_list
+
+    def get_glyph_changes(self, base_sha1, head_sha1):
+        """
+        Compares two *.glif blobs
+
+        :param base_sha1: (string) hexadecimal blob SHA1 or None for added glyphs
+        :param head_sha1: (string) hexadecimal blob SHA1 or None for deleted glyphs
+        :return: (list) change description strings
+        """
+        if base_sha1 is None:
+            return ["glyph added"]
+        elif head_sha1 is None:
+            return ["glyph deleted"]
+        return get_glyph_changes(
+            self._read_glyph(base_sha1), self._read_glyph(head_sha1)
+        )
+
+    def get_glyph_change_generator(self, diff_request):
+        """
+        Generator that yields the structural changes of each *.glif file that changed
+        in filepath order.  Glyph deltas with PARALLEL_MIN_ITEMS or more files are
+        compared in worker processes when more than one worker is requested.
+
+        :param diff_request: (string) 'commits:[N]' or 'branch:[name]'
+        :return: (Python generator of tuples) (filepath, change description list)
+        """
+        base_revision, head_revision = get_diff_revisions(self.git, diff_request)
+        blob_record_list = self.get_glif_blob_list(base_revision, head_revision)
+        if is_parallel_workload(len(blob_record_list), self.workers):
+            return parallel_map(
+                _compare_glif_blob_record,
+                blob_record_list,
+                workers=self.workers,
+                initializer=_init_glyph_worker,
+                initargs=(self.gitrepo_path,),
+            )
+        return (
+            (filepath, self.get_glyph_changes(base_sha1, head_sha1))
+            for filepath, base_sha1, head_sha1 in blob_record_list
+        )
+
+    def get_glyph_diff_string_generator(self, diff_request):
+        """
+        Generator that yields a structural diff report for each *.glif file that
+        changed.  Glyph files with XML formatting changes only are not reported.
+
+        :param diff_request: (string) 'commits:[N]' or 'branch:[name]'
+        :return: (Python generator of strings) glyph diff reports
+        """
+        for filepath, change_list in self.get_glyph_change_generator(diff_request):
+            if len(change_list) == 0:
+                continue
+            yield filepath + os.linesep + os.linesep.join(
+                "  " + change for change in change_list
+            )
+
+    def get_writer(self, diff_request):
+        """
+        Returns the report writer for a glyph diff request.
+        :param diff_request: (string) 'commits:[N]' or 'branch:[name]'
+        :return: (GlyphDiffTextWriter) report writer object
+        """
+        return GlyphDiffTextWriter(self, diff_request)
+
+
+# GlyphDiff object of a worker process, defined in _init_glyph_worker
+_worker_glyphdiff = None
+
+
+def _init_glyph_worker(gitrepo_path):
+    # executed once in each worker process
+    global _worker_glyphdiff
+    _worker_glyphdiff = GlyphDiff(gitrepo_path, workers=1)
+
+
+def _compare_glif_blob_record(blob_record):
+    # executed in a worker process, blobs are read from the worker object database
+    filepath, base_sha1, head_sha1 = blob_record
+    return filepath, _worker_glyphdiff.get_glyph_changes(base_sha1, head_sha1)
+
+
+class GlyphDiffTextWriter(StreamWriter):
+    """
+    Writes plain text format glyphdiff reports.  Glyph reports are written as they
+    are yielded by the (parallel) glyph comparison.
+
+    :param glyphdiff: (GlyphDiff) the GlyphDiff object
+    :param diff_request: (string) 'commits:[N]' or 'branch:[name]'
+    """
+
+    def __init__(self, glyphdiff, diff_request):
+        self.glyphdiff = glyphdiff
+        self.diff_request = diff_request
+
+    def write(self, outstream):
+        outstream.writelines(
+            diff_string + os.linesep
+            for diff_string in self.glyphdiff.get_glyph_diff_string_generator(
+                self.diff_request
+            )
+        )
@@ -0,0 +1,229 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ====================================================
+# Copyright 2018 Christopher Simpkins
+# MIT License
+# ====================================================
+
+import json
+import os
+import posixpath
+
+from ufodiff.subcommands.kerning import KerningDelta, KerningDeltaWriter
+from ufodiff.utilities.gitdelta import get_raw_diff_blob_list
+from ufodiff.utilities.groups import (
+    KerningGroupIndex,
+    get_group_kerning_changes,
+    load_groups,
+)
+from ufodiff.utilities.kerning import (
+    format_kerning_pair,
+    format_kerning_value,
+    load_kerning_pairs,
+)
+
+
+class GroupsDelta(KerningDelta):
+    """
+    GroupsDelta class stores the group membership changes for the `delta groups`,
+    `deltajson groups`, and `deltamd groups` application subcommand reports.  The
+    groups.plist files that changed are identified with a single `git diff --raw`
+    call.  The groups.plist and kerning.plist files of the UFO source are read from
+    the base and head revision trees through the gitdb object database and each
+    membership change is reported with the effective kerning pairs that it affects.
+
+    Commit history tests compare HEAD~N with HEAD (uncommitted working tree changes are
+    not included).
+
+    See KerningDelta for the parameters.
+    """
+
+    def __init__(self, *args, **kwargs):
+        # (filepath, GroupMembershipChange list) tuples ordered by filepath
+        self.group_changes_list = []
+        super(GroupsDelta, self).__init__(*args, **kwargs)
+
+    # PRIVATE METHODS
+
+    def _define_kerning_changes(self):
+        """
+        Defines the GroupsDelta class group_changes_list property on instantiation of
+        the object
+        :return: no return object
+        """
+        base_tree = self.repo.commit(self.base_revision).tree
+        head_tree = self.repo.commit(self.head_revision).tree
+        for filepath, _, _ in get_raw_diff_blob_list(
+            self.git, self.base_revision, self.head_revision, ["*groups.plist"]
+        ):
+            if not self.ufo.is_groups_file(filepath):
+                continue
+            if not self._is_requested_file(filepath):
+                continue
+            group_changes = get_group_kerning_changes(
+                self._get_kerning_group_index(base_tree, filepath),
+                self._get_kerning_group_index(head_tree, filepath),
+            )
+            if len(group_changes) > 0:
+                self.group_changes_list.append((filepath, group_changes))
+
+    def _get_kerning_group_index(self, tree, groups_filepath):
+        """
+        Reads the groups.plist and kerning.plist files of a UFO source from a commit
+        tree and defines the group : kerning pair index
+        :param tree: GitPython Tree object of the revision
+        :param groups_filepath: (string) git repository relative groups.plist filepath
+        :return: (KerningGroupIndex) the revision index
+        """
+        kerning_filepath = posixpath.join(
+            posixpath.dirname(groups_filepath), "kerning.plist"
+        )
+        groups_data = self._read_tree_file(tree, groups_filepath)
+        kerning_data = self._read_tree_file(tree, kerning_filepath)
+        return KerningGroupIndex(
+            {} if kerning_data is None else load_kerning_pairs(kerning_data),
+            {} if groups_data is None else load_groups(groups_data),
+        )
+
+    @staticmethod
+    def _read_tree_file(tree, filepath):
+        """
+        Reads a file from a commit tree
+        :param tree: GitPython Tree object
+        :param filepath: (string) git repository relative filepath
+        :return: (bytes) file data or None if the file is not in the tree
+        """
+        try:
+            blob = tree / filepath
+        except KeyError:
+            return None
+        return blob.data_stream.read()
+
+    # PUBLIC METHODS
+
+    def get_writer(self, write_format=None):
+        """
+        Returns the report writer for the write_format type.
+        :param write_format: (string) options include 'text', 'json', and 'markdown'
+        :return: (KerningDeltaWriter) report writer object for this GroupsDelta object
+        """
+        return GROUPS_DELTA_WRITERS[write_format](self)
+
+
+def _format_affected_pair(affected_pair):
+    pair, value = affected_pair
+    return format_kerning_pair(pair) + " = " + format_kerning_value(value)
+
+
+class GroupsDeltaTextWriter(KerningDeltaWriter):
+    """
+    Writes plain text format `delta groups` subcommand reports.
+    """
+
+    def write(self, outstream):
+        linesep = os.linesep
+        self._write_text_header(outstream)
+        for filepath, group_changes in self.delta.group_changes_list:
+            outstream.write("[G]:" + filepath + linesep)
+            for group_change in group_changes:
+                for indicator, member_list in (
+                    ("[A]:", group_change.added),
+                    ("[D]:", group_change.removed),
+                ):
+                    for glyph_name, affected_pair_list in member_list:
+                        outstream.write(
+                            indicator + group_change.group + " " + glyph_name + linesep
+                        )
+                        outstream.writelines(
+                            " " + _format_affected_pair(affected_pair) + linesep
+                            for affected_pair in affected_pair_list
+                        )
+
+
+class GroupsDeltaJSONWriter(KerningDeltaWriter):
+    """
+    Writes JSON format `deltajson groups` subcommand reports.  Affected pairs are
+    written as [first glyph, second glyph, value] arrays.
+    """
+
+    def get_groups_dict(self):
+        """
+        :return: (dict) JSON serializable groups report data
+        """
+        groups_dict = {}
+        for filepath, group_changes in self.delta.group_changes_list:
+            groups_dict[filepath] = [
+                {
+                    "group": group_change.group,
+                    "added": [
+                        {
+                            "glyph": glyph_name,
+                            "pairs": [
+                                [pair[0], pair[1], value]
+                                for pair, value in affected_pair_list
+                            ],
+                        }
+                        for glyph_name, affected_pair_list in group_change.added
+                    ],
+                    "removed": [
+                        {
+                            "glyph": glyph_name,
+                            "pairs": [
+                                [pair[0], pair[1], value]
+                                for pair, value in affected_pair_list
+                            ],
+                        }
+                        for glyph_name, affected_pair_list in group_change.removed
+                    ],
+                }
+                for group_change in group_changes
+            ]
+        report_dict = self._get_json_header_dict()
+        report_dict["groups"] = groups_dict
+        return report_dict
+
+    def write(self, outstream):
+        json.dump(self.get_groups_dict(), outstream)
+
+
+class GroupsDeltaMarkdownWriter(KerningDeltaWriter):
+    """
+    Writes Markdown format `deltamd groups` subcommand reports.
+    """
+
+    def write(self, outstream):
+        linesep = os.linesep
+        self._write_markdown_header(outstream)
+        if len(self.delta.group_changes_list) == 0:
+            outstream.write("## Group Changes" + linesep + "- None" + linesep)
+
+        for filepath, group_changes in self.delta.group_changes_list:
+            outstream.write("## Groups: " + filepath + linesep)
+            for group_change in group_changes:
+                outstream.write("### " + group_change.group + linesep)
+                for title, member_list in (
+                    ("Added", group_change.added),
+                    ("Removed", group_change.removed),
+                ):
+                    for glyph_name, affected_pair_list in member_list:
+                        outstream.write(
+                            "- " + title + " `" + glyph_name + "`" + linesep
+                        )
+                        outstream.writelines(
+                            "  - `"
+                            + format_kerning_pair(pair)
+                            + "` "
+                            + format_kerning_value(value)
+                            + linesep
+                            for pair, value in affected_pair_list
+                        )
+            outstream.write(linesep)
+        self._write_markdown_footer(outstream)
+
+
+GROUPS_DELTA_WRITERS = {
+    "text": GroupsDeltaTextWriter,
+    "json": GroupsDeltaJSONWriter,
+    "markdown": GroupsDeltaMarkdownWriter,
+}
@@ -0,0 +1,461 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ====================================================
+# Copyright 2018 Christopher Simpkins
+# MIT License
+# ====================================================
+
+import binascii
+import json
+import os
+
+from git import Repo
+from gitdb import GitDB
+
+from ufodiff.settings import major_version, minor_version, patch_version
+from ufodiff.utilities.gitdelta import get_raw_diff_blob_list
+from ufodiff.utilities.kerning import (
+    format_kerning_pair,
+    format_kerning_value,
+    get_kerning_pair_changes,
+    load_kerning_pairs,
+)
+from ufodiff.utilities.ufo import Ufo, UfoDirectoryFilter
+from ufodiff.utilities.writer import StreamWriter
+
+
+class KerningDelta(object):
+    """
+    KerningDelta class stores the kerning pair changes for the `delta kerning`,
+    `deltajson kerning`, and `deltamd kerning` application subcommand reports.  The
+    kerning.plist files that changed and their blob SHA1 are identified with a single
+    `git diff --raw` call, each blob is read once through the gitdb object database
+    and loaded into a flat (first, second) : value pair dictionary.
+
+    Commit history tests compare HEAD~N with HEAD (uncommitted working tree changes are
+    not included).
+
+    :param gitrepo_path: (string) absolute file path to the root level of the git
+     repository for analysis (automatically detected in ufodiff.app.py)
+    :param ufo_directory_list: (list) list of one or more UFO directories for filter
+     of results (user specified on CL)
+    :param is_commit_test: (boolean) flag for request as test of commit history in
+     the git repository
+    :param commit_number: (string) the number of commits in git commit history for
+     analysis as string (user specified)
+    :param is_branch_test: (boolean) flag for request as test of branch vs. branch
+     in git repository
+    :param compare_branch_name: (string) the branch name requested by user for test
+     vs. current branch (user specified)
+    """
+
+    def __init__(
+        self,
+        gitrepo_path,
+        ufo_directory_list,
+        is_commit_test=False,
+        commit_number="0",
+        is_branch_test=False,
+        compare_branch_name=None,
+    ):
+        self.gitrepo_path = gitrepo_path  # root path for git repository
+        self.ufo_directory_list = ufo_directory_list
+        self.is_commit_test = is_commit_test
+        self.commit_number = commit_number
+        self.is_branch_test = is_branch_test
+        self.compare_branch_name = compare_branch_name
+        self.current_branch_name = ""
+        self.ufo = Ufo()  # ufodiff.utilities.ufo.Ufo object
+        self.ufo_directory_filter = UfoDirectoryFilter(ufo_directory_list)
+        # GitPython Repo object with in-process blob reads
+        self.repo = Repo(self.gitrepo_path, odbt=GitDB)
+        self.git = self.repo.git  # GitPython Repo.git object
+
+        # commit SHA1 short codes (commit test) or branch names (branch test)
+        self.commit_sha1_list = []
+        self.branch_list = []
+        # compared revisions, defined in _define_revisions
+        self.base_revision = None
+        self.head_revision = None
+        # (filepath, KerningPairChanges) tuples ordered by filepath
+        self.kerning_changes_list = []
+
+        self._define_revisions()
+        self._define_kerning_changes()
+
+    # PRIVATE METHODS
+
+    def _define_revisions(self):
+        """
+        Defines the compared revisions and the commit SHA1 or branch names for the
+        report on instantiation of the object
+        :return: no return object
+        """
+        if self.is_commit_test is True:
+            self.base_revision = "HEAD~" + self.commit_number
+            self.head_revision = "HEAD"
+            # git log -[N] --pretty=%h ===> newline delimited list of SHA1 x N commit
+            self.commit_sha1_list = self.git.log(
+                ["-" + self.commit_number, "--pretty=%h"]
+            ).split("\n")
+        elif self.is_branch_test is True:
+            self.current_branch_name = self.git.rev_parse(["--abbrev-ref", "HEAD"])
+            self.base_revision = self.compare_branch_name
+            self.head_revision = self.current_branch_name
+            self.branch_list = [self.compare_branch_name, self.current_branch_name]
+
+    def _is_requested_file(self, filepath):
+        """
+        Tests a filepath against the user defined UFO directory filters
+        :param filepath: (string) git repository relative filepath
+        :return: (boolean) True if there are no filters or the filepath matches one
+        """
+        return len(self.ufo_directory_filter) == 0 or (
+            self.ufo_directory_filter.matches(filepath)
+        )
+
+    def _define_kerning_changes(self):
+        """
+        Defines the KerningDelta class kerning_changes_list property on instantiation
+        of the object
+        :return: no return object
+        """
+        for filepath, base_sha1, head_sha1 in get_raw_diff_blob_list(
+            self.git, self.base_revision, self.head_revision, ["*kerning.plist"]
+        ):
+            if not self.ufo.is_kerning_file(filepath):
+                continue
+            if not self._is_requested_file(filepath):
+                continue
+            kerning_changes = get_kerning_pair_changes(
+                self._read_kerning_pairs(base_sha1),
+                self._read_kerning_pairs(head_sha1),
+            )
+            if len(kerning_changes) > 0:
+                self.kerning_changes_list.append((filepath, kerning_changes))
+
+    def _read_kerning_pairs(self, blob_sha1):
+        """
+        Reads and loads a kerning.plist blob from the git object database
+        :param blob_sha1: (string) hexadecimal blob SHA1 or None
+        :return: (dict) (first, second) : value dictionary, empty for added or deleted
+         files
+        """
+        if blob_sha1 is None:
+            return {}
+        kerning_data = self.repo.odb.stream(binascii.unhexlify(blob_sha1)).read()
+        return load_kerning_pairs(kerning_data)
+
+    # PUBLIC METHODS
+
+    def get_stdout_string(self, write_format=None):
+        """
+        :param write_format: (string) options include 'text', 'json', and 'markdown'
+        :return: (string) kerning change report formatted according to write_format
+        """
+        return self.get_writer(write_format).get_string()
+
+    def get_writer(self, write_format=None):
+        """
+        Returns the report writer for the write_format type.
+        :param write_format: (string) options include 'text', 'json', and 'markdown'
+        :return: (KerningDeltaWriter) report writer object for this KerningDelta object
+        """
+        return KERNING_DELTA_WRITERS[write_format](self)
+
+
+class KerningDeltaWriter(StreamWriter):
+    """
+    Base class for the kerning report writers.
+
+    :param kerning_delta: (ufodiff.subcommands.kerning.KerningDelta) the KerningDelta
+     object with report data
+    """
+
+    def __init__(self, kerning_delta):
+        self.delta = kerning_delta
+
+    def _write_text_header(self, outstream):
+        linesep = os.linesep
+        if self.delta.is_commit_test is True:
+            if len(self.delta.commit_sha1_list) > 0:
+                outstream.write(
+                    linesep + "Commit history SHA1 for this analysis:" + linesep
+                )
+                outstream.writelines(
+                    " " + sha1_commit + linesep
+                    for sha1_commit in self.delta.commit_sha1_list
+                )
+                outstream.write(linesep)
+        elif self.delta.is_branch_test is True:
+            outstream.write(linesep + "Branches under analysis:" + linesep)
+            outstream.writelines(
+                " " + branch + linesep for branch in self.delta.branch_list
+            )
+            outstream.write(linesep)
+
+    def _write_markdown_header(self, outstream):
+        linesep = os.linesep
+        if self.delta.is_commit_test is True:
+            if len(self.delta.commit_sha1_list) > 0:
+                outstream.write(
+                    linesep + "## Commit history SHA1 for this analysis:" + linesep
+                )
+                outstream.writelines(
+                    "- `" + sha1_commit + "`" + linesep
+                    for sha1_commit in self.delta.commit_sha1_list
+                )
+                outstream.write(linesep)
+        elif self.delta.is_branch_test is True:
+            outstream.write(linesep + "## Branches under analysis:" + linesep)
+            outstream.writelines(
+                "- " + branch + linesep for branch in self.delta.branch_list
+            )
+            outstream.write(linesep)
+
+    def _write_markdown_footer(self, outstream):
+        # Project URL + version footer
+        outstream.write(
+            os.linesep
+            + "---"
+            + os.linesep
+            + "[ufodiff](https://github.com/source-foundry/ufodiff) v"
+            + major_version
+            + "."
+            + minor_version
+            + "."
+            + patch_version
+        )
+
+    def _get_json_header_dict(self):
+        if self.delta.is_commit_test is True:
+            return {"commits": self.delta.commit_sha1_list}
+        return {"branches": self.delta.branch_list}
+
+
+class KerningDeltaTextWriter(KerningDeltaWriter):
+    """
+    Writes plain text format `delta kerning` subcommand reports.
+    """
+
+    def _write_histogram(self, outstream, title, histogram, signed=False):
+        if len(histogram) == 0:
+            return
+        outstream.write(" " + title + ":" + os.linesep)
+        outstream.writelines(
+            "  "
+            + format_kerning_value(value, signed=signed)
+            + ": "
+            + str(count)
+            + os.linesep
+            for value, count in histogram
+        )
+
+    def write(self, outstream):
+        linesep = os.linesep
+        self._write_text_header(outstream)
+        for filepath, kerning_changes in self.delta.kerning_changes_list:
+            outstream.write("[K]:" + filepath + linesep)
+            outstream.write(
+                " pairs: "
+                + str(kerning_changes.old_pair_number)
+                + " -> "
+                + str(kerning_changes.new_pair_number)
+                + " (added "
+                + str(len(kerning_changes.added))
+                + ", removed "
+                + str(len(kerning_changes.removed))
+                + ", changed "
+                + str(len(kerning_changes.changed))
+                + ")"
+                + linesep
+            )
+            outstream.writelines(
+                "[A]:"
+                + format_kerning_pair(pair)
+                + " = "
+                + format_kerning_value(value)
+                + linesep
+                for pair, value in kerning_changes.added
+            )
+            outstream.writelines(
+                "[D]:"
+                + format_kerning_pair(pair)
+                + " = "
+                + format_kerning_value(value)
+                + linesep
+                for pair, value in kerning_changes.removed
+            )
+            outstream.writelines(
+                "[M]:"
+                + format_kerning_pair(pair)
+                + ": "
+                + format_kerning_value(old_value)
+                + " -> "
+                + format_kerning_value(new_value)
+                + linesep
+                for pair, old_value, new_value in kerning_changes.changed
+            )
+            self._write_histogram(
+                outstream, "added values", kerning_changes.get_added_value_histogram()
+            )
+            self._write_histogram(
+                outstream,
+                "removed values",
+                kerning_changes.get_removed_value_histogram(),
+            )
+            self._write_histogram(
+                outstream,
+                "value changes",
+                kerning_changes.get_value_change_histogram(),
+                signed=True,
+            )
+
+
+class KerningDeltaJSONWriter(KerningDeltaWriter):
+    """
+    Writes JSON format `deltajson kerning` subcommand reports.  Pairs are written as
+    [first, second, value] and [first, second, old value, new value] arrays and
+    histograms as [value, pair number] arrays.
+    """
+
+    def get_kerning_dict(self):
+        """
+        :return: (dict) JSON serializable kerning report data
+        """
+        kerning_dict = {}
+        for filepath, kerning_changes in self.delta.kerning_changes_list:
+            kerning_dict[filepath] = {
+                "pairs": [
+                    kerning_changes.old_pair_number,
+                    kerning_changes.new_pair_number,
+                ],
+                "added": [
+                    [pair[0], pair[1], value] for pair, value in kerning_changes.added
+                ],
+                "removed": [
+                    [pair[0], pair[1], value] for pair, value in kerning_changes.removed
+                ],
+                "changed": [
+                    [pair[0], pair[1], old_value, new_value]
+                    for pair, old_value, new_value in kerning_changes.changed
+                ],
+                "histograms": {
+                    "added": kerning_changes.get_added_value_histogram(),
+                    "removed": kerning_changes.get_removed_value_histogram(),
+                    "changed": kerning_changes.get_value_change_histogram(),
+                },
+            }
+        report_dict = self._get_json_header_dict()
+        report_dict["kerning"] = kerning_dict
+        return report_dict
+
+    def write(self, outstream):
+        json.dump(self.get_kerning_dict(), outstream)
+
+
+class KerningDeltaMarkdownWriter(KerningDeltaWriter):
+    """
+    Writes Markdown format `deltamd kerning` subcommand reports.
+    """
+
+    def _write_pair_block(self, outstream, title, line_list):
+        outstream.write("### " + title + os.linesep)
+        if len(line_list) > 0:
+            outstream.writelines("- " + line + os.linesep for line in line_list)
+        else:
+            outstream.write("- None" + os.linesep)
+
+    def _write_histogram_table(self, outstream, title, value_title, histogram):
+        if len(histogram) == 0:
+            return
+        outstream.write(os.linesep + "### " + title + os.linesep)
+        outstream.write("| " + value_title + " | Pairs |" + os.linesep)
+        outstream.write("| --- | --- |" + os.linesep)
+        outstream.writelines(
+            "| " + value + " | " + str(count) + " |" + os.linesep
+            for value, count in histogram
+        )
+
+    def write(self, outstream):
+        linesep = os.linesep
+        self._write_markdown_header(outstream)
+        if len(self.delta.kerning_changes_list) == 0:
+            outstream.write("## Kerning Changes" + linesep + "- None" + linesep)
+
+        for filepath, kerning_changes in self.delta.kerning_changes_list:
+            outstream.write("## Kerning: " + filepath + linesep)
+            outstream.write(
+                "Pairs: "
+                + str(kerning_changes.old_pair_number)
+                + " -> "
+                + str(kerning_changes.new_pair_number)
+                + linesep
+                + linesep
+            )
+            self._write_pair_block(
+                outstream,
+                "Added Pairs",
+                [
+                    "`" + format_kerning_pair(pair) + "` " + format_kerning_value(value)
+                    for pair, value in kerning_changes.added
+                ],
+            )
+            self._write_pair_block(
+                outstream,
+                "Removed Pairs",
+                [
+                    "`" + format_kerning_pair(pair) + "` " + format_kerning_value(value)
+                    for pair, value in kerning_changes.removed
+                ],
+            )
+            self._write_pair_block(
+                outstream,
+                "Changed Pairs",
+                [
+                    "`"
+                    + format_kerning_pair(pair)
+                    + "` "
+                    + format_kerning_value(old_value)
+                    + " -> "
+                    + format_kerning_value(new_value)
+                    for pair, old_value, new_value in kerning_changes.changed
+                ],
+            )
+            self._write_histogram_table(
+                outstream,
+                "Added Value Histogram",
+                "Value",
+                [
+                    (format_kerning_value(value), count)
+                    for value, count in kerning_changes.get_added_value_histogram()
+                ],
+            )
+            self._write_histogram_table(
+                outstream,
+                "Removed Value Histogram",
+                "Value",
+                [
+                    (format_kerning_value(value), count)
+                    for value, count in kerning_changes.get_removed_value_histogram()
+                ],
+            )
+            self._write_histogram_table(
+                outstream,
+                "Value Change Histogram",
+                "Change",
+                [
+                    (format_kerning_value(value, signed=True), count)
+                    for value, count in kerning_changes.get_value_change_histogram()
+                ],
+            )
+            outstream.write(linesep)
+        self._write_markdown_footer(outstream)
+
+
+KERNING_DELTA_WRITERS = {
+    "text": KerningDeltaTextWriter,
+    "json": KerningDeltaJSONWriter,
+    "markdown": KerningDeltaMarkdownWriter,
+}
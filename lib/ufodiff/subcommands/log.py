@@ -0,0 +1,171 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ====================================================
+# Copyright 2018 Christopher Simpkins
+# MIT License
+# ====================================================
+
+import json
+
+from git import Repo
+
+from ufodiff.utilities.gitlog import (
+    LOG_FORMAT,
+    iter_nul_delimited_tokens,
+    iter_stream_chunks,
+    parse_log_tokens,
+)
+from ufodiff.utilities.ufo import UfoDirectoryFilter, UfoPathClassifier
+from ufodiff.utilities.writer import StreamWriter
+
+
+class Log(object):
+    """
+    Log class streams the UFO source files that were added, deleted, and modified in
+    each commit of a commit range for the `ufodiff log` application subcommand.  The
+    per-commit changes are parsed incrementally from the standard output stream of a
+    single `git log --name-status -z` call and the filepaths are classified with the
+    batch UFO path classifier.  Commits without UFO source file changes are not
+    reported.
+
+    The git log call is not limited with pathspecs.  Pathspecs enable git history
+    simplification, which compares the trees of every commit with its parents and
+    is several times slower than the name-status output of all files.
+
+    :param gitrepo_path: (string) path to root of git repository
+    :param ufo_directory_list: (list) user defined UFO source directory filters
+    """
+
+    def __init__(self, gitrepo_path, ufo_directory_list=None):
+        self.gitrepo_path = gitrepo_path
+        self.repo = Repo(self.gitrepo_path)
+        self.git = self.repo.git
+        self.ufo_classifier = UfoPathClassifier()
+        self.ufo_directory_filter = UfoDirectoryFilter(ufo_directory_list or [])
+
+    # PRIVATE METHODS
+
+    @staticmethod
+    def _get_revision_arg_list(log_request):
+        """
+        Defines the git log revision arguments for a log request
+        :param log_request: (string) 'commits:[N]', 'branch:[name]', or
+         '[base]..[head]'
+        :return: (list) git log revision arguments
+        :raises: ValueError for invalid requests
+        """
+        if log_request.startswith("commits:"):
+            # the N most recent commits reachable from HEAD (`git log -[N]`)
+            return ["-" + log_request.split(":", 1)[1], "HEAD"]
+        elif log_request.startswith("branch:"):
+            # commits of the current branch that are not in the requested branch
+            return [log_request.split(":", 1)[1] + "..HEAD"]
+        elif ".." in log_request:
+            return [log_request]
+        raise ValueError(
+            "'" + log_request + "' is not a valid request. Please use the "
+            "'commits:[N]', 'branch:[name]', or '[base]..[head]' syntax"
+        )
+
+    def _filter_ufo_filepaths(self, filepath_list):
+        """
+        :param filepath_list: (list) git repository relative filepaths
+        :return: (list) UFO source filepaths that match the user defined UFO filters
+        """
+        if len(filepath_list) == 0:
+            return filepath_list
+        category_list = self.ufo_classifier.classify_many(filepath_list)
+        ufo_filepath_list = [
+            filepath
+            for filepath, category in zip(filepath_list, category_list)
+            if category != UfoPathClassifier.NOT_UFO
+        ]
+        if len(self.ufo_directory_filter) > 0:
+            return self.ufo_directory_filter.filter(ufo_filepath_list)
+        return ufo_filepath_list
+
+    # PUBLIC METHODS
+
+    def get_commit_changes_generator(self, log_request):
+        """
+        Creates a Python generator that returns one CommitChanges object per commit
+        with UFO source file changes in git log order (most recent commit first).  The
+        git log subprocess is stopped when the generator is closed before the end of
+        the history.
+
+        :param log_request: (string) 'commits:[N]', 'branch:[name]', or
+         '[base]..[head]'
+        :return: (Python generator of ufodiff.utilities.gitlog.CommitChanges)
+        :raises: git.exc.GitCommandError if the git log call fails
+        """
+        log_arg_list = [
+            "-z",
+            "--name-status",
+            "--no-renames",
+            "--format=" + LOG_FORMAT,
+        ]
+        log_arg_list.extend(self._get_revision_arg_list(log_request))
+        log_arg_list.append("--")
+        log_process = self.git.log(*log_arg_list, as_process=True)
+        is_complete = False
+        try:
+            for commit_changes in parse_log_tokens(
+                iter_nul_delimited_tokens(iter_stream_chunks(log_process.stdout))
+            ):
+                commit_changes.added = self._filter_ufo_filepaths(commit_changes.added)
+                commit_changes.deleted = self._filter_ufo_filepaths(
+                    commit_changes.deleted
+                )
+                commit_changes.modified = self._filter_ufo_filepaths(
+                    commit_changes.modified
+                )
+                if len(commit_changes) > 0:
+                    yield commit_changes
+            is_complete = True
+        finally:
+            if is_complete:
+                # raises GitCommandError for non-zero exit status codes
+                log_process.wait()
+            else:
+                # generator closed early or parse error
+                log_process.proc.kill()
+                log_process.proc.wait()
+
+    def get_writer(self, log_request):
+        """
+        Returns the newline delimited JSON report writer for a log request
+        :param log_request: (string) 'commits:[N]', 'branch:[name]', or
+         '[base]..[head]'
+        :return: (LogJSONWriter) report writer object
+        """
+        return LogJSONWriter(self, log_request)
+
+
+class LogJSONWriter(StreamWriter):
+    """
+    Writes `ufodiff log` reports as newline delimited JSON, one object per commit with
+    'commit', 'timestamp', 'author', 'subject', 'added', 'deleted', and 'modified'
+    keys.  Each line is written as soon as the commit is parsed.
+    """
+
+    def __init__(self, log, log_request):
+        self.log = log
+        self.log_request = log_request
+
+    def write(self, outstream):
+        for commit_changes in self.log.get_commit_changes_generator(self.log_request):
+            outstream.write(
+                json.dumps(
+                    {
+                        "commit": commit_changes.commit_sha1,
+                        "timestamp": commit_changes.timestamp,
+                        "author": commit_changes.author,
+                        "subject": commit_changes.subject,
+                        "added": commit_changes.added,
+                        "deleted": commit_changes.deleted,
+                        "modified": commit_changes.modified,
+                    }
+                )
+                + "\n"
+            )
@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ====================================================
+# Copyright 2018 Christopher Simpkins
+# MIT License
+# ====================================================
+
+import binascii
+import os
+
+from git import Repo
+from gitdb import GitDB
+
+from ufodiff.utilities.gitdelta import get_diff_revisions, get_raw_diff_blob_list
+from ufodiff.utilities.plist import load_plist
+from ufodiff.utilities.plistdiff import format_key_path_change, get_key_path_changes
+from ufodiff.utilities.ufo import Ufo, UfoDirectoryFilter
+
+
+class PlistDiff(object):
+    """
+    PlistDiff class performs a key path comparison of the UFO fontinfo.plist and
+    lib.plist files that changed between two git commits.  The changed files and their
+    blob SHA1 are identified with a single `git diff --raw` call and each blob is read
+    and loaded once through the gitdb object database.  Property list formatting and
+    key order changes are not reported.
+
+    :param gitrepo_path: (string) path to root of git repository
+    :param ufo_directory_list: (list) list of one or more UFO directories for filter
+     of results (user specified on CL)
+    """
+
+    def __init__(self, gitrepo_path, ufo_directory_list=None):
+        self.gitrepo_path = gitrepo_path  # root path for git repository
+        # GitPython Repo object with in-process blob reads
+        self.repo = Repo(self.gitrepo_path, odbt=GitDB)
+        self.git = self.repo.git  # GitPython Repo.git object
+        self.ufo = Ufo()  # ufodiff.utilities.ufo.Ufo object
+        self.ufo_directory_filter = UfoDirectoryFilter(ufo_directory_list or [])
+
+    # PRIVATE METHODS
+
+    def _read_plist(self, blob_sha1):
+        """
+        Reads and loads a property list blob from the git object database
+        :param blob_sha1: (string) hexadecimal blob SHA1
+        :return: Python object
+        """
+        plist_data = self.repo.odb.stream(binascii.unhexlify(blob_sha1)).read()
+        return load_plist(plist_data)
+
+    # PUBLIC METHODS
+
+    def get_plist_blob_list(self, base_revision, head_revision):
+        """
+        Defines the fontinfo.plist and lib.plist files that changed between two
+        revisions with a single `git diff --raw` call.
+
+        :param base_revision: (string) base revision (e.g. 'HEAD~2' or 'master')
+        :param head_revision: (string) head revision (e.g. 'HEAD' or 'feature')
+        :return: (list) (filepath, base blob SHA1 or None, head blob SHA1 or None)
+         tuples for the files in user requested UFO directories
+        """
+        blob_record_list = []
+        for blob_record in get_raw_diff_blob_list(
+            self.git,
+            base_revision,
+            head_revision,
+            self.ufo.get_plist_diff_filterlist(),
+        ):
+            filepath = blob_record[0]
+            if not self.ufo.is_plist_diff_file(filepath):
+                continue
+            if len(self.ufo_directory_filter) > 0 and not (
+                self.ufo_directory_filter.matches(filepath)
+            ):
+                continue
+            blob_record_list.append(blob_record)
+        return blob_record_list
+
+    def get_plist_changes(self, base_sha1, head_sha1):
+        """
+        Compares two property list blobs by key path
+
+        :param base_sha1: (string) hexadecimal blob SHA1 or None for added files
+        :param head_sha1: (string) hexadecimal blob SHA1 or None for deleted files
+        :return: (list) change description strings
+        """
+        if base_sha1 is None:
+            return ["file added"]
+        elif head_sha1 is None:
+            return ["file deleted"]
+        return [
+            format_key_path_change(change)
+            for change in get_key_path_changes(
+                self._read_plist(base_sha1), self._read_plist(head_sha1)
+            )
+        ]
+
+    def get_plist_diff_string_generator(self, diff_request):
+        """
+        Generator that yields a key path diff report for each fontinfo.plist and
+        lib.plist file that changed.  Files with formatting changes only are not
+        reported.
+
+        :param diff_request: (string) 'commits:[N]' or 'branch:[name]'
+        :return: (Python generator of strings) property list diff reports
+        """
+        base_revision, head_revision = get_diff_revisions(self.git, diff_request)
+        for filepath, base_sha1, head_sha1 in self.get_plist_blob_list(
+            base_revision, head_revision
+        ):
+            change_list = self.get_plist_changes(base_sha1, head_sha1)
+            if len(change_list) == 0:
+                continue
+            yield filepath + os.linesep + os.linesep.join(
+                "  " + change for change in change_list
+            )
@@ -0,0 +1,495 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ====================================================
+# Copyright 2018 Christopher Simpkins
+# MIT License
+# ====================================================
+
+"""
+The serve.py module defines the `ufodiff serve` daemon.  The daemon answers the
+delta / deltajson / deltajsonl / deltamd (all, glyph, nonglyph reports) and the
+diff / diffnc requests of `ufodiff-client` (see ufodiff.client for the JSON protocol)
+over a local Unix socket.
+
+Warm state that is held across requests for each git repository:
+ - the GitPython Repo object with the pure Python gitdb object database
+ - the UFO path classifier directory cache
+ - the contents.plist glyph name index
+ - the Diff objects and the current branch name
+ - report results of requests that are fully defined by commit SHA1s (branch and
+   revision range requests, commit history requests with the in-process engines)
+
+Requests that include the working tree (commit history requests with the
+subprocess engine, diff commits:[N] requests) are evaluated on every request.  The
+repository state is rebuilt when HEAD, the packed refs, or the pack files of the
+repository change.
+
+Requests are handled one at a time in the order that they are received.
+"""
+
+import collections
+import contextlib
+import io
+import json
+import os
+import signal
+import socket
+import socketserver
+import sys
+
+from commandlines import Command
+from git import Repo
+from gitdb import GitDB
+
+from ufodiff.client import SERVE_SOCKET_OPTION, get_default_socket_path
+from ufodiff.subcommands.batch import parse_delta_range
+from ufodiff.subcommands.delta import Delta
+from ufodiff.subcommands.diff import Diff
+from ufodiff.utilities.contents import GlyphNameIndex
+from ufodiff.utilities.gitdelta import SUBPROCESS_ENGINE, TREE_ENGINES
+from ufodiff.utilities.ufo import UfoPathClassifier
+
+# maximum number of report results that are held in memory
+SERVE_RESULT_CACHE_SIZE = 256
+# report format of the delta subcommands
+SERVE_DELTA_WRITE_FORMATS = {
+    "delta": "text",
+    "deltajson": "json",
+    "deltajsonl": "jsonl",
+    "deltamd": "markdown",
+}
+SERVE_DELTA_REPORTS = ("all", "glyph", "nonglyph")
+
+
+def get_repository_fingerprint(git_dir):
+    """
+    Defines a fingerprint of the git repository state that is not tracked by commit
+    SHA1s (the checked out branch, packed refs, and pack files)
+    :param git_dir: (string) path to the .git directory
+    :return: (tuple) fingerprint
+    """
+    fingerprint_list = []
+    with open(os.path.join(git_dir, "HEAD"), "rb") as head_file:
+        fingerprint_list.append(head_file.read())
+    for filepath in (
+        os.path.join(git_dir, "packed-refs"),
+        os.path.join(git_dir, "objects", "pack"),
+    ):
+        try:
+            fingerprint_list.append(os.stat(filepath).st_mtime_ns)
+        except OSError:
+            fingerprint_list.append(None)
+    return tuple(fingerprint_list)
+
+
+class ServeRepository(object):
+    """
+    Warm state of one git repository in the `ufodiff serve` daemon
+
+    :param gitrepo_path: (string) path to root of git repository
+    """
+
+    def __init__(self, gitrepo_path):
+        self.gitrepo_path = gitrepo_path
+        # the subprocess engine only uses the Repo object to call git, the in-process
+        # engines and glyph name lookups read objects with the gitdb object database
+        self.repo = Repo(gitrepo_path, odbt=GitDB)
+        self.fingerprint = get_repository_fingerprint(self.repo.git_dir)
+        self.ufo_classifier = UfoPathClassifier()
+        # use_cache : GlyphNameIndex
+        self.glyph_name_index_dict = {}
+        # color_diff : Diff
+        self.diff_dict = {}
+        self.current_branch_name = None
+
+    def is_current(self):
+        """
+        :return: (boolean) True if the repository state has not changed since the
+         object was created
+        """
+        try:
+            return get_repository_fingerprint(self.repo.git_dir) == self.fingerprint
+        except (IOError, OSError):
+            return False
+
+    def get_current_branch_name(self):
+        """
+        :return: (string) current branch name or 'HEAD' for a detached HEAD
+        """
+        if self.current_branch_name is None:
+            if self.repo.head.is_detached:
+                self.current_branch_name = "HEAD"
+            else:
+                self.current_branch_name = self.repo.active_branch.name
+        return self.current_branch_name
+
+    def get_glyph_name_index(self, use_cache):
+        if use_cache not in self.glyph_name_index_dict:
+            self.glyph_name_index_dict[use_cache] = GlyphNameIndex(
+                self.repo, use_cache=use_cache
+            )
+        return self.glyph_name_index_dict[use_cache]
+
+    def get_diff(self, color_diff):
+        if color_diff not in self.diff_dict:
+            self.diff_dict[color_diff] = Diff(
+                self.gitrepo_path, color_diff=color_diff, stream_diff=True
+            )
+        return self.diff_dict[color_diff]
+
+    def get_commit_sha1(self, revision):
+        """
+        :param revision: (string) git revision
+        :return: (string) full commit SHA1 of revision or None if the revision does
+         not resolve to a commit
+        """
+        try:
+            return self.repo.commit(revision).hexsha
+        except Exception:
+            return None
+
+
+class UfodiffServe(object):
+    """
+    UfodiffServe class holds the warm state of the `ufodiff serve` daemon and
+    evaluates client requests.  Repositories are identified by the git repository
+    root of the request working directory.
+
+    :param result_cache_size: (int) maximum number of report results held in memory
+    """
+
+    def __init__(self, result_cache_size=SERVE_RESULT_CACHE_SIZE):
+        # git repository root path : ServeRepository
+        self.repository_dict = {}
+        # least recently used report results, request key : report string
+        self.result_cache = collections.OrderedDict()
+        self.result_cache_size = result_cache_size
+        self.result_cache_hits = 0
+
+    # PRIVATE METHODS
+
+    @staticmethod
+    def _get_command(argv):
+        """
+        Creates a commandlines Command object for a request.  The Command class reads
+        sys.argv, requests are handled one at a time.
+        :param argv: (list) ufodiff command line arguments without the executable name
+        :return: commandlines Command object
+        """
+        saved_argv = sys.argv
+        sys.argv = ["ufodiff"] + list(argv)
+        try:
+            return Command()
+        finally:
+            sys.argv = saved_argv
+
+    @staticmethod
+    def _validate(validate_function, command_obj):
+        """
+        Executes an app.py argument validation function
+        :param validate_function: app.py validate_*_commands_args function
+        :param command_obj: a commandlines library Command object
+        :return: (string) error messages or None if the arguments are valid
+        """
+        error_stream = io.StringIO()
+        try:
+            with contextlib.redirect_stderr(error_stream):
+                validate_function(command_obj)
+        except SystemExit:
+            return error_stream.getvalue()
+        return None
+
+    def _get_cached_result(self, request_key):
+        if request_key is None or request_key not in self.result_cache:
+            return None
+        self.result_cache.move_to_end(request_key)
+        self.result_cache_hits += 1
+        return self.result_cache[request_key]
+
+    def _set_cached_result(self, request_key, result_string):
+        if request_key is None:
+            return
+        self.result_cache[request_key] = result_string
+        while len(self.result_cache) > self.result_cache_size:
+            self.result_cache.popitem(last=False)
+
+    def _get_delta_string(self, repository, command_obj):
+        """
+        Evaluates a delta / deltajson / deltajsonl / deltamd request
+        :param repository: (ServeRepository) repository state
+        :param command_obj: a commandlines library Command object
+        :return: (string) report
+        """
+        if command_obj.contains_definitions("engine"):
+            engine = command_obj.get_definition("engine")
+        else:
+            engine = SUBPROCESS_ENGINE
+        use_cache = not command_obj.contains_switches("no-cache")
+        glyph_names = command_obj.contains_switches("glyph-names")
+        ufo_directory_list = [arg for arg in command_obj.argv if arg.endswith(".ufo")]
+        test_kwargs = parse_delta_range(command_obj.arg2)
+
+        # commit SHA1s that define the report, None if the working tree is included
+        if test_kwargs.get("is_branch_test"):
+            if "head_branch_name" not in test_kwargs:
+                test_kwargs["head_branch_name"] = repository.get_current_branch_name()
+            commit_sha1_list = [
+                repository.get_commit_sha1(test_kwargs["compare_branch_name"]),
+                repository.get_commit_sha1(test_kwargs["head_branch_name"]),
+            ]
+        elif engine in TREE_ENGINES:
+            commit_sha1_list = [repository.get_commit_sha1("HEAD")]
+        else:
+            commit_sha1_list = [None]
+        request_key = None
+        if None not in commit_sha1_list:
+            request_key = (
+                repository.gitrepo_path,
+                tuple(
+                    arg
+                    for arg in command_obj.argv
+                    if not arg.startswith("--output=")
+                    and not arg.startswith(SERVE_SOCKET_OPTION)
+                ),
+                tuple(commit_sha1_list),
+                repository.get_current_branch_name(),
+            )
+        result_string = self._get_cached_result(request_key)
+        if result_string is not None:
+            return result_string
+
+        glyph_name_index = None
+        if glyph_names is True:
+            glyph_name_index = repository.get_glyph_name_index(use_cache)
+        delta = Delta(
+            repository.gitrepo_path,
+            ufo_directory_list,
+            engine=engine,
+            use_cache=use_cache,
+            glyph_names=glyph_names,
+            file_filter=None if command_obj.arg1 == "all" else command_obj.arg1,
+            repo=repository.repo,
+            ufo_classifier=repository.ufo_classifier,
+            glyph_name_index=glyph_name_index,
+            **test_kwargs
+        )
+        result_string = delta.get_writer(
+            write_format=SERVE_DELTA_WRITE_FORMATS[command_obj.subcmd]
+        ).get_string()
+        self._set_cached_result(request_key, result_string)
+        return result_string
+
+    def _get_diff_string(self, repository, command_obj):
+        """
+        Evaluates a diff / diffnc request
+        :param repository: (ServeRepository) repository state
+        :param command_obj: a commandlines library Command object
+        :return: (string) report
+        """
+        color_diff = command_obj.subcmd == "diff"
+        request_key = None
+        # commits:[N] and git idiom requests are compared with the working tree
+        if command_obj.arg1.startswith("branch:"):
+            commit_sha1_list = [
+                repository.get_commit_sha1(command_obj.arg1[7:]),
+                repository.get_commit_sha1(repository.get_current_branch_name()),
+            ]
+            if None not in commit_sha1_list:
+                request_key = (
+                    repository.gitrepo_path,
+                    (command_obj.subcmd, command_obj.arg1),
+                    tuple(commit_sha1_list),
+                    repository.get_current_branch_name(),
+                )
+        result_string = self._get_cached_result(request_key)
+        if result_string is not None:
+            return result_string
+        diff = repository.get_diff(color_diff)
+        result_string = "".join(
+            diff_string + "\n"
+            for diff_string in diff.get_diff_string_generator(command_obj.arg1)
+        )
+        self._set_cached_result(request_key, result_string)
+        return result_string
+
+    # PUBLIC METHODS
+
+    def get_repository(self, gitrepo_path):
+        """
+        Returns the warm repository state of gitrepo_path.  The state is rebuilt when
+        the repository fingerprint has changed.
+        :param gitrepo_path: (string) path to root of git repository
+        :return: (ServeRepository) repository state
+        """
+        repository = self.repository_dict.get(gitrepo_path)
+        if repository is None or not repository.is_current():
+            repository = ServeRepository(gitrepo_path)
+            self.repository_dict[gitrepo_path] = repository
+        return repository
+
+    def handle_request(self, request_dict):
+        """
+        Evaluates a client request
+        :param request_dict: (dict) request with 'argv' and 'cwd' keys
+        :return: (dict) response with 'supported', 'status', 'stdout', and 'stderr'
+         keys
+        """
+        # app.py imports this module for the serve subcommand
+        from ufodiff.app import (
+            get_git_root_path,
+            validate_delta_commands_args,
+            validate_diff_commands_args,
+        )
+
+        argv = [
+            arg
+            for arg in request_dict.get("argv", [])
+            if not arg.startswith(SERVE_SOCKET_OPTION)
+        ]
+        command_obj = self._get_command(argv)
+        if command_obj.subcmd in SERVE_DELTA_WRITE_FORMATS:
+            if (
+                command_obj.arg1 not in SERVE_DELTA_REPORTS
+                or command_obj.arg2 == "batch"
+            ):
+                return {"supported": False}
+            error_string = self._validate(validate_delta_commands_args, command_obj)
+            get_report_string = self._get_delta_string
+        elif command_obj.subcmd in ("diff", "diffnc"):
+            error_string = self._validate(validate_diff_commands_args, command_obj)
+            get_report_string = self._get_diff_string
+        else:
+            return {"supported": False}
+        response = {"supported": True, "status": 0, "stdout": "", "stderr": ""}
+        if error_string is not None:
+            response.update({"status": 1, "stderr": error_string})
+            return response
+
+        cwd = request_dict.get("cwd", ".")
+        error_stream = io.StringIO()
+        try:
+            with contextlib.redirect_stderr(error_stream):
+                gitrepo_path = get_git_root_path(cwd)
+        except SystemExit:
+            response.update({"status": 1, "stderr": error_stream.getvalue()})
+            return response
+        try:
+            report_string = get_report_string(
+                self.get_repository(gitrepo_path), command_obj
+            )
+            if command_obj.contains_definitions("output"):
+                with io.open(
+                    os.path.join(cwd, command_obj.get_definition("output")),
+                    "w",
+                    encoding="utf-8",
+                ) as outfile:
+                    outfile.write(report_string)
+            else:
+                response["stdout"] = report_string
+        except Exception as e:
+            # the repository state is rebuilt on the next request
+            self.repository_dict.pop(gitrepo_path, None)
+            response.update(
+                {
+                    "status": 1,
+                    "stderr": "[ufodiff] ERROR: Unable to excecute your request. "
+                    "Error returned as: " + os.linesep + str(e) + "\n",
+                }
+            )
+        return response
+
+
+class ServeRequestHandler(socketserver.StreamRequestHandler):
+    """
+    Reads one JSON request line and writes one JSON response line per connection
+    """
+
+    def handle(self):
+        request_line = self.rfile.readline()
+        if request_line == b"":
+            # connection closed without a request (e.g. ServeSocketServer probe)
+            return
+        try:
+            request_dict = json.loads(request_line.decode("utf-8"))
+        except ValueError:
+            response = {
+                "supported": True,
+                "status": 1,
+                "stdout": "",
+                "stderr": "[ufodiff] ERROR: invalid request\n",
+            }
+        else:
+            response = self.server.ufodiff_serve.handle_request(request_dict)
+        self.wfile.write((json.dumps(response) + "\n").encode("utf-8"))
+
+
+# socketserver.UnixStreamServer is not defined on platforms without Unix sockets
+# (e.g. Windows)
+if hasattr(socketserver, "UnixStreamServer"):
+
+    class ServeSocketServer(socketserver.UnixStreamServer):
+        """
+        Unix socket server of the `ufodiff serve` daemon.  An existing socket file is
+        replaced when no daemon is listening on it.
+
+        :raises: OSError if a daemon is listening on socket_path
+
+        :param socket_path: (string) Unix socket path
+        :param ufodiff_serve: (UfodiffServe) request handling state
+        """
+
+        def __init__(self, socket_path, ufodiff_serve=None):
+            self.socket_path = socket_path
+            self.ufodiff_serve = ufodiff_serve or UfodiffServe()
+            socket_dirpath = os.path.dirname(socket_path)
+            if socket_dirpath != "" and not os.path.isdir(socket_dirpath):
+                os.makedirs(socket_dirpath)
+            if os.path.exists(socket_path):
+                probe_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                try:
+                    probe_socket.connect(socket_path)
+                except (IOError, OSError):
+                    # stale socket file of a stopped daemon
+                    os.remove(socket_path)
+                else:
+                    raise OSError("a ufodiff server is listening on " + socket_path)
+                finally:
+                    probe_socket.close()
+            socketserver.UnixStreamServer.__init__(
+                self, socket_path, ServeRequestHandler
+            )
+
+        def server_close(self):
+            socketserver.UnixStreamServer.server_close(self)
+            if os.path.exists(self.socket_path):
+                os.remove(self.socket_path)
+
+
+def serve(gitrepo_path, socket_path=None):
+    """
+    Runs the `ufodiff serve` daemon until it is interrupted (SIGINT, SIGTERM)
+    :param gitrepo_path: (string) path to root of git repository
+    :param socket_path: (string) Unix socket path, None for the default socket path
+     in the `.git/ufodiff` directory
+    :return: no return object
+    """
+    if not hasattr(socketserver, "UnixStreamServer"):
+        raise OSError("Unix sockets are not available on this platform")
+    if socket_path is None:
+        socket_path = get_default_socket_path(gitrepo_path)
+    server = ServeSocketServer(socket_path)
+    # warm repository state before the first request
+    server.ufodiff_serve.get_repository(gitrepo_path)
+
+    def handle_sigterm(signum, frame):
+        raise KeyboardInterrupt
+
+    signal.signal(signal.SIGTERM, handle_sigterm)
+    sys.stderr.write("[ufodiff] serving on " + socket_path + "\n")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
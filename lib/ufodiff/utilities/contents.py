@@ -0,0 +1,164 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ====================================================
+# Copyright 2018 Christopher Simpkins
+# MIT License
+# ====================================================
+
+"""
+The contents.py module defines a *.glif filename : glyph name index for UFO glyph
+layer directories that is backed by the layer contents.plist file.
+
+A contents.plist file is loaded once per git blob SHA1.  The filename : glyph name
+dictionary is memoized in memory and in the `.git/ufodiff/contents` cache directory
+so that later runs read a JSON entry rather than parse the property list.  Working
+tree contents.plist files are hashed with the git blob hash to find the entry.
+"""
+
+import binascii
+import hashlib
+import os
+import posixpath
+
+from ufodiff.utilities.deltacache import DELTA_CACHE_DIRNAME, DeltaCache
+from ufodiff.utilities.plist import load_plist
+
+GLYPH_NAME_CACHE_DIRNAME = "contents"
+# increment when the structure of a cache entry changes
+GLYPH_NAME_CACHE_FORMAT = 1
+GLYPH_NAME_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+
+def get_git_blob_sha1(data):
+    """
+    Defines the git blob SHA1 of file data (`git hash-object`)
+    :param data: (bytes) file data
+    :return: (string) hexadecimal blob SHA1
+    """
+    blob_hash = hashlib.sha1(b"blob " + str(len(data)).encode("ascii") + b"\0")
+    blob_hash.update(data)
+    return blob_hash.hexdigest()
+
+
+def load_glyph_name_dict(contents_data):
+    """
+    Loads contents.plist data into a filename : glyph name dictionary
+
+    :param contents_data: (bytes) contents.plist file data
+    :return: (dict) *.glif filename : glyph name dictionary
+    """
+    return {
+        filename: glyph_name
+        for glyph_name, filename in load_plist(contents_data).items()
+    }
+
+
+class GlyphNameIndex(object):
+    """
+    Maps *.glif filepaths to glyph names with the contents.plist file of each glyph
+    layer directory at a git revision or in the working tree.
+
+    :param repo: GitPython Repo object
+    :param use_cache: (boolean) read and write glyph name dictionaries in the
+     `.git/ufodiff/contents` cache directory
+    """
+
+    def __init__(self, repo, use_cache=True):
+        self.repo = repo
+        self.glyph_name_cache = None
+        if use_cache is True:
+            self.glyph_name_cache = DeltaCache(
+                os.path.join(
+                    repo.git_dir, DELTA_CACHE_DIRNAME, GLYPH_NAME_CACHE_DIRNAME
+                ),
+                max_bytes=GLYPH_NAME_CACHE_MAX_BYTES,
+                entry_types={"glyphs": dict},
+            )
+        # blob SHA1 : filename : glyph name dictionary
+        self.glyph_name_dicts = {}
+        # revision : GitPython Tree object
+        self.trees = {}
+
+    def _get_cache_key(self, blob_sha1):
+        return blob_sha1 + "-" + str(GLYPH_NAME_CACHE_FORMAT)
+
+    def _get_glyph_name_dict(self, blob_sha1, read_data):
+        """
+        Returns the memoized filename : glyph name dictionary of a contents.plist blob
+        :param blob_sha1: (string) hexadecimal blob SHA1
+        :param read_data: (callable) returns the contents.plist data on a cache miss
+        :return: (dict) *.glif filename : glyph name dictionary
+        """
+        glyph_name_dict = self.glyph_name_dicts.get(blob_sha1)
+        if glyph_name_dict is not None:
+            return glyph_name_dict
+        if self.glyph_name_cache is not None:
+            entry_dict = self.glyph_name_cache.get(self._get_cache_key(blob_sha1))
+            if entry_dict is not None:
+                glyph_name_dict = entry_dict["glyphs"]
+        if glyph_name_dict is None:
+            glyph_name_dict = load_glyph_name_dict(read_data())
+            if self.glyph_name_cache is not None:
+                self.glyph_name_cache.set(
+                    self._get_cache_key(blob_sha1), {"glyphs": glyph_name_dict}
+                )
+        self.glyph_name_dicts[blob_sha1] = glyph_name_dict
+        return glyph_name_dict
+
+    def _get_layer_glyph_name_dict(self, contents_filepath, revision):
+        """
+        :param contents_filepath: (string) git repository relative contents.plist path
+        :param revision: (string) git revision or None for the working tree
+        :return: (dict) *.glif filename : glyph name dictionary, empty if the layer does
+         not include a contents.plist file
+        """
+        if revision is None:
+            filepath = os.path.join(
+                self.repo.working_tree_dir, *contents_filepath.split("/")
+            )
+            try:
+                with open(filepath, "rb") as f:
+                    contents_data = f.read()
+            except (IOError, OSError):
+                return {}
+            return self._get_glyph_name_dict(
+                get_git_blob_sha1(contents_data), lambda: contents_data
+            )
+        tree = self.trees.get(revision)
+        if tree is None:
+            tree = self.trees[revision] = self.repo.commit(revision).tree
+        try:
+            blob = tree / contents_filepath
+        except KeyError:
+            return {}
+        return self._get_glyph_name_dict(
+            binascii.hexlify(blob.binsha).decode("ascii"),
+            lambda: blob.data_stream.read(),
+        )
+
+    def get_glyph_names(self, glif_filepath_list, revision=None):
+        """
+        Maps *.glif filepaths to glyph names.  Each layer contents.plist file is
+        looked up once.
+
+        :param glif_filepath_list: (iterable) git repository relative *.glif filepaths
+        :param revision: (string) git revision or None for the working tree
+        :return: (dict) filepath : glyph name dictionary for the filepaths that are
+         listed in the layer contents.plist file
+        """
+        glyph_name_dict = {}
+        layer_dict = {}
+        for glif_filepath in glif_filepath_list:
+            layer_dirpath, _, filename = glif_filepath.rpartition("/")
+            layer_glyph_name_dict = layer_dict.get(layer_dirpath)
+            if layer_glyph_name_dict is None:
+                layer_glyph_name_dict = layer_dict[layer_dirpath] = (
+                    self._get_layer_glyph_name_dict(
+                        posixpath.join(layer_dirpath, "contents.plist"), revision
+                    )
+                )
+            glyph_name = layer_glyph_name_dict.get(filename)
+            if glyph_name is not None:
+                glyph_name_dict[glif_filepath] = glyph_name
+        return glyph_name_dict
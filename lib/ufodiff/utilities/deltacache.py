@@ -0,0 +1,202 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ====================================================
+# Copyright 2018 Christopher Simpkins
+# MIT License
+# ====================================================
+
+"""
+The deltacache.py module defines a persistent, content addressed cache of the UFO
+source file delta lists that are collected by the Delta class in the
+ufodiff.subcommands.delta module.
+
+Cache entries are stored as JSON files in the `.git/ufodiff` directory of the git
+repository.  Entries are keyed by the resolved base and head commit SHA1, the user
+defined *.ufo directory filters, and the ufodiff version so that an entry never
+needs to be invalidated.  Entries are written atomically (temporary file + rename)
+so that concurrent ufodiff processes can share the cache, and entries are evicted
+by age and by the total size of the cache directory.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+from ufodiff.settings import major_version, minor_version, patch_version
+
+DELTA_CACHE_DIRNAME = "ufodiff"
+# increment when the structure of a cache entry changes
+DELTA_CACHE_FORMAT = 1
+DELTA_CACHE_ENTRY_KEYS = ("added", "deleted", "modified", "commits")
+DELTA_CACHE_MAX_BYTES = 16 * 1024 * 1024
+DELTA_CACHE_MAX_AGE = 30 * 24 * 60 * 60  # seconds
+
+
+def get_delta_cache_key(
+    base_commit_sha1,
+    head_commit_sha1,
+    ufo_directory_list,
+    commit_number=None,
+    file_filter=None,
+):
+    """
+    Defines the cache key for a delta between two resolved commits.
+
+    :param base_commit_sha1: (string) full SHA1 of the base commit
+    :param head_commit_sha1: (string) full SHA1 of the head commit
+    :param ufo_directory_list: (list) user defined *.ufo directory filters
+    :param commit_number: (string) number of commits for commit history tests (the
+     length of the cached commit SHA1 list) or None for branch tests
+    :param file_filter: (string) 'glyph', 'nonglyph', or None for all files
+    :return: (string) hexadecimal SHA1 digest cache key
+    """
+    key_list = [
+        DELTA_CACHE_FORMAT,
+        major_version + "." + minor_version + "." + patch_version,
+        base_commit_sha1,
+        head_commit_sha1,
+        sorted(set(ufo_directory_list)),
+        commit_number,
+        file_filter,
+    ]
+    key_string = json.dumps(key_list, separators=(",", ":"))
+    return hashlib.sha1(key_string.encode("utf-8")).hexdigest()
+
+
+class DeltaCache(object):
+    """
+    DeltaCache class reads and writes delta cache entries in a cache directory.  Cache
+    read and write errors are not raised, the delta is collected from git instead.
+
+    :param cache_dirpath: (string) path to the cache directory (created on first write)
+    :param max_bytes: (int) maximum total size of the cache entries in bytes
+    :param max_age: (int) maximum age of a cache entry in seconds since last use
+    :param entry_types: (dict) entry key : required value type dictionary that is used
+     to validate entries, None for the delta cache entry keys (lists)
+    """
+
+    def __init__(
+        self,
+        cache_dirpath,
+        max_bytes=DELTA_CACHE_MAX_BYTES,
+        max_age=DELTA_CACHE_MAX_AGE,
+        entry_types=None,
+    ):
+        self.cache_dirpath = cache_dirpath
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        if entry_types is None:
+            entry_types = {entry_key: list for entry_key in DELTA_CACHE_ENTRY_KEYS}
+        self.entry_types = entry_types
+
+    def _get_entry_filepath(self, cache_key):
+        return os.path.join(self.cache_dirpath, cache_key + ".json")
+
+    def get(self, cache_key):
+        """
+        Reads a cache entry.
+
+        :param cache_key: (string) key defined with get_delta_cache_key
+        :return: (dict) cache entry with 'added', 'deleted', 'modified', and 'commits'
+         lists (or the entry_types keys) or None if there is no valid entry for the key
+        """
+        entry_filepath = self._get_entry_filepath(cache_key)
+        try:
+            if time.time() - os.path.getmtime(entry_filepath) > self.max_age:
+                return None
+            with open(entry_filepath, "r", encoding="utf-8") as f:
+                entry_dict = json.load(f)
+            # mark the entry as recently used for eviction
+            os.utime(entry_filepath, None)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry_dict, dict):
+            return None
+        for entry_key, entry_type in self.entry_types.items():
+            if not isinstance(entry_dict.get(entry_key), entry_type):
+                return None
+        return entry_dict
+
+    def set(self, cache_key, entry_dict):
+        """
+        Atomically writes a cache entry and evicts old entries.
+
+        :param cache_key: (string) key defined with get_delta_cache_key
+        :param entry_dict: (dict) cache entry with 'added', 'deleted', 'modified', and
+         'commits' lists
+        :return: (boolean) True if the entry was written
+        """
+        try:
+            if not os.path.isdir(self.cache_dirpath):
+                os.makedirs(self.cache_dirpath)
+        except OSError:
+            # created by a concurrent process or not writable
+            if not os.path.isdir(self.cache_dirpath):
+                return False
+        try:
+            fd, temp_filepath = tempfile.mkstemp(
+                prefix=".tmp-", suffix=".json", dir=self.cache_dirpath
+            )
+        except OSError:
+            return False
+        try:
+            with open(fd, "w", encoding="utf-8") as f:
+                f.write(json.dumps(entry_dict, ensure_ascii=False))
+            os.replace(temp_filepath, self._get_entry_filepath(cache_key))
+        except OSError:
+            self._remove(temp_filepath)
+            return False
+        self.evict()
+        return True
+
+    def evict(self):
+        """
+        Removes cache entries that were not used within max_age seconds, then removes
+        the least recently used entries until the cache size is <= max_bytes.
+
+        :return: (int) number of removed entries
+        """
+        now = time.time()
+        entry_list = []
+        removed_number = 0
+        try:
+            filename_list = os.listdir(self.cache_dirpath)
+        except OSError:
+            return removed_number
+        for filename in filename_list:
+            if not filename.endswith(".json"):
+                continue
+            filepath = os.path.join(self.cache_dirpath, filename)
+            try:
+                stat_result = os.stat(filepath)
+            except OSError:
+                # removed by a concurrent process
+                continue
+            if filename.startswith(".tmp-"):
+                # temporary files of interrupted writes, skip in progress writes
+                if now - stat_result.st_mtime > 60 * 60:
+                    removed_number += self._remove(filepath)
+            elif now - stat_result.st_mtime > self.max_age:
+                removed_number += self._remove(filepath)
+            else:
+                entry_list.append((stat_result.st_mtime, stat_result.st_size, filepath))
+
+        total_bytes = sum(entry[1] for entry in entry_list)
+        # least recently used entries first
+        for _, size, filepath in sorted(entry_list):
+            if total_bytes <= self.max_bytes:
+                break
+            removed_number += self._remove(filepath)
+            total_bytes -= size
+        return removed_number
+
+    @staticmethod
+    def _remove(filepath):
+        try:
+            os.remove(filepath)
+            return 1
+        except OSError:
+            return 0
@@ -0,0 +1,179 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ====================================================
+# Copyright 2018 Christopher Simpkins
+# MIT License
+# ====================================================
+
+"""
+The deltarecords.py module defines the structured delta results of the ufodiff Python
+API (see ufodiff.api).  A DeltaResult holds the added, deleted, and modified UFO
+source filepath lists of a comparison and creates one DeltaRecord per filepath on
+iteration, so large result sets are not held in memory as record objects.  The delta
+/ deltajson / deltamd report writers read the DeltaResult filepath lists, the
+deltajsonl report writer is defined on DeltaResult iteration.
+"""
+
+import collections
+
+from ufodiff.utilities.ufo import UfoPathClassifier
+
+ADDED = "added"
+DELETED = "deleted"
+MODIFIED = "modified"
+# report order of the change types
+CHANGE_TYPES = (ADDED, DELETED, MODIFIED)
+
+
+class DeltaRecord(
+    collections.namedtuple(
+        "DeltaRecord", ("path", "change", "ufo", "layer", "category")
+    )
+):
+    """
+    A UFO source file change
+
+    :param path: (string) git repository relative filepath
+    :param change: (string) ADDED, DELETED, or MODIFIED
+    :param ufo: (string) git repository relative path of the *.ufo directory that
+     includes the file, None if the file is not located in a *.ufo directory
+    :param layer: (string) glyph layer directory name (e.g. 'glyphs') of *.glif files
+     and layer contents.plist / layerinfo.plist files, None for other files
+    :param category: (string) UfoPathClassifier category ('glyph', 'nonglyph',
+     'layer', 'data', or 'image')
+    """
+
+    __slots__ = ()
+
+
+def get_ufo_and_layer(dirpath):
+    """
+    Defines the *.ufo directory path and the glyph layer directory name candidate of a
+    directory path.
+    :param dirpath: (string) git repository relative directory path with '/' path
+     separators
+    :return: (tuple) (*.ufo directory path or None, name of the directory inside of
+     the *.ufo directory that includes the file or None)
+    """
+    if dirpath == "":
+        return None, None
+    component_list = dirpath.split("/")
+    path_component_list = []
+    for component in component_list:
+        path_component_list.append(component)
+        if component.endswith(".ufo"):
+            if len(component_list) - len(path_component_list) == 1:
+                return "/".join(path_component_list), component_list[-1]
+            return "/".join(path_component_list), None
+    return None, None
+
+
+def iter_delta_records(filepath_list, change, ufo_classifier):
+    """
+    Generator that creates DeltaRecord objects for UFO source filepaths
+    :param filepath_list: (list) UFO source filepaths
+    :param change: (string) ADDED, DELETED, or MODIFIED
+    :param ufo_classifier: (UfoPathClassifier) UFO path classifier
+    :return: (Python generator of DeltaRecord) records in filepath_list order
+    """
+    # directory path : (*.ufo directory path, layer directory name)
+    directory_cache = {}
+    # tuple.__new__ without the keyword argument handling of DeltaRecord()
+    make_delta_record = DeltaRecord._make
+    for filepath, category in zip(
+        filepath_list, ufo_classifier.classify_many(filepath_list)
+    ):
+        dirpath = filepath.rpartition("/")[0]
+        ufo_and_layer = directory_cache.get(dirpath)
+        if ufo_and_layer is None:
+            ufo_and_layer = directory_cache[dirpath] = get_ufo_and_layer(dirpath)
+        if category in (UfoPathClassifier.GLYPH, UfoPathClassifier.LAYER):
+            layer = ufo_and_layer[1]
+        else:
+            layer = None
+        yield make_delta_record((filepath, change, ufo_and_layer[0], layer, category))
+
+
+class DeltaResult(object):
+    """
+    Structured result of a delta comparison.  Iteration returns the DeltaRecord
+    objects of the added, deleted, and modified files in report order.
+
+    :param added_filepath_list: (list) added UFO source filepaths
+    :param deleted_filepath_list: (list) deleted UFO source filepaths
+    :param modified_filepath_list: (list) modified UFO source filepaths
+    :param commits: (list) commit SHA1 short codes of commit history comparisons,
+     None for other comparisons
+    :param branches: (list) [compared branch, current branch] names of branch
+     comparisons, None for other comparisons
+    :param base_revision: (string) compared base revision
+    :param head_revision: (string) compared head revision, None for the working tree
+    :param ufo_classifier: (UfoPathClassifier) shared UFO path classifier, None for a
+     new classifier
+    """
+
+    def __init__(
+        self,
+        added_filepath_list,
+        deleted_filepath_list,
+        modified_filepath_list,
+        commits=None,
+        branches=None,
+        base_revision=None,
+        head_revision=None,
+        ufo_classifier=None,
+    ):
+        self.filepath_list_dict = {
+            ADDED: added_filepath_list,
+            DELETED: deleted_filepath_list,
+            MODIFIED: modified_filepath_list,
+        }
+        self.commits = commits
+        self.branches = branches
+        self.base_revision = base_revision
+        self.head_revision = head_revision
+        if ufo_classifier is None:
+            ufo_classifier = UfoPathClassifier()
+        self.ufo_classifier = ufo_classifier
+
+    def __len__(self):
+        return sum(
+            len(filepath_list) for filepath_list in self.filepath_list_dict.values()
+        )
+
+    def __iter__(self):
+        for change in CHANGE_TYPES:
+            for delta_record in self.records(change):
+                yield delta_record
+
+    def filepaths(self, change):
+        """
+        :param change: (string) ADDED, DELETED, or MODIFIED
+        :return: (list) filepaths of the change type in report order
+        """
+        return self.filepath_list_dict[change]
+
+    def records(self, change=None):
+        """
+        Creates a Python generator of the DeltaRecord objects of a change type
+        :param change: (string) ADDED, DELETED, MODIFIED, or None for all change types
+        :return: (Python generator of DeltaRecord) records in report order
+        """
+        if change is None:
+            return iter(self)
+        return iter_delta_records(
+            self.filepath_list_dict[change], change, self.ufo_classifier
+        )
+
+    @property
+    def added(self):
+        return self.records(ADDED)
+
+    @property
+    def deleted(self):
+        return self.records(DELETED)
+
+    @property
+    def modified(self):
+        return self.records(MODIFIED)
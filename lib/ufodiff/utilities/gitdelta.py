@@ -0,0 +1,446 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ====================================================
+# Copyright 2018 Christopher Simpkins
+# MIT License
+# ====================================================
+
+"""
+The gitdelta.py module defines the engines that collect added, deleted, and
+modified filepaths between two git revisions for the Delta class in the
+ufodiff.subcommands.delta module.
+
+Engines:
+ - subprocess : single `git diff --name-status -z` call (default)
+ - inprocess  : commit tree comparison through the gitdb object database, no git
+                subprocess calls
+ - ufotree    : in-process commit tree comparison that only descends into changed
+                *.ufo source directory subtrees
+
+File filters:
+ - glyph    : *.glif files
+ - nonglyph : *.plist and *.fea files
+
+File filters are applied in git as pathspecs with the subprocess engine and by
+filename before blob SHA1 comparison with the in-process engines so that the
+excluded files are not listed, hashed, or classified.
+"""
+
+import heapq
+
+from ufodiff.utilities.ufo import UfoDirectoryFilter
+
+SUBPROCESS_ENGINE = "subprocess"
+INPROCESS_ENGINE = "inprocess"
+UFO_TREE_ENGINE = "ufotree"
+ENGINES = (SUBPROCESS_ENGINE, INPROCESS_ENGINE, UFO_TREE_ENGINE)
+TREE_ENGINES = (INPROCESS_ENGINE, UFO_TREE_ENGINE)
+
+GLYPH_FILTER = "glyph"
+NONGLYPH_FILTER = "nonglyph"
+FILE_FILTERS = (GLYPH_FILTER, NONGLYPH_FILTER)
+# filename extensions of the files that are included with each file filter
+FILE_FILTER_SUFFIXES = {
+    GLYPH_FILTER: (".glif",),
+    NONGLYPH_FILTER: (".plist", ".fea"),
+}
+
+
+def get_file_filter_pathspec_list(file_filter):
+    """
+    Defines the git pathspecs for a file filter
+    :param file_filter: (string) 'glyph', 'nonglyph', or None for all files
+    :return: (list) git pathspec strings, empty for all files
+    """
+    if file_filter is None:
+        return []
+    return ["*" + suffix for suffix in FILE_FILTER_SUFFIXES[file_filter]]
+
+
+def parse_name_status_string(name_status_string):
+    """
+    Parses the NUL delimited output of `git diff --name-status -z` into lists of
+    added, deleted, and modified filepaths.
+
+    Renamed (R) records are split into a deletion of the source path and an addition
+    of the destination path.  Copied (C) records are reported as an addition of the
+    destination path.  All other status codes are ignored.
+
+    :param name_status_string: (string) the raw `git diff --name-status -z` output
+    :return: (tuple) (added_filepath_list, deleted_filepath_list, modified_filepath_list)
+    """
+    added_filepath_list = []
+    deleted_filepath_list = []
+    modified_filepath_list = []
+
+    record_list = name_status_string.split("\0")
+    record_count = len(record_list)
+    index = 0
+    while index < record_count:
+        status = record_list[index]
+        if status == "":
+            # trailing NUL at the end of the stream
+            index += 1
+            continue
+        status_code = status[0]
+        if status_code in ("R", "C"):
+            # two paths follow rename and copy status codes: source, destination
+            if index + 2 >= record_count:
+                break
+            source_path = record_list[index + 1]
+            destination_path = record_list[index + 2]
+            if status_code == "R":
+                deleted_filepath_list.append(source_path)
+            added_filepath_list.append(destination_path)
+            index += 3
+        else:
+            if index + 1 >= record_count:
+                break
+            filepath = record_list[index + 1]
+            if status_code == "A":
+                added_filepath_list.append(filepath)
+            elif status_code == "D":
+                deleted_filepath_list.append(filepath)
+            elif status_code == "M":
+                modified_filepath_list.append(filepath)
+            index += 2
+
+    return added_filepath_list, deleted_filepath_list, modified_filepath_list
+
+
+def get_name_status_filepath_lists(git, diff_arg_string, pathspec_list=None):
+    """
+    Collects added, deleted, and modified filepaths with a single
+    `git diff --name-status -z` subprocess call.
+
+    Rename detection is disabled so that the results match the previous
+    per-status `--diff-filter` calls and git does not perform the additional
+    similarity analysis.
+
+    :param git: GitPython Repo.git object
+    :param diff_arg_string: (string) git revision argument (e.g. 'HEAD~2' or
+     'master..feature')
+    :param pathspec_list: (list) git pathspecs that limit the compared files, None
+     for all files
+    :return: (tuple) (added_filepath_list, deleted_filepath_list, modified_filepath_list)
+    """
+    diff_arg_list = ["--name-status", "-z", "--no-renames", diff_arg_string]
+    if pathspec_list:
+        diff_arg_list.append("--")
+        diff_arg_list.extend(pathspec_list)
+    name_status_string = git.diff(*diff_arg_list)
+    return parse_name_status_string(name_status_string)
+
+
+NULL_SHA1 = "0" * 40
+
+
+def parse_raw_diff_string(raw_diff_string):
+    """
+    Parses the NUL delimited output of `git diff --raw -z --no-abbrev --no-renames`
+    into filepath and blob SHA1 records.
+
+    :param raw_diff_string: (string) the raw `git diff --raw -z` output
+    :return: (list) (filepath, base blob SHA1 or None, head blob SHA1 or None) tuples
+    """
+    blob_record_list = []
+    record_list = raw_diff_string.split("\0")
+    for index in range(0, len(record_list) - 1, 2):
+        # ':100644 100644 [base SHA1] [head SHA1] M' followed by the filepath
+        metadata_list = record_list[index].split(" ")
+        if len(metadata_list) < 5:
+            continue
+        base_sha1 = metadata_list[2]
+        head_sha1 = metadata_list[3]
+        blob_record_list.append(
+            (
+                record_list[index + 1],
+                None if base_sha1 == NULL_SHA1 else base_sha1,
+                None if head_sha1 == NULL_SHA1 else head_sha1,
+            )
+        )
+    return blob_record_list
+
+
+def get_raw_diff_blob_list(git, base_revision, head_revision, pathspec_list):
+    """
+    Defines the files that changed between two revisions and their blob SHA1 with a
+    single `git diff --raw` call.  Files with a mode change only are not included.
+
+    :param git: GitPython Repo.git object
+    :param base_revision: (string) base revision (e.g. 'HEAD~2' or 'master')
+    :param head_revision: (string) head revision (e.g. 'HEAD' or 'feature')
+    :param pathspec_list: (list) git pathspecs that limit the compared files
+    :return: (list) (filepath, base blob SHA1 or None, head blob SHA1 or None) tuples
+    """
+    raw_diff_string = git.diff(
+        "--raw",
+        "-z",
+        "--no-abbrev",
+        "--no-renames",
+        base_revision,
+        head_revision,
+        "--",
+        *pathspec_list
+    )
+    return [
+        blob_record
+        for blob_record in parse_raw_diff_string(raw_diff_string)
+        if blob_record[1] != blob_record[2]
+    ]
+
+
+def get_diff_revisions(git, diff_request):
+    """
+    Defines the base and head revisions for a `commits:[N]` or `branch:[name]`
+    request.  Commit history requests compare HEAD~N with HEAD and branch requests
+    compare the requested branch with the current branch.
+
+    :param git: GitPython Repo.git object
+    :param diff_request: (string) 'commits:[N]' or 'branch:[name]'
+    :return: (tuple) (base revision, head revision)
+    """
+    if diff_request.startswith("commits:"):
+        return "HEAD~" + diff_request.split(":")[1], "HEAD"
+    elif diff_request.startswith("branch:"):
+        current_branch = git.rev_parse("--abbrev-ref", "HEAD")
+        return diff_request.split(":")[1], current_branch
+    else:
+        raise ValueError(
+            "'" + diff_request + "' is not a valid request. Please use the "
+            "'commits:[N]' or 'branch:[name]' syntax"
+        )
+
+
+# ------------------------------------------------------------------------------
+# In-process tree diff engine
+# ------------------------------------------------------------------------------
+
+TREE_MODE = 0o040000
+TYPE_MASK = 0o170000
+
+
+def read_tree_entries(odb, tree_binsha):
+    """
+    Reads the entries of a git tree object from the object database without a
+    git subprocess call.
+
+    :param odb: gitdb object database (Repo.odb)
+    :param tree_binsha: (bytes) 20 byte binary SHA1 of the tree object
+    :return: (dict) {sort key: (name, binsha, mode)} where the sort key follows git
+     tree order (directory names sort with a trailing '/')
+    """
+    # imported on use, the engine and filter names of this module are read during
+    # ufodiff command line argument validation without a GitPython import
+    from git.objects.fun import tree_entries_from_data
+
+    entry_dict = {}
+    if tree_binsha is None:
+        return entry_dict
+    for binsha, mode, name in tree_entries_from_data(odb.stream(tree_binsha).read()):
+        if mode & TYPE_MASK == TREE_MODE:
+            entry_dict[name + "/"] = (name, binsha, mode)
+        else:
+            entry_dict[name] = (name, binsha, mode)
+    return entry_dict
+
+
+def walk_tree_delta(
+    odb,
+    base_tree_binsha,
+    head_tree_binsha,
+    path_prefix,
+    filepath_lists,
+    filename_suffixes=None,
+):
+    """
+    Recursively compares two git trees and appends the blob filepaths that were
+    added, deleted, and modified to filepath_lists.  Subtrees with an identical
+    SHA1 at both revisions are not read.
+
+    :param odb: gitdb object database (Repo.odb)
+    :param base_tree_binsha: (bytes) binary SHA1 of the base tree or None
+    :param head_tree_binsha: (bytes) binary SHA1 of the head tree or None
+    :param path_prefix: (string) repository relative path of the trees
+    :param filepath_lists: (tuple) (added_list, deleted_list, modified_list)
+    :param filename_suffixes: (tuple) only compare files with these filename
+     extensions, None for all files
+    :return: no return object
+    """
+    if base_tree_binsha == head_tree_binsha:
+        return
+    added_filepath_list, deleted_filepath_list, modified_filepath_list = filepath_lists
+    base_entry_dict = read_tree_entries(odb, base_tree_binsha)
+    head_entry_dict = read_tree_entries(odb, head_tree_binsha)
+
+    for sort_key in sorted(set(base_entry_dict) | set(head_entry_dict)):
+        base_entry = base_entry_dict.get(sort_key)
+        head_entry = head_entry_dict.get(sort_key)
+        if sort_key.endswith("/"):
+            walk_tree_delta(
+                odb,
+                base_entry[1] if base_entry else None,
+                head_entry[1] if head_entry else None,
+                path_prefix + sort_key,
+                filepath_lists,
+                filename_suffixes,
+            )
+        elif filename_suffixes is not None and not sort_key.endswith(filename_suffixes):
+            # excluded by the file filter
+            continue
+        elif base_entry is None:
+            added_filepath_list.append(path_prefix + sort_key)
+        elif head_entry is None:
+            deleted_filepath_list.append(path_prefix + sort_key)
+        elif base_entry[1] != head_entry[1] or base_entry[2] != head_entry[2]:
+            # type changes (e.g. file to symlink) are excluded as in the
+            # `git diff` engine
+            if base_entry[2] & TYPE_MASK == head_entry[2] & TYPE_MASK:
+                modified_filepath_list.append(path_prefix + sort_key)
+
+
+def walk_ufo_tree_delta(
+    odb,
+    base_tree_binsha,
+    head_tree_binsha,
+    path_prefix,
+    filepath_lists,
+    ufo_filter,
+    filename_suffixes=None,
+):
+    """
+    Recursively compares two git trees and only descends into the *.ufo directory
+    subtrees that changed between them.  Files outside of *.ufo directories are not
+    collected and *.ufo subtrees with an identical SHA1 at both revisions are not read.
+    When ufo_filter includes filters, only the *.ufo subtrees that match a user
+    defined UFO directory filter are compared.
+
+    :param odb: gitdb object database (Repo.odb)
+    :param base_tree_binsha: (bytes) binary SHA1 of the base tree or None
+    :param head_tree_binsha: (bytes) binary SHA1 of the head tree or None
+    :param path_prefix: (string) repository relative path of the trees
+    :param filepath_lists: (tuple) (added_list, deleted_list, modified_list)
+    :param ufo_filter: (ufodiff.utilities.ufo.UfoDirectoryFilter) user defined *.ufo
+     directory filters
+    :param filename_suffixes: (tuple) only compare files with these filename
+     extensions, None for all files
+    :return: no return object
+    """
+    if base_tree_binsha == head_tree_binsha:
+        return
+    base_entry_dict = read_tree_entries(odb, base_tree_binsha)
+    head_entry_dict = read_tree_entries(odb, head_tree_binsha)
+
+    for sort_key in sorted(set(base_entry_dict) | set(head_entry_dict)):
+        if not sort_key.endswith("/"):
+            # files outside of a *.ufo directory are not UFO source files
+            continue
+        base_entry = base_entry_dict.get(sort_key)
+        head_entry = head_entry_dict.get(sort_key)
+        base_subtree_binsha = base_entry[1] if base_entry else None
+        head_subtree_binsha = head_entry[1] if head_entry else None
+        if sort_key.endswith(".ufo/"):
+            if len(ufo_filter) == 0 or ufo_filter.matches_directory(
+                path_prefix + sort_key[:-1]
+            ):
+                walk_tree_delta(
+                    odb,
+                    base_subtree_binsha,
+                    head_subtree_binsha,
+                    path_prefix + sort_key,
+                    filepath_lists,
+                    filename_suffixes,
+                )
+        else:
+            # search for nested *.ufo directories
+            walk_ufo_tree_delta(
+                odb,
+                base_subtree_binsha,
+                head_subtree_binsha,
+                path_prefix + sort_key,
+                filepath_lists,
+                ufo_filter,
+                filename_suffixes,
+            )
+
+
+def get_tree_filepath_lists(
+    repo,
+    base_revision,
+    head_revision,
+    ufo_subtrees_only=False,
+    ufo_filter_list=None,
+    file_filter=None,
+):
+    """
+    Collects added, deleted, and modified filepaths between two commits in-process
+    through the GitPython / gitdb object database.  No git subprocess is spawned when
+    the Repo object is instantiated with the gitdb.GitDB object database type.
+
+    Unlike the `git diff [revision]` engine, this engine compares two commits and
+    does not include uncommitted changes in the working tree.
+
+    :param repo: GitPython Repo object
+    :param base_revision: (string) base revision (e.g. 'HEAD~2' or 'master')
+    :param head_revision: (string) head revision (e.g. 'HEAD' or 'feature')
+    :param ufo_subtrees_only: (boolean) only compare files inside of *.ufo directories
+    :param ufo_filter_list: (list) user defined *.ufo directory filters that limit the
+     compared *.ufo directories when ufo_subtrees_only is True
+    :param file_filter: (string) 'glyph', 'nonglyph', or None for all files
+    :return: (tuple) (added_filepath_list, deleted_filepath_list, modified_filepath_list)
+    """
+    filepath_lists = ([], [], [])
+    filename_suffixes = None
+    if file_filter is not None:
+        filename_suffixes = FILE_FILTER_SUFFIXES[file_filter]
+    base_tree_binsha = repo.commit(base_revision).tree.binsha
+    head_tree_binsha = repo.commit(head_revision).tree.binsha
+    if ufo_subtrees_only is True:
+        walk_ufo_tree_delta(
+            repo.odb,
+            base_tree_binsha,
+            head_tree_binsha,
+            "",
+            filepath_lists,
+            UfoDirectoryFilter(ufo_filter_list or []),
+            filename_suffixes,
+        )
+    else:
+        walk_tree_delta(
+            repo.odb,
+            base_tree_binsha,
+            head_tree_binsha,
+            "",
+            filepath_lists,
+            filename_suffixes,
+        )
+    return filepath_lists
+
+
+def get_commit_sha1_list(repo, commit_number):
+    """
+    Defines the abbreviated SHA1 of the most recent commits reachable from HEAD in
+    reverse chronological commit date order without a git subprocess call.  This
+    mirrors the output of `git log -[N] --pretty=%h` with a fixed seven character
+    abbreviation.
+
+    :param repo: GitPython Repo object
+    :param commit_number: (int) number of commits to include
+    :return: (list) abbreviated SHA1 strings
+    """
+    commit_sha1_list = []
+    head_commit = repo.head.commit
+    seen_binsha_set = {head_commit.binsha}
+    # heap ordered by most recent commit date, insertion counter breaks ties
+    commit_heap = [(-head_commit.committed_date, 0, head_commit)]
+    counter = 1
+    while commit_heap and len(commit_sha1_list) < commit_number:
+        commit = heapq.heappop(commit_heap)[2]
+        commit_sha1_list.append(commit.hexsha[:7])
+        for parent in commit.parents:
+            if parent.binsha not in seen_binsha_set:
+                seen_binsha_set.add(parent.binsha)
+                heapq.heappush(commit_heap, (-parent.committed_date, counter, parent))
+                counter += 1
+    return commit_sha1_list
@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ====================================================
+# Copyright 2018 Christopher Simpkins
+# MIT License
+# ====================================================
+
+"""
+The gitlog.py module defines an incremental parser for the NUL delimited output of
+a single `git log --name-status -z` call.  The output stream is read in fixed size
+chunks and one CommitChanges object is returned per commit, so memory use does not
+depend on the length of the commit history.
+
+Each commit header is written with the LOG_FORMAT format string.  The header starts
+with the LOG_COMMIT_MARKER byte so that it can be distinguished from the name-status
+records of the previous commit.
+"""
+
+# start of commit header byte, not used in name-status status codes
+LOG_COMMIT_MARKER = "\x01"
+# commit SHA1, committer date (UNIX timestamp), author name, subject
+LOG_FORMAT = "%x01%H%x00%ct%x00%an%x00%s"
+LOG_HEADER_FIELD_NUMBER = 4
+# bytes per read of the git log standard output stream
+LOG_READ_SIZE = 64 * 1024
+
+
+class CommitChanges(object):
+    """
+    Files that were added, deleted, and modified in a commit
+
+    :param commit_sha1: (string) full commit SHA1
+    :param timestamp: (int) committer date as UNIX timestamp
+    :param author: (string) author name
+    :param subject: (string) commit message subject line
+    """
+
+    __slots__ = (
+        "commit_sha1",
+        "timestamp",
+        "author",
+        "subject",
+        "added",
+        "deleted",
+        "modified",
+    )
+
+    def __init__(self, commit_sha1, timestamp, author, subject):
+        self.commit_sha1 = commit_sha1
+        self.timestamp = timestamp
+        self.author = author
+        self.subject = subject
+        self.added = []
+        self.deleted = []
+        self.modified = []
+
+    def __len__(self):
+        return len(self.added) + len(self.deleted) + len(self.modified)
+
+
+def iter_nul_delimited_tokens(chunk_iterable):
+    """
+    Generator that splits a stream of byte chunks into NUL delimited tokens.  Tokens
+    are decoded as UTF-8, undecodable bytes are preserved with surrogate escapes.
+    :param chunk_iterable: (iterable of bytes) stream chunks
+    :return: (Python generator of strings) tokens without the NUL delimiter
+    """
+    remainder = b""
+    for chunk in chunk_iterable:
+        token_list = (remainder + chunk).split(b"\0")
+        # the last item is incomplete until the next NUL byte
+        remainder = token_list.pop()
+        for token in token_list:
+            yield token.decode("utf-8", "surrogateescape")
+    if remainder != b"":
+        yield remainder.decode("utf-8", "surrogateescape")
+
+
+def iter_stream_chunks(stream, read_size=LOG_READ_SIZE):
+    """
+    Generator that reads a binary stream in chunks
+    :param stream: binary file object (e.g. subprocess standard output pipe)
+    :param read_size: (int) maximum bytes per read
+    :return: (Python generator of bytes) chunks
+    """
+    while True:
+        chunk = stream.read(read_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+def parse_log_tokens(token_iterable):
+    """
+    Generator that parses `git log --name-status -z --no-renames --format=LOG_FORMAT`
+    tokens into CommitChanges objects in git log order.  Records with status codes
+    other than added (A), deleted (D), and modified (M) are ignored.
+
+    :param token_iterable: (iterable of strings) NUL delimited tokens
+    :return: (Python generator of CommitChanges) one object per commit
+    """
+    token_iterator = iter(token_iterable)
+    commit_changes = None
+    for token in token_iterator:
+        # header and status tokens follow a newline after the previous commit header
+        token = token.lstrip("\n")
+        if token.startswith(LOG_COMMIT_MARKER):
+            if commit_changes is not None:
+                yield commit_changes
+            header_list = [token[1:]]
+            for _ in range(LOG_HEADER_FIELD_NUMBER - 1):
+                header_list.append(next(token_iterator, ""))
+            commit_changes = CommitChanges(
+                header_list[0], int(header_list[1] or 0), header_list[2], header_list[3]
+            )
+            continue
+        if token == "" or commit_changes is None:
+            continue
+        filepath = next(token_iterator, None)
+        if filepath is None:
+            break
+        status_code = token[0]
+        if status_code == "A":
+            commit_changes.added.append(filepath)
+        elif status_code == "D":
+            commit_changes.deleted.append(filepath)
+        elif status_code == "M":
+            commit_changes.modified.append(filepath)
+        elif status_code in ("R", "C"):
+            # rename and copy records include a second path
+            next(token_iterator, None)
+    if commit_changes is not None:
+        yield commit_changes
@@ -0,0 +1,511 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ====================================================
+# Copyright 2018 Christopher Simpkins
+# MIT License
+# ====================================================
+
+"""
+The glif.py module defines a parser for the UFO *.glif glyph XML file format and
+a structural comparison of two glyphs.  The comparison reports changes to the
+advance, unicodes, guidelines, anchors, contours, points, components, and lib of
+the glyph.  XML attribute order and formatting changes are not reported.
+
+Contours, points, components, and guidelines are compared by position and anchors
+are compared by name so that the comparison is linear in the size of the glyphs.
+"""
+
+import re
+import xml.parsers.expat
+from array import array
+
+from ufodiff.utilities.plist import PlistObjectBuilder
+
+# default component transformation attribute values
+COMPONENT_TRANSFORMATION_DEFAULTS = (
+    ("xScale", 1.0),
+    ("xyScale", 0.0),
+    ("yxScale", 0.0),
+    ("yScale", 1.0),
+    ("xOffset", 0.0),
+    ("yOffset", 0.0),
+)
+# point type codes in Contour.point_types
+POINT_TYPES = ("offcurve", "move", "line", "curve", "qcurve")
+POINT_TYPE_CODES = {point_type: code for code, point_type in enumerate(POINT_TYPES)}
+# the outline element is located with a regular expression for lazy decoding
+OUTLINE_REGEX = re.compile(
+    rb"<outline\b[^>]*?/>|<outline\b.*?</outline\s*>", flags=re.DOTALL
+)
+
+
+class Contour(object):
+    """
+    Contour class stores the points of a glyph contour in compact arrays
+
+    Attributes:
+     - coordinates: (array.array 'd') interleaved x, y point coordinates
+     - point_types: (array.array 'b') POINT_TYPES index of each point
+     - smooth_flags: (array.array 'b') 1 for smooth points, 0 for other points
+     - point_names: (dict) {point index: name} for named points
+    """
+
+    __slots__ = ("coordinates", "point_types", "smooth_flags", "point_names")
+
+    def __init__(self):
+        self.coordinates = array("d")
+        self.point_types = array("b")
+        self.smooth_flags = array("b")
+        self.point_names = {}
+
+    def __len__(self):
+        return len(self.point_types)
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, Contour)
+            and self.coordinates == other.coordinates
+            and self.point_types == other.point_types
+            and self.smooth_flags == other.smooth_flags
+            and self.point_names == other.point_names
+        )
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __iter__(self):
+        for index in range(len(self.point_types)):
+            yield self.get_point(index)
+
+    def get_point(self, index):
+        """
+        :param index: (int) point index
+        :return: (tuple) (x, y, type, smooth, name)
+        """
+        return (
+            self.coordinates[2 * index],
+            self.coordinates[2 * index + 1],
+            POINT_TYPES[self.point_types[index]],
+            self.smooth_flags[index] == 1,
+            self.point_names.get(index),
+        )
+
+
+class Component(object):
+    """
+    Component class stores a glyph component
+
+    Attributes:
+     - base: (string) base glyph name
+     - transformation: (tuple) xScale, xyScale, yxScale, yScale, xOffset, yOffset
+    """
+
+    __slots__ = ("base", "transformation")
+
+    def __init__(self, base, transformation):
+        self.base = base
+        self.transformation = transformation
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, Component)
+            and self.base == other.base
+            and self.transformation == other.transformation
+        )
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+
+class Glyph(object):
+    """
+    Glyph class stores the glyph data that are parsed from a *.glif file.  When the
+    glyph is parsed with lazy_outline=True, the outline XML is decoded on first
+    access of the contours or components attributes.
+
+    Attributes:
+     - name: (string) glyph name
+     - width, height: (float) advance width and height
+     - unicodes: (list) unicode hexadecimal strings (upper case)
+     - guidelines: (list) (x, y, angle, name) tuples
+     - anchors: (list) (name, x, y) tuples
+     - contours: (list) Contour objects
+     - components: (list) Component objects
+     - lib: (dict) glyph lib plist data
+    """
+
+    __slots__ = (
+        "name",
+        "width",
+        "height",
+        "unicodes",
+        "guidelines",
+        "anchors",
+        "lib",
+        "_contours",
+        "_components",
+        "_outline_data",
+    )
+
+    def __init__(self):
+        self.name = None
+        self.width = 0.0
+        self.height = 0.0
+        self.unicodes = []
+        self.guidelines = []
+        self.anchors = []
+        self.lib = {}
+        self._contours = []
+        self._components = []
+        # undecoded outline element XML (lazy_outline parses)
+        self._outline_data = None
+
+    def _decode_outline(self):
+        outline_data = self._outline_data
+        self._outline_data = None
+        _GlifParser(self).parse(outline_data)
+
+    @property
+    def contours(self):
+        if self._outline_data is not None:
+            self._decode_outline()
+        return self._contours
+
+    @property
+    def components(self):
+        if self._outline_data is not None:
+            self._decode_outline()
+        return self._components
+
+
+def _get_number(attribute_dict, attribute_name, default=None):
+    value = attribute_dict.get(attribute_name)
+    if value is None:
+        return default
+    return float(value)
+
+
+class _GlifParser(object):
+    """
+    Streaming expat parser that loads *.glif XML data into a Glyph object.  Identifier
+    and color attributes, notes, and images are not included.
+
+    :param glyph: ufodiff.utilities.glif.Glyph object
+    """
+
+    def __init__(self, glyph):
+        self.glyph = glyph
+        self.contour = None
+        # glyph lib property list builder, defined in the lib element
+        self.plist_builder = None
+
+    def parse(self, glif_data):
+        parser = xml.parsers.expat.ParserCreate()
+        parser.buffer_text = True
+        parser.StartElementHandler = self.start_element
+        parser.EndElementHandler = self.end_element
+        parser.CharacterDataHandler = self.character_data
+        parser.Parse(glif_data, True)
+
+    def start_element(self, tag, attribute_dict):
+        if self.plist_builder is not None:
+            self.plist_builder.start_element(tag)
+        elif tag == "point":
+            contour = self.contour
+            if contour is None:
+                return
+            contour.coordinates.append(float(attribute_dict["x"]))
+            contour.coordinates.append(float(attribute_dict["y"]))
+            contour.point_types.append(
+                POINT_TYPE_CODES.get(attribute_dict.get("type", "offcurve"), 0)
+            )
+            contour.smooth_flags.append(
+                1 if attribute_dict.get("smooth") == "yes" else 0
+            )
+            if "name" in attribute_dict:
+                contour.point_names[len(contour.point_types) - 1] = attribute_dict[
+                    "name"
+                ]
+        elif tag == "contour":
+            self.contour = Contour()
+            self.glyph._contours.append(self.contour)
+        elif tag == "component":
+            self.glyph._components.append(
+                Component(
+                    attribute_dict.get("base"),
+                    tuple(
+                        _get_number(attribute_dict, attribute_name, default)
+                        for attribute_name, default in COMPONENT_TRANSFORMATION_DEFAULTS
+                    ),
+                )
+            )
+        elif tag == "glyph":
+            self.glyph.name = attribute_dict.get("name")
+        elif tag == "advance":
+            self.glyph.width = _get_number(attribute_dict, "width", 0.0)
+            self.glyph.height = _get_number(attribute_dict, "height", 0.0)
+        elif tag == "unicode":
+            self.glyph.unicodes.append(attribute_dict.get("hex", "").upper())
+        elif tag == "guideline":
+            self.glyph.guidelines.append(
+                (
+                    _get_number(attribute_dict, "x"),
+                    _get_number(attribute_dict, "y"),
+                    _get_number(attribute_dict, "angle"),
+                    attribute_dict.get("name"),
+                )
+            )
+        elif tag == "anchor":
+            self.glyph.anchors.append(
+                (
+                    attribute_dict.get("name"),
+                    _get_number(attribute_dict, "x"),
+                    _get_number(attribute_dict, "y"),
+                )
+            )
+        elif tag == "lib":
+            self.plist_builder = PlistObjectBuilder()
+
+    def end_element(self, tag):
+        if self.plist_builder is not None:
+            if tag == "lib":
+                # the top level lib dictionary
+                if isinstance(self.plist_builder.root, dict):
+                    self.glyph.lib = self.plist_builder.root
+                self.plist_builder = None
+            else:
+                self.plist_builder.end_element(tag)
+        elif tag == "contour":
+            self.contour = None
+
+    def character_data(self, text):
+        if self.plist_builder is not None:
+            self.plist_builder.character_data(text)
+
+
+def parse_glif(glif_data, lazy_outline=False):
+    """
+    Parses *.glif XML file data into a Glyph object with a streaming expat parser.
+    Identifier and color attributes, notes, and images are not included.
+
+    :param glif_data: (bytes or string) *.glif file data
+    :param lazy_outline: (boolean) defer decoding of the contours and components until
+     first access.  Use for callers that only need the glyph name, metrics, unicodes,
+     anchors, guidelines, or lib.
+    :return: ufodiff.utilities.glif.Glyph object
+    """
+    if not isinstance(glif_data, bytes):
+        glif_data = glif_data.encode("utf-8")
+    glyph = Glyph()
+    if lazy_outline is True:
+        outline_match = OUTLINE_REGEX.search(glif_data)
+        if outline_match is not None:
+            glyph._outline_data = outline_match.group(0)
+            outline_start, outline_end = outline_match.span()
+            glif_data = glif_data[:outline_start] + glif_data[outline_end:]
+    _GlifParser(glyph).parse(glif_data)
+    return glyph
+
+
+# ------------------------------------------------------------------------------
+# Glyph comparison
+# ------------------------------------------------------------------------------
+
+
+def format_number(number):
+    """
+    Formats a coordinate value without a trailing '.0' for integer values
+    :param number: (float) number or None
+    :return: (string) formatted number
+    """
+    if number is None:
+        return "None"
+    if number == int(number):
+        return str(int(number))
+    return repr(number)
+
+
+def format_point(point):
+    x, y, point_type, smooth, name = point
+    point_string = "(" + format_number(x) + ", " + format_number(y) + ") " + point_type
+    if smooth:
+        point_string += " smooth"
+    if name is not None:
+        point_string += " '" + name + "'"
+    return point_string
+
+
+def format_component(component):
+    component_string = "'" + str(component.base) + "'"
+    transformation = component.transformation
+    if transformation != tuple(x[1] for x in COMPONENT_TRANSFORMATION_DEFAULTS):
+        component_string += (
+            " [" + ", ".join(format_number(value) for value in transformation) + "]"
+        )
+    return component_string
+
+
+def format_guideline(guideline):
+    x, y, angle, name = guideline
+    guideline_string = (
+        "x="
+        + format_number(x)
+        + " y="
+        + format_number(y)
+        + " angle="
+        + format_number(angle)
+    )
+    if name is not None:
+        guideline_string += " '" + name + "'"
+    return guideline_string
+
+
+def _get_positional_changes(label, old_list, new_list, format_func):
+    """
+    Compares two lists by position.
+    :return: (list) change description strings
+    """
+    change_list = []
+    common_number = min(len(old_list), len(new_list))
+    for index in range(common_number):
+        if old_list[index] != new_list[index]:
+            change_list.append(
+                label
+                + " "
+                + str(index + 1)
+                + ": "
+                + format_func(old_list[index])
+                + " -> "
+                + format_func(new_list[index])
+            )
+    for index in range(common_number, len(old_list)):
+        change_list.append(
+            label + " " + str(index + 1) + " removed: " + format_func(old_list[index])
+        )
+    for index in range(common_number, len(new_list)):
+        change_list.append(
+            label + " " + str(index + 1) + " added: " + format_func(new_list[index])
+        )
+    return change_list
+
+
+def _get_contour_changes(old_contours, new_contours):
+    change_list = []
+    common_number = min(len(old_contours), len(new_contours))
+    for index in range(common_number):
+        old_contour = old_contours[index]
+        new_contour = new_contours[index]
+        if old_contour != new_contour:
+            change_list.extend(
+                _get_positional_changes(
+                    "contour " + str(index + 1) + " point",
+                    list(old_contour),
+                    list(new_contour),
+                    format_point,
+                )
+            )
+    for index in range(common_number, len(old_contours)):
+        change_list.append(
+            "contour "
+            + str(index + 1)
+            + " removed: "
+            + str(len(old_contours[index]))
+            + " points"
+        )
+    for index in range(common_number, len(new_contours)):
+        change_list.append(
+            "contour "
+            + str(index + 1)
+            + " added: "
+            + str(len(new_contours[index]))
+            + " points"
+        )
+    return change_list
+
+
+def _get_lib_changes(old_lib, new_lib):
+    change_list = []
+    for key in sorted(set(old_lib) | set(new_lib)):
+        if key not in old_lib:
+            change_list.append("lib key '" + key + "' added")
+        elif key not in new_lib:
+            change_list.append("lib key '" + key + "' removed")
+        elif old_lib[key] != new_lib[key]:
+            change_list.append("lib key '" + key + "' modified")
+    return change_list
+
+
+def get_glyph_changes(old_glyph, new_glyph):
+    """
+    Compares two Glyph objects.
+
+    :param old_glyph: ufodiff.utilities.glif.Glyph object
+    :param new_glyph: ufodiff.utilities.glif.Glyph object
+    :return: (list) change description strings, an empty list if the glyphs are
+     structurally identical
+    """
+    change_list = []
+    if old_glyph.name != new_glyph.name:
+        change_list.append(
+            "name: '" + str(old_glyph.name) + "' -> '" + str(new_glyph.name) + "'"
+        )
+    if old_glyph.width != new_glyph.width:
+        change_list.append(
+            "advance width: "
+            + format_number(old_glyph.width)
+            + " -> "
+            + format_number(new_glyph.width)
+        )
+    if old_glyph.height != new_glyph.height:
+        change_list.append(
+            "advance height: "
+            + format_number(old_glyph.height)
+            + " -> "
+            + format_number(new_glyph.height)
+        )
+    if old_glyph.unicodes != new_glyph.unicodes:
+        change_list.append(
+            "unicodes: "
+            + (" ".join(old_glyph.unicodes) or "None")
+            + " -> "
+            + (" ".join(new_glyph.unicodes) or "None")
+        )
+    change_list.extend(
+        _get_positional_changes(
+            "guideline", old_glyph.guidelines, new_glyph.guidelines, format_guideline
+        )
+    )
+    # anchors are compared by name
+    old_anchor_dict = {anchor[0]: anchor[1:] for anchor in old_glyph.anchors}
+    new_anchor_dict = {anchor[0]: anchor[1:] for anchor in new_glyph.anchors}
+    for anchor in old_glyph.anchors:
+        name = anchor[0]
+        if name not in new_anchor_dict:
+            change_list.append("anchor '" + str(name) + "' removed")
+        elif anchor[1:] != new_anchor_dict[name]:
+            new_x, new_y = new_anchor_dict[name]
+            change_list.append(
+                "anchor '"
+                + str(name)
+                + "': ("
+                + format_number(anchor[1])
+                + ", "
+                + format_number(anchor[2])
+                + ") -> ("
+                + format_number(new_x)
+                + ", "
+                + format_number(new_y)
+                + ")"
+            )
+    for anchor in new_glyph.anchors:
+        if anchor[0] not in old_anchor_dict:
+            change_list.append("anchor '" + str(anchor[0]) + "' added")
+    change_list.extend(_get_contour_changes(old_glyph.contours, new_glyph.contours))
+    change_list.extend(
+        _get_positional_changes(
+            "component", old_glyph.components, new_glyph.components, format_component
+        )
+    )
+    change_list.extend(_get_lib_changes(old_glyph.lib, new_glyph.lib))
+    return change_list
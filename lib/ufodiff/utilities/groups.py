@@ -0,0 +1,177 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ====================================================
+# Copyright 2018 Christopher Simpkins
+# MIT License
+# ====================================================
+
+"""
+The groups.py module defines a membership comparison of two revisions of a UFO
+groups.plist file and the kerning pairs that are affected by each membership change.
+
+Group memberships are compared as sets so that member order changes are not
+reported.  A KerningGroupIndex maps each group name to the kerning pairs that
+include the group as the first or second member of the pair.  The effective glyph
+pairs that are affected when a glyph is added to or removed from a group are defined
+from the pairs of that group only, the kerning pairs are not expanded to glyph pairs.
+"""
+
+import sys
+
+from ufodiff.utilities.plist import load_plist
+
+
+def load_groups(groups_data):
+    """
+    Loads groups.plist data into a group name : member set dictionary
+
+    :param groups_data: (bytes) groups.plist file data
+    :return: (dict) group name : frozenset of glyph names dictionary
+    """
+    return {
+        sys.intern(group): frozenset(
+            sys.intern(glyph_name) for glyph_name in member_list
+        )
+        for group, member_list in load_plist(groups_data).items()
+    }
+
+
+class GroupMembershipChange(object):
+    """
+    Membership change of a single group.
+
+    :param group: (string) group name
+    :param added: (list) (glyph name, affected pair list) tuples for added members
+    :param removed: (list) (glyph name, affected pair list) tuples for removed members
+    """
+
+    __slots__ = ("group", "added", "removed")
+
+    def __init__(self, group, added, removed):
+        self.group = group
+        self.added = added
+        self.removed = removed
+
+
+class KerningGroupIndex(object):
+    """
+    Inverted index of group name : kerning pairs for a kerning.plist and groups.plist
+    revision.  The index is built in a single pass over the kerning pairs.
+
+    :param pair_dict: (dict) (first, second) : value kerning pair dictionary
+    :param group_dict: (dict) group name : member set dictionary
+    """
+
+    def __init__(self, pair_dict, group_dict):
+        self.pair_dict = pair_dict
+        self.group_dict = group_dict
+        # group name : [((first, second), value), ...]
+        self.first_index = {}
+        self.second_index = {}
+        for pair, value in pair_dict.items():
+            first, second = pair
+            if first in group_dict:
+                self.first_index.setdefault(first, []).append((pair, value))
+            if second in group_dict:
+                self.second_index.setdefault(second, []).append((pair, value))
+
+    def _get_side_members(self, name):
+        # group members for group names, the glyph for glyph names
+        member_set = self.group_dict.get(name)
+        if member_set is None:
+            return (name,)
+        return sorted(member_set)
+
+    def get_affected_pairs(self, group, glyph_name):
+        """
+        Defines the effective glyph pairs that the glyph receives through the kerning
+        pairs of the group.  Glyph pairs that are defined by a more specific kerning
+        pair (glyph + glyph, glyph + group, or group + glyph) are not included.
+
+        :param group: (string) group name
+        :param glyph_name: (string) glyph name that is a member of the group
+        :return: (list) ((first glyph, second glyph), value) tuples ordered by pair
+        """
+        pair_dict = self.pair_dict
+        group_dict = self.group_dict
+        affected_pair_list = []
+        for (_, second), value in self.first_index.get(group, ()):
+            second_is_group = second in group_dict
+            for second_glyph in self._get_side_members(second):
+                if (glyph_name, second_glyph) in pair_dict:
+                    continue
+                if second_is_group and (
+                    (glyph_name, second) in pair_dict
+                    or (group, second_glyph) in pair_dict
+                ):
+                    continue
+                affected_pair_list.append(((glyph_name, second_glyph), value))
+        for (first, _), value in self.second_index.get(group, ()):
+            first_is_group = first in group_dict
+            for first_glyph in self._get_side_members(first):
+                if (first_glyph, glyph_name) in pair_dict:
+                    continue
+                if first_is_group and (
+                    (first_glyph, group) in pair_dict
+                    or (first, glyph_name) in pair_dict
+                ):
+                    continue
+                affected_pair_list.append(((first_glyph, glyph_name), value))
+        affected_pair_list.sort()
+        return affected_pair_list
+
+
+def get_group_membership_changes(old_group_dict, new_group_dict):
+    """
+    Compares the group memberships of two groups.plist revisions.  Groups that were
+    added or removed are reported with all members added or removed.
+
+    :param old_group_dict: (dict) base revision group name : member set dictionary
+    :param new_group_dict: (dict) head revision group name : member set dictionary
+    :return: (list) (group name, added glyph name list, removed glyph name list) tuples
+     ordered by group name for the groups with membership changes
+    """
+    change_list = []
+    empty_set = frozenset()
+    for group in sorted(set(old_group_dict) | set(new_group_dict)):
+        old_member_set = old_group_dict.get(group, empty_set)
+        new_member_set = new_group_dict.get(group, empty_set)
+        if old_member_set == new_member_set:
+            continue
+        change_list.append(
+            (
+                group,
+                sorted(new_member_set - old_member_set),
+                sorted(old_member_set - new_member_set),
+            )
+        )
+    return change_list
+
+
+def get_group_kerning_changes(old_index, new_index):
+    """
+    Defines the group membership changes and the effective kerning pairs that are
+    affected by each change.  Added members are looked up in the head revision index
+    and removed members in the base revision index.
+
+    :param old_index: (KerningGroupIndex) base revision index
+    :param new_index: (KerningGroupIndex) head revision index
+    :return: (list) GroupMembershipChange objects ordered by group name
+    """
+    return [
+        GroupMembershipChange(
+            group,
+            [
+                (glyph_name, new_index.get_affected_pairs(group, glyph_name))
+                for glyph_name in added_list
+            ],
+            [
+                (glyph_name, old_index.get_affected_pairs(group, glyph_name))
+                for glyph_name in removed_list
+            ],
+        )
+        for group, added_list, removed_list in get_group_membership_changes(
+            old_index.group_dict, new_index.group_dict
+        )
+    ]
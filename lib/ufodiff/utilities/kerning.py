@@ -0,0 +1,204 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ====================================================
+# Copyright 2018 Christopher Simpkins
+# MIT License
+# ====================================================
+
+"""
+The kerning.py module defines a pair comparison of two revisions of a UFO
+kerning.plist file.  The kerning.plist first glyph/group : second glyph/group : value
+dictionary is streamed into a flat (first, second) : value dictionary with interned
+glyph and group names so that nested dictionaries are not created and names that are
+shared by many pairs are stored once.  Pair changes are identified in a single pass
+over each revision.
+"""
+
+import collections
+import plistlib
+import sys
+import xml.parsers.expat
+
+
+class KerningPairBuilder(object):
+    """
+    Builds a flat (first, second) : value kerning pair dictionary from XML property
+    list element events.  The start_element, end_element, and character_data methods
+    are expat handlers.
+
+    :param pair_dict: (dict) the kerning pair dictionary that is loaded
+    """
+
+    def __init__(self, pair_dict):
+        self.pair_dict = pair_dict
+        # dictionary nesting depth, 1 = first glyph/group, 2 = second glyph/group
+        self.dict_depth = 0
+        self.first = None
+        self.second = None
+        self.text_list = None
+
+    def start_element(self, tag, attribute_dict=None):
+        if tag == "dict":
+            self.dict_depth += 1
+        elif tag in ("key", "integer", "real"):
+            self.text_list = []
+
+    def end_element(self, tag):
+        if tag == "dict":
+            self.dict_depth -= 1
+        elif tag == "key":
+            if self.dict_depth == 1:
+                self.first = sys.intern("".join(self.text_list))
+            elif self.dict_depth == 2:
+                self.second = sys.intern("".join(self.text_list))
+            self.text_list = None
+        elif tag == "integer" and self.dict_depth == 2:
+            self.pair_dict[(self.first, self.second)] = int("".join(self.text_list))
+            self.text_list = None
+        elif tag == "real" and self.dict_depth == 2:
+            self.pair_dict[(self.first, self.second)] = float("".join(self.text_list))
+            self.text_list = None
+
+    def character_data(self, text):
+        if self.text_list is not None:
+            self.text_list.append(text)
+
+
+def load_kerning_pairs(kerning_data):
+    """
+    Loads kerning.plist data into a flat kerning pair dictionary.  XML property list
+    data are streamed with an expat parser and binary property list data are loaded
+    with the plistlib module.
+
+    :param kerning_data: (bytes) kerning.plist file data
+    :return: (dict) (first, second) : value kerning pair dictionary
+    """
+    pair_dict = {}
+    if kerning_data[:8] == b"bplist00":
+        for first, second_dict in plistlib.loads(kerning_data).items():
+            first = sys.intern(first)
+            for second, value in second_dict.items():
+                pair_dict[(first, sys.intern(second))] = value
+        return pair_dict
+    builder = KerningPairBuilder(pair_dict)
+    parser = xml.parsers.expat.ParserCreate()
+    parser.buffer_text = True
+    parser.StartElementHandler = builder.start_element
+    parser.EndElementHandler = builder.end_element
+    parser.CharacterDataHandler = builder.character_data
+    parser.Parse(kerning_data, True)
+    return pair_dict
+
+
+class KerningPairChanges(object):
+    """
+    Kerning pair changes between two revisions of a kerning.plist file.  Changes are
+    ordered by pair.
+
+    :param old_pair_number: (int) number of pairs in the base revision
+    :param new_pair_number: (int) number of pairs in the head revision
+    :param added: (list) ((first, second), value) tuples
+    :param removed: (list) ((first, second), value) tuples
+    :param changed: (list) ((first, second), old value, new value) tuples
+    """
+
+    __slots__ = ("old_pair_number", "new_pair_number", "added", "removed", "changed")
+
+    def __init__(self, old_pair_number, new_pair_number, added, removed, changed):
+        self.old_pair_number = old_pair_number
+        self.new_pair_number = new_pair_number
+        self.added = added
+        self.removed = removed
+        self.changed = changed
+
+    def __len__(self):
+        return len(self.added) + len(self.removed) + len(self.changed)
+
+    def get_added_value_histogram(self):
+        """
+        :return: (list) (value, pair number) tuples ordered by value
+        """
+        return get_value_histogram(value for _, value in self.added)
+
+    def get_removed_value_histogram(self):
+        """
+        :return: (list) (value, pair number) tuples ordered by value
+        """
+        return get_value_histogram(value for _, value in self.removed)
+
+    def get_value_change_histogram(self):
+        """
+        :return: (list) (new value - old value, pair number) tuples ordered by value
+         change
+        """
+        return get_value_histogram(
+            new_value - old_value for _, old_value, new_value in self.changed
+        )
+
+
+def get_kerning_pair_changes(old_pair_dict, new_pair_dict):
+    """
+    Compares two kerning pair dictionaries.  Each dictionary is iterated once and the
+    head revision is only iterated when pairs were added.
+
+    :param old_pair_dict: (dict) base revision (first, second) : value dictionary
+    :param new_pair_dict: (dict) head revision (first, second) : value dictionary
+    :return: (KerningPairChanges) the kerning pair changes
+    """
+    added = []
+    removed = []
+    changed = []
+    new_get = new_pair_dict.get
+    for pair, old_value in old_pair_dict.items():
+        new_value = new_get(pair)
+        if new_value is None:
+            removed.append((pair, old_value))
+        elif new_value != old_value:
+            changed.append((pair, old_value, new_value))
+    # pairs that are in both revisions = old pair number - removed pair number
+    if len(new_pair_dict) > len(old_pair_dict) - len(removed):
+        added = [
+            (pair, new_value)
+            for pair, new_value in new_pair_dict.items()
+            if pair not in old_pair_dict
+        ]
+    added.sort()
+    removed.sort()
+    changed.sort()
+    return KerningPairChanges(
+        len(old_pair_dict), len(new_pair_dict), added, removed, changed
+    )
+
+
+def get_value_histogram(values):
+    """
+    Counts kerning values (or value changes)
+
+    :param values: (iterable) int or float values
+    :return: (list) (value, count) tuples ordered by value
+    """
+    return sorted(collections.Counter(values).items())
+
+
+def format_kerning_value(value, signed=False):
+    """
+    Formats a kerning value without a trailing '.0' for integer values
+    :param value: (int or float) kerning value
+    :param signed: (boolean) include a '+' sign for positive values
+    :return: (string) formatted value
+    """
+    if value == int(value):
+        value = int(value)
+    if signed is True and value > 0:
+        return "+" + str(value)
+    return str(value)
+
+
+def format_kerning_pair(pair):
+    """
+    Formats a (first, second) kerning pair
+    :param pair: (tuple) (first, second) glyph or group names
+    :return: (string) formatted pair
+    """
+    return pair[0] + " " + pair[1]
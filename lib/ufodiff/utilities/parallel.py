@@ -0,0 +1,146 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ====================================================
+# Copyright 2018 Christopher Simpkins
+# MIT License
+# ====================================================
+
+"""
+The parallel.py module defines a process pool execution layer for per-glyph work
+(e.g. *.glif parsing and comparison) on large deltas.  Items are submitted to a
+concurrent.futures.ProcessPoolExecutor in chunks to reduce inter-process
+communication overhead and results are yielded in item order so that reports are
+deterministic.  A bounded number of chunks are in flight at one time so that results
+can be consumed as a stream without holding the full result list in memory.
+
+Small workloads and a single worker are processed sequentially in the calling
+process.
+
+The glyphdiff report writer (ufodiff.subcommands.glyphdiff.GlyphDiffTextWriter)
+consumes the parallel_map result stream.  The delta / deltajson / deltajsonl / deltamd
+report writers do not read *.glif files: filepaths come from the git tree comparison
+and glyph names from one contents.plist file per glyph layer, so there is no per-glyph
+work in those reports.
+"""
+
+import collections
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+# items per submitted chunk
+DEFAULT_CHUNK_SIZE = 64
+# chunks in flight per worker process
+CHUNKS_PER_WORKER = 2
+# workloads with fewer items are processed sequentially, pool start up cost is higher
+# than the per-item work
+PARALLEL_MIN_ITEMS = 256
+
+
+def get_worker_number(workers=None):
+    """
+    Defines the number of worker processes
+    :param workers: (int) requested number of worker processes, None or 0 for the
+     number of CPUs
+    :return: (int) number of worker processes
+    """
+    if workers is None or workers == 0:
+        # os.cpu_count returns None when the number of CPUs is undetermined
+        return os.cpu_count() or 1
+    if workers < 0:
+        raise ValueError("The number of workers must be a positive integer")
+    return workers
+
+
+# (initializer, initargs) that were called in this process
+_initialized_set = set()
+
+
+def is_parallel_workload(item_number, workers=None, min_items=None):
+    """
+    Tests whether a workload is processed in a process pool
+    :param item_number: (int) number of items
+    :param workers: (int) number of worker processes, None or 0 for the number of CPUs
+    :param min_items: (int) workloads with fewer items are processed sequentially,
+     None for PARALLEL_MIN_ITEMS
+    :return: (boolean) True for process pool execution
+    """
+    if min_items is None:
+        min_items = PARALLEL_MIN_ITEMS
+    return get_worker_number(workers) > 1 and item_number >= max(min_items, 2)
+
+
+def _run_chunk(func, item_list, initializer, initargs):
+    # executed in a worker process, the initializer is called on the first chunk
+    # (ProcessPoolExecutor initializer argument requires Py3.7+)
+    if initializer is not None and (initializer, initargs) not in _initialized_set:
+        initializer(*initargs)
+        _initialized_set.add((initializer, initargs))
+    return [func(item) for item in item_list]
+
+
+def _iter_chunks(item_list, chunk_size):
+    for start_index in range(0, len(item_list), chunk_size):
+        stop_index = start_index + chunk_size
+        yield item_list[start_index:stop_index]
+
+
+def parallel_map(
+    func,
+    item_list,
+    workers=None,
+    chunk_size=DEFAULT_CHUNK_SIZE,
+    initializer=None,
+    initargs=(),
+    min_items=None,
+):
+    """
+    Generator that applies func to each item in a process pool and yields the results
+    in item_list order.  func and the items must be picklable (e.g. module level
+    functions and tuples of strings).
+
+    :param func: (callable) function of one item that is executed in the workers
+    :param item_list: (list) items
+    :param workers: (int) number of worker processes, None or 0 for the number of CPUs
+    :param chunk_size: (int) number of items per submitted chunk
+    :param initializer: (callable) called once in each worker process (and in the
+     calling process for sequential execution) before items are processed, must be
+     picklable with picklable initargs
+    :param initargs: (tuple) initializer arguments
+    :param min_items: (int) item_list lengths below this value are processed
+     sequentially, None for PARALLEL_MIN_ITEMS
+    :return: (Python generator) func(item) results in item_list order
+    """
+    if not is_parallel_workload(len(item_list), workers, min_items):
+        if initializer is not None:
+            initializer(*initargs)
+        for item in item_list:
+            yield func(item)
+        return
+
+    worker_number = get_worker_number(workers)
+    executor = ProcessPoolExecutor(max_workers=worker_number)
+    chunk_iterator = _iter_chunks(item_list, max(chunk_size, 1))
+    future_queue = collections.deque()
+    try:
+        # fill the pipeline, then submit one chunk per consumed chunk
+        for chunk in chunk_iterator:
+            future_queue.append(
+                executor.submit(_run_chunk, func, chunk, initializer, initargs)
+            )
+            if len(future_queue) >= worker_number * CHUNKS_PER_WORKER:
+                break
+        while len(future_queue) > 0:
+            result_list = future_queue.popleft().result()
+            chunk = next(chunk_iterator, None)
+            if chunk is not None:
+                future_queue.append(
+                    executor.submit(_run_chunk, func, chunk, initializer, initargs)
+                )
+            for result in result_list:
+                yield result
+    finally:
+        # also reached when the consumer closes the generator early
+        for future in future_queue:
+            future.cancel()
+        executor.shutdown(wait=True)
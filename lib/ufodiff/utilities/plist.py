@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ====================================================
+# Copyright 2018 Christopher Simpkins
+# MIT License
+# ====================================================
+
+"""
+The plist.py module defines a streaming expat loader for XML property list data
+(UFO *.plist files and the lib element of *.glif files).  Character data are
+buffered by expat so that each text element is handled once.  String, data, and
+date values are loaded as text with whitespace removed from data values.
+"""
+
+import plistlib
+import xml.parsers.expat
+
+PLIST_TEXT_TAGS = {"key", "string", "integer", "real", "data", "date"}
+
+
+class PlistObjectBuilder(object):
+    """
+    Builds Python objects from XML property list element events.  The start_element,
+    end_element, and character_data methods are expat handlers.  The top level
+    property list value is defined in the root attribute.
+    """
+
+    def __init__(self):
+        self.root = None
+        # dictionary and array value stack and dictionary key stack
+        self.value_stack = []
+        self.key_stack = []
+        self.text_list = None
+
+    def start_element(self, tag, attribute_dict=None):
+        if tag == "dict":
+            self.value_stack.append({})
+        elif tag == "array":
+            self.value_stack.append([])
+        elif tag in PLIST_TEXT_TAGS:
+            self.text_list = []
+
+    def end_element(self, tag):
+        if tag == "key":
+            self.key_stack.append("".join(self.text_list))
+            self.text_list = None
+            return
+        elif tag == "string":
+            value = "".join(self.text_list)
+            self.text_list = None
+        elif tag in ("dict", "array"):
+            value = self.value_stack.pop()
+        elif tag == "integer":
+            value = int("".join(self.text_list))
+            self.text_list = None
+        elif tag == "real":
+            value = float("".join(self.text_list))
+            self.text_list = None
+        elif tag == "true":
+            value = True
+        elif tag == "false":
+            value = False
+        elif tag == "data":
+            # base64 text, line breaks and indentation are formatting
+            value = "".join("".join(self.text_list).split())
+            self.text_list = None
+        elif tag == "date":
+            value = "".join(self.text_list).strip()
+            self.text_list = None
+        else:
+            return
+        value_stack = self.value_stack
+        if len(value_stack) == 0:
+            self.root = value
+        elif type(value_stack[-1]) is dict:
+            value_stack[-1][self.key_stack.pop()] = value
+        else:
+            value_stack[-1].append(value)
+
+    def character_data(self, text):
+        if self.text_list is not None:
+            self.text_list.append(text)
+
+
+def load_plist(plist_data):
+    """
+    Loads XML property list data with a streaming expat parser.  Binary property list
+    data are loaded with the plistlib module.
+
+    :param plist_data: (bytes) property list file data
+    :return: Python object (dict for UFO property list files)
+    """
+    if plist_data[:8] == b"bplist00":
+        return plistlib.loads(plist_data)
+    builder = PlistObjectBuilder()
+    parser = xml.parsers.expat.ParserCreate()
+    parser.buffer_text = True
+    parser.StartElementHandler = builder.start_element
+    parser.EndElementHandler = builder.end_element
+    parser.CharacterDataHandler = builder.character_data
+    parser.Parse(plist_data, True)
+    return builder.root
@@ -0,0 +1,238 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ====================================================
+# Copyright 2018 Christopher Simpkins
+# MIT License
+# ====================================================
+
+"""
+The plistdiff.py module defines a key path comparison of two property list files
+(e.g. the UFO fontinfo.plist and lib.plist files).  The property lists are loaded
+into Python objects so that formatting and key order changes are not reported.
+
+Key paths join nested dictionary keys with a '/' character and array indices are
+appended in brackets (e.g. 'openTypeOS2WinAscent', 'com.foo.bar[3]',
+'com.foo.bar[3]/name').  Arrays that are longer than LARGE_ARRAY_LENGTH items (e.g.
+the lib.plist public.glyphOrder array) are aligned by item digest rather than
+compared by position, so that an inserted or deleted item is reported once and not
+as a change of every item that follows it.  Arrays with the same items in a
+different order are reported with a single REORDERED change.
+"""
+
+import collections
+import difflib
+import hashlib
+import json
+
+LARGE_ARRAY_LENGTH = 64
+
+ADDED = "added"
+REMOVED = "removed"
+CHANGED = "changed"
+REORDERED = "reordered"
+
+
+def get_value_digest(value):
+    """
+    Defines a digest of a property list value.  Dictionary keys are sorted so that the
+    digest does not depend on key order.
+
+    :param value: property list Python object
+    :return: (bytes) SHA1 digest
+    """
+    # data (bytes) and date values are serialized with repr
+    canonical_string = json.dumps(
+        value, sort_keys=True, separators=(",", ":"), default=repr
+    )
+    return hashlib.sha1(canonical_string.encode("utf-8")).digest()
+
+
+def _get_item_key(item):
+    # dict and array items are compared by digest, other values by type and value
+    if isinstance(item, (dict, list)):
+        return get_value_digest(item)
+    return type(item), item
+
+
+def format_value(value):
+    """
+    Formats a property list value for a report, dictionary and array values are
+    summarized
+
+    :param value: property list Python object
+    :return: (string) formatted value
+    """
+    if isinstance(value, dict):
+        return "<dict " + str(len(value)) + " keys>"
+    elif isinstance(value, list):
+        return "<array " + str(len(value)) + " items>"
+    return repr(value)
+
+
+def _join_key_path(key_path, key):
+    if key_path == "":
+        return key
+    return key_path + "/" + key
+
+
+def _compare_values(old_value, new_value, key_path, change_list):
+    if isinstance(old_value, dict) and isinstance(new_value, dict):
+        for key in sorted(set(old_value) | set(new_value)):
+            if key not in new_value:
+                change_list.append(
+                    (REMOVED, _join_key_path(key_path, key), old_value[key], None)
+                )
+            elif key not in old_value:
+                change_list.append(
+                    (ADDED, _join_key_path(key_path, key), None, new_value[key])
+                )
+            else:
+                _compare_values(
+                    old_value[key],
+                    new_value[key],
+                    _join_key_path(key_path, key),
+                    change_list,
+                )
+    elif isinstance(old_value, list) and isinstance(new_value, list):
+        if len(old_value) > LARGE_ARRAY_LENGTH or len(new_value) > LARGE_ARRAY_LENGTH:
+            _compare_large_arrays(old_value, new_value, key_path, change_list)
+            return
+        common_number = min(len(old_value), len(new_value))
+        for index in range(common_number):
+            _compare_values(
+                old_value[index],
+                new_value[index],
+                key_path + "[" + str(index) + "]",
+                change_list,
+            )
+        _append_array_length_changes(old_value, new_value, key_path, change_list)
+    elif old_value != new_value or type(old_value) is not type(new_value):
+        change_list.append((CHANGED, key_path, old_value, new_value))
+
+
+def _compare_large_arrays(old_value, new_value, key_path, change_list):
+    # whole array test before the item alignment, the digest test reports value type
+    # changes (e.g. 1 -> 1.0) of equal arrays
+    if old_value == new_value and get_value_digest(old_value) == get_value_digest(
+        new_value
+    ):
+        return
+    old_key_list = [_get_item_key(item) for item in old_value]
+    new_key_list = [_get_item_key(item) for item in new_value]
+    if old_key_list == new_key_list:
+        return
+    if collections.Counter(old_key_list) == collections.Counter(new_key_list):
+        change_list.append((REORDERED, key_path, old_value, new_value))
+        return
+    # the common lead and trail items are not aligned with SequenceMatcher
+    lead_number = 0
+    common_number = min(len(old_key_list), len(new_key_list))
+    while (
+        lead_number < common_number
+        and old_key_list[lead_number] == new_key_list[lead_number]
+    ):
+        lead_number += 1
+    trail_number = 0
+    while (
+        trail_number < common_number - lead_number
+        and old_key_list[-1 - trail_number] == new_key_list[-1 - trail_number]
+    ):
+        trail_number += 1
+    sequence_matcher = difflib.SequenceMatcher(
+        None,
+        old_key_list[lead_number : len(old_key_list) - trail_number],  # noqa: E203
+        new_key_list[lead_number : len(new_key_list) - trail_number],  # noqa: E203
+        autojunk=False,
+    )
+    for tag, old_start, old_end, new_start, new_end in sequence_matcher.get_opcodes():
+        if tag == "equal":
+            continue
+        old_start += lead_number
+        old_end += lead_number
+        new_start += lead_number
+        new_end += lead_number
+        if tag == "replace" and old_end - old_start == new_end - new_start:
+            # items replaced in place
+            for old_index, new_index in zip(
+                range(old_start, old_end), range(new_start, new_end)
+            ):
+                change_list.append(
+                    (
+                        CHANGED,
+                        key_path + "[" + str(new_index) + "]",
+                        old_value[old_index],
+                        new_value[new_index],
+                    )
+                )
+            continue
+        for old_index in range(old_start, old_end):
+            change_list.append(
+                (
+                    REMOVED,
+                    key_path + "[" + str(old_index) + "]",
+                    old_value[old_index],
+                    None,
+                )
+            )
+        for new_index in range(new_start, new_end):
+            change_list.append(
+                (
+                    ADDED,
+                    key_path + "[" + str(new_index) + "]",
+                    None,
+                    new_value[new_index],
+                )
+            )
+
+
+def _append_array_length_changes(old_value, new_value, key_path, change_list):
+    common_number = min(len(old_value), len(new_value))
+    for index in range(common_number, len(old_value)):
+        change_list.append(
+            (REMOVED, key_path + "[" + str(index) + "]", old_value[index], None)
+        )
+    for index in range(common_number, len(new_value)):
+        change_list.append(
+            (ADDED, key_path + "[" + str(index) + "]", None, new_value[index])
+        )
+
+
+def get_key_path_changes(old_plist, new_plist):
+    """
+    Compares two property list Python objects by key path.
+
+    :param old_plist: property list Python object (dict for UFO property list files)
+    :param new_plist: property list Python object (dict for UFO property list files)
+    :return: (list) (change type, key path, old value, new value) tuples where the
+     change type is one of ADDED, REMOVED, CHANGED, or REORDERED.  Changes are
+     ordered by dictionary key and array index.  The key paths of REMOVED array items
+     use the old array index, the key paths of other array item changes use the new
+     array index.
+    """
+    change_list = []
+    _compare_values(old_plist, new_plist, "", change_list)
+    return change_list
+
+
+def format_key_path_change(change):
+    """
+    Formats a get_key_path_changes change tuple for a report
+    :param change: (tuple) (change type, key path, old value, new value)
+    :return: (string) formatted change
+    """
+    change_type, key_path, old_value, new_value = change
+    if change_type == ADDED:
+        return "added: " + key_path + " = " + format_value(new_value)
+    elif change_type == REMOVED:
+        return "removed: " + key_path + " = " + format_value(old_value)
+    elif change_type == REORDERED:
+        return "reordered: " + key_path + " = " + format_value(new_value)
+    return (
+        "changed: "
+        + key_path
+        + ": "
+        + format_value(old_value)
+        + " -> "
+        + format_value(new_value)
+    )
@@ -7,6 +7,7 @@
 # ====================================================
 
 import os
+import re
 
 
 class Ufo(object):
@@ -26,6 +27,8 @@ class Ufo(object):
             "layercontents.plist",
             "layerinfo.plist",
         }
+        # property list files that are compared by key path (ufodiff plistdiff)
+        self.plist_diff_files = {"fontinfo.plist", "lib.plist"}
 
     def _is_images_directory_file(self, filepath):
         path_list = filepath.split(os.path.sep)
@@ -107,8 +110,205 @@ class Ufo(object):
         else:
             return False
 
+    def is_plist_diff_file(self, filepath):
+        # fontinfo.plist and lib.plist located directly inside of a *.ufo directory
+        if os.path.basename(filepath) in self.plist_diff_files and os.path.basename(
+            os.path.dirname(filepath)
+        ).endswith(".ufo"):
+            return True
+        else:
+            return False
+
+    def is_kerning_file(self, filepath):
+        # kerning.plist located directly inside of a *.ufo directory
+        if os.path.basename(filepath) == "kerning.plist" and os.path.basename(
+            os.path.dirname(filepath)
+        ).endswith(".ufo"):
+            return True
+        else:
+            return False
+
+    def is_groups_file(self, filepath):
+        # groups.plist located directly inside of a *.ufo directory
+        if os.path.basename(filepath) == "groups.plist" and os.path.basename(
+            os.path.dirname(filepath)
+        ).endswith(".ufo"):
+            return True
+        else:
+            return False
+
+    def get_plist_diff_filterlist(self):
+        filter_list = []
+        for a_file in sorted(self.plist_diff_files):
+            filter_list.append("*" + a_file)
+        return filter_list
+
     def is_ufo_version_file(self, filepath):
         if os.path.basename(filepath) == "metainfo.plist":
             return True
         else:
             return False
+
+
+class UfoPathClassifier(object):
+    """
+    Classifies git repository filepaths by Unified Font Object source specification
+    category.  The *.ufo/data and *.ufo/images directory test is compiled once as a
+    regular expression and the result is cached for each parent directory path so that
+    it is performed once per directory rather than once per filepath.
+
+    Filepaths are expected in git format with '/' path separators.
+    """
+
+    GLYPH = "glyph"
+    NONGLYPH = "nonglyph"
+    LAYER = "layer"
+    DATA = "data"
+    IMAGE = "image"
+    NOT_UFO = "notufo"
+
+    layer_files = {"contents.plist", "layercontents.plist", "layerinfo.plist"}
+    nonglyph_files = {
+        "metainfo.plist",
+        "fontinfo.plist",
+        "groups.plist",
+        "kerning.plist",
+        "features.fea",
+        "lib.plist",
+    }
+    # data or images directory located directly inside of a *.ufo directory
+    ufo_subdirectory_regex = re.compile(r"(?:^|/)[^/]*\.ufo/(data|images)(?=/|$)")
+
+    def __init__(self):
+        # parent directory path : (is data directory file, is images directory file)
+        self.directory_cache = {}
+
+    def _classify_directory(self, dirpath):
+        subdirectory_set = set(self.ufo_subdirectory_regex.findall(dirpath))
+        directory_class = ("data" in subdirectory_set, "images" in subdirectory_set)
+        self.directory_cache[dirpath] = directory_class
+        return directory_class
+
+    def classify(self, filepath):
+        """
+        Classifies a single filepath.
+        :param filepath: (string) git repository relative filepath
+        :return: (string) one of the UfoPathClassifier category constants
+        """
+        return self.classify_many([filepath])[0]
+
+    def classify_many(self, filepath_list):
+        """
+        Classifies an iterable of filepaths.
+        :param filepath_list: (iterable) git repository relative filepaths
+        :return: (list) UfoPathClassifier category constants in filepath_list order
+        """
+        category_list = []
+        append = category_list.append
+        directory_cache = self.directory_cache
+        layer_files = self.layer_files
+        nonglyph_files = self.nonglyph_files
+        for filepath in filepath_list:
+            dirpath, _, basename = filepath.rpartition("/")
+            if basename.endswith(".glif"):
+                append(self.GLYPH)
+            elif basename in layer_files:
+                append(self.LAYER)
+            elif basename in nonglyph_files:
+                append(self.NONGLYPH)
+            else:
+                directory_class = directory_cache.get(dirpath)
+                if directory_class is None:
+                    directory_class = self._classify_directory(dirpath)
+                if directory_class[0] is True:
+                    append(self.DATA)
+                elif (
+                    directory_class[1] is True
+                    and len(basename) > 4
+                    and basename.endswith(".png")
+                ):
+                    append(self.IMAGE)
+                else:
+                    append(self.NOT_UFO)
+        return category_list
+
+
+class UfoDirectoryFilter(object):
+    """
+    Matches filepaths against user defined *.ufo source directory filters (e.g.
+    'Test-Regular.ufo' or 'source/Test-Regular.ufo').  Filters are stored in a
+    reversed path component trie so that a filepath is tested in a single pass over
+    its directory components.  Filters match complete path components only, i.e.
+    'Test.ufo' does not match 'BigTest.ufo'.
+
+    :param ufo_directory_list: (list) user defined *.ufo directory filters
+    """
+
+    terminal_key = None
+
+    def __init__(self, ufo_directory_list):
+        # path component trie built from the last filter component to the first
+        self.trie = {}
+        for ufo_directory in ufo_directory_list:
+            component_list = [
+                component
+                for component in ufo_directory.replace(os.path.sep, "/").split("/")
+                if component not in ("", ".")
+            ]
+            if len(component_list) == 0:
+                continue
+            node = self.trie
+            for component in reversed(component_list):
+                node = node.setdefault(component, {})
+            node[self.terminal_key] = True
+
+    def __len__(self):
+        return len(self.trie)
+
+    def _matches_component_list(self, component_list, directory_component_number):
+        trie = self.trie
+        terminal_key = self.terminal_key
+        for index in range(directory_component_number):
+            node = trie.get(component_list[index])
+            if node is None:
+                continue
+            if terminal_key in node:
+                return True
+            # multi-component filters, test the preceding path components
+            previous_index = index - 1
+            while previous_index >= 0:
+                node = node.get(component_list[previous_index])
+                if node is None:
+                    break
+                if terminal_key in node:
+                    return True
+                previous_index -= 1
+        return False
+
+    def matches(self, filepath):
+        """
+        Tests whether a filepath is located in a filtered *.ufo directory.
+        :param filepath: (string) git repository relative filepath
+        :return: (boolean) True if a directory component matches a filter
+        """
+        component_list = filepath.replace(os.path.sep, "/").split("/")
+        # the final path component is the file name, only test directories
+        return self._matches_component_list(component_list, len(component_list) - 1)
+
+    def matches_directory(self, dirpath):
+        """
+        Tests whether a directory path is, or is located in, a filtered *.ufo directory.
+        :param dirpath: (string) git repository relative directory path
+        :return: (boolean) True if a directory component matches a filter
+        """
+        component_list = dirpath.replace(os.path.sep, "/").split("/")
+        return self._matches_component_list(component_list, len(component_list))
+
+    def filter(self, filepath_list):
+        """
+        Filters a list of filepaths by the *.ufo directory filters.  Each filepath is
+        included once irrespective of the number of filters that it matches.
+        :param filepath_list: (iterable) git repository relative filepaths
+        :return: (list) filepaths located in filtered *.ufo directories
+        """
+        return [filepath for filepath in filepath_list if self.matches(filepath)]
@@ -0,0 +1,43 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ====================================================
+# Copyright 2018 Christopher Simpkins
+# MIT License
+# ====================================================
+
+import io
+
+
+class StreamWriter(object):
+    """
+    Base class for the report writers.  Subclasses stream the report to a text stream
+    (e.g. sys.stdout or an open file) in the write method, the report can also be
+    written to a file or returned as a single string.
+    """
+
+    def write(self, outstream):
+        """
+        Writes the report to outstream.
+        :param outstream: text stream with a write method
+        :return: no return object
+        """
+        raise NotImplementedError
+
+    def write_file(self, filepath):
+        """
+        Writes the report to a file on filepath through a buffered file stream.
+        :param filepath: (string) the output file path
+        :return: no return object
+        """
+        with io.open(filepath, "w", encoding="utf-8") as outfile:
+            self.write(outfile)
+
+    def get_string(self):
+        """
+        Returns the report as a single string.
+        :return: (string) the formatted report
+        """
+        outstream = io.StringIO()
+        self.write(outstream)
+        return outstream.getvalue()
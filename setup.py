@@ -54,7 +54,12 @@ setup(
     packages=find_packages("lib"),
     package_dir={"": "lib"},
     install_requires=["commandlines", "standardstreams", "gitpython"],
-    entry_points={"console_scripts": ["ufodiff = ufodiff.app:main"],},
+    entry_points={
+        "console_scripts": [
+            "ufodiff = ufodiff.app:main",
+            "ufodiff-client = ufodiff.client:main",
+        ],
+    },
     keywords="font, typeface, ufo, diff, source, ttf, otf",
     include_package_data=True,
     classifiers=[
@@ -0,0 +1,34 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+
+import pytest
+
+from git import Repo
+
+
+def write_file(repo_path, filepath, data):
+    """
+    Writes a file on a "/" delimited filepath that is relative to repo_path, parent
+    directories are created as needed.  bytes data are written in binary mode.
+    """
+    full_path = os.path.join(str(repo_path), *filepath.split("/"))
+    if not os.path.isdir(os.path.dirname(full_path)):
+        os.makedirs(os.path.dirname(full_path))
+    if isinstance(data, bytes):
+        with open(full_path, "wb") as f:
+            f.write(data)
+    else:
+        with open(full_path, "w") as f:
+            f.write(data)
+
+
+@pytest.fixture
+def git_repo(tmp_path):
+    """Empty git repository on tmp_path with a committer identity"""
+    repo = Repo.init(str(tmp_path))
+    with repo.config_writer() as config:
+        config.set_value("user", "name", "ufodiff")
+        config.set_value("user", "email", "ufodiff@example.com")
+    return repo
@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import types
+
+import pytest
+
+from git import Repo
+
+from tests.conftest import write_file
+from ufodiff import api
+from ufodiff.utilities.deltarecords import get_ufo_and_layer
+
+
+@pytest.fixture
+def api_repo(git_repo, tmp_path):
+    write_file(tmp_path, "source/Test-Regular.ufo/glyphs/a.glif", "a")
+    write_file(tmp_path, "source/Test-Regular.ufo/fontinfo.plist", "fontinfo")
+    write_file(tmp_path, "source/Test-Bold.ufo/glyphs/a.glif", "a")
+    write_file(tmp_path, "README.md", "readme")
+    git_repo.git.add("-A")
+    git_repo.git.commit("-m", "first")
+    git_repo.git.tag("v1.0")
+    write_file(tmp_path, "source/Test-Regular.ufo/glyphs/a.glif", "modified")
+    write_file(tmp_path, "source/Test-Regular.ufo/glyphs.background/a.glif", "a")
+    write_file(tmp_path, "source/Test-Regular.ufo/glyphs.background/contents.plist", "")
+    write_file(tmp_path, "source/Test-Regular.ufo/data/com.example/x.txt", "x")
+    write_file(tmp_path, "README.md", "modified")
+    git_repo.git.rm("source/Test-Regular.ufo/fontinfo.plist")
+    git_repo.git.add("-A")
+    git_repo.git.commit("-m", "second")
+    return str(tmp_path)
+
+
+def test_ufodiff_api_delta_records(api_repo):
+    result = api.delta(api_repo, "v1.0")
+    assert len(result) == 5
+    assert result.branches == ["v1.0", "HEAD"]
+    assert isinstance(result.added, types.GeneratorType)
+    assert list(result) == [
+        api.DeltaRecord(
+            "source/Test-Regular.ufo/data/com.example/x.txt",
+            api.ADDED,
+            "source/Test-Regular.ufo",
+            None,
+            api.DATA,
+        ),
+        api.DeltaRecord(
+            "source/Test-Regular.ufo/glyphs.background/a.glif",
+            api.ADDED,
+            "source/Test-Regular.ufo",
+            "glyphs.background",
+            api.GLYPH,
+        ),
+        api.DeltaRecord(
+            "source/Test-Regular.ufo/glyphs.background/contents.plist",
+            api.ADDED,
+            "source/Test-Regular.ufo",
+            "glyphs.background",
+            api.LAYER,
+        ),
+        api.DeltaRecord(
+            "source/Test-Regular.ufo/fontinfo.plist",
+            api.DELETED,
+            "source/Test-Regular.ufo",
+            None,
+            api.NONGLYPH,
+        ),
+        api.DeltaRecord(
+            "source/Test-Regular.ufo/glyphs/a.glif",
+            api.MODIFIED,
+            "source/Test-Regular.ufo",
+            "glyphs",
+            api.GLYPH,
+        ),
+    ]
+    record = next(result.modified)
+    assert record.layer == "glyphs"
+    assert record._asdict()["change"] == "modified"
+
+
+def test_ufodiff_api_delta_filters_and_engines(api_repo):
+    repo = Repo(api_repo)
+    for engine in ("subprocess", "inprocess", "ufotree"):
+        result = api.delta(repo, "v1.0", "HEAD", file_filter="glyph", engine=engine)
+        assert result.filepaths(api.ADDED) == [
+            "source/Test-Regular.ufo/glyphs.background/a.glif"
+        ]
+        assert [record.path for record in result.modified] == [
+            "source/Test-Regular.ufo/glyphs/a.glif"
+        ]
+    assert len(api.delta(api_repo, "v1.0", filters=["Test-Bold.ufo"])) == 0
+    assert len(api.delta(api_repo, "HEAD", "v1.0")) == 5
+    with pytest.raises(ValueError):
+        api.delta(api_repo, "v1.0", file_filter="bogus")
+
+
+def test_ufodiff_api_get_ufo_and_layer():
+    assert get_ufo_and_layer("") == (None, None)
+    assert get_ufo_and_layer("glyphs") == (None, None)
+    assert get_ufo_and_layer("A.ufo") == ("A.ufo", None)
+    assert get_ufo_and_layer("x/A.ufo/glyphs") == ("x/A.ufo", "glyphs")
+    assert get_ufo_and_layer("x/A.ufo/data/B.ufo/glyphs") == ("x/A.ufo", None)
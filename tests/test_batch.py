@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import json
+import os
+
+import pytest
+
+from git import Repo
+from git.cmd import Git
+
+from tests.conftest import write_file
+from ufodiff.subcommands.batch import DeltaBatch, parse_delta_range
+from ufodiff.subcommands.delta import Delta
+
+
+@pytest.fixture
+def batch_repo(git_repo, tmp_path):
+    for revision, filepath in enumerate(
+        (
+            "source/Test-Regular.ufo/fontinfo.plist",
+            "source/Test-Regular.ufo/glyphs/a.glif",
+            "source/Test-Regular.ufo/glyphs/b.glif",
+        )
+    ):
+        write_file(tmp_path, filepath, filepath)
+        git_repo.git.add("-A")
+        git_repo.git.commit("-m", "revision " + str(revision))
+        git_repo.git.tag("v1." + str(revision))
+    return str(tmp_path)
+
+
+def test_ufodiff_batch_parse_delta_range():
+    assert parse_delta_range("commits:2") == {
+        "is_commit_test": True,
+        "commit_number": "2",
+    }
+    assert parse_delta_range("branch:dev") == {
+        "is_branch_test": True,
+        "compare_branch_name": "dev",
+    }
+    assert parse_delta_range("v1.0..v1.1") == {
+        "is_branch_test": True,
+        "compare_branch_name": "v1.0",
+        "head_branch_name": "v1.1",
+    }
+    for range_string in ("commits:0", "commits:x", "branch:", "v1.0...v1.1", "..v1"):
+        with pytest.raises(ValueError):
+            parse_delta_range(range_string)
+
+
+@pytest.mark.parametrize("engine", ["subprocess", "inprocess"])
+def test_ufodiff_batch_matches_delta(batch_repo, engine):
+    delta_batch = DeltaBatch(batch_repo, [], engine=engine)
+    range_list = ["commits:1", "commits:2", "v1.0..v1.1", "branch:v1.0"]
+    delta_list = list(delta_batch.get_delta_generator(range_list))
+    assert [range_string for range_string, _ in delta_list] == range_list
+    # one shared repository handle and classifier
+    assert all(delta.repo is delta_batch.repo for _, delta in delta_list)
+    assert all(
+        delta.ufo_classifier is delta_batch.ufo_classifier for _, delta in delta_list
+    )
+    assert (
+        delta_list[0][1].delta_fp_string_dict.delta_dict
+        == Delta(
+            batch_repo, [], is_commit_test=True, commit_number="1", engine=engine
+        ).delta_fp_string_dict.delta_dict
+    )
+    assert delta_list[2][1].delta_fp_string_dict.delta_dict["branches"] == [
+        "v1.0",
+        "v1.1",
+    ]
+    assert delta_list[2][1].delta_fp_string_dict.delta_dict["added"] == [
+        "source/Test-Regular.ufo/glyphs/a.glif"
+    ]
+    current_branch_name = Repo(batch_repo).active_branch.name
+    assert delta_list[3][1].delta_fp_string_dict.delta_dict == (
+        Delta(
+            batch_repo,
+            [],
+            is_branch_test=True,
+            compare_branch_name="v1.0",
+            engine=engine,
+        ).delta_fp_string_dict.delta_dict
+    )
+    assert delta_list[3][1].current_branch_name == current_branch_name
+
+
+def test_ufodiff_batch_shares_branch_lookup(batch_repo, mocker):
+    execute_spy = mocker.spy(Git, "execute")
+    delta_batch = DeltaBatch(batch_repo, [], engine="inprocess", use_cache=False)
+    for _ in delta_batch.get_delta_generator(["branch:v1.0", "branch:v1.1"]):
+        pass
+    # in-process engine, no git subprocess for the current branch or the deltas
+    assert execute_spy.call_count == 0
+
+
+def test_ufodiff_batch_writers(batch_repo):
+    delta_batch = DeltaBatch(batch_repo, [], file_filter="glyph")
+    range_list = ["v1.0..v1.1", "v1.1..v1.2"]
+    text_string = delta_batch.get_writer(range_list, "text").get_string()
+    assert (
+        os.linesep.join(
+            [
+                "Range: v1.0..v1.1",
+                "",
+                "Branches under analysis:",
+                " v1.0",
+                " v1.1",
+                "",
+                "[A]:source/Test-Regular.ufo/glyphs/a.glif",
+                "",
+                "Range: v1.1..v1.2",
+            ]
+        )
+        in text_string
+    )
+    json_line_list = delta_batch.get_writer(range_list, "json").get_string().split("\n")
+    assert json_line_list[-1] == ""
+    report_list = [json.loads(line) for line in json_line_list[:-1]]
+    assert [report["range"] for report in report_list] == range_list
+    assert report_list[1]["added"] == ["source/Test-Regular.ufo/glyphs/b.glif"]
+    markdown_string = delta_batch.get_writer(range_list, "markdown").get_string()
+    assert "# v1.1..v1.2" + os.linesep in markdown_string
+    jsonl_line_list = (
+        delta_batch.get_writer(range_list, "jsonl").get_string().split("\n")
+    )
+    record_list = [json.loads(line) for line in jsonl_line_list[:-1]]
+    assert [(record["type"], record["range"]) for record in record_list] == [
+        ("header", "v1.0..v1.1"),
+        ("file", "v1.0..v1.1"),
+        ("footer", "v1.0..v1.1"),
+        ("header", "v1.1..v1.2"),
+        ("file", "v1.1..v1.2"),
+        ("footer", "v1.1..v1.2"),
+    ]
@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import json
+import os
+import plistlib
+
+import pytest
+
+from git import Repo
+
+from tests.conftest import write_file
+from ufodiff.subcommands.delta import Delta
+from ufodiff.utilities.contents import (
+    GlyphNameIndex,
+    get_git_blob_sha1,
+    load_glyph_name_dict,
+)
+
+GLYPHS_DIRPATH = "source/Test-Regular.ufo/glyphs"
+
+
+def get_glif_filename(glyph_name):
+    # UFO user name to file name convention for capital letters
+    return "".join(c + "_" if c.isupper() else c for c in glyph_name) + ".glif"
+
+
+def write_contents(repo_path, glyph_name_list):
+    write_file(
+        repo_path,
+        GLYPHS_DIRPATH + "/contents.plist",
+        plistlib.dumps({name: get_glif_filename(name) for name in glyph_name_list}),
+    )
+    for glyph_name in glyph_name_list:
+        write_file(
+            repo_path,
+            GLYPHS_DIRPATH + "/" + get_glif_filename(glyph_name),
+            b'<glyph name="' + glyph_name.encode("utf-8") + b'" format="2"/>',
+        )
+
+
+@pytest.fixture
+def contents_repo(git_repo, tmp_path):
+    write_contents(tmp_path, ["A", "Aacute", "b"])
+    git_repo.git.add("-A")
+    git_repo.git.commit("-m", "first")
+    # remove b.glif, modify A_.glif, add c.glif
+    os.remove(os.path.join(str(tmp_path), *(GLYPHS_DIRPATH + "/b.glif").split("/")))
+    write_contents(tmp_path, ["A", "Aacute", "c"])
+    write_file(tmp_path, GLYPHS_DIRPATH + "/A_.glif", b'<glyph name="A" format="1"/>')
+    git_repo.git.add("-A")
+    git_repo.git.commit("-m", "second")
+    return str(tmp_path)
+
+
+def test_ufodiff_contents_git_blob_sha1(contents_repo):
+    repo = Repo(contents_repo)
+    blob = repo.head.commit.tree / (GLYPHS_DIRPATH + "/contents.plist")
+    with open(os.path.join(contents_repo, *blob.path.split("/")), "rb") as f:
+        assert get_git_blob_sha1(f.read()) == blob.hexsha
+
+
+def test_ufodiff_contents_load_glyph_name_dict():
+    contents_data = plistlib.dumps({"A": "A_.glif", ".notdef": "_notdef.glif"})
+    assert load_glyph_name_dict(contents_data) == {
+        "A_.glif": "A",
+        "_notdef.glif": ".notdef",
+    }
+
+
+def test_ufodiff_contents_glyph_name_index(contents_repo):
+    glyph_name_index = GlyphNameIndex(Repo(contents_repo))
+    filepath_list = [
+        GLYPHS_DIRPATH + "/A_.glif",
+        GLYPHS_DIRPATH + "/b.glif",
+        GLYPHS_DIRPATH + "/c.glif",
+        "source/Test-Bold.ufo/glyphs/A_.glif",
+    ]
+    assert glyph_name_index.get_glyph_names(filepath_list, "HEAD~1") == {
+        GLYPHS_DIRPATH + "/A_.glif": "A",
+        GLYPHS_DIRPATH + "/b.glif": "b",
+    }
+    # working tree
+    assert glyph_name_index.get_glyph_names(filepath_list) == {
+        GLYPHS_DIRPATH + "/A_.glif": "A",
+        GLYPHS_DIRPATH + "/c.glif": "c",
+    }
+    # one parsed dictionary per contents.plist blob, the working tree file is HEAD
+    assert len(glyph_name_index.glyph_name_dicts) == 2
+
+
+def test_ufodiff_contents_glyph_name_index_disk_cache(contents_repo, monkeypatch):
+    repo = Repo(contents_repo)
+    filepath_list = [GLYPHS_DIRPATH + "/A_acute.glif"]
+    assert GlyphNameIndex(repo).get_glyph_names(filepath_list, "HEAD") == {
+        GLYPHS_DIRPATH + "/A_acute.glif": "Aacute"
+    }
+    assert os.listdir(os.path.join(repo.git_dir, "ufodiff", "contents"))
+
+    # a new index reads the cache entry without a parse of the property list
+    def fail_load(contents_data):
+        raise AssertionError("contents.plist was parsed")
+
+    monkeypatch.setattr("ufodiff.utilities.contents.load_glyph_name_dict", fail_load)
+    assert GlyphNameIndex(repo).get_glyph_names(filepath_list, "HEAD") == {
+        GLYPHS_DIRPATH + "/A_acute.glif": "Aacute"
+    }
+    with pytest.raises(AssertionError):
+        GlyphNameIndex(repo, use_cache=False).get_glyph_names(filepath_list, "HEAD")
+
+
+@pytest.mark.parametrize("engine", ["subprocess", "inprocess"])
+def test_ufodiff_contents_delta_glyph_names(contents_repo, engine):
+    delta = Delta(
+        contents_repo,
+        [],
+        is_commit_test=True,
+        commit_number="1",
+        engine=engine,
+        glyph_names=True,
+    )
+    text_string = delta.get_stdout_string(write_format="text")
+    assert "[A]:" + GLYPHS_DIRPATH + "/c.glif (c)" in text_string
+    assert "[D]:" + GLYPHS_DIRPATH + "/b.glif (b)" in text_string
+    assert "[M]:" + GLYPHS_DIRPATH + "/A_.glif (A)" in text_string
+    # contents.plist is not a *.glif file
+    assert "[M]:" + GLYPHS_DIRPATH + "/contents.plist" + os.linesep in text_string
+    delta_dict = json.loads(delta.get_stdout_string(write_format="json"))
+    assert delta_dict["glyphs"] == {
+        GLYPHS_DIRPATH + "/A_.glif": "A",
+        GLYPHS_DIRPATH + "/b.glif": "b",
+        GLYPHS_DIRPATH + "/c.glif": "c",
+    }
+    markdown_string = delta.get_stdout_string(write_format="markdown")
+    assert "- " + GLYPHS_DIRPATH + "/c.glif (`c`)" in markdown_string
+
+
+def test_ufodiff_contents_delta_without_glyph_names(contents_repo):
+    delta = Delta(contents_repo, [], is_commit_test=True, commit_number="1")
+    assert "[A]:" + GLYPHS_DIRPATH + "/c.glif" + os.linesep in delta.get_stdout_string(
+        write_format="text"
+    )
+    assert "glyphs" not in json.loads(delta.get_stdout_string(write_format="json"))
@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import io
 import sys
 import os
 import pytest
@@ -8,7 +9,15 @@ import json
 
 from git import Repo
 
-from ufodiff.subcommands.delta import Delta, DeltaFilepathStringDict
+from ufodiff.subcommands.delta import (
+    Delta,
+    DeltaFilepathStringDict,
+    DeltaJSONLinesWriter,
+    DeltaJSONWriter,
+    DeltaMarkdownWriter,
+    DeltaTextWriter,
+)
+
 
 # creates a temporary new git branch (testing_branch) for testing
 def make_testing_branch():
@@ -619,6 +628,71 @@ def test_ufodiff_delta_get_delta_markdown_string_method_branch():
     delete_testing_branch()
 
 
+def test_ufodiff_delta_writers_stream_and_string_match(tmp_path):
+    deltaobj = Delta(".", [], is_commit_test=True, commit_number="1")
+
+    deltaobj._validate_ufo_and_load_dict_from_filepath_strings(
+        get_mock_added_list(), get_mock_deleted_list(), get_mock_modified_list()
+    )
+
+    for write_format, writer_class in (
+        ("text", DeltaTextWriter),
+        ("json", DeltaJSONWriter),
+        ("jsonl", DeltaJSONLinesWriter),
+        ("markdown", DeltaMarkdownWriter),
+    ):
+        delta_writer = deltaobj.get_writer(write_format=write_format)
+        assert isinstance(delta_writer, writer_class)
+        # stream writes
+        outstream = io.StringIO()
+        delta_writer.write(outstream)
+        assert outstream.getvalue() == deltaobj.get_stdout_string(
+            write_format=write_format
+        )
+        # file writes
+        filepath = str(tmp_path / ("delta." + write_format))
+        delta_writer.write_file(filepath)
+        with io.open(filepath, "r", encoding="utf-8", newline="") as f:
+            assert f.read().replace(os.linesep, "\n") == outstream.getvalue().replace(
+                os.linesep, "\n"
+            )
+
+
+def test_ufodiff_delta_json_lines_writer():
+    deltaobj = Delta(".", [], is_commit_test=True, commit_number="1")
+
+    deltaobj._validate_ufo_and_load_dict_from_filepath_strings(
+        get_mock_added_list(), get_mock_deleted_list(), get_mock_modified_list()
+    )
+
+    line_list = DeltaJSONLinesWriter(deltaobj).get_string().split("\n")
+    assert line_list[-1] == ""
+    record_list = [json.loads(line) for line in line_list[:-1]]
+    json_dict = json.loads(deltaobj.get_stdout_string(write_format="json"))
+    assert record_list[0] == {"type": "header", "commits": json_dict["commits"]}
+    assert record_list[-1] == {
+        "type": "footer",
+        "added": len(json_dict["added"]),
+        "deleted": len(json_dict["deleted"]),
+        "modified": len(json_dict["modified"]),
+    }
+    file_record_list = record_list[1:-1]
+    assert [record["path"] for record in file_record_list] == (
+        json_dict["added"] + json_dict["deleted"] + json_dict["modified"]
+    )
+    metainfo_record = file_record_list[0]
+    assert sorted(metainfo_record) == [
+        "category",
+        "change",
+        "layer",
+        "path",
+        "type",
+        "ufo",
+    ]
+    assert metainfo_record["change"] == "added"
+    assert metainfo_record["category"] == "nonglyph"
+
+
 # ///////////////////////////////////////////////////////
 #
 #  DeltaFilepathStringDict class tests
@@ -724,3 +798,45 @@ def test_ufodiff_dfpd_add_modified_fp_method():
     assert dfpd3.delta_dict["modified"][0] == os.path.join(
         "source", "Test-Regular.ufo", "metainfo.plist"
     )
+
+
+def test_ufodiff_dfpd_filter_matches_complete_path_components():
+    dfpd = DeltaFilepathStringDict(["Foo.ufo"])
+    dfpd.add_added_filepaths(
+        [
+            "source/Foo.ufo/metainfo.plist",
+            "source/BigFoo.ufo/metainfo.plist",
+            "source/Foo.ufo.bak/metainfo.plist",
+        ]
+    )
+    assert dfpd.delta_dict["added"] == ["source/Foo.ufo/metainfo.plist"]
+
+
+def test_ufodiff_dfpd_filter_includes_filepath_once():
+    # a filepath that matches more than one filter is only included once
+    dfpd = DeltaFilepathStringDict(
+        ["Test-Regular.ufo", "source/Test-Regular.ufo", "./source/Test-Regular.ufo/"]
+    )
+    dfpd.add_modified_filepaths(
+        [
+            "source/Test-Regular.ufo/glyphs/a.glif",
+            "other/Test-Regular.ufo/glyphs/a.glif",
+            "source/Test-Italic.ufo/glyphs/a.glif",
+        ]
+    )
+    assert dfpd.delta_dict["modified"] == [
+        "source/Test-Regular.ufo/glyphs/a.glif",
+        "other/Test-Regular.ufo/glyphs/a.glif",
+    ]
+
+
+def test_ufodiff_dfpd_filter_multiple_path_components():
+    dfpd = DeltaFilepathStringDict(["source/Test-Regular.ufo"])
+    dfpd.add_deleted_filepaths(
+        [
+            "source/Test-Regular.ufo/glyphs/a.glif",
+            "other/Test-Regular.ufo/glyphs/a.glif",
+            "Test-Regular.ufo/glyphs/a.glif",
+        ]
+    )
+    assert dfpd.delta_dict["deleted"] == ["source/Test-Regular.ufo/glyphs/a.glif"]
@@ -0,0 +1,187 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import time
+
+import pytest
+
+from git.cmd import Git
+
+from tests.conftest import write_file
+from ufodiff.subcommands import delta as delta_module
+from ufodiff.subcommands.delta import Delta
+from ufodiff.utilities.deltacache import DeltaCache, get_delta_cache_key
+
+# ///////////////////////////////////////////////////////
+#
+#  DeltaCache class tests
+#
+# ///////////////////////////////////////////////////////
+
+
+def get_entry_dict(filepath):
+    return {"added": [filepath], "deleted": [], "modified": [], "commits": []}
+
+
+def test_ufodiff_deltacache_key():
+    key = get_delta_cache_key("a" * 40, "b" * 40, ["A.ufo", "B.ufo"])
+    assert len(key) == 40
+    # filter order and duplicate filters do not change the key
+    assert key == get_delta_cache_key("a" * 40, "b" * 40, ["B.ufo", "A.ufo", "A.ufo"])
+    assert key != get_delta_cache_key("b" * 40, "a" * 40, ["A.ufo", "B.ufo"])
+    assert key != get_delta_cache_key("a" * 40, "b" * 40, ["A.ufo"])
+    assert key != get_delta_cache_key("a" * 40, "b" * 40, ["A.ufo", "B.ufo"], "2")
+
+
+def test_ufodiff_deltacache_set_and_get(tmp_path):
+    cache = DeltaCache(str(tmp_path / "ufodiff"))
+    assert cache.get("abc") is None
+    assert cache.set("abc", get_entry_dict("Test.ufo/metainfo.plist")) is True
+    assert cache.get("abc") == get_entry_dict("Test.ufo/metainfo.plist")
+    # no temporary files remain after the atomic write
+    assert os.listdir(str(tmp_path / "ufodiff")) == ["abc.json"]
+
+
+def test_ufodiff_deltacache_invalid_entries(tmp_path):
+    cache = DeltaCache(str(tmp_path))
+    with open(str(tmp_path / "bad.json"), "w") as f:
+        f.write("{")
+    with open(str(tmp_path / "incomplete.json"), "w") as f:
+        f.write('{"added": []}')
+    assert cache.get("bad") is None
+    assert cache.get("incomplete") is None
+
+
+def test_ufodiff_deltacache_age_eviction(tmp_path):
+    cache = DeltaCache(str(tmp_path), max_age=60)
+    cache.set("old", get_entry_dict("a"))
+    old_time = time.time() - 120
+    os.utime(str(tmp_path / "old.json"), (old_time, old_time))
+    assert cache.get("old") is None
+    cache.set("new", get_entry_dict("b"))
+    assert sorted(os.listdir(str(tmp_path))) == ["new.json"]
+
+
+def test_ufodiff_deltacache_size_eviction(tmp_path):
+    entry_size = len('{"added": ["a"], "deleted": [], "modified": [], "commits": []}')
+    cache = DeltaCache(str(tmp_path), max_bytes=entry_size * 2)
+    for index, cache_key in enumerate(("first", "second", "third")):
+        cache.set(cache_key, get_entry_dict("a"))
+        entry_time = time.time() - 100 + index
+        os.utime(str(tmp_path / (cache_key + ".json")), (entry_time, entry_time))
+    # the least recently used entry is removed when the third entry is written
+    assert sorted(os.listdir(str(tmp_path))) == ["second.json", "third.json"]
+
+
+# ///////////////////////////////////////////////////////
+#
+#  Delta class cache tests
+#
+# ///////////////////////////////////////////////////////
+
+
+@pytest.fixture
+def cache_repo(git_repo, tmp_path):
+    write_file(tmp_path, "source/Test-Regular.ufo/metainfo.plist", "first")
+    write_file(tmp_path, "source/Test-Regular.ufo/glyphs/a.glif", "first")
+    git_repo.git.add("-A")
+    git_repo.git.commit("-m", "first")
+    git_repo.git.branch("base")
+    write_file(tmp_path, "source/Test-Regular.ufo/glyphs/a.glif", "second")
+    write_file(tmp_path, "source/Test-Regular.ufo/glyphs/b.glif", "second")
+    write_file(tmp_path, "README.md", "second")
+    git_repo.git.add("-A")
+    git_repo.git.commit("-m", "second")
+    return str(tmp_path)
+
+
+def test_ufodiff_deltacache_delta_branch_cache_hit(cache_repo, mocker):
+    first_delta = Delta(
+        cache_repo, [], is_branch_test=True, compare_branch_name="base", use_cache=True
+    )
+    assert len(os.listdir(os.path.join(cache_repo, ".git", "ufodiff"))) == 1
+
+    execute_spy = mocker.spy(Git, "execute")
+    name_status_spy = mocker.spy(delta_module, "get_name_status_filepath_lists")
+    cached_delta = Delta(
+        cache_repo, [], is_branch_test=True, compare_branch_name="base", use_cache=True
+    )
+    # current branch name and commit SHA1 resolution only
+    assert execute_spy.call_count == 2
+    assert name_status_spy.call_count == 0
+    assert (
+        cached_delta.delta_fp_string_dict.delta_dict
+        == first_delta.delta_fp_string_dict.delta_dict
+    )
+    assert cached_delta.delta_fp_string_dict.delta_dict["added"] == [
+        "source/Test-Regular.ufo/glyphs/b.glif"
+    ]
+
+
+def test_ufodiff_deltacache_delta_inprocess_cache_hit(cache_repo, mocker):
+    first_delta = Delta(
+        cache_repo, [], is_commit_test=True, commit_number="1", engine="inprocess"
+    )
+    Delta(
+        cache_repo,
+        [],
+        is_commit_test=True,
+        commit_number="1",
+        engine="inprocess",
+        use_cache=True,
+    )
+    tree_spy = mocker.spy(delta_module, "get_tree_filepath_lists")
+    cached_delta = Delta(
+        cache_repo,
+        [],
+        is_commit_test=True,
+        commit_number="1",
+        engine="inprocess",
+        use_cache=True,
+    )
+    assert tree_spy.call_count == 0
+    assert cached_delta.commit_sha1_list == first_delta.commit_sha1_list
+    assert cached_delta.get_stdout_string(
+        write_format="text"
+    ) == first_delta.get_stdout_string(write_format="text")
+
+
+def test_ufodiff_deltacache_delta_ufo_filter_cache_entries(cache_repo):
+    for ufo_directory_list in ([], ["Test-Regular.ufo"], ["Test-Bold.ufo"]):
+        Delta(
+            cache_repo,
+            ufo_directory_list,
+            is_commit_test=True,
+            commit_number="1",
+            engine="inprocess",
+            use_cache=True,
+        )
+    assert len(os.listdir(os.path.join(cache_repo, ".git", "ufodiff"))) == 3
+    cached_delta = Delta(
+        cache_repo,
+        ["Test-Bold.ufo"],
+        is_commit_test=True,
+        commit_number="1",
+        engine="inprocess",
+        use_cache=True,
+    )
+    assert cached_delta.delta_fp_string_dict.delta_dict["modified"] == []
+
+
+def test_ufodiff_deltacache_delta_working_tree_not_cached(cache_repo):
+    # `git diff HEAD~N` includes uncommitted working tree changes
+    Delta(cache_repo, [], is_commit_test=True, commit_number="1", use_cache=True)
+    assert not os.path.exists(os.path.join(cache_repo, ".git", "ufodiff"))
+
+
+def test_ufodiff_deltacache_delta_cache_disabled(cache_repo):
+    Delta(
+        cache_repo,
+        [],
+        is_commit_test=True,
+        commit_number="1",
+        engine="inprocess",
+        use_cache=False,
+    )
+    assert not os.path.exists(os.path.join(cache_repo, ".git", "ufodiff"))
@@ -7,6 +7,7 @@ import pytest
 import types
 
 from git import Repo
+from git.cmd import Git
 
 from ufodiff.subcommands.diff import Diff
 
@@ -51,6 +52,33 @@ test_dirty_diff_string_commits_color = """\x1b[1mdiff --git a/README.md b/README
    <key>familyName</key>^[[m"""
 
 
+# previous string concatenation implementation of Diff._clean_diff_string, used as
+# the reference for output parity tests
+def legacy_clean_diff_string(dirty_diff_string):
+    dirty_diffstring_list = dirty_diff_string.split("\n")
+    clean_diff_string = ""
+    for a_string in dirty_diffstring_list:
+        if a_string.startswith("\x1b[1mdiff --git") or a_string.startswith(
+            "diff --git"
+        ):
+            clean_a_string = a_string.replace("diff --git", "")
+            clean_a_string = clean_a_string.replace(" ", os.linesep)
+            clean_diff_string += clean_a_string + os.linesep
+        elif "100644" in a_string:
+            clean_a_string = a_string.replace("100644", "")
+            clean_a_string = clean_a_string.replace("mode", "")
+            clean_diff_string += clean_a_string + os.linesep
+        else:
+            clean_diff_string += a_string + os.linesep
+    if "---" in clean_diff_string and "+++" in clean_diff_string:
+        clean_diff_string_list = clean_diff_string.split(os.linesep)
+        purged_head_paths_diff_string_list = clean_diff_string_list[3:]
+        clean_diff_string = ""
+        for line in purged_head_paths_diff_string_list:
+            clean_diff_string += line + os.linesep
+    return clean_diff_string
+
+
 # creates a temporary new git branch (testing_branch) for testing
 def make_testing_branch():
     repo = Repo(".")
@@ -85,6 +113,39 @@ def delete_testing_branch():
         gitobj.branch("-d", "testing_branch")
 
 
+def write_file(repo_path, filepath, text):
+    full_path = os.path.join(str(repo_path), *filepath.split("/"))
+    if not os.path.isdir(os.path.dirname(full_path)):
+        os.makedirs(os.path.dirname(full_path))
+    with open(full_path, "w") as f:
+        f.write(text)
+
+
+# creates a temporary git repository with two commits of UFO source modifications
+@pytest.fixture
+def ufo_repo(tmp_path):
+    repo = Repo.init(str(tmp_path))
+    with repo.config_writer() as config:
+        config.set_value("user", "name", "ufodiff")
+        config.set_value("user", "email", "ufodiff@example.com")
+    filepath_list = [
+        "README.md",
+        "source/Test-Regular.ufo/layercontents.plist",
+        "source/Test-Regular.ufo/glyphs/contents.plist",
+        "source/Test-Regular.ufo/glyphs/a.glif",
+        "source/Test-Regular.ufo/data/com.test.txt",
+    ]
+    for filepath in filepath_list:
+        write_file(tmp_path, filepath, "first" + os.linesep)
+    repo.git.add("-A")
+    repo.git.commit("-m", "first")
+    for filepath in filepath_list:
+        write_file(tmp_path, filepath, "second" + os.linesep)
+    repo.git.add("-A")
+    repo.git.commit("-m", "second")
+    return str(tmp_path)
+
+
 # ///////////////////////////////////////////////////////
 #
 #  Diff class tests
@@ -118,6 +179,31 @@ def test_ufodiff_diff_clean_diff_string_method_colored_string():
     assert cleaned_string.startswith("\x1b[1mindex 47e8ec3d2") is True
 
 
+def test_ufodiff_diff_clean_diff_string_method_matches_legacy_output(monkeypatch):
+    diff = Diff(".")
+    test_string_list = [
+        "",
+        "\n",
+        "---+++",
+        "---\n+++",
+        "a\nb\n---\nc\n+++\nd",
+        "x\n+++\ny\nz\nw\n---",
+        "diff --git a/x y.plist b/x y.plist\nnew file mode 100644\n--- a\n+++ b",
+        "diff --git a/a b/a\nold mode 100644\nnew mode 100755",
+        "binary files differ",
+        test_dirty_diff_string_commits_nocolor,
+        test_dirty_diff_string_commits_color,
+        test_dirty_diff_string_commits_nocolor + "\n" + test_dirty_diff_string_commits_color,
+        "diff --git a/a b/a\r\n--- a\r\n+++ b\r\n-\r\n+ \r",
+    ]
+    for linesep in ("\n", "\r\n"):
+        monkeypatch.setattr(os, "linesep", linesep)
+        for test_string in test_string_list:
+            assert diff._clean_diff_string(test_string) == legacy_clean_diff_string(
+                test_string
+            )
+
+
 def test_ufodiff_diff_get_diff_string_generator_method_uncolored_commits():
     diffobj = Diff(".")
     test_generator = diffobj.get_diff_string_generator("commits:1")
@@ -172,3 +258,62 @@ def test_ufodiff_diff_get_diff_string_generator_method_colored_gitidiom():
     for thing in test_generator:
         pass
     assert isinstance(test_generator, types.GeneratorType)
+
+
+def test_ufodiff_diff_get_diff_string_generator_single_git_call(ufo_repo, mocker):
+    diffobj = Diff(ufo_repo)
+    execute_spy = mocker.spy(Git, "execute")
+    diff_string_list = list(diffobj.get_diff_string_generator("commits:1"))
+    assert execute_spy.call_count == 1
+    # one report per UFO file, each file once, in git path order
+    assert len(diff_string_list) == 4
+    assert "data/com.test.txt" in diff_string_list[0]
+    assert "glyphs/a.glif" in diff_string_list[1]
+    assert "glyphs/contents.plist" in diff_string_list[2]
+    assert "layercontents.plist" in diff_string_list[3]
+    for diff_string in diff_string_list:
+        assert diff_string.startswith("index ")
+        assert "README.md" not in diff_string
+
+
+def test_ufodiff_diff_current_branch_detected_on_use(ufo_repo, mocker):
+    execute_spy = mocker.spy(Git, "execute")
+    diffobj = Diff(ufo_repo)
+    list(diffobj.get_diff_string_generator("commits:1"))
+    # commits: requests do not execute `git rev-parse`
+    assert execute_spy.call_count == 1
+    assert diffobj.current_branch == Repo(ufo_repo).active_branch.name
+    assert diffobj.current_branch == Repo(ufo_repo).active_branch.name
+    assert execute_spy.call_count == 2
+
+
+def test_ufodiff_diff_split_diff_lines_by_file_method():
+    diffobj = Diff(".")
+    file_diff_list = list(
+        diffobj._split_diff_lines_by_file(
+            test_dirty_diff_string_commits_color.split("\n")
+        )
+    )
+    assert len(file_diff_list) == 1
+    assert "\n".join(file_diff_list[0]) == test_dirty_diff_string_commits_color
+    assert list(diffobj._split_diff_lines_by_file([""])) == []
+
+
+def test_ufodiff_diff_stream_diff_matches_string_diff(ufo_repo):
+    for color_diff in (False, True):
+        string_diffobj = Diff(ufo_repo, color_diff=color_diff)
+        stream_diffobj = Diff(ufo_repo, color_diff=color_diff, stream_diff=True)
+        assert stream_diffobj.is_stream_diff is True
+        test_generator = stream_diffobj.get_diff_string_generator("commits:1")
+        assert isinstance(test_generator, types.GeneratorType)
+        assert list(test_generator) == list(
+            string_diffobj.get_diff_string_generator("commits:1")
+        )
+
+
+def test_ufodiff_diff_stream_diff_raises_on_git_error(ufo_repo):
+    from git.exc import GitCommandError
+
+    diffobj = Diff(ufo_repo, stream_diff=True)
+    with pytest.raises(GitCommandError):
+        list(diffobj.get_diff_string_generator("commits:10"))
@@ -0,0 +1,315 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from git import Repo
+from git.cmd import Git
+from gitdb import GitDB
+
+from tests.conftest import write_file
+from ufodiff.subcommands.delta import Delta
+from ufodiff.utilities import gitdelta
+from ufodiff.utilities.gitdelta import (
+    ENGINES,
+    INPROCESS_ENGINE,
+    SUBPROCESS_ENGINE,
+    get_commit_sha1_list,
+    get_file_filter_pathspec_list,
+    get_name_status_filepath_lists,
+    get_tree_filepath_lists,
+    parse_name_status_string,
+)
+
+# ///////////////////////////////////////////////////////
+#
+#  git diff --name-status -z parser tests
+#
+# ///////////////////////////////////////////////////////
+
+
+def test_ufodiff_gitdelta_parse_name_status_add_delete_modify():
+    name_status_string = (
+        "A\0source/Test-Regular.ufo/glyphs/A_.glif\0"
+        "D\0source/Test-Regular.ufo/fontinfo.plist\0"
+        "M\0source/Test-Regular.ufo/features.fea\0"
+        "M\0README.md\0"
+    )
+    added, deleted, modified = parse_name_status_string(name_status_string)
+    assert added == ["source/Test-Regular.ufo/glyphs/A_.glif"]
+    assert deleted == ["source/Test-Regular.ufo/fontinfo.plist"]
+    assert modified == ["source/Test-Regular.ufo/features.fea", "README.md"]
+
+
+def test_ufodiff_gitdelta_parse_name_status_rename_and_copy():
+    name_status_string = (
+        "R087\0source/Test.ufo/glyphs/a.glif\0source/Test.ufo/glyphs/b.glif\0"
+        "C100\0source/Test.ufo/lib.plist\0source/Test2.ufo/lib.plist\0"
+    )
+    added, deleted, modified = parse_name_status_string(name_status_string)
+    assert added == ["source/Test.ufo/glyphs/b.glif", "source/Test2.ufo/lib.plist"]
+    assert deleted == ["source/Test.ufo/glyphs/a.glif"]
+    assert modified == []
+
+
+def test_ufodiff_gitdelta_parse_name_status_paths_with_whitespace():
+    name_status_string = "A\0source/Test Regular.ufo/glyphs/space.glif\0"
+    added, deleted, modified = parse_name_status_string(name_status_string)
+    assert added == ["source/Test Regular.ufo/glyphs/space.glif"]
+
+
+def test_ufodiff_gitdelta_parse_name_status_ignores_other_status_codes():
+    name_status_string = "T\0a/b.ufo/lib.plist\0U\0a/b.ufo/kerning.plist\0"
+    assert parse_name_status_string(name_status_string) == ([], [], [])
+
+
+def test_ufodiff_gitdelta_parse_name_status_empty_string():
+    assert parse_name_status_string("") == ([], [], [])
+
+
+def test_ufodiff_gitdelta_name_status_matches_diff_filter_lists():
+    git = Repo(".").git
+    added, deleted, modified = get_name_status_filepath_lists(git, "HEAD~1")
+    for diff_filter, filepath_list in (("A", added), ("D", deleted), ("M", modified)):
+        filter_string = git.diff(
+            "--name-only", "--no-renames", "--diff-filter=" + diff_filter, "HEAD~1"
+        )
+        expected_list = [x for x in filter_string.split("\n") if x != ""]
+        assert filepath_list == expected_list
+
+
+# ///////////////////////////////////////////////////////
+#
+#  In-process engine parity tests
+#
+# ///////////////////////////////////////////////////////
+
+
+@pytest.fixture
+def parity_repo(git_repo, tmp_path):
+    for filepath in (
+        "README.md",
+        "dir",
+        "build/artefact.txt",
+        "source/Test-Regular.ufo/metainfo.plist",
+        "source/Test-Regular.ufo/lib.plist",
+        "source/Test-Regular.ufo/glyphs/a.glif",
+        "source/Test-Regular.ufo/glyphs/b.glif",
+        "source/Test-Regular.ufo/glyphs/contents.plist",
+        "source/Test-Italic.ufo/glyphs/a.glif",
+    ):
+        write_file(tmp_path, filepath, filepath)
+    git_repo.git.add("-A")
+    git_repo.git.commit("-m", "first")
+    # modified
+    write_file(tmp_path, "source/Test-Regular.ufo/glyphs/a.glif", "modified")
+    write_file(tmp_path, "build/artefact.txt", "modified")
+    # deleted
+    git_repo.git.rm("source/Test-Regular.ufo/glyphs/b.glif")
+    # renamed
+    git_repo.git.mv(
+        "source/Test-Regular.ufo/lib.plist", "source/Test-Regular.ufo/layerinfo.plist"
+    )
+    # file replaced by a directory
+    git_repo.git.rm("dir")
+    write_file(tmp_path, "dir/Test-Bold.ufo/fontinfo.plist", "added")
+    # added, with sort order sensitive names
+    write_file(tmp_path, "source/Test-Regular.ufo/glyphs.background/a.glif", "added")
+    write_file(tmp_path, "source/Test-Regular.ufo/glyphs/c.glif", "added")
+    write_file(tmp_path, "source/Test-Regular.ufo/glyphs-x.glif", "added")
+    git_repo.git.add("-A")
+    # mode change
+    git_repo.git.update_index("--chmod=+x", "README.md")
+    git_repo.git.commit("-m", "second")
+    return str(tmp_path)
+
+
+def test_ufodiff_gitdelta_inprocess_engine_parity(parity_repo):
+    git = Repo(parity_repo).git
+    subprocess_lists = get_name_status_filepath_lists(git, "HEAD~1..HEAD")
+    inprocess_lists = get_tree_filepath_lists(
+        Repo(parity_repo, odbt=GitDB), "HEAD~1", "HEAD"
+    )
+    assert inprocess_lists == subprocess_lists
+    assert "README.md" in inprocess_lists[2]
+    assert "dir" in inprocess_lists[1]
+
+
+def test_ufodiff_gitdelta_inprocess_engine_identical_trees(parity_repo):
+    repo = Repo(parity_repo, odbt=GitDB)
+    assert get_tree_filepath_lists(repo, "HEAD", "HEAD") == ([], [], [])
+
+
+def test_ufodiff_gitdelta_inprocess_engine_no_git_subprocess(parity_repo, mocker):
+    execute_spy = mocker.spy(Git, "execute")
+    repo = Repo(parity_repo, odbt=GitDB)
+    get_tree_filepath_lists(repo, "HEAD~1", "HEAD")
+    assert get_commit_sha1_list(repo, 2) == [
+        repo.commit("HEAD").hexsha[:7],
+        repo.commit("HEAD~1").hexsha[:7],
+    ]
+    assert execute_spy.call_count == 0
+
+
+def test_ufodiff_gitdelta_inprocess_engine_delta_parity(parity_repo):
+    subprocess_delta = Delta(parity_repo, [], is_commit_test=True, commit_number="1")
+    inprocess_delta = Delta(
+        parity_repo,
+        [],
+        is_commit_test=True,
+        commit_number="1",
+        engine=INPROCESS_ENGINE,
+    )
+    assert subprocess_delta.engine == SUBPROCESS_ENGINE
+    assert inprocess_delta.engine == INPROCESS_ENGINE
+    assert (
+        inprocess_delta.delta_fp_string_dict.delta_dict
+        == subprocess_delta.delta_fp_string_dict.delta_dict
+    )
+
+
+def test_ufodiff_gitdelta_ufo_tree_engine_delta(parity_repo):
+    inprocess_delta = Delta(
+        parity_repo, [], is_commit_test=True, commit_number="1", engine="inprocess"
+    )
+    ufo_tree_delta = Delta(
+        parity_repo, [], is_commit_test=True, commit_number="1", engine="ufotree"
+    )
+    assert (
+        ufo_tree_delta.delta_fp_string_dict.delta_dict
+        == inprocess_delta.delta_fp_string_dict.delta_dict
+    )
+
+
+def test_ufodiff_gitdelta_invalid_engine_raises_valueerror(parity_repo):
+    with pytest.raises(ValueError):
+        Delta(parity_repo, [], is_commit_test=True, commit_number="1", engine="bogus")
+
+
+def test_ufodiff_gitdelta_ufo_tree_engine_only_ufo_directories(parity_repo):
+    repo = Repo(parity_repo, odbt=GitDB)
+    inprocess_lists = get_tree_filepath_lists(repo, "HEAD~1", "HEAD")
+    ufo_tree_lists = get_tree_filepath_lists(
+        repo, "HEAD~1", "HEAD", ufo_subtrees_only=True
+    )
+    for inprocess_list, ufo_tree_list in zip(inprocess_lists, ufo_tree_lists):
+        assert ufo_tree_list == [x for x in inprocess_list if ".ufo/" in x]
+    assert "dir/Test-Bold.ufo/fontinfo.plist" in ufo_tree_lists[0]
+    assert "build/artefact.txt" not in ufo_tree_lists[2]
+
+
+def test_ufodiff_gitdelta_ufo_tree_engine_with_ufo_filter(parity_repo):
+    repo = Repo(parity_repo, odbt=GitDB)
+    added, deleted, modified = get_tree_filepath_lists(
+        repo,
+        "HEAD~1",
+        "HEAD",
+        ufo_subtrees_only=True,
+        ufo_filter_list=["Test-Bold.ufo"],
+    )
+    assert added == ["dir/Test-Bold.ufo/fontinfo.plist"]
+    assert deleted == []
+    assert modified == []
+
+
+def test_ufodiff_gitdelta_ufo_tree_engine_skips_unchanged_ufo_subtrees(
+    parity_repo, mocker
+):
+    repo = Repo(parity_repo, odbt=GitDB)
+    read_spy = mocker.spy(gitdelta, "read_tree_entries")
+    get_tree_filepath_lists(
+        repo,
+        "HEAD~1",
+        "HEAD",
+        ufo_subtrees_only=True,
+        ufo_filter_list=["Test-Italic.ufo"],
+    )
+    # root, build, dir, and source trees at both revisions; the unchanged
+    # Test-Italic.ufo and the filtered Test-Regular.ufo subtrees are not read
+    assert read_spy.call_count == 8
+
+
+# ///////////////////////////////////////////////////////
+#
+#  glyph / nonglyph file filter tests
+#
+# ///////////////////////////////////////////////////////
+
+
+def test_ufodiff_gitdelta_file_filter_pathspec_list():
+    assert get_file_filter_pathspec_list(None) == []
+    assert get_file_filter_pathspec_list("glyph") == ["*.glif"]
+    assert get_file_filter_pathspec_list("nonglyph") == ["*.plist", "*.fea"]
+
+
+@pytest.mark.parametrize("file_filter", ["glyph", "nonglyph"])
+def test_ufodiff_gitdelta_file_filter_engine_parity(parity_repo, file_filter):
+    git = Repo(parity_repo).git
+    subprocess_lists = get_name_status_filepath_lists(
+        git, "HEAD~1..HEAD", get_file_filter_pathspec_list(file_filter)
+    )
+    for ufo_subtrees_only in (False, True):
+        assert (
+            get_tree_filepath_lists(
+                Repo(parity_repo, odbt=GitDB),
+                "HEAD~1",
+                "HEAD",
+                ufo_subtrees_only=ufo_subtrees_only,
+                file_filter=file_filter,
+            )
+            == subprocess_lists
+        )
+
+
+def test_ufodiff_gitdelta_file_filter_delta(parity_repo):
+    all_delta_dict = Delta(
+        parity_repo, [], is_commit_test=True, commit_number="1"
+    ).delta_fp_string_dict.delta_dict
+    for engine in ENGINES:
+        glyph_delta_dict = Delta(
+            parity_repo,
+            [],
+            is_commit_test=True,
+            commit_number="1",
+            engine=engine,
+            file_filter="glyph",
+        ).delta_fp_string_dict.delta_dict
+        nonglyph_delta_dict = Delta(
+            parity_repo,
+            [],
+            is_commit_test=True,
+            commit_number="1",
+            engine=engine,
+            file_filter="nonglyph",
+        ).delta_fp_string_dict.delta_dict
+        for key in ("added", "deleted", "modified"):
+            assert glyph_delta_dict[key] == [
+                filepath
+                for filepath in all_delta_dict[key]
+                if filepath.endswith(".glif")
+            ]
+            assert nonglyph_delta_dict[key] == [
+                filepath
+                for filepath in all_delta_dict[key]
+                if filepath.endswith((".plist", ".fea"))
+            ]
+    assert nonglyph_delta_dict["added"] == [
+        "dir/Test-Bold.ufo/fontinfo.plist",
+        "source/Test-Regular.ufo/layerinfo.plist",
+    ]
+
+
+def test_ufodiff_gitdelta_file_filter_delta_pathspec(parity_repo, mocker):
+    diff_spy = mocker.spy(Git, "execute")
+    Delta(
+        parity_repo, [], is_commit_test=True, commit_number="1", file_filter="nonglyph"
+    )
+    diff_command_list = [
+        call[0][1] for call in diff_spy.call_args_list if "diff" in call[0][1]
+    ]
+    assert diff_command_list[0][-3:] == ["--", "*.plist", "*.fea"]
+
+
+def test_ufodiff_gitdelta_invalid_file_filter_raises_valueerror(parity_repo):
+    with pytest.raises(ValueError):
+        Delta(parity_repo, [], is_commit_test=True, commit_number="1", file_filter="x")
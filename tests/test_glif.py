@@ -0,0 +1,146 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from array import array
+
+from ufodiff.utilities.glif import Glyph, get_glyph_changes, parse_glif
+
+GLIF_STRING = """<?xml version="1.0" encoding="UTF-8"?>
+<glyph name="a" format="2">
+  <advance width="500"/>
+  <unicode hex="0061"/>
+  <guideline x="10" y="20" angle="90" name="stem"/>
+  <anchor x="250" y="700" name="top"/>
+  <anchor x="250" y="0" name="bottom"/>
+  <outline>
+    <contour>
+      <point x="100" y="0" type="line"/>
+      <point x="100" y="200" type="line" smooth="yes"/>
+      <point x="150" y="250"/>
+    </contour>
+    <component base="acute" xOffset="120"/>
+  </outline>
+  <lib>
+    <dict>
+      <key>public.markColor</key>
+      <string>1,0,0,1</string>
+      <key>com.test.list</key>
+      <array>
+        <integer>1</integer>
+        <real>2.5</real>
+        <true/>
+      </array>
+    </dict>
+  </lib>
+</glyph>
+"""
+
+
+def test_ufodiff_glif_parse():
+    glyph = parse_glif(GLIF_STRING.encode("utf-8"))
+    assert isinstance(glyph, Glyph)
+    assert glyph.name == "a"
+    assert glyph.width == 500
+    assert glyph.height == 0
+    assert glyph.unicodes == ["0061"]
+    assert glyph.guidelines == [(10, 20, 90, "stem")]
+    assert glyph.anchors == [("top", 250, 700), ("bottom", 250, 0)]
+    assert [list(contour) for contour in glyph.contours] == [
+        [
+            (100, 0, "line", False, None),
+            (100, 200, "line", True, None),
+            (150, 250, "offcurve", False, None),
+        ]
+    ]
+    assert [
+        (component.base,) + component.transformation for component in glyph.components
+    ] == [("acute", 1, 0, 0, 1, 120, 0)]
+    assert glyph.lib == {
+        "public.markColor": "1,0,0,1",
+        "com.test.list": [1, 2.5, True],
+    }
+
+
+def test_ufodiff_glif_attribute_order_and_formatting_not_reported():
+    reordered_glif_string = (
+        GLIF_STRING.replace('x="100" y="0" type="line"', 'type="line"  y="0" x="100.0"')
+        .replace('<advance width="500"/>', '<advance  width="500.0" />')
+        .replace("  ", "\t")
+    )
+    old_glyph = parse_glif(GLIF_STRING)
+    new_glyph = parse_glif(reordered_glif_string)
+    assert get_glyph_changes(old_glyph, new_glyph) == []
+
+
+def test_ufodiff_glif_glyph_changes():
+    new_glif_string = (
+        GLIF_STRING.replace('<advance width="500"/>', '<advance width="520"/>')
+        .replace('<unicode hex="0061"/>', '<unicode hex="0061"/><unicode hex="0041"/>')
+        .replace('x="250" y="700" name="top"', 'x="260" y="700" name="top"')
+        .replace('<anchor x="250" y="0" name="bottom"/>', "")
+        .replace('<point x="150" y="250"/>', '<point x="151" y="250"/>')
+        .replace('base="acute"', 'base="grave"')
+        .replace("<string>1,0,0,1</string>", "<string>0,1,0,1</string>")
+        .replace(
+            "</outline>",
+            '<contour><point x="0" y="0" type="move"/></contour></outline>',
+        )
+    )
+    change_list = get_glyph_changes(
+        parse_glif(GLIF_STRING), parse_glif(new_glif_string)
+    )
+    assert change_list == [
+        "advance width: 500 -> 520",
+        "unicodes: 0061 -> 0061 0041",
+        "anchor 'top': (250, 700) -> (260, 700)",
+        "anchor 'bottom' removed",
+        "contour 1 point 3: (150, 250) offcurve -> (151, 250) offcurve",
+        "contour 2 added: 1 points",
+        "component 1: 'acute' [1, 0, 0, 1, 120, 0] -> 'grave' [1, 0, 0, 1, 120, 0]",
+        "lib key 'public.markColor' modified",
+    ]
+
+
+def test_ufodiff_glif_point_number_changes():
+    old_glyph = parse_glif(GLIF_STRING)
+    new_glyph = parse_glif(GLIF_STRING.replace('<point x="150" y="250"/>', ""))
+    assert get_glyph_changes(old_glyph, new_glyph) == [
+        "contour 1 point 3 removed: (150, 250) offcurve"
+    ]
+    assert get_glyph_changes(new_glyph, old_glyph) == [
+        "contour 1 point 3 added: (150, 250) offcurve"
+    ]
+
+
+def test_ufodiff_glif_compact_model():
+    glyph = parse_glif(GLIF_STRING)
+    contour = glyph.contours[0]
+    assert len(contour) == 3
+    assert contour.coordinates == array("d", [100, 0, 100, 200, 150, 250])
+    assert contour.get_point(1) == (100, 200, "line", True, None)
+    for compact_object in (glyph, contour, glyph.components[0]):
+        assert not hasattr(compact_object, "__dict__")
+
+
+def test_ufodiff_glif_lazy_outline():
+    glyph = parse_glif(GLIF_STRING, lazy_outline=True)
+    assert glyph._outline_data is not None
+    assert glyph.width == 500
+    assert glyph.unicodes == ["0061"]
+    assert glyph.lib["com.test.list"] == [1, 2.5, True]
+    assert glyph._outline_data is not None
+    # the outline is decoded on first access of the contours or components
+    assert glyph.contours == parse_glif(GLIF_STRING).contours
+    assert glyph._outline_data is None
+    assert glyph.components[0].base == "acute"
+    assert get_glyph_changes(glyph, parse_glif(GLIF_STRING)) == []
+
+
+def test_ufodiff_glif_lazy_outline_empty_outline():
+    glif_string = (
+        '<glyph name="space" format="2"><advance width="250"/><outline/></glyph>'
+    )
+    glyph = parse_glif(glif_string, lazy_outline=True)
+    assert glyph.width == 250
+    assert glyph.contours == []
+    assert glyph.components == []
@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+
+import pytest
+
+from tests.conftest import write_file
+from ufodiff.subcommands.glyphdiff import GlyphDiff
+from ufodiff.utilities import parallel
+from ufodiff.utilities.gitdelta import parse_raw_diff_string
+from ufodiff.utilities.parallel import is_parallel_workload
+
+GLIF_TEMPLATE = """<?xml version="1.0" encoding="UTF-8"?>
+<glyph name="{name}" format="2">
+  <advance width="{width}"/>
+  <outline>
+    <contour>
+      <point x="0" y="0" type="line"/>
+      <point x="{x}" y="100" type="line"/>
+    </contour>
+  </outline>
+</glyph>
+"""
+
+
+@pytest.fixture
+def glyph_repo(git_repo, tmp_path):
+    for ufo_name in ("Test-Regular.ufo", "Test-Bold.ufo"):
+        for glyph_name in ("a", "b", "c"):
+            write_file(
+                tmp_path,
+                "source/" + ufo_name + "/glyphs/" + glyph_name + ".glif",
+                GLIF_TEMPLATE.format(name=glyph_name, width=500, x=100),
+            )
+    git_repo.git.add("-A")
+    git_repo.git.commit("-m", "first")
+    git_repo.git.branch("base")
+    # modified
+    write_file(
+        tmp_path,
+        "source/Test-Regular.ufo/glyphs/a.glif",
+        GLIF_TEMPLATE.format(name="a", width=520, x=101),
+    )
+    # formatting change only
+    write_file(
+        tmp_path,
+        "source/Test-Regular.ufo/glyphs/b.glif",
+        GLIF_TEMPLATE.format(name="b", width="500.0", x=100).replace("  ", "\t"),
+    )
+    # deleted and added
+    git_repo.git.rm("source/Test-Regular.ufo/glyphs/c.glif")
+    write_file(
+        tmp_path,
+        "source/Test-Regular.ufo/glyphs/d.glif",
+        GLIF_TEMPLATE.format(name="d", width=500, x=100),
+    )
+    write_file(
+        tmp_path,
+        "source/Test-Bold.ufo/glyphs/a.glif",
+        GLIF_TEMPLATE.format(name="a", width=600, x=100),
+    )
+    git_repo.git.add("-A")
+    git_repo.git.commit("-m", "second")
+    return str(tmp_path)
+
+
+def test_ufodiff_gitdelta_parse_raw_diff_string():
+    raw_diff_string = (
+        ":100644 100644 " + "a" * 40 + " " + "b" * 40 + " M\0a.ufo/glyphs/a.glif\0"
+        ":000000 100644 " + "0" * 40 + " " + "c" * 40 + " A\0a.ufo/glyphs/b.glif\0"
+        ":100644 000000 " + "d" * 40 + " " + "0" * 40 + " D\0a.ufo/glyphs/c.glif\0"
+    )
+    assert parse_raw_diff_string(raw_diff_string) == [
+        ("a.ufo/glyphs/a.glif", "a" * 40, "b" * 40),
+        ("a.ufo/glyphs/b.glif", None, "c" * 40),
+        ("a.ufo/glyphs/c.glif", "d" * 40, None),
+    ]
+    assert parse_raw_diff_string("") == []
+
+
+def test_ufodiff_glyphdiff_commits(glyph_repo):
+    glyphdiff = GlyphDiff(glyph_repo)
+    report_list = list(glyphdiff.get_glyph_diff_string_generator("commits:1"))
+    assert report_list == [
+        os.linesep.join(
+            [
+                "source/Test-Bold.ufo/glyphs/a.glif",
+                "  advance width: 500 -> 600",
+            ]
+        ),
+        os.linesep.join(
+            [
+                "source/Test-Regular.ufo/glyphs/a.glif",
+                "  advance width: 500 -> 520",
+                "  contour 1 point 2: (100, 100) line -> (101, 100) line",
+            ]
+        ),
+        os.linesep.join(["source/Test-Regular.ufo/glyphs/c.glif", "  glyph deleted"]),
+        os.linesep.join(["source/Test-Regular.ufo/glyphs/d.glif", "  glyph added"]),
+    ]
+
+
+def test_ufodiff_glyphdiff_branch_with_ufo_filter(glyph_repo):
+    glyphdiff = GlyphDiff(glyph_repo, ["Test-Bold.ufo"])
+    report_list = list(glyphdiff.get_glyph_diff_string_generator("branch:base"))
+    assert len(report_list) == 1
+    assert report_list[0].startswith("source/Test-Bold.ufo/glyphs/a.glif")
+
+
+def test_ufodiff_glyphdiff_skips_unchanged_blobs(glyph_repo, mocker):
+    glyphdiff = GlyphDiff(glyph_repo)
+    read_spy = mocker.spy(glyphdiff, "_read_glyph")
+    list(glyphdiff.get_glyph_diff_string_generator("commits:1"))
+    # base and head blobs of the three modified glyph files, the unchanged
+    # Test-Bold.ufo b.glif and c.glif blobs are not read
+    assert read_spy.call_count == 6
+
+
+def test_ufodiff_glyphdiff_invalid_request(glyph_repo):
+    glyphdiff = GlyphDiff(glyph_repo)
+    with pytest.raises(ValueError):
+        list(glyphdiff.get_glyph_diff_string_generator("HEAD~1"))
+
+
+def test_ufodiff_glyphdiff_process_pool(glyph_repo, monkeypatch, mocker):
+    sequential_report_list = list(
+        GlyphDiff(glyph_repo, workers=1).get_glyph_diff_string_generator("commits:1")
+    )
+    monkeypatch.setattr(parallel, "PARALLEL_MIN_ITEMS", 0)
+    executor_spy = mocker.spy(parallel, "ProcessPoolExecutor")
+    glyphdiff = GlyphDiff(glyph_repo, workers=2)
+    blob_record_list = glyphdiff.get_glif_blob_list("HEAD~1", "HEAD")
+    assert is_parallel_workload(len(blob_record_list), 2) is True
+    report_list = list(glyphdiff.get_glyph_diff_string_generator("commits:1"))
+    # identical reports in the same filepath order
+    assert report_list == sequential_report_list
+    assert executor_spy.call_count == 1
+    assert glyphdiff.get_writer("commits:1").get_string() == "".join(
+        report + os.linesep for report in sequential_report_list
+    )
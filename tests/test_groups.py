@@ -0,0 +1,200 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import json
+import os
+import plistlib
+
+import pytest
+
+from git import Repo
+
+from ufodiff.subcommands.groups import GroupsDelta
+from ufodiff.utilities.groups import (
+    KerningGroupIndex,
+    get_group_kerning_changes,
+    get_group_membership_changes,
+    load_groups,
+)
+
+# ///////////////////////////////////////////////////////
+#
+#  Group membership and kerning group index tests
+#
+# ///////////////////////////////////////////////////////
+
+GROUP_DICT = {
+    "public.kern1.O": frozenset(["O", "D", "Q"]),
+    "public.kern2.V": frozenset(["V", "W"]),
+    "public.kern2.O": frozenset(["O", "C"]),
+}
+
+PAIR_DICT = {
+    ("public.kern1.O", "public.kern2.V"): -40,
+    ("public.kern1.O", "A"): -20,
+    ("T", "public.kern2.O"): -60,
+    # exceptions, more specific than the group pairs
+    ("Q", "W"): -10,
+    ("public.kern1.O", "V"): -35,
+}
+
+
+def test_ufodiff_groups_load_groups():
+    groups_data = plistlib.dumps({"public.kern1.O": ["O", "D", "O"], "empty": []})
+    assert load_groups(groups_data) == {
+        "public.kern1.O": frozenset(["O", "D"]),
+        "empty": frozenset(),
+    }
+
+
+def test_ufodiff_groups_membership_changes():
+    old_group_dict = {"a": frozenset(["A", "B"]), "b": frozenset(["C"])}
+    new_group_dict = {"a": frozenset(["B", "A"]), "b": frozenset(["D"]), "c": {"E"}}
+    assert get_group_membership_changes(old_group_dict, new_group_dict) == [
+        ("b", ["D"], ["C"]),
+        ("c", ["E"], []),
+    ]
+    assert get_group_membership_changes(new_group_dict, {}) == [
+        ("a", [], ["A", "B"]),
+        ("b", [], ["D"]),
+        ("c", [], ["E"]),
+    ]
+
+
+def test_ufodiff_groups_index_affected_pairs():
+    group_index = KerningGroupIndex(PAIR_DICT, GROUP_DICT)
+    assert sorted(group_index.first_index) == ["public.kern1.O"]
+    assert sorted(group_index.second_index) == ["public.kern2.O", "public.kern2.V"]
+    # group + group pair without the (Q, W) exception and the (kern1.O, V) pair
+    assert group_index.get_affected_pairs("public.kern1.O", "Q") == [
+        (("Q", "A"), -20),
+        (("Q", "V"), -35),
+    ]
+    assert group_index.get_affected_pairs("public.kern1.O", "D") == [
+        (("D", "A"), -20),
+        (("D", "V"), -35),
+        (("D", "W"), -40),
+    ]
+    assert group_index.get_affected_pairs("public.kern2.O", "C") == [(("T", "C"), -60)]
+    # second group member, the (Q, W) exception is not included
+    assert group_index.get_affected_pairs("public.kern2.V", "W") == [
+        (("D", "W"), -40),
+        (("O", "W"), -40),
+    ]
+
+
+def test_ufodiff_groups_kerning_changes_use_revision_indexes():
+    new_group_dict = dict(GROUP_DICT)
+    new_group_dict["public.kern1.O"] = frozenset(["O", "Q", "G"])
+    changes = get_group_kerning_changes(
+        KerningGroupIndex(PAIR_DICT, GROUP_DICT),
+        KerningGroupIndex({("public.kern1.O", "A"): -25}, new_group_dict),
+    )
+    assert len(changes) == 1
+    assert changes[0].group == "public.kern1.O"
+    # added members are resolved in the head revision
+    assert changes[0].added == [("G", [(("G", "A"), -25)])]
+    # removed members are resolved in the base revision
+    assert changes[0].removed == [
+        ("D", [(("D", "A"), -20), (("D", "V"), -35), (("D", "W"), -40)])
+    ]
+
+
+# ///////////////////////////////////////////////////////
+#
+#  GroupsDelta class tests
+#
+# ///////////////////////////////////////////////////////
+
+
+def write_plist(repo_path, filepath, plist_dict):
+    full_path = os.path.join(str(repo_path), *filepath.split("/"))
+    if not os.path.isdir(os.path.dirname(full_path)):
+        os.makedirs(os.path.dirname(full_path))
+    with open(full_path, "wb") as f:
+        f.write(plistlib.dumps(plist_dict))
+
+
+@pytest.fixture
+def groups_repo(tmp_path):
+    repo = Repo.init(str(tmp_path))
+    with repo.config_writer() as config:
+        config.set_value("user", "name", "ufodiff")
+        config.set_value("user", "email", "ufodiff@example.com")
+    for ufo_name in ("Test-Regular.ufo", "Test-Bold.ufo"):
+        write_plist(
+            tmp_path,
+            "source/" + ufo_name + "/groups.plist",
+            {"public.kern1.O": ["O", "D"], "public.kern2.V": ["V", "W"]},
+        )
+        write_plist(
+            tmp_path,
+            "source/" + ufo_name + "/kerning.plist",
+            {"public.kern1.O": {"public.kern2.V": -40}},
+        )
+    repo.git.add("-A")
+    repo.git.commit("-m", "first")
+    repo.git.branch("base")
+    write_plist(
+        tmp_path,
+        "source/Test-Regular.ufo/groups.plist",
+        {"public.kern1.O": ["O", "Q"], "public.kern2.V": ["W", "V"]},
+    )
+    # member order change only
+    write_plist(
+        tmp_path,
+        "source/Test-Bold.ufo/groups.plist",
+        {"public.kern1.O": ["D", "O"], "public.kern2.V": ["V", "W"]},
+    )
+    repo.git.add("-A")
+    repo.git.commit("-m", "second")
+    return str(tmp_path)
+
+
+def test_ufodiff_groups_delta_text(groups_repo):
+    groups_delta = GroupsDelta(groups_repo, [], is_commit_test=True, commit_number="1")
+    assert [filepath for filepath, _ in groups_delta.group_changes_list] == [
+        "source/Test-Regular.ufo/groups.plist"
+    ]
+    text_string = groups_delta.get_stdout_string(write_format="text")
+    assert (
+        os.linesep.join(
+            [
+                "[G]:source/Test-Regular.ufo/groups.plist",
+                "[A]:public.kern1.O Q",
+                " Q V = -40",
+                " Q W = -40",
+                "[D]:public.kern1.O D",
+                " D V = -40",
+                " D W = -40",
+            ]
+        )
+        in text_string
+    )
+
+
+def test_ufodiff_groups_delta_json_and_markdown(groups_repo):
+    groups_delta = GroupsDelta(
+        groups_repo,
+        ["Test-Bold.ufo"],
+        is_branch_test=True,
+        compare_branch_name="base",
+    )
+    groups_dict = json.loads(groups_delta.get_stdout_string(write_format="json"))
+    assert groups_dict["groups"] == {}
+    assert groups_dict["branches"][0] == "base"
+
+    groups_delta = GroupsDelta(groups_repo, [], is_commit_test=True, commit_number="1")
+    groups_dict = json.loads(groups_delta.get_stdout_string(write_format="json"))
+    assert groups_dict["groups"]["source/Test-Regular.ufo/groups.plist"] == [
+        {
+            "group": "public.kern1.O",
+            "added": [{"glyph": "Q", "pairs": [["Q", "V", -40], ["Q", "W", -40]]}],
+            "removed": [{"glyph": "D", "pairs": [["D", "V", -40], ["D", "W", -40]]}],
+        }
+    ]
+    markdown_string = groups_delta.get_stdout_string(write_format="markdown")
+    assert (
+        os.linesep.join(["### public.kern1.O", "- Added `Q`", "  - `Q V` -40"])
+        in markdown_string
+    )
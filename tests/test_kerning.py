@@ -0,0 +1,192 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import json
+import os
+import plistlib
+
+import pytest
+
+from git import Repo
+
+from ufodiff.subcommands.kerning import KerningDelta
+from ufodiff.utilities.kerning import (
+    format_kerning_value,
+    get_kerning_pair_changes,
+    get_value_histogram,
+    load_kerning_pairs,
+)
+
+# ///////////////////////////////////////////////////////
+#
+#  Kerning pair comparison tests
+#
+# ///////////////////////////////////////////////////////
+
+
+def test_ufodiff_kerning_load_kerning_pairs():
+    kerning_dict = {
+        "public.kern1.O": {"A": -20, "public.kern2.V": -35.5},
+        "T": {"o": -60},
+    }
+    pair_dict = load_kerning_pairs(plistlib.dumps(kerning_dict))
+    assert pair_dict == {
+        ("public.kern1.O", "A"): -20,
+        ("public.kern1.O", "public.kern2.V"): -35.5,
+        ("T", "o"): -60,
+    }
+    assert type(pair_dict[("T", "o")]) is int
+    binary_data = plistlib.dumps(kerning_dict, fmt=plistlib.FMT_BINARY)
+    assert load_kerning_pairs(binary_data) == pair_dict
+
+
+def test_ufodiff_kerning_load_kerning_pairs_interns_names():
+    kerning_data = plistlib.dumps(
+        {"public.kern1.O": {"A": -20}, "T": {"public.kern1.O": -10, "A": -5}}
+    )
+    pair_list = list(load_kerning_pairs(kerning_data))
+    name_dict = {}
+    for pair in pair_list:
+        for name in pair:
+            # each glyph or group name is one string object
+            assert name_dict.setdefault(name, name) is name
+
+
+def test_ufodiff_kerning_pair_changes():
+    old_pair_dict = {("A", "V"): -40, ("T", "o"): -60, ("W", "a"): -20, ("L", "T"): 0}
+    new_pair_dict = {("A", "V"): -40, ("T", "o"): -70, ("L", "T"): -80, ("Y", "a"): -30}
+    kerning_changes = get_kerning_pair_changes(old_pair_dict, new_pair_dict)
+    assert kerning_changes.old_pair_number == 4
+    assert kerning_changes.new_pair_number == 4
+    assert kerning_changes.added == [(("Y", "a"), -30)]
+    assert kerning_changes.removed == [(("W", "a"), -20)]
+    assert kerning_changes.changed == [(("L", "T"), 0, -80), (("T", "o"), -60, -70)]
+    assert len(kerning_changes) == 4
+    assert kerning_changes.get_value_change_histogram() == [(-80, 1), (-10, 1)]
+    assert kerning_changes.get_added_value_histogram() == [(-30, 1)]
+    assert kerning_changes.get_removed_value_histogram() == [(-20, 1)]
+    # integer and real values with the same value are not changes
+    assert len(get_kerning_pair_changes({("A", "V"): -40}, {("A", "V"): -40.0})) == 0
+
+
+def test_ufodiff_kerning_value_histogram_and_format():
+    assert get_value_histogram([-10, 5, -10, -10, 5]) == [(-10, 3), (5, 2)]
+    assert format_kerning_value(-40.0) == "-40"
+    assert format_kerning_value(10, signed=True) == "+10"
+    assert format_kerning_value(-2.5, signed=True) == "-2.5"
+    assert format_kerning_value(0, signed=True) == "0"
+
+
+# ///////////////////////////////////////////////////////
+#
+#  KerningDelta class tests
+#
+# ///////////////////////////////////////////////////////
+
+
+def write_kerning(repo_path, filepath, kerning_dict):
+    full_path = os.path.join(str(repo_path), *filepath.split("/"))
+    if not os.path.isdir(os.path.dirname(full_path)):
+        os.makedirs(os.path.dirname(full_path))
+    with open(full_path, "wb") as f:
+        f.write(plistlib.dumps(kerning_dict))
+
+
+@pytest.fixture
+def kerning_repo(tmp_path):
+    repo = Repo.init(str(tmp_path))
+    with repo.config_writer() as config:
+        config.set_value("user", "name", "ufodiff")
+        config.set_value("user", "email", "ufodiff@example.com")
+    for ufo_name in ("Test-Regular.ufo", "Test-Bold.ufo"):
+        write_kerning(
+            tmp_path,
+            "source/" + ufo_name + "/kerning.plist",
+            {"A": {"V": -40, "W": -30}, "T": {"o": -60}},
+        )
+    write_kerning(tmp_path, "build/kerning.plist", {"A": {"V": -40}})
+    repo.git.add("-A")
+    repo.git.commit("-m", "first")
+    repo.git.branch("base")
+    write_kerning(
+        tmp_path,
+        "source/Test-Regular.ufo/kerning.plist",
+        {"A": {"V": -50, "Y": -45}, "T": {"o": -70}},
+    )
+    write_kerning(
+        tmp_path,
+        "source/Test-Bold.ufo/kerning.plist",
+        {"A": {"V": -40, "W": -30}, "T": {"o": -60, "a": -50}},
+    )
+    write_kerning(tmp_path, "build/kerning.plist", {"A": {"V": -50}})
+    repo.git.add("-A")
+    repo.git.commit("-m", "second")
+    return str(tmp_path)
+
+
+def test_ufodiff_kerning_delta_commits(kerning_repo):
+    kerning_delta = KerningDelta(
+        kerning_repo, [], is_commit_test=True, commit_number="1"
+    )
+    assert [filepath for filepath, _ in kerning_delta.kerning_changes_list] == [
+        "source/Test-Bold.ufo/kerning.plist",
+        "source/Test-Regular.ufo/kerning.plist",
+    ]
+    assert len(kerning_delta.commit_sha1_list) == 1
+    text_string = kerning_delta.get_stdout_string(write_format="text")
+    assert (
+        os.linesep.join(
+            [
+                "[K]:source/Test-Regular.ufo/kerning.plist",
+                " pairs: 3 -> 3 (added 1, removed 1, changed 2)",
+                "[A]:A Y = -45",
+                "[D]:A W = -30",
+                "[M]:A V: -40 -> -50",
+                "[M]:T o: -60 -> -70",
+                " added values:",
+                "  -45: 1",
+                " removed values:",
+                "  -30: 1",
+                " value changes:",
+                "  -10: 2",
+            ]
+        )
+        in text_string
+    )
+
+
+def test_ufodiff_kerning_delta_json_branch_with_ufo_filter(kerning_repo):
+    kerning_delta = KerningDelta(
+        kerning_repo,
+        ["Test-Regular.ufo"],
+        is_branch_test=True,
+        compare_branch_name="base",
+    )
+    kerning_dict = json.loads(kerning_delta.get_stdout_string(write_format="json"))
+    current_branch_name = Repo(kerning_repo).active_branch.name
+    assert kerning_dict["branches"] == ["base", current_branch_name]
+    assert kerning_dict["kerning"] == {
+        "source/Test-Regular.ufo/kerning.plist": {
+            "pairs": [3, 3],
+            "added": [["A", "Y", -45]],
+            "removed": [["A", "W", -30]],
+            "changed": [["A", "V", -40, -50], ["T", "o", -60, -70]],
+            "histograms": {
+                "added": [[-45, 1]],
+                "removed": [[-30, 1]],
+                "changed": [[-10, 2]],
+            },
+        }
+    }
+
+
+def test_ufodiff_kerning_delta_markdown(kerning_repo):
+    kerning_delta = KerningDelta(
+        kerning_repo, ["Test-Bold.ufo"], is_commit_test=True, commit_number="1"
+    )
+    markdown_string = kerning_delta.get_stdout_string(write_format="markdown")
+    assert "## Kerning: source/Test-Bold.ufo/kerning.plist" in markdown_string
+    assert "### Added Pairs" + os.linesep + "- `T a` -50" in markdown_string
+    assert "### Removed Pairs" + os.linesep + "- None" in markdown_string
+    assert "Test-Regular.ufo" not in markdown_string
+    assert markdown_string.rstrip().split(os.linesep)[-1].startswith("[ufodiff]")
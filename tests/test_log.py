@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import json
+
+import pytest
+
+from git import Repo
+
+from tests.conftest import write_file
+from ufodiff.subcommands.log import Log
+from ufodiff.utilities.gitlog import (
+    iter_nul_delimited_tokens,
+    parse_log_tokens,
+)
+
+# ///////////////////////////////////////////////////////
+#
+#  git log --name-status -z parser tests
+#
+# ///////////////////////////////////////////////////////
+
+LOG_DATA = (
+    b"\x01" + b"a" * 40 + b"\x00100\x00Jane\x00third\x00\nM\x00x/A.ufo/lib.plist\x00"
+    b"D\x00x/A.ufo/glyphs/b.glif\x00"
+    b"\x01" + b"b" * 40 + b"\x0090\x00Jane\x00\x00"
+    b"\x01" + b"c" * 40 + b"\x0080\x00John\x00first\x00\nA\x00x/A.ufo/glyphs/b.glif\x00"
+    b"R100\x00old.glif\x00new.glif\x00A\x00caf\xc3\xa9.glif\x00"
+)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, len(LOG_DATA)])
+def test_ufodiff_gitlog_parse_log_tokens(chunk_size):
+    chunk_list = [
+        LOG_DATA[index : index + chunk_size]  # noqa: E203
+        for index in range(0, len(LOG_DATA), chunk_size)
+    ]
+    commit_changes_list = list(parse_log_tokens(iter_nul_delimited_tokens(chunk_list)))
+    assert [changes.commit_sha1[0] for changes in commit_changes_list] == [
+        "a",
+        "b",
+        "c",
+    ]
+    third, second, first = commit_changes_list
+    assert (third.timestamp, third.author, third.subject) == (100, "Jane", "third")
+    assert third.modified == ["x/A.ufo/lib.plist"]
+    assert third.deleted == ["x/A.ufo/glyphs/b.glif"]
+    # empty commit with an empty subject
+    assert second.subject == ""
+    assert len(second) == 0
+    # rename records are skipped with both paths
+    assert first.added == ["x/A.ufo/glyphs/b.glif", "café.glif"]
+
+
+# ///////////////////////////////////////////////////////
+#
+#  Log class tests
+#
+# ///////////////////////////////////////////////////////
+
+
+@pytest.fixture
+def log_repo(git_repo, tmp_path):
+    write_file(tmp_path, "source/Test-Regular.ufo/glyphs/a.glif", "a")
+    write_file(tmp_path, "source/Test-Bold.ufo/glyphs/a.glif", "a")
+    write_file(tmp_path, "README.md", "readme")
+    git_repo.git.add("-A")
+    git_repo.git.commit("-m", "first")
+    git_repo.git.tag("v1.0")
+    # commit without UFO source changes
+    write_file(tmp_path, "README.md", "modified")
+    git_repo.git.add("-A")
+    git_repo.git.commit("-m", "second")
+    write_file(tmp_path, "source/Test-Regular.ufo/glyphs/a.glif", "modified")
+    write_file(tmp_path, "source/Test-Bold.ufo/fontinfo.plist", "added")
+    git_repo.git.rm("source/Test-Bold.ufo/glyphs/a.glif")
+    git_repo.git.add("-A")
+    git_repo.git.commit("-m", "third")
+    return str(tmp_path)
+
+
+def test_ufodiff_log_commit_changes(log_repo):
+    commit_changes_list = list(Log(log_repo).get_commit_changes_generator("commits:3"))
+    assert [changes.subject for changes in commit_changes_list] == ["third", "first"]
+    third = commit_changes_list[0]
+    assert third.commit_sha1 == Repo(log_repo).head.commit.hexsha
+    assert third.added == ["source/Test-Bold.ufo/fontinfo.plist"]
+    assert third.deleted == ["source/Test-Bold.ufo/glyphs/a.glif"]
+    assert third.modified == ["source/Test-Regular.ufo/glyphs/a.glif"]
+    assert commit_changes_list[1].added == [
+        "source/Test-Bold.ufo/glyphs/a.glif",
+        "source/Test-Regular.ufo/glyphs/a.glif",
+    ]
+
+
+def test_ufodiff_log_ranges_and_ufo_filter(log_repo):
+    log = Log(log_repo, ["Test-Regular.ufo"])
+    commit_changes_list = list(log.get_commit_changes_generator("v1.0..HEAD"))
+    assert len(commit_changes_list) == 1
+    assert commit_changes_list[0].added == []
+    assert commit_changes_list[0].modified == ["source/Test-Regular.ufo/glyphs/a.glif"]
+    assert [
+        changes.subject for changes in log.get_commit_changes_generator("branch:v1.0")
+    ] == ["third"]
+    with pytest.raises(ValueError):
+        list(log.get_commit_changes_generator("bogus"))
+
+
+def test_ufodiff_log_generator_close_stops_git(log_repo):
+    log = Log(log_repo)
+    commit_changes_generator = log.get_commit_changes_generator("commits:3")
+    assert next(commit_changes_generator).subject == "third"
+    commit_changes_generator.close()
+    # the git log process was stopped and a new request can be made
+    assert len(list(log.get_commit_changes_generator("commits:1"))) == 1
+
+
+def test_ufodiff_log_json_writer(log_repo):
+    line_list = Log(log_repo).get_writer("commits:3").get_string().split("\n")
+    assert line_list[-1] == ""
+    record_list = [json.loads(line) for line in line_list[:-1]]
+    assert [record["subject"] for record in record_list] == ["third", "first"]
+    assert sorted(record_list[0]) == [
+        "added",
+        "author",
+        "commit",
+        "deleted",
+        "modified",
+        "subject",
+        "timestamp",
+    ]
+    assert record_list[0]["author"] == "ufodiff"
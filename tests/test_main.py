@@ -1,7 +1,10 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import io
+import json
 import os
+import subprocess
 import sys
 import pytest
 import mock
@@ -10,6 +13,44 @@ from git import Repo
 
 from ufodiff.app import get_git_root_path
 
+# modules that ufodiff.app imports on demand
+LAZY_IMPORT_MODULE_NAMES = (
+    "git",
+    "gitdb",
+    "smmap",
+    "ufodiff.client",
+    "ufodiff.subcommands.batch",
+    "ufodiff.subcommands.delta",
+    "ufodiff.subcommands.diff",
+    "ufodiff.subcommands.glyphdiff",
+    "ufodiff.subcommands.groups",
+    "ufodiff.subcommands.kerning",
+    "ufodiff.subcommands.log",
+    "ufodiff.subcommands.plistdiff",
+    "ufodiff.subcommands.serve",
+)
+
+
+# runs the ufodiff main() function with `python -X importtime` in a new interpreter
+# and returns the {module name: cumulative import time in microseconds} dictionary
+def get_import_time_dict(argv):
+    code = "import sys; sys.argv = {!r}; from ufodiff.app import main; main()".format(
+        ["ufodiff"] + argv
+    )
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+    )
+    import_time_dict = {}
+    for line in process.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            fields = line[len("import time:") :].split("|")  # noqa: E203
+            if fields[1].strip().isdigit():
+                import_time_dict[fields[2].strip()] = int(fields[1])
+    return import_time_dict
+
 
 # creates a temporary new git branch (testing_branch) for testing
 def make_testing_branch():
@@ -377,6 +418,57 @@ def test_ufodiff_commandline_deltajson_exit_success(capsys):
     assert pytest_wrapped_e.value.code == 0
 
 
+def test_ufodiff_commandline_deltajsonl_exit_success(capsys):
+    with pytest.raises(SystemExit) as pytest_wrapped_e:
+        from ufodiff.app import main
+
+        sys.argv = ["ufodiff", "deltajsonl", "all", "commits:2"]
+        main()
+
+    out, err = capsys.readouterr()
+    assert pytest_wrapped_e.type == SystemExit
+    assert pytest_wrapped_e.value.code == 0
+    line_list = out.split("\n")
+    assert line_list[-1] == ""
+    record_list = [json.loads(line) for line in line_list[:-1]]
+    assert record_list[0]["type"] == "header"
+    assert record_list[-1]["type"] == "footer"
+
+
+def test_ufodiff_commandline_delta_kerning_and_groups_unsupported_options_fail(
+    capsys,
+):
+    for report in ("kerning", "groups"):
+        for option in (
+            "--engine=inprocess",
+            "--workers=2",
+            "--no-cache",
+            "--glyph-names",
+        ):
+            with pytest.raises(SystemExit) as pytest_wrapped_e:
+                from ufodiff.app import main
+
+                sys.argv = ["ufodiff", "delta", report, "commits:2", option]
+                main()
+
+            out, err = capsys.readouterr()
+            assert err.startswith("[ufodiff] ERROR: The '" + option.split("=")[0] + "'")
+            assert pytest_wrapped_e.value.code == 1
+
+
+def test_ufodiff_commandline_deltajsonl_kerning_and_groups_fail(capsys):
+    for report in ("kerning", "groups"):
+        with pytest.raises(SystemExit) as pytest_wrapped_e:
+            from ufodiff.app import main
+
+            sys.argv = ["ufodiff", "deltajsonl", report, "commits:2"]
+            main()
+
+        out, err = capsys.readouterr()
+        assert err.startswith("[ufodiff] ERROR:")
+        assert pytest_wrapped_e.value.code == 1
+
+
 def test_ufodiff_commandline_deltamd_exit_success(capsys):
     with pytest.raises(SystemExit) as pytest_wrapped_e:
         from ufodiff.app import main
@@ -389,6 +481,265 @@ def test_ufodiff_commandline_deltamd_exit_success(capsys):
     assert pytest_wrapped_e.value.code == 0
 
 
+def test_ufodiff_commandline_delta_inprocess_engine_exit_success(capsys):
+    with pytest.raises(SystemExit) as pytest_wrapped_e:
+        from ufodiff.app import main
+
+        sys.argv = ["ufodiff", "delta", "all", "commits:1", "--engine=inprocess"]
+        main()
+
+    out, err = capsys.readouterr()
+    assert pytest_wrapped_e.type == SystemExit
+    assert pytest_wrapped_e.value.code == 0
+
+
+def test_ufodiff_commandline_delta_no_cache_exit_success(capsys):
+    with pytest.raises(SystemExit) as pytest_wrapped_e:
+        from ufodiff.app import main
+
+        sys.argv = [
+            "ufodiff",
+            "delta",
+            "all",
+            "commits:1",
+            "--engine=inprocess",
+            "--no-cache",
+        ]
+        main()
+
+    out, err = capsys.readouterr()
+    assert pytest_wrapped_e.type == SystemExit
+    assert pytest_wrapped_e.value.code == 0
+
+
+def test_ufodiff_commandline_delta_batch_exit_success(capsys, monkeypatch):
+    for subcmd in ("delta", "deltajson", "deltamd"):
+        with pytest.raises(SystemExit) as pytest_wrapped_e:
+            from ufodiff.app import main
+
+            sys.argv = ["ufodiff", subcmd, "all", "batch", "commits:1", "commits:2"]
+            main()
+
+        out, err = capsys.readouterr()
+        assert pytest_wrapped_e.type == SystemExit
+        assert pytest_wrapped_e.value.code == 0
+    # ranges on stdin
+    monkeypatch.setattr(
+        "sys.stdin", io.StringIO("commits:1\n\n# comment\nHEAD~2..HEAD\n")
+    )
+    with pytest.raises(SystemExit) as pytest_wrapped_e:
+        from ufodiff.app import main
+
+        sys.argv = ["ufodiff", "deltajson", "nonglyph", "batch", "--no-cache"]
+        main()
+
+    out, err = capsys.readouterr()
+    assert pytest_wrapped_e.value.code == 0
+    assert len(out.splitlines()) == 2
+
+
+def test_ufodiff_commandline_delta_batch_invalid_range(capsys):
+    for argv in (
+        ["ufodiff", "delta", "all", "batch", "commits:0"],
+        ["ufodiff", "delta", "kerning", "batch", "commits:1"],
+    ):
+        with pytest.raises(SystemExit) as pytest_wrapped_e:
+            from ufodiff.app import main
+
+            sys.argv = argv
+            main()
+
+        out, err = capsys.readouterr()
+        assert err.startswith("[ufodiff] ERROR:")
+        assert pytest_wrapped_e.value.code == 1
+
+
+def test_ufodiff_commandline_log_exit_success(capsys):
+    for arg in ("commits:2", "HEAD~2..HEAD"):
+        with pytest.raises(SystemExit) as pytest_wrapped_e:
+            from ufodiff.app import main
+
+            sys.argv = ["ufodiff", "log", arg]
+            main()
+
+        out, err = capsys.readouterr()
+        assert pytest_wrapped_e.type == SystemExit
+        assert pytest_wrapped_e.value.code == 0
+
+
+def test_ufodiff_commandline_log_invalid_args(capsys):
+    for argv in (
+        ["ufodiff", "log"],
+        ["ufodiff", "log", "commits:0"],
+        ["ufodiff", "log", "branch:"],
+        ["ufodiff", "log", "bogus"],
+    ):
+        with pytest.raises(SystemExit) as pytest_wrapped_e:
+            from ufodiff.app import main
+
+            sys.argv = argv
+            main()
+
+        out, err = capsys.readouterr()
+        assert err.startswith("[ufodiff] ERROR:")
+        assert pytest_wrapped_e.value.code == 1
+
+
+def test_ufodiff_commandline_delta_glyph_and_nonglyph_exit_success(capsys):
+    for subcmd in ("delta", "deltajson", "deltajsonl", "deltamd"):
+        for report in ("glyph", "nonglyph"):
+            with pytest.raises(SystemExit) as pytest_wrapped_e:
+                from ufodiff.app import main
+
+                sys.argv = ["ufodiff", subcmd, report, "commits:2", "--no-cache"]
+                main()
+
+            out, err = capsys.readouterr()
+            assert pytest_wrapped_e.type == SystemExit
+            assert pytest_wrapped_e.value.code == 0
+
+
+def test_ufodiff_commandline_delta_glyph_names_exit_success(capsys):
+    for subcmd in ("delta", "deltajson", "deltajsonl", "deltamd"):
+        with pytest.raises(SystemExit) as pytest_wrapped_e:
+            from ufodiff.app import main
+
+            sys.argv = [
+                "ufodiff",
+                subcmd,
+                "all",
+                "commits:1",
+                "--engine=inprocess",
+                "--no-cache",
+                "--glyph-names",
+            ]
+            main()
+
+        out, err = capsys.readouterr()
+        assert pytest_wrapped_e.type == SystemExit
+        assert pytest_wrapped_e.value.code == 0
+
+
+def test_ufodiff_commandline_delta_kerning_and_groups_exit_success(capsys):
+    for subcmd in ("delta", "deltajson", "deltamd"):
+        with pytest.raises(SystemExit) as pytest_wrapped_e:
+            from ufodiff.app import main
+
+            sys.argv = ["ufodiff", subcmd, "kerning", "commits:2"]
+            main()
+
+        out, err = capsys.readouterr()
+        assert pytest_wrapped_e.type == SystemExit
+        assert pytest_wrapped_e.value.code == 0
+
+        with pytest.raises(SystemExit) as pytest_wrapped_e:
+            from ufodiff.app import main
+
+            sys.argv = ["ufodiff", subcmd, "groups", "commits:2"]
+            main()
+
+        out, err = capsys.readouterr()
+        assert pytest_wrapped_e.type == SystemExit
+        assert pytest_wrapped_e.value.code == 0
+
+
+def test_ufodiff_commandline_glyphdiff_exit_success(capsys):
+    with pytest.raises(SystemExit) as pytest_wrapped_e:
+        from ufodiff.app import main
+
+        sys.argv = ["ufodiff", "glyphdiff", "commits:1"]
+        main()
+
+    out, err = capsys.readouterr()
+    assert pytest_wrapped_e.type == SystemExit
+    assert pytest_wrapped_e.value.code == 0
+
+
+def test_ufodiff_commandline_plistdiff_exit_success(capsys):
+    with pytest.raises(SystemExit) as pytest_wrapped_e:
+        from ufodiff.app import main
+
+        sys.argv = ["ufodiff", "plistdiff", "commits:2"]
+        main()
+
+    out, err = capsys.readouterr()
+    assert pytest_wrapped_e.type == SystemExit
+    assert pytest_wrapped_e.value.code == 0
+
+
+def test_ufodiff_commandline_glyphdiff_workers_output_file(capsys, tmp_path):
+    output_path = str(tmp_path / "glyphdiff.txt")
+    with pytest.raises(SystemExit) as pytest_wrapped_e:
+        from ufodiff.app import main
+
+        sys.argv = [
+            "ufodiff",
+            "glyphdiff",
+            "commits:1",
+            "--workers=2",
+            "--output=" + output_path,
+        ]
+        main()
+
+    out, err = capsys.readouterr()
+    assert pytest_wrapped_e.value.code == 0
+    assert os.path.isfile(output_path)
+
+
+def test_ufodiff_commandline_glyphdiff_invalid_workers(capsys):
+    with pytest.raises(SystemExit) as pytest_wrapped_e:
+        from ufodiff.app import main
+
+        sys.argv = ["ufodiff", "glyphdiff", "commits:1", "--workers=0"]
+        main()
+
+    out, err = capsys.readouterr()
+    assert err.startswith("[ufodiff] ERROR:")
+    assert pytest_wrapped_e.value.code == 1
+
+
+def test_ufodiff_commandline_glyphdiff_invalid_request(capsys):
+    with pytest.raises(SystemExit) as pytest_wrapped_e:
+        from ufodiff.app import main
+
+        sys.argv = ["ufodiff", "glyphdiff", "HEAD~1"]
+        main()
+
+    out, err = capsys.readouterr()
+    assert err.startswith("[ufodiff] ERROR:")
+    assert pytest_wrapped_e.type == SystemExit
+    assert pytest_wrapped_e.value.code == 1
+
+
+def test_ufodiff_commandline_delta_invalid_engine(capsys):
+    with pytest.raises(SystemExit) as pytest_wrapped_e:
+        from ufodiff.app import main
+
+        sys.argv = ["ufodiff", "delta", "all", "commits:1", "--engine=bogus"]
+        main()
+
+    out, err = capsys.readouterr()
+    assert err.startswith("[ufodiff] ERROR:")
+    assert pytest_wrapped_e.type == SystemExit
+    assert pytest_wrapped_e.value.code == 1
+
+
+def test_ufodiff_commandline_delta_output_file(capsys, tmp_path):
+    output_path = str(tmp_path / "delta.md")
+    with pytest.raises(SystemExit) as pytest_wrapped_e:
+        from ufodiff.app import main
+
+        sys.argv = ["ufodiff", "deltamd", "all", "commits:1", "--output=" + output_path]
+        main()
+
+    out, err = capsys.readouterr()
+    assert pytest_wrapped_e.type == SystemExit
+    assert pytest_wrapped_e.value.code == 0
+    assert out == ""
+    with open(output_path) as f:
+        assert "## Added Files" in f.read()
+
+
 # ////////////////////////////////////////////////////////////
 #
 # Standard output tests for diff + diffnc command argument validations
@@ -583,6 +934,17 @@ def test_ufodiff_commandline_diffnc_exception_git_request(capsys):
     assert pytest_wrapped_e.value.code == 1
 
 
+def test_ufodiff_commandline_git_repo_root_path_start_directory(tmp_path, capsys):
+    gitrepo_path = os.path.abspath(".")
+    assert get_git_root_path() == gitrepo_path
+    assert get_git_root_path(os.path.join("tests", "testfiles")) == gitrepo_path
+    with pytest.raises(SystemExit) as pytest_wrapped_e:
+        get_git_root_path(str(tmp_path))
+    out, err = capsys.readouterr()
+    assert err.startswith("[ufodiff] ERROR:")
+    assert pytest_wrapped_e.value.code == 1
+
+
 # raise exception in git root path handling
 def test_ufodiff_commandline_git_repo_root_exception(capsys):
     with pytest.raises(SystemExit) as pytest_wrapped_e:
@@ -596,3 +958,37 @@ def test_ufodiff_commandline_git_repo_root_exception(capsys):
     assert err.startswith("[ufodiff] ERROR:")
     assert pytest_wrapped_e.type == SystemExit
     assert pytest_wrapped_e.value.code == 1
+
+
+def test_ufodiff_commandline_startup_without_git_import():
+    for argv in (
+        ["--version"],
+        ["--help"],
+        ["delta", "bogus", "commits:1"],
+        ["diff", "commits:x"],
+    ):
+        import_time_dict = get_import_time_dict(argv)
+        assert "ufodiff.app" in import_time_dict
+        assert [
+            module_name
+            for module_name in import_time_dict
+            if module_name.split(".")[0] in ("git", "gitdb", "smmap")
+        ] == []
+
+
+def test_ufodiff_commandline_import_defers_git_and_subcommands():
+    # new interpreter, this test process has already imported git and the subcommands
+    process = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import json, sys, ufodiff.app; print(json.dumps(sorted(sys.modules)))",
+        ],
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+    module_name_set = set(json.loads(process.stdout))
+    assert "ufodiff.app" in module_name_set
+    for module_name in LAZY_IMPORT_MODULE_NAMES:
+        assert module_name not in module_name_set
@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from ufodiff.utilities import parallel
+from ufodiff.utilities.parallel import (
+    get_worker_number,
+    is_parallel_workload,
+    parallel_map,
+)
+
+
+def test_ufodiff_parallel_worker_number():
+    assert get_worker_number(3) == 3
+    assert get_worker_number(None) >= 1
+    assert get_worker_number(0) == get_worker_number(None)
+    with pytest.raises(ValueError):
+        get_worker_number(-1)
+
+
+def test_ufodiff_parallel_is_parallel_workload():
+    assert is_parallel_workload(10000, workers=1) is False
+    assert is_parallel_workload(10, workers=4) is False
+    assert is_parallel_workload(10, workers=4, min_items=0) is True
+    assert is_parallel_workload(1, workers=4, min_items=0) is False
+    assert is_parallel_workload(parallel.PARALLEL_MIN_ITEMS, workers=4) is True
+
+
+def test_ufodiff_parallel_map_sequential(mocker):
+    executor_spy = mocker.spy(parallel, "ProcessPoolExecutor")
+    item_list = list(range(-50, 50))
+    assert list(parallel_map(abs, item_list, workers=4)) == [abs(x) for x in item_list]
+    assert list(parallel_map(abs, item_list, workers=1, min_items=0)) == [
+        abs(x) for x in item_list
+    ]
+    assert executor_spy.call_count == 0
+
+
+def test_ufodiff_parallel_map_process_pool_order():
+    # more chunks than the number of chunks in flight
+    item_list = list(range(-500, 500))
+    result_list = list(
+        parallel_map(abs, item_list, workers=2, chunk_size=7, min_items=0)
+    )
+    assert result_list == [abs(x) for x in item_list]
+
+
+def test_ufodiff_parallel_map_streams_results():
+    result_generator = parallel_map(
+        abs, list(range(-500, 500)), workers=2, chunk_size=10, min_items=0
+    )
+    assert next(result_generator) == 500
+    # the pool is shut down when the generator is closed early
+    result_generator.close()
@@ -0,0 +1,223 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import plistlib
+
+import pytest
+
+from git import Repo
+
+from ufodiff.subcommands.plistdiff import PlistDiff
+from ufodiff.utilities import plistdiff
+from ufodiff.utilities.plistdiff import (
+    ADDED,
+    CHANGED,
+    LARGE_ARRAY_LENGTH,
+    REMOVED,
+    REORDERED,
+    format_key_path_change,
+    get_key_path_changes,
+)
+from ufodiff.utilities.plist import load_plist
+
+# ///////////////////////////////////////////////////////
+#
+#  Key path comparison tests
+#
+# ///////////////////////////////////////////////////////
+
+
+def test_ufodiff_plistdiff_key_path_changes():
+    old_plist = {
+        "openTypeOS2WinAscent": 950,
+        "styleMapStyleName": "regular",
+        "com.foo.bar": [1, 2, {"name": "a"}, 4],
+        "com.foo.nested": {"a": {"b": True}},
+    }
+    new_plist = {
+        "openTypeOS2WinAscent": 980,
+        "com.foo.bar": [1, 2, {"name": "b"}, 4, 5],
+        "com.foo.nested": {"a": {"b": False}},
+        "copyright": "Test",
+    }
+    assert get_key_path_changes(old_plist, new_plist) == [
+        (CHANGED, "com.foo.bar[2]/name", "a", "b"),
+        (ADDED, "com.foo.bar[4]", None, 5),
+        (CHANGED, "com.foo.nested/a/b", True, False),
+        (ADDED, "copyright", None, "Test"),
+        (CHANGED, "openTypeOS2WinAscent", 950, 980),
+        (REMOVED, "styleMapStyleName", "regular", None),
+    ]
+
+
+def test_ufodiff_plistdiff_value_types():
+    # integer and real values, and boolean and integer values are distinct
+    assert get_key_path_changes({"a": 1, "b": 1}, {"a": 1.0, "b": True}) == [
+        (CHANGED, "a", 1, 1.0),
+        (CHANGED, "b", 1, True),
+    ]
+    assert get_key_path_changes({"a": 1}, {"a": 1}) == []
+
+
+def test_ufodiff_plistdiff_large_arrays_compared_by_digest(mocker):
+    old_array = [{"x": index} for index in range(1000)]
+    new_array = [{"x": index} for index in range(1000)]
+    new_array[500] = {"x": -1}
+    compare_spy = mocker.spy(plistdiff, "_compare_values")
+    change_list = get_key_path_changes({"a": old_array}, {"a": new_array})
+    assert change_list == [(CHANGED, "a[500]", {"x": 500}, {"x": -1})]
+    # array items are not compared recursively
+    assert compare_spy.call_count == 2
+    assert get_key_path_changes({"a": old_array}, {"a": list(old_array)}) == []
+
+
+def test_ufodiff_plistdiff_large_array_insert_and_delete_aligned():
+    glyph_order = ["glyph{}".format(index) for index in range(LARGE_ARRAY_LENGTH * 4)]
+    inserted_glyph_order = glyph_order[:10] + ["new"] + glyph_order[10:]
+    assert get_key_path_changes(
+        {"public.glyphOrder": glyph_order},
+        {"public.glyphOrder": inserted_glyph_order},
+    ) == [(ADDED, "public.glyphOrder[10]", None, "new")]
+    deleted_glyph_order = glyph_order[:20] + glyph_order[21:]
+    assert get_key_path_changes(
+        {"public.glyphOrder": glyph_order},
+        {"public.glyphOrder": deleted_glyph_order},
+    ) == [(REMOVED, "public.glyphOrder[20]", "glyph20", None)]
+    # an insert and a delete in one revision are reported once each
+    change_list = get_key_path_changes(
+        {"public.glyphOrder": glyph_order},
+        {"public.glyphOrder": inserted_glyph_order[:100] + inserted_glyph_order[101:]},
+    )
+    assert change_list == [
+        (ADDED, "public.glyphOrder[10]", None, "new"),
+        (REMOVED, "public.glyphOrder[99]", "glyph99", None),
+    ]
+
+
+def test_ufodiff_plistdiff_large_array_reordered():
+    glyph_order = ["glyph{}".format(index) for index in range(LARGE_ARRAY_LENGTH * 4)]
+    change_list = get_key_path_changes(
+        {"public.glyphOrder": glyph_order},
+        {"public.glyphOrder": list(reversed(glyph_order))},
+    )
+    assert [change[:2] for change in change_list] == [(REORDERED, "public.glyphOrder")]
+    assert format_key_path_change(change_list[0]) == (
+        "reordered: public.glyphOrder = <array 256 items>"
+    )
+
+
+def test_ufodiff_plistdiff_formatting_and_key_order_not_reported():
+    plist_dict = {"b": [1, 2, 3], "a": {"y": "1", "x": "2"}}
+    old_data = plistlib.dumps(plist_dict, sort_keys=True)
+    new_data = plistlib.dumps(plist_dict, sort_keys=False).replace(b"\t", b"  ")
+    assert old_data != new_data
+    assert get_key_path_changes(load_plist(old_data), load_plist(new_data)) == []
+
+
+def test_ufodiff_plistdiff_load_plist_matches_plistlib():
+    plist_dict = {
+        "a": [1, 2.5, True, False, "text", {"b": "<&>"}],
+        "c": {},
+        "d": [],
+        "e": "",
+    }
+    plist_data = plistlib.dumps(plist_dict)
+    assert load_plist(plist_data) == plistlib.loads(plist_data)
+    assert load_plist(plistlib.dumps(plist_dict, fmt=plistlib.FMT_BINARY)) == plist_dict
+
+
+def test_ufodiff_plistdiff_format_key_path_change():
+    assert format_key_path_change((CHANGED, "a", 1, 2)) == "changed: a: 1 -> 2"
+    assert (
+        format_key_path_change((ADDED, "b", None, [1])) == "added: b = <array 1 items>"
+    )
+    assert (
+        format_key_path_change((REMOVED, "c", {"x": 1}, None))
+        == "removed: c = <dict 1 keys>"
+    )
+
+
+# ///////////////////////////////////////////////////////
+#
+#  PlistDiff class tests
+#
+# ///////////////////////////////////////////////////////
+
+
+def write_plist(repo_path, filepath, plist_dict, sort_keys=True):
+    full_path = os.path.join(str(repo_path), *filepath.split("/"))
+    if not os.path.isdir(os.path.dirname(full_path)):
+        os.makedirs(os.path.dirname(full_path))
+    with open(full_path, "wb") as f:
+        f.write(plistlib.dumps(plist_dict, sort_keys=sort_keys))
+
+
+@pytest.fixture
+def plist_repo(tmp_path):
+    repo = Repo.init(str(tmp_path))
+    with repo.config_writer() as config:
+        config.set_value("user", "name", "ufodiff")
+        config.set_value("user", "email", "ufodiff@example.com")
+    for ufo_name in ("Test-Regular.ufo", "Test-Bold.ufo"):
+        write_plist(
+            tmp_path,
+            "source/" + ufo_name + "/fontinfo.plist",
+            {"familyName": "Test", "unitsPerEm": 1000, "openTypeOS2WinAscent": 950},
+        )
+        write_plist(
+            tmp_path,
+            "source/" + ufo_name + "/lib.plist",
+            {"public.glyphOrder": ["a", "b", "c"]},
+        )
+    write_plist(tmp_path, "build/lib.plist", {"a": 1})
+    repo.git.add("-A")
+    repo.git.commit("-m", "first")
+    repo.git.branch("base")
+    write_plist(
+        tmp_path,
+        "source/Test-Regular.ufo/fontinfo.plist",
+        {"familyName": "Test", "unitsPerEm": 1000, "openTypeOS2WinAscent": 980},
+    )
+    # rewritten with a different key order, no changes
+    write_plist(
+        tmp_path,
+        "source/Test-Bold.ufo/fontinfo.plist",
+        {"unitsPerEm": 1000, "openTypeOS2WinAscent": 950, "familyName": "Test"},
+        sort_keys=False,
+    )
+    write_plist(
+        tmp_path,
+        "source/Test-Bold.ufo/lib.plist",
+        {"public.glyphOrder": ["a", "b", "d"]},
+    )
+    write_plist(tmp_path, "build/lib.plist", {"a": 2})
+    repo.git.add("-A")
+    repo.git.commit("-m", "second")
+    return str(tmp_path)
+
+
+def test_ufodiff_plistdiff_commits(plist_repo):
+    plistdiff_obj = PlistDiff(plist_repo)
+    report_list = list(plistdiff_obj.get_plist_diff_string_generator("commits:1"))
+    assert report_list == [
+        os.linesep.join(
+            [
+                "source/Test-Bold.ufo/lib.plist",
+                "  changed: public.glyphOrder[2]: 'c' -> 'd'",
+            ]
+        ),
+        os.linesep.join(
+            [
+                "source/Test-Regular.ufo/fontinfo.plist",
+                "  changed: openTypeOS2WinAscent: 950 -> 980",
+            ]
+        ),
+    ]
+
+
+def test_ufodiff_plistdiff_branch_with_ufo_filter(plist_repo):
+    plistdiff_obj = PlistDiff(plist_repo, ["Test-Regular.ufo"])
+    report_list = list(plistdiff_obj.get_plist_diff_string_generator("branch:base"))
+    assert len(report_list) == 1
+    assert report_list[0].startswith("source/Test-Regular.ufo/fontinfo.plist")
@@ -0,0 +1,190 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import socket
+import sys
+import threading
+
+import pytest
+
+from git import Repo
+
+from tests.conftest import write_file
+from ufodiff.client import get_default_socket_path, get_socket_path, send_request
+from ufodiff.subcommands.delta import Delta
+from ufodiff.subcommands.diff import Diff
+from ufodiff.subcommands import serve
+from ufodiff.subcommands.serve import UfodiffServe
+
+# serve.ServeSocketServer is only defined on platforms with Unix sockets
+pytestmark = pytest.mark.skipif(
+    not hasattr(socket, "AF_UNIX"), reason="Unix sockets are not available"
+)
+
+
+@pytest.fixture
+def serve_repo(git_repo, tmp_path):
+    write_file(tmp_path, "source/Test-Regular.ufo/glyphs/a.glif", "a")
+    git_repo.git.add("-A")
+    git_repo.git.commit("-m", "first")
+    git_repo.git.branch("base")
+    write_file(tmp_path, "source/Test-Regular.ufo/glyphs/a.glif", "a\nmodified")
+    write_file(tmp_path, "source/Test-Regular.ufo/fontinfo.plist", "fontinfo")
+    git_repo.git.add("-A")
+    git_repo.git.commit("-m", "second")
+    return str(tmp_path)
+
+
+@pytest.fixture
+def serve_socket_path(serve_repo):
+    socket_path = get_default_socket_path(serve_repo)
+    server = serve.ServeSocketServer(socket_path)
+    server_thread = threading.Thread(target=server.serve_forever)
+    server_thread.start()
+    yield socket_path
+    server.shutdown()
+    server_thread.join()
+    server.server_close()
+
+
+def test_ufodiff_serve_delta_requests(serve_repo, serve_socket_path):
+    for argv, test_kwargs in (
+        (
+            ["deltajson", "all", "branch:base"],
+            {"is_branch_test": True, "compare_branch_name": "base"},
+        ),
+        (
+            ["delta", "glyph", "commits:1"],
+            {"is_commit_test": True, "commit_number": "1"},
+        ),
+    ):
+        response = send_request(serve_socket_path, argv, serve_repo)
+        assert response["supported"] is True
+        assert response["status"] == 0
+        assert response["stderr"] == ""
+        delta = Delta(
+            serve_repo,
+            [],
+            file_filter="glyph" if argv[1] == "glyph" else None,
+            **test_kwargs
+        )
+        write_format = "json" if argv[0] == "deltajson" else "text"
+        assert response["stdout"] == delta.get_writer(write_format).get_string()
+    assert "fontinfo.plist" not in response["stdout"]
+
+
+def test_ufodiff_serve_result_cache_and_state(serve_repo):
+    ufodiff_serve = UfodiffServe()
+    request_dict = {"argv": ["delta", "all", "branch:base"], "cwd": serve_repo}
+    first_response = ufodiff_serve.handle_request(request_dict)
+    assert ufodiff_serve.handle_request(request_dict) == first_response
+    assert ufodiff_serve.result_cache_hits == 1
+    commits_request_dict = {"argv": ["delta", "all", "commits:1"], "cwd": serve_repo}
+    ufodiff_serve.handle_request(commits_request_dict)
+    ufodiff_serve.handle_request(commits_request_dict)
+    assert ufodiff_serve.result_cache_hits == 1
+    # a new commit on the current branch changes the branch request result
+    repository = ufodiff_serve.get_repository(serve_repo)
+    write_file(serve_repo, "source/Test-Regular.ufo/glyphs/b.glif", "b")
+    Repo(serve_repo).git.add("-A")
+    Repo(serve_repo).git.commit("-m", "third")
+    response = ufodiff_serve.handle_request(request_dict)
+    assert "glyphs/b.glif" in response["stdout"]
+    assert ufodiff_serve.get_repository(serve_repo) is repository
+    # the repository state is rebuilt after a checkout
+    Repo(serve_repo).git.checkout("-b", "feature")
+    response = ufodiff_serve.handle_request(request_dict)
+    assert " feature" in response["stdout"]
+    assert ufodiff_serve.get_repository(serve_repo) is not repository
+
+
+def test_ufodiff_serve_diff_request(serve_repo, serve_socket_path):
+    for argv in (["diffnc", "commits:1"], ["diff", "branch:base"]):
+        response = send_request(serve_socket_path, argv, serve_repo)
+        diff = Diff(serve_repo, color_diff=(argv[0] == "diff"), stream_diff=True)
+        assert response["status"] == 0
+        assert response["stdout"] == "".join(
+            diff_string + "\n"
+            for diff_string in diff.get_diff_string_generator(argv[1])
+        )
+        assert "modified" in response["stdout"]
+
+
+def test_ufodiff_serve_invalid_and_unsupported_requests(serve_repo, tmp_path_factory):
+    ufodiff_serve = UfodiffServe()
+    # request outside of a git repository
+    response = ufodiff_serve.handle_request(
+        {
+            "argv": ["delta", "all", "commits:1"],
+            "cwd": str(tmp_path_factory.mktemp("norepo")),
+        }
+    )
+    assert response["status"] == 1
+    assert response["stderr"].startswith("[ufodiff] ERROR:")
+    for argv in (["delta", "all", "commits:0"], ["diff", "commits:x"]):
+        response = ufodiff_serve.handle_request({"argv": argv, "cwd": serve_repo})
+        assert response["status"] == 1
+        assert response["stderr"].startswith("[ufodiff] ERROR:")
+    for argv in (
+        ["delta", "kerning", "commits:1"],
+        ["delta", "all", "batch", "commits:1"],
+        ["log", "commits:1"],
+    ):
+        response = ufodiff_serve.handle_request({"argv": argv, "cwd": serve_repo})
+        assert response == {"supported": False}
+    response = ufodiff_serve.handle_request(
+        {"argv": ["delta", "all", "branch:bogus"], "cwd": serve_repo}
+    )
+    assert response["status"] == 1
+    assert response["stderr"].startswith("[ufodiff] ERROR:")
+
+
+def test_ufodiff_serve_output_file(serve_repo, serve_socket_path):
+    response = send_request(
+        serve_socket_path,
+        ["deltamd", "all", "commits:1", "--output=delta.md"],
+        serve_repo,
+    )
+    assert response["stdout"] == ""
+    with open(os.path.join(serve_repo, "delta.md")) as f:
+        assert "fontinfo.plist" in f.read()
+
+
+def test_ufodiff_serve_socket_server_socket_file(serve_repo, serve_socket_path):
+    # a second server is not started on a socket with a listening server
+    with pytest.raises(OSError):
+        serve.ServeSocketServer(serve_socket_path)
+    # stale socket files are replaced
+    stale_socket_path = os.path.join(serve_repo, "stale.sock")
+    stale_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale_socket.bind(stale_socket_path)
+    stale_socket.close()
+    server = serve.ServeSocketServer(stale_socket_path)
+    server.server_close()
+    assert not os.path.exists(stale_socket_path)
+
+
+def test_ufodiff_serve_client_main(serve_repo, serve_socket_path, capsys, monkeypatch):
+    from ufodiff.client import main
+
+    monkeypatch.chdir(serve_repo)
+    assert get_socket_path([], serve_repo) == serve_socket_path
+    # request answered by the server
+    monkeypatch.setattr(sys, "argv", ["ufodiff-client", "delta", "all", "commits:1"])
+    with pytest.raises(SystemExit) as pytest_wrapped_e:
+        main()
+    out, err = capsys.readouterr()
+    assert pytest_wrapped_e.value.code == 0
+    assert "fontinfo.plist" in out
+    # unsupported request and request without a server run in the client process
+    for argv in (
+        ["ufodiff-client", "log", "commits:1"],
+        ["ufodiff-client", "delta", "all", "commits:1", "--socket=bogus.sock"],
+    ):
+        monkeypatch.setattr(sys, "argv", argv)
+        with pytest.raises(SystemExit) as pytest_wrapped_e:
+            main()
+        out, err = capsys.readouterr()
+        assert pytest_wrapped_e.value.code == 0
+        assert "fontinfo.plist" in out
@@ -5,7 +5,7 @@ import os
 import sys
 import pytest
 
-from ufodiff.utilities.ufo import Ufo
+from ufodiff.utilities.ufo import Ufo, UfoDirectoryFilter, UfoPathClassifier
 
 # ///////////////////////////////////////////////////////
 #
@@ -100,6 +100,17 @@ def test_ufodiff_ufo_version_false():
 
 
 # test UFO file filters for diff and diffnc commands
+def test_ufodiff_ufo_plist_diff_files():
+    ufo = Ufo()
+    assert ufo.is_plist_diff_file(os.path.join("source", "Test.ufo", "lib.plist"))
+    assert ufo.is_plist_diff_file(os.path.join("Test.ufo", "fontinfo.plist"))
+    assert not ufo.is_plist_diff_file(
+        os.path.join("source", "Test.ufo", "groups.plist")
+    )
+    assert not ufo.is_plist_diff_file(os.path.join("build", "lib.plist"))
+    assert ufo.get_plist_diff_filterlist() == ["*fontinfo.plist", "*lib.plist"]
+
+
 def test_ufodiff_ufo_diff_filters():
     ufo = Ufo()
     filter_test_list = ufo.get_valid_file_filterlist_for_diff()
@@ -193,3 +204,113 @@ def test_ufodiff_ufo_data_dir_file_via_public_method_call():
     assert ufo.validate_file(test_path_1) is False
     assert ufo.validate_file(test_path_2) is False
     assert ufo.validate_file(test_path_3) is True
+
+
+# ///////////////////////////////////////////////////////
+#
+#  UfoPathClassifier class tests
+#
+# ///////////////////////////////////////////////////////
+
+classifier_test_paths = {
+    "source/Test-Regular.ufo/glyphs/A_.glif": UfoPathClassifier.GLYPH,
+    "source/Test-Regular.ufo/glyphs.background/A_.glif": UfoPathClassifier.GLYPH,
+    "source/Test-Regular.ufo/glyphs/contents.plist": UfoPathClassifier.LAYER,
+    "source/Test-Regular.ufo/glyphs/layerinfo.plist": UfoPathClassifier.LAYER,
+    "source/Test-Regular.ufo/layercontents.plist": UfoPathClassifier.LAYER,
+    "source/Test-Regular.ufo/metainfo.plist": UfoPathClassifier.NONGLYPH,
+    "source/Test-Regular.ufo/fontinfo.plist": UfoPathClassifier.NONGLYPH,
+    "source/Test-Regular.ufo/groups.plist": UfoPathClassifier.NONGLYPH,
+    "source/Test-Regular.ufo/kerning.plist": UfoPathClassifier.NONGLYPH,
+    "source/Test-Regular.ufo/features.fea": UfoPathClassifier.NONGLYPH,
+    "source/Test-Regular.ufo/lib.plist": UfoPathClassifier.NONGLYPH,
+    "source/Test-Regular.ufo/data/org.sourcefoundry.coolstuff": UfoPathClassifier.DATA,
+    "source/Test-Regular.ufo/data/sub/file.txt": UfoPathClassifier.DATA,
+    "Test-Regular.ufo/data/file.txt": UfoPathClassifier.DATA,
+    "source/Test-Regular.ufo/images/cap_a.png": UfoPathClassifier.IMAGE,
+    "source/Test-Regular.ufo/images/cap_a.jpg": UfoPathClassifier.NOT_UFO,
+    "source/Test-Regular.ufo/image/cap_a.png": UfoPathClassifier.NOT_UFO,
+    "source/anotherdir/images/cap_a.png": UfoPathClassifier.NOT_UFO,
+    "source/Test-Regular.ufo/datum/org.sourcefoundry.coolstuff": UfoPathClassifier.NOT_UFO,
+    "source/Test-Regular/data/org.sourcefoundry.coolstuff": UfoPathClassifier.NOT_UFO,
+    "source/Test-Regular.ufo/database/file.txt": UfoPathClassifier.NOT_UFO,
+    "README.md": UfoPathClassifier.NOT_UFO,
+    "testing.py": UfoPathClassifier.NOT_UFO,
+    "": UfoPathClassifier.NOT_UFO,
+}
+
+
+def test_ufodiff_ufo_classifier_classify_many():
+    classifier = UfoPathClassifier()
+    filepath_list = list(classifier_test_paths.keys())
+    category_list = classifier.classify_many(filepath_list)
+    assert len(category_list) == len(filepath_list)
+    for filepath, category in zip(filepath_list, category_list):
+        assert category == classifier_test_paths[filepath], filepath
+
+
+def test_ufodiff_ufo_classifier_classify_single_path():
+    classifier = UfoPathClassifier()
+    for filepath, expected_category in classifier_test_paths.items():
+        assert classifier.classify(filepath) == expected_category
+
+
+def test_ufodiff_ufo_classifier_matches_validate_file():
+    ufo = Ufo()
+    classifier = UfoPathClassifier()
+    filepath_list = list(classifier_test_paths.keys())
+    for filepath, category in zip(
+        filepath_list, classifier.classify_many(filepath_list)
+    ):
+        is_ufo_file = category != UfoPathClassifier.NOT_UFO
+        assert is_ufo_file is ufo.validate_file(filepath.replace("/", os.path.sep))
+
+
+def test_ufodiff_ufo_classifier_caches_directory_results(mocker):
+    classifier = UfoPathClassifier()
+    directory_spy = mocker.spy(classifier, "_classify_directory")
+    classifier.classify_many(
+        [
+            "source/Test-Regular.ufo/data/a.txt",
+            "source/Test-Regular.ufo/data/b.txt",
+            "source/Test-Regular.ufo/images/a.png",
+            "source/Test-Regular.ufo/images/b.png",
+        ]
+    )
+    assert directory_spy.call_count == 2
+    assert classifier.directory_cache["source/Test-Regular.ufo/data"] == (True, False)
+    assert classifier.directory_cache["source/Test-Regular.ufo/images"] == (
+        False,
+        True,
+    )
+
+
+# ///////////////////////////////////////////////////////
+#
+#  UfoDirectoryFilter class tests
+#
+# ///////////////////////////////////////////////////////
+
+
+def test_ufodiff_ufo_directory_filter_matches():
+    ufo_filter = UfoDirectoryFilter(["Test-Regular.ufo", "fonts/Test-Bold.ufo"])
+    assert len(ufo_filter) == 2
+    assert ufo_filter.matches("source/Test-Regular.ufo/glyphs/a.glif") is True
+    assert ufo_filter.matches("Test-Regular.ufo/metainfo.plist") is True
+    assert ufo_filter.matches("fonts/Test-Bold.ufo/metainfo.plist") is True
+    assert ufo_filter.matches("source/Test-Bold.ufo/metainfo.plist") is False
+    assert ufo_filter.matches("source/MyTest-Regular.ufo/metainfo.plist") is False
+    # file name components are not tested against the filters
+    assert ufo_filter.matches("source/Test-Regular.ufo") is False
+
+
+def test_ufodiff_ufo_directory_filter_matches_directory():
+    ufo_filter = UfoDirectoryFilter(["source/Test-Regular.ufo/"])
+    assert ufo_filter.matches_directory("source/Test-Regular.ufo") is True
+    assert ufo_filter.matches_directory("Test-Regular.ufo") is False
+
+
+def test_ufodiff_ufo_directory_filter_empty():
+    ufo_filter = UfoDirectoryFilter(["", "./"])
+    assert len(ufo_filter) == 0
+    assert ufo_filter.filter(["source/Test-Regular.ufo/metainfo.plist"]) == []